@@ -900,6 +900,14 @@ class TextureAtlasExtractorApp(QMainWindow):
         except Exception:
             pass
 
+        # Stop directory scans, metadata parses and editor loads still running
+        extract_tab = getattr(self, "extract_tab_widget", None)
+        if extract_tab is not None:
+            extract_tab.stop_background_workers()
+        editor_tab = getattr(self, "editor_tab_widget", None)
+        if editor_tab is not None:
+            editor_tab.stop_background_workers()
+
         # Save settings if needed
         try:
             self.app_config.save_settings()
@@ -994,15 +1002,19 @@ class TextureAtlasExtractorApp(QMainWindow):
 
         return complete_settings
 
-    def show_animation_preview_window(self, animation_path, settings):
-        """Shows the animation preview window for the given animation file."""
+    def show_animation_preview_window(
+        self, animation_path, settings, preview=None, request=None
+    ):
+        """Shows the animation preview window for an animation file or in-memory frames."""
         try:
             from gui.extractor.animation_preview_window import (
                 AnimationPreviewWindow,
             )
 
             # Create and show the preview window
-            preview_window = AnimationPreviewWindow(self, animation_path, settings)
+            preview_window = AnimationPreviewWindow(
+                self, animation_path, settings, preview=preview, request=request
+            )
 
             # Connect signal to handle saved settings
             preview_window.settings_saved.connect(self.handle_preview_settings_saved)
@@ -1056,10 +1068,7 @@ class TextureAtlasExtractorApp(QMainWindow):
     ):
         """Preview an animation given the paths and animation name. Used by ExtractTabWidget."""
         try:
-            # Generate temp animation for preview
-            from core.extractor import Extractor
-
-            extractor = Extractor(None, self.current_version, self.settings_manager)
+            from core.extractor import PreviewRequest
 
             # Get spritesheet name from path for settings lookup
             spritesheet_name = spritesheet_label or os.path.basename(spritesheet_path)
@@ -1069,26 +1078,16 @@ class TextureAtlasExtractorApp(QMainWindow):
                 spritesheet_name, animation_name
             )
 
-            temp_path = extractor.generate_temp_animation_for_preview(
+            # Frames are prepared in memory by the window and shown as they arrive
+            request = PreviewRequest(
                 atlas_path=spritesheet_path,
                 metadata_path=metadata_path,
-                settings=preview_settings,
                 animation_name=animation_name,
+                settings=preview_settings,
                 spritemap_info=spritemap_info,
                 spritesheet_label=spritesheet_name,
             )
-
-            if temp_path and os.path.exists(temp_path):
-                # Show animation preview
-                self.show_animation_preview_window(temp_path, preview_settings)
-            else:
-                from PySide6.QtWidgets import QMessageBox
-
-                QMessageBox.warning(
-                    self,
-                    self.tr("Preview Error"),
-                    self.tr("Could not generate animation preview."),
-                )
+            self.show_animation_preview_window(None, preview_settings, request=request)
 
         except Exception as e:
             from PySide6.QtWidgets import QMessageBox
@@ -1232,8 +1231,13 @@ def run_updater(exe_mode: bool, wait_seconds: int = 3, target_tag: str = None):
 
 if __name__ == "__main__":
     import argparse
+    import multiprocessing
     from utils.update_installer import UpdateUtilities
 
+    # Process pools (e.g. the parallel atlas search) re-launch the frozen
+    # executable on Windows; this turns those launches into pool workers.
+    multiprocessing.freeze_support()
+
     try:
         parser = argparse.ArgumentParser(description="TextureAtlas Toolbox")
         parser.add_argument("--update", action="store_true", help="Run in update mode")
@@ -20,7 +20,9 @@ from core.extractor import (
     FileProcessorWorker,
     FrameExporter,
     FrameSelector,
+    PreviewAnimation,
     PreviewGenerator,
+    PreviewRequest,
     SpriteProcessor,
     UnknownSpritesheetHandler,
 )
@@ -33,7 +35,9 @@ __all__ = [
     "FileProcessorWorker",
     "FrameExporter",
     "FrameSelector",
+    "PreviewAnimation",
     "PreviewGenerator",
+    "PreviewRequest",
     "SpriteProcessor",
     "UnknownSpritesheetHandler",
 ]
@@ -5,6 +5,8 @@ combining frames from existing source animations with optional per-frame
 overrides (e.g., custom durations).
 
 Modules:
+    animation_loader: Loads extractor animations for the alignment editor
+        through the shared preview session cache.
     editor_composite: Functions for cloning animation maps and constructing
         composite frame sequences from user-defined definitions.
 """
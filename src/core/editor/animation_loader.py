@@ -0,0 +1,97 @@
+"""Load extractor animations for the alignment editor.
+
+Opening an animation in the editor used to decode the atlas and parse its
+metadata again each time, on the GUI thread. ``load_animation_frames`` goes
+through ``PreviewSessionCache`` instead: a spritesheet that was already
+previewed or opened is neither decoded nor parsed again, and frames loaded
+for the editor are reused by later previews of the same animation.
+
+The function blocks; the editor runs it on a worker thread.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional
+
+from core.editor.editor_composite import FrameTuple
+
+
+def load_animation_frames(
+    atlas_path: str,
+    metadata_path: Optional[str],
+    animation_name: str,
+    spritemap_info: Optional[dict] = None,
+    spritemap_target: Any = None,
+    settings_manager=None,
+    spritesheet_label: Optional[str] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[List[FrameTuple]]:
+    """Return the raw frames of an animation from the shared preview session.
+
+    Args:
+        atlas_path: Path to the atlas image.
+        metadata_path: Path to the XML/TXT metadata, or ``None`` for
+            spritemap projects.
+        animation_name: Animation to load; also the session cache key.
+        spritemap_info: Adobe spritemap project info, if any.
+        spritemap_target: Symbol or timeline label to render; defaults to
+            ``animation_name``.
+        settings_manager: Receives FPS defaults if the spritemap renderer is
+            built here.
+        spritesheet_label: Spritesheet name used for those defaults.
+        is_cancelled: Polled between rendered spritemap frames. A cancelled
+            render returns ``None`` and is not cached.
+
+    Returns:
+        The session's frame list (do not mutate), or ``None`` if the
+        animation has no frames or loading was cancelled.
+
+    Raises:
+        ValueError: If the spritesheet has neither metadata nor complete
+            spritemap info.
+    """
+    from core.extractor.preview_session import PreviewSessionCache
+
+    if spritemap_info:
+        if not (
+            spritemap_info.get("animation_json")
+            and spritemap_info.get("spritemap_json")
+        ):
+            raise ValueError("Spritemap metadata is incomplete.")
+    elif not metadata_path:
+        raise ValueError("The selected spritesheet does not have metadata.")
+
+    cancelled = is_cancelled or (lambda: False)
+    session = PreviewSessionCache.get(atlas_path, metadata_path, spritemap_info)
+    with session.lock:
+        if cancelled():
+            return None
+        if spritemap_info:
+            target = spritemap_target or animation_name
+
+            def render():
+                renderer = session.spritemap_renderer(
+                    settings_manager, spritesheet_label
+                )
+                if renderer is None:
+                    return None
+                rendered = []
+                for index, image in renderer.iter_animation_frames(target):
+                    if cancelled():
+                        return None
+                    rendered.append((index, image))
+                return renderer.finalize_frames(rendered, renderer.frame_prefix(target))
+
+            return session.animation_frames(animation_name, render)
+
+        def process():
+            sprite_processor = session.sprite_processor
+            if sprite_processor is None:
+                return None
+            processed = sprite_processor.process_specific_animation(animation_name)
+            return processed.get(animation_name)
+
+        return session.animation_frames(animation_name, process)
+
+
+__all__ = ["load_animation_frames"]
@@ -13,6 +13,9 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from core.extractor.frame_buffer import CopyStats, share_frame
+from core.extractor.image_utils import FrameRecord
+
 FrameTuple = Tuple[str, Any, dict]
 """A single frame: (name, image object, metadata dict)."""
 
@@ -45,12 +48,14 @@ def build_editor_composite_frames(
     source_frames: AnimationMap,
     *,
     log_warning: Optional[Callable[[str], None]] = None,
+    copy_stats: Optional[CopyStats] = None,
 ) -> List[FrameTuple]:
     """Assemble frames for an editor-defined composite animation.
 
     Each entry in ``definition["sequence"]`` references a source animation
-    and frame index. Frames are copied so modifications do not mutate the
-    originals.
+    and frame index. Frames share pixels with their source through
+    read-only views, so the originals cannot be modified through a
+    composite; a frame referenced several times costs no extra memory.
 
     Args:
         definition: A dict with at least a ``"sequence"`` list. Each element
@@ -59,6 +64,7 @@ def build_editor_composite_frames(
         source_frames: Available animations keyed by name.
         log_warning: Optional callback invoked with a message when a frame
             reference cannot be resolved.
+        copy_stats: Optional counters charged for shared and copied pixels.
 
     Returns:
         Ordered list of FrameTuples for the composite, or an empty list if
@@ -107,8 +113,12 @@ def build_editor_composite_frames(
         )
         frame_metadata["editor_sequence_index"] = index
 
-        frame_image = image.copy() if hasattr(image, "copy") else image
-        frames.append((frame_name, frame_image, frame_metadata))
+        frame_image = share_frame(image, copy_stats)
+        if isinstance(source_frame, FrameRecord):
+            # Same pixels, so the source's bounding box still applies
+            frames.append(source_frame.renamed(frame_name, frame_metadata, frame_image))
+        else:
+            frames.append((frame_name, frame_image, frame_metadata))
 
     return frames
 
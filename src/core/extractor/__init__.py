@@ -10,10 +10,20 @@ Exports:
     FileProcessorWorker: QThread subclass that processes files from a queue.
     AnimationProcessor: Sequences frames and delegates to animation exporters.
     AtlasProcessor: Loads atlas images and parses associated metadata.
+    DirectoryIndex: Cached discovery of spritesheets in an input folder.
+    FrameBuffer: Copy-on-write frame pixels shared as read-only views.
+    CopyStats: Bytes copied and shared while preparing one export.
+    FrameDeduper: Exact duplicate grouping of an animation's frames.
     FrameSelector: Filters frames by animation name or user selection.
     FrameExporter: Writes individual frame images to disk.
+    FrameEncoderRegistry: Prepared per-format encoders and compression profiles.
     AnimationExporter: Renders GIF, APNG, or WebP from frame sequences.
-    PreviewGenerator: Creates temporary animation files for UI preview.
+    OutputSink: Destination of exported files (directory, zip or tar).
+    PreviewGenerator: Prepares in-memory frames or temp files for UI preview.
+    PreviewAnimation: Display-ready preview frames and durations.
+    PreviewRequest: Source paths and settings for one animation preview.
+    PreviewSessionCache: LRU of per-spritesheet preview state.
+    run_preflight: Parallel metadata-only validation of a batch.
     SpriteProcessor: Groups parsed sprites into animation buckets.
     UnknownSpritesheetHandler: Fallback for atlas images lacking metadata.
 """
@@ -21,10 +31,29 @@ Exports:
 from .extractor import Extractor, FileProcessorWorker, ExtractionCancelled
 from .animation_processor import AnimationProcessor
 from .atlas_processor import AtlasProcessor
+from .directory_index import DirectoryIndex, SpritesheetEntry
+from .frame_buffer import CopyStats, FrameBuffer
+from .frame_dedupe import FrameDeduper
 from .frame_selector import FrameSelector
+from .frame_encoders import COMPRESSION_PROFILES, FrameEncoder, FrameEncoderRegistry
 from .frame_exporter import FrameExporter
 from .animation_exporter import AnimationExporter
-from .preview_generator import PreviewGenerator
+from .output_sink import (
+    DirectorySink,
+    OutputSink,
+    TarSink,
+    WriterPool,
+    ZipSink,
+    create_output_sink,
+)
+from .preview_generator import PreviewAnimation, PreviewGenerator, PreviewRequest
+from .preview_session import PreviewSession, PreviewSessionCache
+from .preflight import (
+    PreflightReport,
+    PreflightTask,
+    build_preflight_tasks,
+    run_preflight,
+)
 from .sprite_processor import SpriteProcessor
 from .unknown_spritesheet_handler import UnknownSpritesheetHandler
 
@@ -34,10 +63,32 @@ __all__ = [
     "FileProcessorWorker",
     "AnimationProcessor",
     "AtlasProcessor",
+    "DirectoryIndex",
+    "CopyStats",
+    "FrameBuffer",
+    "FrameDeduper",
     "FrameSelector",
+    "COMPRESSION_PROFILES",
+    "FrameEncoder",
+    "FrameEncoderRegistry",
     "FrameExporter",
     "AnimationExporter",
+    "DirectorySink",
+    "OutputSink",
+    "TarSink",
+    "WriterPool",
+    "ZipSink",
+    "create_output_sink",
+    "PreviewAnimation",
     "PreviewGenerator",
+    "PreviewRequest",
+    "PreviewSession",
+    "PreviewSessionCache",
+    "PreflightReport",
+    "PreflightTask",
+    "build_preflight_tasks",
+    "run_preflight",
     "SpriteProcessor",
+    "SpritesheetEntry",
     "UnknownSpritesheetHandler",
 ]
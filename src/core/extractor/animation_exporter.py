@@ -5,14 +5,14 @@ a sequence of frames (PIL Images or NumPy arrays), handling scaling, cropping,
 duration calculation, and duplicate frame removal.
 """
 
-import os
-from typing import Optional, Sequence, Set
+from typing import Sequence
 
 import numpy
 from PIL.PngImagePlugin import PngInfo
 from wand.color import Color
 from wand.image import Image as WandImg
 
+from core.extractor.frame_dedupe import FrameDeduper
 from core.extractor.frame_pipeline import (
     build_frame_durations,
     compute_shared_bbox,
@@ -21,11 +21,13 @@ from core.extractor.frame_pipeline import (
 from core.extractor.image_utils import (
     apply_alpha_threshold,
     FrameSource,
-    crop_to_bbox,
     ensure_rgba_array,
     frame_dimensions,
+    frame_record_bbox,
     pad_frames_to_canvas,
+    stack_frames,
 )
+from core.extractor.output_sink import DirectorySink
 from utils.utilities import Utilities
 
 
@@ -36,21 +38,27 @@ class AnimationExporter:
         output_dir: Directory where exported animations are saved.
         current_version: Version string embedded in file metadata.
         scale_image: Callable used to resize frames before export.
+        output_sink: ``OutputSink`` receiving the encoded animations.
     """
 
-    def __init__(self, output_dir, current_version, scale_image_func):
+    def __init__(self, output_dir, current_version, scale_image_func, output_sink=None):
         """Initialise the exporter with output path and helpers.
 
         Args:
             output_dir: Filesystem path for saved animations.
             current_version: Version string for metadata comments.
             scale_image_func: Callable ``(image, scale) -> image`` for resizing.
+            output_sink: Where encoded animations go; defaults to files
+                written directly under ``output_dir``.
         """
         self.output_dir = output_dir
         self.current_version = current_version
         self.scale_image = scale_image_func
+        self.output_sink = output_sink or DirectorySink(output_dir)
 
-    def save_animations(self, image_tuples, spritesheet_name, animation_name, settings):
+    def save_animations(
+        self, image_tuples, spritesheet_name, animation_name, settings, dedupe=None
+    ):
         """Export an animation from the given frame tuples.
 
         Dispatches to the appropriate format-specific method based on
@@ -61,6 +69,7 @@ class AnimationExporter:
             spritesheet_name: Name of the source spritesheet.
             animation_name: Label for the animation.
             settings: Dict containing fps, delay, scale, format, etc.
+            dedupe: Optional ``FrameDeduper`` over ``image_tuples``.
 
         Returns:
             Number of animations successfully exported (0 or 1).
@@ -81,6 +90,10 @@ class AnimationExporter:
         animation_format = settings.get("animation_format")
 
         images = pad_frames_to_canvas([img[1] for img in image_tuples])
+        # Padding only grows the canvas right/down, so frame boxes still hold
+        bboxes = None
+        if (settings.get("crop_option") or "None").lower() != "none":
+            bboxes = [frame_record_bbox(frame) for frame in image_tuples]
 
         filename = settings.get("filename")
 
@@ -96,12 +109,25 @@ class AnimationExporter:
 
         if animation_format == "GIF":
             self.save_gif(
-                images, filename, fps, delay, period, scale, threshold, settings
+                images,
+                filename,
+                fps,
+                delay,
+                period,
+                scale,
+                threshold,
+                settings,
+                bboxes=bboxes,
+                dedupe=dedupe,
             )
         elif animation_format == "WebP":
-            self.save_webp(images, filename, fps, delay, period, scale, settings)
+            self.save_webp(
+                images, filename, fps, delay, period, scale, settings, bboxes=bboxes
+            )
         elif animation_format == "APNG":
-            self.save_apng(images, filename, fps, delay, period, scale, settings)
+            self.save_apng(
+                images, filename, fps, delay, period, scale, settings, bboxes=bboxes
+            )
 
         anims_generated += 1
         return anims_generated
@@ -115,6 +141,7 @@ class AnimationExporter:
         period,
         scale,
         settings,
+        bboxes=None,
     ):
         """Save frames as a lossless animated WebP.
 
@@ -126,12 +153,14 @@ class AnimationExporter:
             period: Total loop period in ms, or ``None``.
             scale: Scale factor (negative flips horizontally).
             settings: Additional options such as ``crop_option``.
+            bboxes: Known per-frame bounding boxes, or ``None`` to scan.
         """
         final_images = prepare_scaled_sequence(
             images,
             self.scale_image,
             scale,
             settings.get("crop_option"),
+            bboxes,
         )
         if not final_images:
             return
@@ -146,18 +175,22 @@ class AnimationExporter:
         if not durations:
             return
 
-        webp_filename = os.path.join(self.output_dir, f"{filename}.webp")
+        webp_filename = f"{filename}.webp"
 
-        final_images[0].save(
+        self.output_sink.save(
             webp_filename,
-            save_all=True,
-            append_images=final_images[1:],
-            disposal=2,
-            duration=durations,
-            loop=0,
-            lossless=True,
+            lambda file: final_images[0].save(
+                file,
+                format="WEBP",
+                save_all=True,
+                append_images=final_images[1:],
+                disposal=2,
+                duration=durations,
+                loop=0,
+                lossless=True,
+            ),
         )
-        print(f"Saved WEBP animation: {webp_filename}")
+        print(f"Saved WEBP animation: {self.output_sink.describe(webp_filename)}")
 
     def remove_dups(self, animation):
         """Remove duplicate frames from a Wand animation in place.
@@ -198,6 +231,8 @@ class AnimationExporter:
         scale,
         threshold,
         settings,
+        bboxes=None,
+        dedupe=None,
     ):
         """Save frames as an animated GIF using ImageMagick via Wand.
 
@@ -213,6 +248,9 @@ class AnimationExporter:
             scale: Scale factor (negative flips horizontally).
             threshold: Alpha threshold for edge cleanup, or ``None``.
             settings: Additional options such as ``crop_option``.
+            bboxes: Known per-frame bounding boxes, or ``None`` to scan.
+            dedupe: ``FrameDeduper`` over the source frames, reused to
+                group frames that were already known to be identical.
         """
         durations = build_frame_durations(
             len(images),
@@ -232,13 +270,12 @@ class AnimationExporter:
         should_crop = crop_mode != "none"
         crop_bounds = None
         if should_crop:
-            crop_bounds = compute_shared_bbox(frame_arrays)
+            crop_bounds = compute_shared_bbox(frame_arrays, bboxes)
             if crop_bounds is None:
                 should_crop = False
             else:
-                frame_arrays = [
-                    crop_to_bbox(array, crop_bounds) for array in frame_arrays
-                ]
+                # One private (N, H, W, 4) copy of the cropped frames
+                frame_arrays = stack_frames(frame_arrays, crop_bounds)
 
         apply_threshold = should_crop and threshold is not None
         if apply_threshold:
@@ -247,45 +284,36 @@ class AnimationExporter:
             except (TypeError, ValueError):
                 apply_threshold = False
             else:
-                frame_arrays = [
-                    apply_alpha_threshold(array, threshold_value)
-                    for array in frame_arrays
-                ]
+                frame_arrays = apply_alpha_threshold(
+                    frame_arrays, threshold_value, in_place=True
+                )
 
-        dedupe_required = False
-        signature_cache: Optional[Set[int]] = set() if len(images) > 1 else None
+        # Merge runs of identical frames up front, as remove_dups would,
+        # by extending the first frame of each run
+        duplicates = FrameDeduper(frame_arrays, hint=dedupe)
+        dedupe_required = len(images) > 1 and duplicates.has_duplicates()
+        sequence = []
+        for index in range(len(images)):
+            frame_delay = int(durations[index] / 10)
+            if sequence and dedupe_required and duplicates.same(index - 1, index):
+                sequence[-1][1] += frame_delay
+            else:
+                sequence.append([frame_arrays[index], frame_delay])
 
         with WandImg(width=width, height=height) as animation:
             animation.image_remove()
-            for index, frame in enumerate(images):
-                arr = frame_arrays[index]
-                if signature_cache is not None and not dedupe_required:
-                    signature = self._frame_signature(arr)
-                    if signature is None:
-                        print(
-                            "[AnimationExporter] Unable to hash frame data; falling back to duplicate pruning."
-                        )
-                        dedupe_required = True
-                        signature_cache = None
-                    elif signature in signature_cache:
-                        dedupe_required = True
-                        signature_cache = None
-                    else:
-                        signature_cache.add(signature)
+            for arr, frame_delay in sequence:
                 with self._wand_from_array(arr) as wand_frame:
                     wand_frame.background_color = Color("None")
                     wand_frame.alpha_channel = "background"
 
-                    wand_frame.delay = int(durations[index] / 10)
+                    wand_frame.delay = frame_delay
                     wand_frame.dispose = "background"
                     animation.sequence.append(wand_frame)
-            signature_cache = None
-            if dedupe_required:
-                self.remove_dups(animation)
             animation.quantize(
                 number_colors=256, colorspace_type="undefined", dither=False
             )
-            # Removing duplicates after quantization ensures palette changes are accounted for once.
+            # Frames that differed slightly may match once quantized
             if dedupe_required:
                 self.remove_dups(animation)
             for i in range(len(animation.sequence)):
@@ -298,45 +326,13 @@ class AnimationExporter:
                 if scale < 0:
                     animation.flop()
 
-            gif_filename = os.path.join(self.output_dir, f"{filename}.gif")
             animation.loop = 0
             animation.options["comment"] = (
                 f"GIF generated by: TextureAtlas Toolbox v{self.current_version}"
             )
-            animation.save(filename=gif_filename)
-
-    @staticmethod
-    def _frame_signature(frame_array: numpy.ndarray) -> Optional[int]:
-        """Compute a fast fingerprint of a frame for duplicate detection.
-        Uses coarse spatial sampling to avoid hashing entire pixel buffers.
-
-        Args:
-            frame_array: RGBA NumPy array.
-
-        Returns:
-            An integer hash, or ``None`` if the array cannot be processed.
-        """
-        if frame_array.ndim < 2:
-            return None
-
-        try:
-            step_y = max(1, frame_array.shape[0] // 64)
-            step_x = max(1, frame_array.shape[1] // 64)
-            sample = frame_array[::step_y, ::step_x]
-        except Exception:
-            sample = frame_array
-
-        if sample.ndim == 3 and sample.shape[2] > 4:
-            sample = sample[..., :4]
-
-        try:
-            sample = numpy.ascontiguousarray(sample)
-            sample_bytes = sample.tobytes()
-        except Exception:
-            return None
-
-        prefix = sample_bytes[:512]
-        return hash((frame_array.shape, frame_array.dtype.str, prefix))
+            # Encode in place; make_blob("gif") would clone the whole sequence
+            animation.format = "gif"
+            self.output_sink.write(f"{filename}.gif", animation.make_blob())
 
     @staticmethod
     def _wand_from_array(array: numpy.ndarray) -> WandImg:
@@ -360,7 +356,9 @@ class AnimationExporter:
 
         return WandImg.from_array(array)
 
-    def save_apng(self, images, filename, fps, delay, period, scale, settings):
+    def save_apng(
+        self, images, filename, fps, delay, period, scale, settings, bboxes=None
+    ):
         """Save frames as an animated PNG.
 
         Args:
@@ -371,12 +369,14 @@ class AnimationExporter:
             period: Total loop period in ms, or ``None``.
             scale: Scale factor (negative flips horizontally).
             settings: Additional options such as ``crop_option``.
+            bboxes: Known per-frame bounding boxes, or ``None`` to scan.
         """
         final_images = prepare_scaled_sequence(
             images,
             self.scale_image,
             scale,
             settings.get("crop_option"),
+            bboxes,
         )
         if not final_images:
             return
@@ -391,7 +391,7 @@ class AnimationExporter:
         if not durations:
             return
 
-        apng_filename = os.path.join(self.output_dir, f"{filename}.png")
+        apng_filename = f"{filename}.png"
 
         metadata = PngInfo()
         metadata.add_text(
@@ -399,14 +399,17 @@ class AnimationExporter:
             f"APNG generated by TextureAtlas Toolbox v{self.current_version}",
         )
 
-        final_images[0].save(
+        self.output_sink.save(
             apng_filename,
-            save_all=True,
-            append_images=final_images[1:],
-            duration=durations,
-            loop=0,
-            format="PNG",
-            disposal=2,
-            pnginfo=metadata,
+            lambda file: final_images[0].save(
+                file,
+                save_all=True,
+                append_images=final_images[1:],
+                duration=durations,
+                loop=0,
+                format="PNG",
+                disposal=2,
+                pnginfo=metadata,
+            ),
         )
-        print(f"Saved APNG animation: {apng_filename}")
+        print(f"Saved APNG animation: {self.output_sink.describe(apng_filename)}")
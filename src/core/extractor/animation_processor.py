@@ -8,16 +8,17 @@ alignment overrides, injects editor-defined composites, and delegates to
 import os
 from typing import Set
 
-from PIL import Image
-
 from core.extractor.animation_exporter import AnimationExporter
 from core.extractor.frame_exporter import FrameExporter
 from core.extractor.frame_pipeline import FramePipeline
+from core.extractor.frame_buffer import CopyStats, FrameBuffer, share_frame
 from core.extractor.image_utils import (
-    ensure_pil_image,
+    FrameRecord,
+    ensure_rgba_array,
     frame_dimensions,
     scale_image_nearest,
 )
+from core.extractor.output_sink import DirectorySink
 from core.editor.editor_composite import (
     clone_animation_map,
     build_editor_composite_frames,
@@ -41,6 +42,9 @@ class AnimationProcessor:
         spritesheet_label: Display name for the spritesheet.
         frame_exporter: ``FrameExporter`` instance for static frames.
         animation_exporter: ``AnimationExporter`` instance for animations.
+        output_sink: ``OutputSink`` both exporters write to.
+        copy_stats: Pixel bytes copied and shared by composites and
+            alignment overrides during this export.
     """
 
     def __init__(
@@ -51,6 +55,7 @@ class AnimationProcessor:
         settings_manager,
         current_version,
         spritesheet_label=None,
+        output_sink=None,
     ):
         """Initialise the processor and inject editor composites.
 
@@ -61,6 +66,8 @@ class AnimationProcessor:
             settings_manager: Settings provider for export options.
             current_version: Version string embedded in output metadata.
             spritesheet_label: Optional display name; defaults to atlas filename.
+            output_sink: Where exported files go; defaults to files written
+                directly under ``output_dir``. The caller closes it.
         """
         base_animations = clone_animation_map(animations)
         self._source_frames = clone_animation_map(base_animations)
@@ -70,14 +77,23 @@ class AnimationProcessor:
         self.settings_manager = settings_manager
         self.current_version = current_version
         self.spritesheet_label = spritesheet_label or os.path.split(self.atlas_path)[1]
+        self.output_sink = output_sink or DirectorySink(self.output_dir)
+        # The exporters batch frames when handed ``scale_image_nearest`` itself
         self.frame_exporter = FrameExporter(
-            self.output_dir, self.current_version, self.scale_image
+            self.output_dir,
+            self.current_version,
+            scale_image_nearest,
+            self.output_sink,
         )
         self.animation_exporter = AnimationExporter(
-            self.output_dir, self.current_version, self.scale_image
+            self.output_dir,
+            self.current_version,
+            scale_image_nearest,
+            self.output_sink,
         )
         self._frame_pipeline = FramePipeline()
         self._editor_composite_names: Set[str] = set()
+        self.copy_stats = CopyStats()
         self._inject_editor_composites()
 
     def process_animations(self, is_unknown_spritesheet=False):
@@ -147,7 +163,11 @@ class AnimationProcessor:
                 and animation_format != "None"
             ):
                 anims_generated += self.animation_exporter.save_animations(
-                    context.frames, spritesheet_name, animation_name, settings
+                    context.frames,
+                    spritesheet_name,
+                    animation_name,
+                    settings,
+                    dedupe=context.dedupe,
                 )
 
         return frames_generated, anims_generated
@@ -169,6 +189,7 @@ class AnimationProcessor:
                 definition,
                 self._source_frames,
                 log_warning=lambda message: print(message),
+                copy_stats=self.copy_stats,
             )
             if not frames:
                 continue
@@ -244,8 +265,8 @@ class AnimationProcessor:
             canvas_height = max(heights) if heights else 1
 
         adjusted = []
-        for name, frame_image, metadata in image_tuples:
-            frame_image = ensure_pil_image(frame_image)
+        for frame in image_tuples:
+            name, frame_image, metadata = frame
             offset_data = frames_map.get(name, {})
             offset_x = int(offset_data.get("x", default_x))
             offset_y = int(offset_data.get("y", default_y))
@@ -254,19 +275,65 @@ class AnimationProcessor:
                 offset_x, offset_y = fnf_override
             offset_x += translate_x
             offset_y += translate_y
-            canvas_image = Image.new("RGBA", (canvas_width, canvas_height))
+            frame_width, frame_height = frame_dimensions(frame_image)
             if top_left_origin:
                 target_x = offset_x
                 target_y = offset_y
             else:
                 # Anchor around the center so offsets nudge relative to the origin crosshair
-                target_x = (canvas_width - frame_image.width) // 2 + offset_x
-                target_y = (canvas_height - frame_image.height) // 2 + offset_y
-            canvas_image.paste(frame_image, (target_x, target_y), frame_image)
-            adjusted.append((name, canvas_image, metadata))
+                target_x = (canvas_width - frame_width) // 2 + offset_x
+                target_y = (canvas_height - frame_height) // 2 + offset_y
+            adjusted.append(
+                self._place_on_canvas(
+                    frame, canvas_width, canvas_height, target_x, target_y
+                )
+            )
 
         return adjusted
 
+    def _place_on_canvas(self, frame, canvas_width, canvas_height, x, y):
+        """Return ``frame`` placed at ``(x, y)`` on a transparent canvas.
+
+        A frame that already fills the canvas at the origin is shared as a
+        read-only view; otherwise only the visible part is copied onto a new
+        canvas. Either way the source pixels are left untouched.
+
+        Args:
+            frame: ``(name, image, metadata)`` tuple.
+            canvas_width: Width of the target canvas.
+            canvas_height: Height of the target canvas.
+            x: Left edge of the frame on the canvas; may be negative.
+            y: Top edge of the frame on the canvas; may be negative.
+
+        Returns:
+            ``FrameRecord`` whose bounding box is searched only within the
+            pasted area.
+        """
+        name, frame_image, metadata = frame
+        pixels = ensure_rgba_array(frame_image)
+        frame_height, frame_width = pixels.shape[:2]
+
+        if (x, y, frame_width, frame_height) == (0, 0, canvas_width, canvas_height):
+            shared = share_frame(pixels, self.copy_stats)
+            if isinstance(frame, FrameRecord):
+                return frame.with_image(shared)
+            return FrameRecord(name, shared, metadata)
+
+        canvas = FrameBuffer.blank(canvas_width, canvas_height, self.copy_stats)
+        left, top = max(0, x), max(0, y)
+        right = min(canvas_width, x + frame_width)
+        bottom = min(canvas_height, y + frame_height)
+        if right <= left or bottom <= top:
+            return FrameRecord(name, canvas.view(), metadata, bbox=None)
+
+        canvas.writable()[top:bottom, left:right] = pixels[
+            top - y : bottom - y, left - x : right - x
+        ]
+        # Everything outside the pasted area is transparent
+        return FrameRecord(
+            name, canvas.view(), metadata, content_rect=(left, top, right, bottom)
+        )
+
     def scale_image(self, img, size):
         """Scale an image using nearest-neighbour interpolation.
 
@@ -6,7 +6,6 @@ unified parser registry for metadata parsing with full error handling.
 
 from __future__ import annotations
 
-import re
 from typing import Any, Dict, List, Optional, Tuple
 
 from PIL import Image
@@ -17,8 +16,8 @@ from PIL import Image
 class AtlasProcessor:
     """Open a texture atlas and parse sprite metadata.
 
-    Uses the unified ParserRegistry for format detection and parsing.
-    For unknown spritesheets (no metadata or image-only paths),
+    Uses the unified ParserRegistry for format detection and parsing,
+    through the shared ``MetadataCache``. For unknown spritesheets (no metadata or image-only paths),
     falls back to heuristic sprite detection.
 
     Attributes:
@@ -26,7 +25,7 @@ class AtlasProcessor:
         metadata_path: Filesystem path to the metadata file, or ``None``.
         parent_window: Optional parent widget for progress dialogs.
         atlas: The opened PIL ``Image``, or ``None`` on failure.
-        sprites: List of parsed sprite dicts.
+        sprites: Parsed sprites, a list of dicts or a ``SpriteTable``.
         parse_result: Full ParseResult with warnings and errors.
     """
 
@@ -48,6 +47,7 @@ class AtlasProcessor:
         self.metadata_path = metadata_path
         self.parent_window = parent_window
         self.parse_result: Optional[Any] = None  # Will be ParseResult
+        self._sprite_index: Optional[Any] = None  # AnimationNameIndex of sprites
         self.atlas, self.sprites = self.open_atlas_and_parse_metadata()
 
     def open_atlas_and_parse_metadata(
@@ -67,8 +67,9 @@ class AtlasProcessor:
             ParserError: If the metadata file cannot be parsed.
         """
         # Lazy imports to avoid circular dependencies
-        from parsers.parser_registry import ParserRegistry
+        from parsers.metadata_cache import MetadataCache
         from parsers.parser_types import ParseResult, ParserError, ParserErrorCode
+        from parsers.sprite_table import SpriteTable
         from parsers.unknown_parser import UnknownParser
 
         atlas: Optional[Image.Image] = None
@@ -91,16 +92,15 @@ class AtlasProcessor:
                 atlas = processed_atlas
             return atlas, sprites
 
-        # Use unified parser registry
+        # Use unified parser registry; the Extract tab may have parsed it already
         try:
-            # Initialize registry if needed
-            if not ParserRegistry._all_parsers:
-                ParserRegistry.initialize()
-
-            self.parse_result = ParserRegistry.parse_file(self.metadata_path)
+            self.parse_result = MetadataCache.parse(self.metadata_path)
 
             if self.parse_result.is_valid:
-                sprites = list(self.parse_result.sprites)
+                # Tables are never mutated, so they are shared as they are
+                sprites = self.parse_result.sprites
+                if not isinstance(sprites, SpriteTable):
+                    sprites = list(sprites)
 
                 # Log any warnings
                 for warning in self.parse_result.warnings:
@@ -207,22 +207,32 @@ class AtlasProcessor:
 
         Args:
             animation_name: Animation prefix to filter by.
-            sprites: List of all sprites.
+            sprites: List of all sprites, or a ``SpriteTable``.
 
         Returns:
             Filtered list of matching sprites.
         """
-        anim_patterns = self._get_animation_patterns(animation_name)
+        matches = self._name_index(sprites).match_animation(animation_name)
+        return [sprites[index] for index in matches.tolist()]
+
+    def _name_index(self, sprites) -> Any:
+        """Return the animation-name index for ``sprites``.
+
+        Tables carry their own; the index of ``self.sprites`` is kept for
+        the lifetime of this processor.
+        """
+        from parsers.animation_index import AnimationNameIndex
+        from parsers.sprite_table import SpriteTable
 
-        animation_sprites = []
-        for sprite in sprites:
-            sprite_name = sprite.get("name", "")
-            for pattern in anim_patterns:
-                if sprite_name == pattern or sprite_name.startswith(pattern):
-                    animation_sprites.append(sprite)
-                    break
+        if isinstance(sprites, SpriteTable):
+            return sprites.name_index
+        if sprites is self.sprites and self._sprite_index is not None:
+            return self._sprite_index
 
-        return animation_sprites
+        index = AnimationNameIndex([sprite.get("name", "") for sprite in sprites])
+        if sprites is self.sprites:
+            self._sprite_index = index
+        return index
 
     @staticmethod
     def _get_animation_patterns(animation_name: str) -> List[str]:
@@ -234,19 +244,15 @@ class AtlasProcessor:
         Returns:
             List of patterns to match against sprite names.
         """
-        patterns = [
-            animation_name,
-            re.sub(r"\d+$", "", animation_name),
-            re.sub(r"_?\d+$", "", animation_name),
-            re.sub(r"[-_]?\d+$", "", animation_name),
-        ]
-        return list(dict.fromkeys(patterns))
+        from parsers.animation_index import AnimationNameIndex
+
+        return AnimationNameIndex.animation_patterns(animation_name)
 
     def parse_xml_for_preview(self, animation_name: str) -> List[Dict[str, Any]]:
         """Parse XML metadata for a single animation's sprites.
 
-        Only extracts sprites whose names match ``animation_name``, reducing
-        memory and processing time for preview generation.
+        Streams the file and only builds sprite dicts for names matching
+        ``animation_name``; the full element tree is never held in memory.
 
         Args:
             animation_name: Animation prefix to filter by.
@@ -258,42 +264,16 @@ class AtlasProcessor:
             return []
 
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(self.metadata_path)
-            xml_root = tree.getroot()
-
-            anim_patterns = self._get_animation_patterns(animation_name)
-
-            animation_sprites = []
-            for sprite in xml_root.findall("SubTexture"):
-                sprite_name = sprite.get("name", "")
-                is_match = False
-                for pattern in anim_patterns:
-                    if sprite_name == pattern or sprite_name.startswith(pattern):
-                        is_match = True
-                        break
-
-                if is_match:
-                    sprite_data = {
-                        "name": sprite_name,
-                        "x": int(sprite.get("x", 0)),
-                        "y": int(sprite.get("y", 0)),
-                        "width": int(sprite.get("width", 0)),
-                        "height": int(sprite.get("height", 0)),
-                        "frameX": int(sprite.get("frameX", 0)),
-                        "frameY": int(sprite.get("frameY", 0)),
-                        "frameWidth": int(
-                            sprite.get("frameWidth", sprite.get("width", 0))
-                        ),
-                        "frameHeight": int(
-                            sprite.get("frameHeight", sprite.get("height", 0))
-                        ),
-                        "rotated": sprite.get("rotated", "false") == "true",
-                    }
-                    animation_sprites.append(sprite_data)
-
-            return animation_sprites
+            from parsers.xml_parser import XmlParser
+
+            anim_patterns = tuple(self._get_animation_patterns(animation_name))
+            # str.startswith also covers the exact-name case
+            return list(
+                XmlParser.iter_sprites(
+                    self.metadata_path,
+                    name_filter=lambda name: name.startswith(anim_patterns),
+                )
+            )
 
         except Exception as e:
             print(f"Error parsing XML for animation {animation_name}: {e}")
@@ -0,0 +1,308 @@
+"""Cached discovery of spritesheets and their metadata in an input folder.
+
+Provides ``DirectoryIndex``, which walks an input directory once with
+``os.scandir`` and pairs every atlas image with its metadata using the
+in-memory directory listings, and ``SpritesheetEntry``, one discovered
+spritesheet.
+
+Listings are persisted per directory together with the directory's mtime.
+A directory whose mtime is unchanged is not listed again, so reopening a
+folder costs one ``stat`` per directory instead of a listing plus several
+``exists()`` checks per image. Spritemap symbol maps are cached against the
+``Animation.json`` mtime and size.
+
+The rules match the original glob-based discovery:
+
+    root directory:    every PNG, with ``<stem>.xml``/``<stem>.txt`` or an
+                       ``Animation.json`` + ``<stem>.json`` spritemap
+    nested directories: only PNGs forming a spritemap project
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from core.extractor.spritemap.metadata import build_symbol_map
+
+INDEXED_EXTENSIONS = (".png", ".xml", ".txt", ".json")
+
+
+@dataclass
+class SpritesheetEntry:
+    """One spritesheet found by ``DirectoryIndex``.
+
+    Attributes:
+        display_name: Path relative to the indexed root, using ``/``.
+        image_path: Absolute path of the atlas image.
+        data_files: Metadata in the same shape as ``data_dict`` entries:
+            optional ``xml``/``txt`` paths and a ``spritemap`` info dict.
+    """
+
+    display_name: str
+    image_path: str
+    data_files: Dict[str, object] = field(default_factory=dict)
+
+
+def _default_cache_path() -> str:
+    """Store the index next to ``app_config.cfg``."""
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "..", "directory_index.json")
+    )
+
+
+class DirectoryIndex:
+    """Incremental, persisted index of the spritesheets below a directory.
+
+    The persisted file is shared by every indexed root and guarded by a
+    class-level lock, like the parser and exporter registries.
+
+    Class Attributes:
+        max_roots: Input directories kept in the persisted file.
+
+    Attributes:
+        root: Absolute path of the indexed directory.
+        cache_path: JSON file holding the persisted listings.
+        filter_single_frame: Passed to ``build_symbol_map``.
+    """
+
+    max_roots: int = 8
+    _file_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: str,
+        cache_path: Optional[str] = None,
+        filter_single_frame: bool = True,
+    ) -> None:
+        """Prepare an index for ``root``; nothing is read until ``scan``.
+
+        Args:
+            root: Directory to index.
+            cache_path: Persisted index file; defaults to
+                ``directory_index.json`` next to the app config.
+            filter_single_frame: Skip single-frame spritemap symbols.
+        """
+        self.root = os.path.abspath(root)
+        self.cache_path = cache_path or _default_cache_path()
+        self.filter_single_frame = filter_single_frame
+
+        self._directories: Dict[str, dict] = {}
+        self._symbol_maps: Dict[str, dict] = {}
+        self.listed_directories = 0  # Directories read with scandir in this scan
+
+    @property
+    def indexed_directories(self) -> int:
+        """Directories visited by the last scan."""
+        return len(self._directories)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+    def scan(
+        self, cancelled: Optional[Callable[[], bool]] = None
+    ) -> Iterator[List[SpritesheetEntry]]:
+        """Walk the tree and yield the spritesheets of each directory.
+
+        Batches come root first, then nested directories depth-first in name
+        order. The persisted index is updated when the walk completes.
+
+        Args:
+            cancelled: Polled between directories; the walk stops (without
+                saving) when it returns ``True``.
+
+        Yields:
+            Non-empty lists of ``SpritesheetEntry`` per directory.
+        """
+        is_cancelled = cancelled or (lambda: False)
+        previous = self._load()
+        previous_directories = previous.get("directories", {})
+        previous_symbol_maps = previous.get("symbol_maps", {})
+        self._directories = {}
+        self._symbol_maps = {}
+        self.listed_directories = 0
+
+        if not os.path.isdir(self.root):
+            return
+
+        pending = [""]
+        while pending:
+            if is_cancelled():
+                return
+            relative = pending.pop()
+            listing = self._directory_listing(relative, previous_directories)
+            if listing is None:
+                continue
+
+            entries = self._pair_directory(relative, listing, previous_symbol_maps)
+            if entries:
+                yield entries
+
+            # Reversed so the stack pops subdirectories in name order
+            for name in reversed(listing["dirs"]):
+                pending.append(f"{relative}/{name}" if relative else name)
+
+        self._save()
+
+    def _directory_listing(
+        self, relative: str, previous_directories: Dict[str, dict]
+    ) -> Optional[dict]:
+        """Return ``{"mtime", "files", "dirs"}`` for a directory.
+
+        The persisted listing is reused when the directory mtime matches.
+        """
+        path = os.path.join(self.root, relative) if relative else self.root
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = previous_directories.get(relative)
+        if cached is not None and cached.get("mtime") == mtime:
+            self._directories[relative] = cached
+            return cached
+
+        files: List[str] = []
+        dirs: List[str] = []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif os.path.normcase(entry.name).endswith(INDEXED_EXTENSIONS):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as exc:
+            print(f"[DirectoryIndex] Could not list {path}: {exc}")
+            return None
+
+        self.listed_directories += 1
+        listing = {"mtime": mtime, "files": sorted(files), "dirs": sorted(dirs)}
+        self._directories[relative] = listing
+        return listing
+
+    def _pair_directory(
+        self,
+        relative: str,
+        listing: dict,
+        previous_symbol_maps: Dict[str, dict],
+    ) -> List[SpritesheetEntry]:
+        """Pair the images of one directory with their metadata files."""
+        directory = os.path.join(self.root, relative) if relative else self.root
+        names = set(listing["files"])
+        has_animation_json = "Animation.json" in names
+        entries: List[SpritesheetEntry] = []
+
+        for name in listing["files"]:
+            if not os.path.normcase(name).endswith(".png"):
+                continue
+            stem = os.path.splitext(name)[0]
+            is_spritemap = has_animation_json and f"{stem}.json" in names
+            if relative and not is_spritemap:
+                continue
+
+            data_files: Dict[str, object] = {}
+            if f"{stem}.xml" in names:
+                data_files["xml"] = os.path.join(directory, f"{stem}.xml")
+            if f"{stem}.txt" in names:
+                data_files["txt"] = os.path.join(directory, f"{stem}.txt")
+            if is_spritemap:
+                animation_json = os.path.join(directory, "Animation.json")
+                data_files["spritemap"] = {
+                    "type": "spritemap",
+                    "animation_json": animation_json,
+                    "spritemap_json": os.path.join(directory, f"{stem}.json"),
+                    "symbol_map": self._symbol_map(
+                        animation_json, previous_symbol_maps
+                    ),
+                }
+
+            entries.append(
+                SpritesheetEntry(
+                    display_name=f"{relative}/{name}" if relative else name,
+                    image_path=os.path.join(directory, name),
+                    data_files=data_files,
+                )
+            )
+        return entries
+
+    def _symbol_map(
+        self, animation_json_path: str, previous_symbol_maps: Dict[str, dict]
+    ) -> dict:
+        """Return the symbol map of a spritemap project, parsing it at most once."""
+        cached = self._symbol_maps.get(animation_json_path)
+        if cached is not None:
+            return cached["symbol_map"]
+
+        try:
+            stat = os.stat(animation_json_path)
+            stamp = [stat.st_mtime_ns, stat.st_size, self.filter_single_frame]
+        except OSError:
+            stamp = None
+
+        cached = previous_symbol_maps.get(animation_json_path)
+        if stamp is not None and cached is not None and cached.get("stamp") == stamp:
+            self._symbol_maps[animation_json_path] = cached
+            return cached["symbol_map"]
+
+        symbol_map: dict = {}
+        try:
+            with open(animation_json_path, "r", encoding="utf-8") as animation_file:
+                symbol_map = build_symbol_map(
+                    json.load(animation_file), self.filter_single_frame
+                )
+        except Exception as exc:
+            print(
+                f"Error parsing spritemap animation metadata {animation_json_path}: {exc}"
+            )
+            stamp = None  # Retry on the next scan
+
+        if stamp is not None:
+            self._symbol_maps[animation_json_path] = {
+                "stamp": stamp,
+                "symbol_map": symbol_map,
+            }
+        return symbol_map
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _read_file(self) -> Dict[str, dict]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load(self) -> dict:
+        """Return the persisted record for this root, or an empty one."""
+        with self._file_lock:
+            record = self._read_file().get(self.root)
+        return record if isinstance(record, dict) else {}
+
+    def _save(self) -> None:
+        """Persist this scan, keeping the most recently indexed roots."""
+        record = {
+            "directories": self._directories,
+            "symbol_maps": self._symbol_maps,
+        }
+        with self._file_lock:
+            data = self._read_file()
+            data.pop(self.root, None)
+            data[self.root] = record
+            for stale_root in list(data)[: -self.max_roots]:
+                del data[stale_root]
+            try:
+                with open(self.cache_path, "w", encoding="utf-8") as index_file:
+                    json.dump(data, index_file)
+            except OSError as exc:
+                print(f"[DirectoryIndex] Could not save {self.cache_path}: {exc}")
+
+
+__all__ = ["DirectoryIndex", "SpritesheetEntry"]
@@ -19,7 +19,7 @@ import time
 from pathlib import Path
 from queue import SimpleQueue, Empty
 from threading import Event, Lock
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from PySide6.QtCore import QCoreApplication, QThread, Signal
 
@@ -27,7 +27,8 @@ from PySide6.QtCore import QCoreApplication, QThread, Signal
 from core.extractor.atlas_processor import AtlasProcessor
 from core.extractor.sprite_processor import SpriteProcessor
 from core.extractor.animation_processor import AnimationProcessor
-from core.extractor.preview_generator import PreviewGenerator
+from core.extractor.output_sink import OutputSink, create_output_sink
+from core.extractor.preview_generator import PreviewAnimation, PreviewGenerator
 from core.extractor.spritemap import AdobeSpritemapRenderer
 from core.extractor.unknown_spritesheet_handler import UnknownSpritesheetHandler
 from utils.utilities import Utilities
@@ -233,6 +234,34 @@ class Extractor:
             cpu_threads = max(1, os.cpu_count() // 2)
         return cpu_threads
 
+    def _create_output_sink(self, output_dir: str) -> OutputSink:
+        """Build the sink for one spritesheet from the ``export_output`` config.
+
+        Args:
+            output_dir (str): The spritesheet's output folder.
+
+        Returns:
+            OutputSink: A new sink; plain files written in the calling
+            thread unless the configuration says otherwise.
+        """
+        options = {}
+        if self.app_config:
+            options = self.app_config.settings.get("export_output", {}) or {}
+        try:
+            writer_threads = int(options.get("writer_threads", 0) or 0)
+        except (ValueError, TypeError):
+            writer_threads = 0
+        try:
+            return create_output_sink(
+                output_dir,
+                options.get("sink", "directory"),
+                writer_threads,
+                bool(options.get("fsync", False)),
+            )
+        except ValueError as exc:
+            print(f"[Extractor] {exc}; writing plain files instead")
+            return create_output_sink(output_dir)
+
     @staticmethod
     def _determine_worker_budget(cpu_threads, file_count):
         """Return the smaller of available threads and pending files.
@@ -561,6 +590,8 @@ class Extractor:
             print(
                 f"[_apply_stats_update] Totals: {stats_snapshot[0]} frames, {stats_snapshot[1]} anims, {stats_snapshot[2]} failed"
             )
+            if update.get("debug_message"):
+                print(f"[_apply_stats_update] {update['debug_message']}")
 
         if self.statistics_callback:
             self.statistics_callback(*stats_snapshot)
@@ -711,6 +742,12 @@ class Extractor:
             frames_added = result.get("frames_generated", 0)
             anims_added = result.get("anims_generated", 0)
             failed_added = result.get("sprites_failed", 0)
+            if "bytes_copied" in result:
+                debug_message = (
+                    f"{Path(filename).name}: "
+                    f"{result['bytes_copied'] / 2**20:.2f} MiB of frame pixels copied, "
+                    f"{result.get('bytes_shared', 0) / 2**20:.2f} MiB shared"
+                )
         else:
             failed_added = 1
 
@@ -794,22 +831,26 @@ class Extractor:
                 atlas_processor.atlas, atlas_processor.sprites
             )
             animations = sprite_processor.process_sprites()
-            animation_processor = AnimationProcessor(
-                animations,
-                atlas_path,
-                output_dir,
-                self.settings_manager,
-                self.current_version,
-                spritesheet_label=spritesheet_label,
-            )
+            with self._create_output_sink(output_dir) as output_sink:
+                animation_processor = AnimationProcessor(
+                    animations,
+                    atlas_path,
+                    output_dir,
+                    self.settings_manager,
+                    self.current_version,
+                    spritesheet_label=spritesheet_label,
+                    output_sink=output_sink,
+                )
 
-            frames_generated, anims_generated = animation_processor.process_animations(
-                is_unknown_spritesheet
-            )
+                frames_generated, anims_generated = (
+                    animation_processor.process_animations(is_unknown_spritesheet)
+                )
             return {
                 "frames_generated": frames_generated,
                 "anims_generated": anims_generated,
                 "sprites_failed": sprites_failed,
+                "bytes_copied": animation_processor.copy_stats.bytes_copied,
+                "bytes_shared": animation_processor.copy_stats.bytes_shared,
             }
 
         except Exception as general_error:
@@ -873,19 +914,25 @@ class Extractor:
                     "sprites_failed": 0,
                 }
 
-            animation_processor = AnimationProcessor(
-                animations,
-                atlas_path,
-                output_dir,
-                self.settings_manager,
-                self.current_version,
-                spritesheet_label=spritesheet_name,
-            )
-            frames_generated, anims_generated = animation_processor.process_animations()
+            with self._create_output_sink(output_dir) as output_sink:
+                animation_processor = AnimationProcessor(
+                    animations,
+                    atlas_path,
+                    output_dir,
+                    self.settings_manager,
+                    self.current_version,
+                    spritesheet_label=spritesheet_name,
+                    output_sink=output_sink,
+                )
+                frames_generated, anims_generated = (
+                    animation_processor.process_animations()
+                )
             return {
                 "frames_generated": frames_generated,
                 "anims_generated": anims_generated,
                 "sprites_failed": 0,
+                "bytes_copied": animation_processor.copy_stats.bytes_copied,
+                "bytes_shared": animation_processor.copy_stats.bytes_shared,
             }
         except Exception as exc:
             sprites_failed += 1
@@ -932,6 +979,75 @@ class Extractor:
             spritesheet_label=spritesheet_label,
         )
 
+    def generate_preview_frames(
+        self,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        settings: Dict[str, Any],
+        animation_name: str,
+        spritemap_info: Optional[Dict[str, Any]] = None,
+        spritesheet_label: Optional[str] = None,
+    ) -> Optional[PreviewAnimation]:
+        """Prepare in-memory preview frames without encoding a file.
+
+        Delegates to ``PreviewGenerator.generate_preview_frames``.
+
+        Args:
+            atlas_path: Path to the source atlas.
+            metadata_path: Path to metadata, or ``None`` for unknown sheets.
+            settings: Export options dict.
+            animation_name: Name of the animation to preview.
+            spritemap_info: Optional Adobe spritemap project info.
+            spritesheet_label: Friendly display name.
+
+        Returns:
+            Prepared ``PreviewAnimation``, or ``None`` on failure.
+        """
+        return self.preview_generator.generate_preview_frames(
+            atlas_path,
+            metadata_path,
+            settings,
+            animation_name,
+            spritemap_info=spritemap_info,
+            spritesheet_label=spritesheet_label,
+        )
+
+    def iter_preview_frames(
+        self,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        settings: Dict[str, Any],
+        animation_name: str,
+        spritemap_info: Optional[Dict[str, Any]] = None,
+        spritesheet_label: Optional[str] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[Tuple[int, int, Any]]:
+        """Yield preview frames as they are prepared, for progressive display.
+
+        Delegates to ``PreviewGenerator.iter_preview_frames``.
+
+        Args:
+            atlas_path: Path to the source atlas.
+            metadata_path: Path to metadata, or ``None`` for unknown sheets.
+            settings: Export options dict.
+            animation_name: Name of the animation to preview.
+            spritemap_info: Optional Adobe spritemap project info.
+            spritesheet_label: Friendly display name.
+            cancelled: Polled between frames to stop early.
+
+        Yields:
+            ``(index, total, frame)`` tuples.
+        """
+        return self.preview_generator.iter_preview_frames(
+            atlas_path,
+            metadata_path,
+            settings,
+            animation_name,
+            spritemap_info=spritemap_info,
+            spritesheet_label=spritesheet_label,
+            cancelled=cancelled,
+        )
+
     def _handle_unknown_spritesheets_background_detection(
         self,
         input_dir: str,
@@ -1062,7 +1178,8 @@ class FileProcessorWorker(QThread):
             animation_json_path = atlas_dir / "Animation.json"
             spritemap_json_path = atlas_dir / f"{base_filename}.json"
 
-            os.makedirs(sprite_output_dir, exist_ok=True)
+            # Output sinks create folders as they write, and archive sinks
+            # write a single file next to where this folder would be
             sprite_output_dir = str(sprite_output_dir)
 
             has_animation_project = (
@@ -0,0 +1,131 @@
+"""Copy-on-write access to frame pixels.
+
+Frames produced by ``SpriteProcessor`` are slices of one atlas array, and
+editor composites and alignment overrides reuse those frames. Copying them
+defensively costs a full frame per reference; writing into them without a
+copy would change the atlas and every other frame sharing it.
+
+``FrameBuffer`` hands out read-only views of the source pixels and makes a
+private copy only the first time ``writable()`` is called. Copies are
+counted in a ``CopyStats`` so an export can report how many bytes it
+actually duplicated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from core.extractor.image_utils import FrameSource, ensure_rgba_array
+
+
+@dataclass
+class CopyStats:
+    """Bytes copied and shared while preparing frames for one export.
+
+    Attributes:
+        bytes_copied: Pixel bytes duplicated into private buffers.
+        copies: Number of private buffers created.
+        bytes_shared: Pixel bytes handed out as views instead of copies.
+    """
+
+    bytes_copied: int = 0
+    copies: int = 0
+    bytes_shared: int = 0
+
+    def record_copy(self, nbytes: int) -> None:
+        self.bytes_copied += int(nbytes)
+        self.copies += 1
+
+    def record_share(self, nbytes: int) -> None:
+        self.bytes_shared += int(nbytes)
+
+
+def readonly_view(array: np.ndarray) -> np.ndarray:
+    """Return a view of ``array`` that cannot be written through.
+
+    The flag only applies to the view, so the owner of ``array`` can still
+    write to it; everyone holding the view gets an error instead of
+    silently modifying shared pixels.
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class FrameBuffer:
+    """Pixels of one frame, shared until someone needs to write.
+
+    Attributes:
+        stats: Optional ``CopyStats`` charged for copies and shares.
+    """
+
+    __slots__ = ("_array", "_private", "stats")
+
+    def __init__(self, source: FrameSource, stats: Optional[CopyStats] = None):
+        """Wrap a frame without copying it.
+
+        Args:
+            source: PIL image or RGBA NumPy array. PIL images are converted
+                once; arrays are used as they are.
+            stats: Optional counters for this export.
+        """
+        self._array = ensure_rgba_array(source)
+        # Converting a PIL image already produced a copy nobody else holds
+        self._private = not isinstance(source, np.ndarray)
+        self.stats = stats
+        if self._private and stats is not None:
+            stats.record_copy(self._array.nbytes)
+
+    @classmethod
+    def blank(
+        cls, width: int, height: int, stats: Optional[CopyStats] = None
+    ) -> "FrameBuffer":
+        """Return a private, fully transparent buffer of the given size."""
+        buffer = cls(np.zeros((height, width, 4), dtype=np.uint8))
+        buffer._private = True
+        buffer.stats = stats
+        if stats is not None:
+            stats.record_copy(buffer.nbytes)
+        return buffer
+
+    @property
+    def shape(self):
+        return self._array.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self._array.nbytes
+
+    @property
+    def is_private(self) -> bool:
+        """True once the buffer owns a copy nobody else can see."""
+        return self._private
+
+    def view(self) -> np.ndarray:
+        """Return a read-only view of the pixels.
+
+        Views of a shared buffer are charged to ``stats`` as shared bytes.
+        """
+        if self.stats is not None and not self._private:
+            self.stats.record_share(self._array.nbytes)
+        return readonly_view(self._array)
+
+    def writable(self) -> np.ndarray:
+        """Return an array that may be modified, copying it the first time."""
+        if not self._private:
+            self._array = np.array(self._array, dtype=np.uint8, order="C")
+            self._private = True
+            if self.stats is not None:
+                self.stats.record_copy(self._array.nbytes)
+        return self._array
+
+
+def share_frame(source: FrameSource, stats: Optional[CopyStats] = None):
+    """Return a read-only view of a frame's pixels for reuse elsewhere."""
+    return FrameBuffer(source, stats).view()
+
+
+__all__ = ["CopyStats", "FrameBuffer", "readonly_view", "share_frame"]
@@ -0,0 +1,202 @@
+"""Exact duplicate detection for frame sequences.
+
+Frame selection ("No duplicates", single-frame detection) and GIF export
+all need to know which frames of an animation are identical. Hashing a
+sparse sample of each frame is cheap but can merge frames that differ
+outside the sample; comparing every frame's bytes against every other
+frame is exact but slow.
+
+``FrameDeduper`` does both in two tiers:
+
+    1. a fingerprint per frame (shape and a hash of a sampled pixel grid)
+       sorts frames into buckets; frames in different buckets can never be
+       equal
+    2. frames in the same bucket are confirmed with an exact array compare
+
+Fingerprints and groups are computed lazily and at most once per frame.
+A deduper built over prepared frames (cropped, thresholded) can take the
+deduper of the source frames as a ``hint``: frames that were identical
+before a per-frame transform are still identical after it, so they are
+grouped without being looked at again.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+from core.extractor.image_utils import FrameSource, ensure_rgba_array
+
+# Samples per axis for the bucket fingerprint
+SAMPLE_GRID = 32
+
+
+class FrameDeduper:
+    """Groups identical frames of one sequence.
+
+    Attributes:
+        images: Frames being compared, as given (PIL images, arrays or one
+            ``(N, H, W, C)`` stack).
+    """
+
+    def __init__(
+        self,
+        images: Sequence[FrameSource],
+        *,
+        hint: Optional["FrameDeduper"] = None,
+    ) -> None:
+        """Prepare to compare ``images``; nothing is read until asked.
+
+        Args:
+            images: Frames to compare.
+            hint: Deduper over the frames ``images`` were derived from, one
+                to one. Used only if it already grouped its frames.
+        """
+        self.images = images
+        self._hint = hint if hint is not None and len(hint) == len(images) else None
+        self._arrays: Dict[int, np.ndarray] = {}
+        self._fingerprints: Dict[int, Hashable] = {}
+        self._canonical: Optional[List[int]] = None
+
+    @classmethod
+    def from_frames(cls, frames: Sequence) -> "FrameDeduper":
+        """Return a deduper over the images of ``(name, image, metadata)`` tuples."""
+        return cls([frame[1] for frame in frames])
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    # ------------------------------------------------------------------
+    # Tier 1: fingerprints
+    # ------------------------------------------------------------------
+    def _array(self, index: int) -> np.ndarray:
+        array = self._arrays.get(index)
+        if array is None:
+            array = ensure_rgba_array(self.images[index])
+            self._arrays[index] = array
+        return array
+
+    def fingerprint(self, index: int) -> Hashable:
+        """Return the bucket key of a frame; equal frames have equal keys."""
+        fingerprint = self._fingerprints.get(index)
+        if fingerprint is None:
+            if isinstance(self.images, np.ndarray) and self.images.ndim == 4:
+                self._fingerprint_stack()
+                return self._fingerprints[index]
+            array = self._array(index)
+            # Only pixel-derived values: a key that depends on how the frame
+            # was passed in would split identical frames across buckets
+            fingerprint = (array.shape, hash(_sample_grid(_packed(array)).tobytes()))
+            self._fingerprints[index] = fingerprint
+        return fingerprint
+
+    def _fingerprint_stack(self) -> None:
+        """Fingerprint every frame of a stack with one sampling pass."""
+        stack = self.images
+        samples = _sample_grid(_packed(stack), first_axis=1)
+        shape = stack.shape[1:]
+        for index, sample in enumerate(samples):
+            self._fingerprints[index] = (shape, hash(sample.tobytes()))
+
+    # ------------------------------------------------------------------
+    # Tier 2: exact confirmation
+    # ------------------------------------------------------------------
+    def same(self, first: int, second: int) -> bool:
+        """Return True if two frames hold identical pixels."""
+        if self._canonical is not None:
+            return self._canonical[first] == self._canonical[second]
+        if self.fingerprint(first) != self.fingerprint(second):
+            return False
+        return _equal(self._array(first), self._array(second))
+
+    @property
+    def canonical(self) -> List[int]:
+        """Index of the first frame identical to each frame."""
+        if self._canonical is None:
+            hint = self._hint._canonical if self._hint is not None else None
+            canonical: List[int] = []
+            buckets: Dict[Hashable, List[int]] = {}
+            for index in range(len(self)):
+                if hint is not None and hint[index] != index:
+                    canonical.append(canonical[hint[index]])
+                    continue
+                bucket = buckets.setdefault(self.fingerprint(index), [])
+                for candidate in bucket:
+                    if _equal(self._array(candidate), self._array(index)):
+                        canonical.append(candidate)
+                        break
+                else:
+                    bucket.append(index)
+                    canonical.append(index)
+            self._canonical = canonical
+            # Pixels are not needed once the groups are known
+            self._arrays.clear()
+        return self._canonical
+
+    def unique_indices(self) -> List[int]:
+        """Return the first index of each distinct frame, in order."""
+        return [index for index, first in enumerate(self.canonical) if first == index]
+
+    def has_duplicates(self) -> bool:
+        return len(self.unique_indices()) < len(self)
+
+    def all_identical(self) -> bool:
+        """Return True if every frame equals the first; stops at the first miss.
+
+        Compares each frame to the first directly; a fingerprint would not
+        save anything when there is a single candidate.
+        """
+        if self._canonical is not None:
+            return not any(self._canonical)
+        first = self._array(0) if len(self) else None
+        for index in range(1, len(self)):
+            if not _equal(first, self._array(index)):
+                return False
+        self._canonical = [0] * len(self)
+        self._arrays.clear()
+        return True
+
+
+def _packed(array: np.ndarray) -> np.ndarray:
+    """Return RGBA pixels as one uint32 per pixel, or ``array`` if it can't.
+
+    Comparing and sampling whole pixels is several times faster than doing
+    it per byte.
+    """
+    if array.dtype == np.uint8 and array.shape[-1] == 4:
+        try:
+            return array.view(np.uint32)[..., 0]
+        except ValueError:
+            pass
+    return array
+
+
+def _equal(first: np.ndarray, second: np.ndarray) -> bool:
+    """Exact pixel comparison of two frames."""
+    if first.shape != second.shape:
+        return False
+    # Atlas entries that reuse one sprite region are views of the same pixels
+    if (
+        first.__array_interface__["data"][0] == second.__array_interface__["data"][0]
+        and first.strides == second.strides
+        and first.dtype == second.dtype
+    ):
+        return True
+    return bool(np.array_equal(_packed(first), _packed(second)))
+
+
+def _sample_grid(array: np.ndarray, first_axis: int = 0) -> np.ndarray:
+    """Return a strided sample of about ``SAMPLE_GRID`` rows and columns."""
+    height, width = array.shape[first_axis], array.shape[first_axis + 1]
+    step_y = max(1, height // SAMPLE_GRID)
+    step_x = max(1, width // SAMPLE_GRID)
+    index = (
+        (slice(None),) * first_axis
+        + (slice(None, None, step_y),)
+        + (slice(None, None, step_x),)
+    )
+    return array[index]
+
+
+__all__ = ["FrameDeduper", "SAMPLE_GRID"]
@@ -0,0 +1,255 @@
+"""Prepared image encoders for frame export.
+
+``FrameExporter`` used to rebuild the PIL ``save`` arguments, including a
+new ``PngInfo``, for every frame it wrote. ``FrameEncoderRegistry`` maps
+each frame format to a builder that turns compression settings into a
+``FrameEncoder`` once; every frame exported with the same settings reuses
+it.
+
+Compression profiles adjust the settings before an encoder is built:
+
+    default  the compression settings as configured
+    fast     low-effort settings for quick iteration builds: zlib level 3
+             without the optimize pass for PNG, method 0 for WebP and speed
+             10 for AVIF. Lossless settings stay lossless.
+
+The profile is read from the ``compression_profile`` setting, which the
+compression settings dialog stores in the global settings next to the
+format's own keys.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+from PIL.PngImagePlugin import PngInfo
+
+COMPRESSION_PROFILES: Dict[str, Dict[str, object]] = {
+    "default": {},
+    "fast": {
+        # Levels above 3 barely shrink sprite frames but take several
+        # times longer (see tools/benchmarks/frame_encode_benchmark.py)
+        "png_compress_level": 3,
+        "png_optimize": False,
+        "webp_method": 0,
+        "avif_speed": 10,
+    },
+}
+
+# Prepared encoders kept before the cache is emptied
+MAX_CACHED_ENCODERS = 32
+
+
+@dataclass(frozen=True)
+class FrameEncoder:
+    """PIL save arguments for one format, prepared once and reused.
+
+    Attributes:
+        format_name: Frame format this encoder writes (e.g. ``"PNG"``).
+        extension: File extension including the dot.
+        save_kwargs: Keyword arguments passed to ``Image.save``; includes
+            ``format`` so file objects can be written to as well.
+    """
+
+    format_name: str
+    extension: str
+    save_kwargs: Dict[str, object] = field(default_factory=dict)
+
+    def save(self, image, target) -> None:
+        """Encode ``image`` to a path or writable binary file object."""
+        image.save(target, **self.save_kwargs)
+
+
+EncoderBuilder = Callable[[Dict[str, object], str], Dict[str, object]]
+
+
+class FrameEncoderRegistry:
+    """Registry of frame formats and cache of their prepared encoders.
+
+    Class Attributes:
+        _builders: Format name to ``(extension, builder)``. A builder takes
+            the format's compression options (prefixed keys such as
+            ``png_compress_level``) and the application version, and
+            returns the ``Image.save`` keyword arguments.
+        _encoders: Prepared encoders keyed by format, options and version.
+    """
+
+    _builders: Dict[str, Tuple[str, EncoderBuilder]] = {}
+    _encoders: Dict[Tuple, FrameEncoder] = {}
+
+    @classmethod
+    def register(
+        cls, format_name: str, extension: str
+    ) -> Callable[[EncoderBuilder], EncoderBuilder]:
+        """Register the save-argument builder of a frame format.
+
+        Used as a decorator:
+            @FrameEncoderRegistry.register("PNG", ".png")
+            def _png(options, version):
+                ...
+
+        Args:
+            format_name: Name used in the ``frame_format`` setting.
+            extension: File extension including the dot.
+
+        Returns:
+            Decorator registering the builder and returning it unchanged.
+        """
+
+        def decorator(builder: EncoderBuilder) -> EncoderBuilder:
+            cls._builders[format_name] = (extension, builder)
+            cls._encoders.clear()
+            return builder
+
+        return decorator
+
+    @classmethod
+    def formats(cls):
+        """Return the registered format names."""
+        return list(cls._builders)
+
+    @classmethod
+    def extension(cls, frame_format: str) -> str:
+        """Return the file extension of a format, ``.png`` if unknown."""
+        entry = cls._builders.get(frame_format)
+        return entry[0] if entry else ".png"
+
+    @classmethod
+    def get_encoder(
+        cls,
+        frame_format: str,
+        compression_settings: Optional[Dict[str, object]] = None,
+        version: str = "",
+    ) -> FrameEncoder:
+        """Return the prepared encoder for a format and its settings.
+
+        Unknown formats are written as PNG, like ``Image.save`` would infer
+        from the ``.png`` extension they are given.
+
+        Args:
+            frame_format: Format name (e.g. ``"PNG"``, ``"WebP"``).
+            compression_settings: Settings holding the prefixed compression
+                keys and optionally ``compression_profile``. Other keys are
+                ignored, so the merged export settings can be passed as-is.
+            version: Application version embedded in file metadata.
+
+        Returns:
+            A shared ``FrameEncoder``; do not modify its ``save_kwargs``.
+        """
+        if frame_format not in cls._builders:
+            frame_format = "PNG"
+        options = resolve_compression_options(frame_format, compression_settings)
+        key = (frame_format, tuple(sorted(options.items())), version)
+        encoder = cls._encoders.get(key)
+        if encoder is None:
+            extension, builder = cls._builders[frame_format]
+            encoder = FrameEncoder(frame_format, extension, builder(options, version))
+            if len(cls._encoders) >= MAX_CACHED_ENCODERS:
+                cls._encoders.clear()
+            cls._encoders[key] = encoder
+        return encoder
+
+
+def resolve_compression_options(
+    frame_format: str, compression_settings: Optional[Dict[str, object]] = None
+) -> Dict[str, object]:
+    """Return a format's compression options with the profile applied.
+
+    Args:
+        frame_format: Format name whose lowercase name prefixes its keys.
+        compression_settings: Settings dict, or ``None`` for defaults.
+
+    Returns:
+        Dict of the format's prefixed keys, e.g. ``{"png_compress_level": 1}``.
+    """
+    settings = compression_settings or {}
+    prefix = f"{frame_format.lower()}_"
+    options = {
+        key: value
+        for key, value in settings.items()
+        if key.startswith(prefix) and not isinstance(value, (list, dict))
+    }
+    profile = COMPRESSION_PROFILES.get(
+        settings.get("compression_profile") or "default", {}
+    )
+    options.update(
+        (key, value) for key, value in profile.items() if key.startswith(prefix)
+    )
+    return options
+
+
+@FrameEncoderRegistry.register("AVIF", ".avif")
+def _avif(options, version):
+    return {
+        "format": "AVIF",
+        "lossless": options.get("avif_lossless", True),
+        "quality": options.get("avif_quality", 100),
+        "speed": options.get("avif_speed", 0),
+    }
+
+
+@FrameEncoderRegistry.register("BMP", ".bmp")
+def _bmp(options, version):
+    return {"format": "BMP"}
+
+
+@FrameEncoderRegistry.register("DDS", ".dds")
+def _dds(options, version):
+    return {"format": "DDS"}
+
+
+@FrameEncoderRegistry.register("PNG", ".png")
+def _png(options, version):
+    metadata = PngInfo()
+    metadata.add_text("Comment", f"PNG generated by TextureAtlas Toolbox v{version}")
+    return {
+        "format": "PNG",
+        "pnginfo": metadata,
+        "compress_level": options.get("png_compress_level", 9),
+        "optimize": options.get("png_optimize", True),
+    }
+
+
+@FrameEncoderRegistry.register("TGA", ".tga")
+def _tga(options, version):
+    return {
+        "format": "TGA",
+        "compression": options.get("tga_compression", "tga_rle"),
+    }
+
+
+@FrameEncoderRegistry.register("TIFF", ".tiff")
+def _tiff(options, version):
+    compression_type = options.get("tiff_compression_type", "lzw")
+    kwargs = {
+        "format": "TIFF",
+        "compression": compression_type if compression_type != "none" else None,
+        "optimize": options.get("tiff_optimize", True),
+        "description": f"TIFF generated by TextureAtlas Toolbox v{version}",
+    }
+    if compression_type == "jpeg":
+        kwargs["quality"] = options.get("tiff_quality", 90)
+    return kwargs
+
+
+@FrameEncoderRegistry.register("WebP", ".webp")
+def _webp(options, version):
+    kwargs = {
+        "format": "WebP",
+        "lossless": options.get("webp_lossless", True),
+    }
+    if not kwargs["lossless"]:
+        kwargs["quality"] = options.get("webp_quality", 100)
+    kwargs["method"] = options.get("webp_method", 6)
+    kwargs["alpha_quality"] = options.get("webp_alpha_quality", 100)
+    kwargs["exact"] = options.get("webp_exact", True)
+    return kwargs
+
+
+__all__ = [
+    "COMPRESSION_PROFILES",
+    "FrameEncoder",
+    "FrameEncoderRegistry",
+    "resolve_compression_options",
+]
@@ -2,13 +2,24 @@
 
 Provides ``FrameExporter`` which writes individual frames as image files
 in various formats (PNG, WebP, AVIF, etc.) with configurable cropping,
-scaling, and compression options.
+scaling, and compression options. Encoders come from
+``FrameEncoderRegistry`` and are prepared once per animation.
 """
 
 import os
-from PIL.PngImagePlugin import PngInfo
 
-from core.extractor.image_utils import ensure_pil_image
+from core.extractor.frame_encoders import FrameEncoderRegistry
+from core.extractor.image_utils import (
+    array_to_rgba_image,
+    crop_to_bbox,
+    crop_to_bbox_padded,
+    ensure_rgba_array,
+    frame_record_bbox,
+    scale_array_nearest,
+    scale_image_nearest,
+    union_bbox,
+)
+from core.extractor.output_sink import DirectorySink
 from utils.utilities import Utilities
 
 
@@ -22,19 +33,23 @@ class FrameExporter:
         output_dir: Directory where exported frames are saved.
         current_version: Version string embedded in image metadata.
         scale_image: Callable that scales a PIL image by a given factor.
+        output_sink: ``OutputSink`` receiving the encoded frames.
     """
 
-    def __init__(self, output_dir, current_version, scale_image_func):
+    def __init__(self, output_dir, current_version, scale_image_func, output_sink=None):
         """Initialise the frame exporter.
 
         Args:
             output_dir: Base directory for exported frame folders.
             current_version: Version string for file metadata comments.
             scale_image_func: Callable ``(image, scale) -> image`` for resizing.
+            output_sink: Where encoded frames go; defaults to files written
+                directly under ``output_dir``.
         """
         self.output_dir = output_dir
         self.current_version = current_version
         self.scale_image = scale_image_func
+        self.output_sink = output_sink or DirectorySink(output_dir)
 
     def save_frames(
         self,
@@ -72,21 +87,15 @@ class FrameExporter:
         frame_scale = settings.get("frame_scale", scale)
 
         safe_animation_folder = Utilities.replace_invalid_chars(animation_name)
-        frames_folder = os.path.join(self.output_dir, safe_animation_folder)
-        os.makedirs(frames_folder, exist_ok=True)
 
         crop_option = settings.get("crop_option")
 
-        format_extensions = {
-            "AVIF": ".avif",
-            "BMP": ".bmp",
-            "DDS": ".dds",
-            "PNG": ".png",
-            "TGA": ".tga",
-            "TIFF": ".tiff",
-            "WebP": ".webp",
-        }
-        file_extension = format_extensions.get(frame_format, ".png")
+        # The compression dialog stores its keys in the settings themselves
+        compression_settings = settings.get("compression_settings") or settings
+        encoder = FrameEncoderRegistry.get_encoder(
+            frame_format, compression_settings, self.current_version
+        )
+        file_extension = FrameEncoderRegistry.extension(frame_format)
 
         animation_bbox = None
         if crop_option == "Animation based":
@@ -108,15 +117,15 @@ class FrameExporter:
                 )
 
                 frame_filename = os.path.join(
-                    frames_folder, f"{formatted_frame_name}{file_extension}"
+                    safe_animation_folder, f"{formatted_frame_name}{file_extension}"
                 )
-                frame_image = ensure_pil_image(frame[1])
                 final_frame_image = self._prepare_frame_image(
-                    frame_image,
+                    frame[1],
                     crop_option,
                     animation_bbox,
                     frame_scale,
                     is_unknown_spritesheet,
+                    frame_record_bbox(frame),
                 )
                 if final_frame_image is None:
                     continue
@@ -124,8 +133,8 @@ class FrameExporter:
                 self._save_frame_to_image(
                     final_frame_image,
                     frame_filename,
-                    frame_format,
-                    settings.get("compression_settings"),
+                    encoder,
+                    compression_settings,
                 )
                 frames_generated += 1
         return frames_generated
@@ -137,33 +146,44 @@ class FrameExporter:
         animation_bbox,
         frame_scale,
         is_unknown_spritesheet,
+        bbox,
     ):
         """Crop and scale a frame image before saving.
 
+        Frames stay NumPy arrays until they are encoded: crops are views,
+        and with ``scale_image_nearest`` scaling is an index lookup. Any
+        other scaler, and the extra crop pass, work on PIL images.
+
         Args:
-            frame_image: PIL image to process.
+            frame_image: PIL image or RGBA NumPy array to process.
             crop_option: ``"Frame based"``, ``"Animation based"``, or ``None``.
             animation_bbox: Precomputed bounding box for animation-based crop.
             frame_scale: Scale factor to apply after cropping.
             is_unknown_spritesheet: When ``True``, runs an extra crop pass.
+            bbox: The frame's own bounding box (from its frame record), or
+                ``None`` if it has no visible pixels.
 
         Returns:
             Processed PIL image, or ``None`` if the frame is fully transparent.
         """
-        bbox = frame_image.getbbox()
         if bbox is None:
             return None
 
-        working = frame_image
+        working = ensure_rgba_array(frame_image)
         if crop_option == "Frame based" and bbox is not None:
-            working = working.crop(bbox)
+            working = crop_to_bbox(working, bbox)
         elif crop_option == "Animation based" and animation_bbox is not None:
-            working = working.crop(animation_bbox)
+            # Frames may be smaller than the shared box in either axis
+            working = crop_to_bbox_padded(working, animation_bbox)
 
         if is_unknown_spritesheet:
-            working = self._apply_extra_crop_pass(working)
-
-        return self.scale_image(working, frame_scale)
+            return self.scale_image(
+                self._apply_extra_crop_pass(array_to_rgba_image(working)),
+                frame_scale,
+            )
+        if self.scale_image is scale_image_nearest:
+            return array_to_rgba_image(scale_array_nearest(working, frame_scale))
+        return self.scale_image(array_to_rgba_image(working), frame_scale)
 
     @staticmethod
     def _compute_animation_bbox(image_tuples, kept_frame_indices):
@@ -177,120 +197,45 @@ class FrameExporter:
         Returns:
             Tuple ``(left, top, right, bottom)``, or ``None`` if no valid bbox.
         """
-        min_x, min_y, max_x, max_y = float("inf"), float("inf"), 0, 0
-        for index, frame in enumerate(image_tuples):
-            if index in kept_frame_indices:
-                bbox = ensure_pil_image(frame[1]).getbbox()
-                if bbox:
-                    min_x = min(min_x, bbox[0])
-                    min_y = min(min_y, bbox[1])
-                    max_x = max(max_x, bbox[2])
-                    max_y = max(max_y, bbox[3])
-
-        if min_x > max_x or min_y > max_y:
-            return None
-        return (min_x, min_y, max_x, max_y)
+        return union_bbox(
+            [
+                frame_record_bbox(frame)
+                for index, frame in enumerate(image_tuples)
+                if index in kept_frame_indices
+            ]
+        )
 
-    def _save_frame_to_image(
-        self, image, filename, frame_format, compression_settings=None
-    ):
-        """Write an image to disk in the specified format.
+    def _save_frame_to_image(self, image, filename, encoder, compression_settings):
+        """Encode an image with a prepared encoder and hand it to the sink.
 
-        Falls back to PNG if saving in the requested format fails.
+        Falls back to PNG, with the same compression settings, if saving in
+        the requested format fails.
 
         Args:
             image: PIL image to save.
-            filename: Destination path including extension.
-            frame_format: Format name (e.g., ``"PNG"``, ``"WebP"``).
-            compression_settings: Optional dict of format-specific options.
+            filename: Destination path relative to the output folder,
+                including extension.
+            encoder: ``FrameEncoder`` for the export's format and settings.
+            compression_settings: Settings the encoder was built from; used
+                to build the PNG fallback.
         """
-        save_kwargs = {}
-
-        if compression_settings is None:
-            compression_settings = {}
-
-        if frame_format == "AVIF":
-            save_kwargs["format"] = "AVIF"
-            save_kwargs["lossless"] = compression_settings.get("avif_lossless", True)
-            save_kwargs["quality"] = compression_settings.get("avif_quality", 100)
-            save_kwargs["speed"] = compression_settings.get("avif_speed", 0)
-
-        elif frame_format == "BMP":
-            save_kwargs["format"] = "BMP"
-
-        elif frame_format == "DDS":
-            save_kwargs["format"] = "DDS"
-
-        elif frame_format == "PNG":
-            metadata = PngInfo()
-            metadata.add_text(
-                "Comment",
-                f"PNG generated by TextureAtlas Toolbox v{self.current_version}",
-            )
-            save_kwargs["pnginfo"] = metadata
-            save_kwargs["format"] = "PNG"
-            save_kwargs["compress_level"] = compression_settings.get(
-                "png_compress_level", 9
-            )
-            save_kwargs["optimize"] = compression_settings.get("png_optimize", True)
-
-        elif frame_format == "TGA":
-            save_kwargs["format"] = "TGA"
-            save_kwargs["compression"] = compression_settings.get(
-                "tga_compression", "tga_rle"
-            )
-
-        elif frame_format == "TIFF":
-            save_kwargs["format"] = "TIFF"
-
-            compression_type = compression_settings.get("tiff_compression_type", "lzw")
-            save_kwargs["compression"] = (
-                compression_type if compression_type != "none" else None
-            )
-
-            if compression_type == "jpeg":
-                save_kwargs["quality"] = compression_settings.get("tiff_quality", 90)
-
-            save_kwargs["optimize"] = compression_settings.get("tiff_optimize", True)
-
-            if hasattr(image, "info"):
-                image.info["description"] = (
-                    f"TIFF generated by TextureAtlas Toolbox v{self.current_version}"
-                )
-
-        elif frame_format == "WebP":
-            save_kwargs["format"] = "WebP"
-
-            save_kwargs["lossless"] = compression_settings.get("webp_lossless", True)
-            if not save_kwargs["lossless"]:
-                save_kwargs["quality"] = compression_settings.get("webp_quality", 100)
-            save_kwargs["method"] = compression_settings.get("webp_method", 6)
-            save_kwargs["alpha_quality"] = compression_settings.get(
-                "webp_alpha_quality", 100
-            )
-            save_kwargs["exact"] = compression_settings.get("webp_exact", True)
-
+        sink = self.output_sink
         try:
-            image.save(filename, **save_kwargs)
-            # print(f"Successfully saved {filename} as {frame_format}")
+            sink.save(filename, lambda file: encoder.save(image, file))
 
         except Exception as e:
-            print(f"Error saving {filename} as {frame_format}: {e}")
+            print(
+                f"Error saving {sink.describe(filename)} as {encoder.format_name}: {e}"
+            )
             try:
                 png_filename = filename.rsplit(".", 1)[0] + ".png"
-                metadata = PngInfo()
-                metadata.add_text(
-                    "Comment",
-                    f"PNG generated by TextureAtlas Toolbox v{self.current_version}",
+                png_encoder = FrameEncoderRegistry.get_encoder(
+                    "PNG", compression_settings, self.current_version
                 )
-                image.save(
-                    png_filename,
-                    format="PNG",
-                    pnginfo=metadata,
-                    compress_level=9,
-                    optimize=True,
+                sink.save(png_filename, lambda file: png_encoder.save(image, file))
+                print(
+                    f"Fallback: Successfully saved {sink.describe(png_filename)} as PNG"
                 )
-                print(f"Fallback: Successfully saved {png_filename} as PNG")
             except Exception as fallback_e:
                 print(f"Critical error: Could not save image even as PNG: {fallback_e}")
 
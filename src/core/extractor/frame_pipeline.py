@@ -7,6 +7,8 @@ functions for computing bounding boxes and frame durations.
 Type Aliases:
     FrameTuple: ``Tuple[str, FrameSource, dict]`` representing a single frame
         with its name, image data (PIL Image or NumPy array), and metadata.
+        Frames from ``SpriteProcessor`` are ``FrameRecord`` instances, which
+        also cache their bounding box.
 """
 
 from __future__ import annotations
@@ -17,13 +19,20 @@ from typing import Callable, Iterator, List, Optional, Sequence, Tuple
 import numpy as np
 from PIL import Image
 
+from core.extractor.frame_dedupe import FrameDeduper
 from core.extractor.frame_selector import FrameSelector
 from core.extractor.image_utils import (
+    apply_alpha_threshold,
     array_to_rgba_image,
+    BBox,
+    FrameRecord,
     FrameSource,
-    crop_to_bbox,
     ensure_rgba_array,
     frame_bbox,
+    scale_image_nearest,
+    scale_stack_nearest,
+    stack_frames,
+    union_bbox,
 )
 
 FrameTuple = Tuple[str, FrameSource, dict]
@@ -40,6 +49,8 @@ class AnimationContext:
         frames: List of ``(name, image, metadata)`` tuples after normalization.
         kept_indices: Indices into ``frames`` of the frames to export.
         single_frame: ``True`` when all frames are visually identical.
+        dedupe: ``FrameDeduper`` over ``frames``, shared by selection and
+            the exporters; ``None`` once the frames are replaced.
     """
 
     spritesheet_name: str
@@ -48,10 +59,13 @@ class AnimationContext:
     frames: List[FrameTuple]
     kept_indices: List[int]
     single_frame: bool
+    dedupe: Optional[FrameDeduper] = None
 
     def with_frames(self, frames: Sequence[FrameTuple]) -> "AnimationContext":
         """Return a shallow copy of this context with a replaced frame list.
 
+        The duplicate groups of the old frames do not carry over.
+
         Args:
             frames: New sequence of frame tuples.
 
@@ -105,8 +119,11 @@ class FramePipeline:
             Populated ``AnimationContext`` with sorted frames and kept indices.
         """
         frames = self._normalize_frames(image_tuples, settings)
-        single_frame = FrameSelector.is_single_frame(frames)
-        kept_frames = FrameSelector.get_kept_frames(settings, single_frame, frames)
+        dedupe = FrameDeduper.from_frames(frames)
+        single_frame = FrameSelector.is_single_frame(frames, dedupe)
+        kept_frames = FrameSelector.get_kept_frames(
+            settings, single_frame, frames, dedupe
+        )
         kept_indices = FrameSelector.get_kept_frame_indices(kept_frames, frames)
         return AnimationContext(
             spritesheet_name=spritesheet_name,
@@ -115,6 +132,7 @@ class FramePipeline:
             frames=frames,
             kept_indices=kept_indices,
             single_frame=single_frame,
+            dedupe=dedupe,
         )
 
     def _normalize_frames(
@@ -149,8 +167,14 @@ class FramePipeline:
             frames = [frames[i] for i in indices]
 
         normalized: List[FrameTuple] = []
-        for name, image, metadata in frames:
-            normalized.append((name, ensure_rgba_array(image), metadata))
+        for frame in frames:
+            name, image, metadata = frame
+            array = ensure_rgba_array(image)
+            if isinstance(frame, FrameRecord):
+                # Same pixels, so the record's bbox cache stays valid
+                normalized.append(frame if array is image else frame.with_image(array))
+            else:
+                normalized.append((name, array, metadata))
 
         return normalized
 
@@ -190,34 +214,65 @@ class FramePipeline:
 
 def compute_shared_bbox(
     images: Sequence[FrameSource],
+    bboxes: Optional[Sequence[Optional[BBox]]] = None,
 ) -> Optional[Tuple[int, int, int, int]]:
     """Compute the union bounding box spanning all non-empty frames.
 
     Args:
         images: Sequence of PIL Images or NumPy arrays.
+        bboxes: Per-frame boxes already known (e.g. ``FrameRecord.bbox``);
+            frames are only scanned when omitted.
 
     Returns:
         Tuple ``(left, top, right, bottom)``, or ``None`` if all frames are empty.
     """
-    min_x, min_y, max_x, max_y = (
-        float("inf"),
-        float("inf"),
-        float("-inf"),
-        float("-inf"),
-    )
-
-    for frame in images:
-        bbox = frame_bbox(frame)
-        if bbox is None:
-            continue
-        min_x = min(min_x, bbox[0])
-        min_y = min(min_y, bbox[1])
-        max_x = max(max_x, bbox[2])
-        max_y = max(max_y, bbox[3])
-
-    if min_x == float("inf") or max_x == float("-inf"):
-        return None
-    return int(min_x), int(min_y), int(max_x), int(max_y)
+    if bboxes is None:
+        bboxes = [frame_bbox(frame) for frame in images]
+    return union_bbox(bboxes)
+
+
+def prepare_frame_stack(
+    images: Sequence[FrameSource],
+    scale: float,
+    crop_option: Optional[str],
+    threshold: Optional[float] = None,
+    bboxes: Optional[Sequence[Optional[BBox]]] = None,
+) -> Optional[np.ndarray]:
+    """Crop, threshold and scale a whole animation as one array.
+
+    Frames are copied once, straight into a ``(N, H, W, 4)`` stack cropped
+    to the shared bounding box; thresholding then runs in place on that
+    copy, and flipping and nearest-neighbour scaling are single operations
+    over the stack.
+
+    Args:
+        images: Sequence of PIL Images or NumPy arrays, aligned top-left on
+            a shared canvas (smaller frames are padded).
+        scale: Multiplier applied after cropping; negative flips horizontally.
+        crop_option: ``"Animation based"`` to use shared bbox, or ``None``.
+        threshold: Alpha threshold applied to cropped frames, as the GIF
+            exporter does, or ``None`` to keep alpha unchanged.
+        bboxes: Known per-frame boxes, passed to ``compute_shared_bbox``.
+
+    Returns:
+        Contiguous uint8 stack, or ``None`` if cropping was requested and
+        all frames lack content.
+    """
+    scale_value = scale if isinstance(scale, (int, float)) else 1.0
+    crop_mode = (crop_option or "None").lower()
+
+    frame_arrays = [ensure_rgba_array(frame) for frame in images]
+    crop_box = None
+    if crop_mode != "none":
+        crop_box = compute_shared_bbox(frame_arrays, bboxes)
+        if crop_box is None:
+            return None
+
+    stack = stack_frames(frame_arrays, crop_box)
+    if crop_box is not None and threshold is not None:
+        # The stack is a private copy, so threshold it in place
+        stack = apply_alpha_threshold(stack, threshold, in_place=True)
+    return np.ascontiguousarray(scale_stack_nearest(stack, scale_value))
 
 
 def prepare_scaled_sequence(
@@ -225,40 +280,64 @@ def prepare_scaled_sequence(
     scale_image: Callable[[Image.Image, float], Image.Image],
     scale: float,
     crop_option: Optional[str],
+    bboxes: Optional[Sequence[Optional[BBox]]] = None,
 ) -> List[Image.Image]:
     """Crop and scale all frames in a sequence.
 
+    With ``scale_image_nearest`` the work is done by ``prepare_frame_stack``
+    and the returned images wrap views of the stack; any other scaler is
+    applied frame by frame.
+
     Args:
         images: Sequence of PIL Images or NumPy arrays.
         scale_image: Callable ``(image, factor) -> image`` for resizing.
         scale: Multiplier applied after cropping.
         crop_option: ``"Animation based"`` to use shared bbox, or ``None``.
+        bboxes: Known per-frame boxes, passed to ``compute_shared_bbox``.
 
     Returns:
         List of processed PIL Images, empty if all frames lack content.
     """
     scale_value = scale if isinstance(scale, (int, float)) else 1.0
-    crop_mode = (crop_option or "None").lower()
 
-    crop_box = None
-    frame_arrays: Optional[List[np.ndarray]] = None
-    if crop_mode != "none":
-        frame_arrays = [ensure_rgba_array(frame) for frame in images]
-        crop_box = compute_shared_bbox(frame_arrays)
-        if crop_box is None:
+    if scale_image is scale_image_nearest:
+        stack = prepare_frame_stack(images, scale_value, crop_option, bboxes=bboxes)
+        if stack is None:
             return []
+        return [array_to_rgba_image(frame) for frame in stack]
 
-    processed: List[Image.Image] = []
-    for index, frame in enumerate(images):
-        frame_array = (
-            frame_arrays[index]
-            if frame_arrays is not None
-            else ensure_rgba_array(frame)
-        )
-        working_array = crop_to_bbox(frame_array, crop_box) if crop_box else frame_array
-        working_image = array_to_rgba_image(working_array)
-        processed.append(scale_image(working_image, scale_value))
-    return processed
+    stack = prepare_frame_stack(images, 1.0, crop_option, bboxes=bboxes)
+    if stack is None:
+        return []
+    return [scale_image(array_to_rgba_image(frame), scale_value) for frame in stack]
+
+
+def prepare_array_sequence(
+    images: Sequence[FrameSource],
+    scale: float,
+    crop_option: Optional[str],
+    threshold: Optional[float] = None,
+    bboxes: Optional[Sequence[Optional[BBox]]] = None,
+) -> List[np.ndarray]:
+    """Crop, threshold and scale frames without leaving NumPy.
+
+    Produces the same pixels the animation exporters encode, for consumers
+    that display frames directly instead of reading an encoded file back.
+
+    Args:
+        images: Sequence of PIL Images or NumPy arrays sharing one canvas.
+        scale: Multiplier applied after cropping; negative flips horizontally.
+        crop_option: ``"Animation based"`` to use shared bbox, or ``None``.
+        threshold: Alpha threshold applied to cropped frames, as the GIF
+            exporter does, or ``None`` to keep alpha unchanged.
+        bboxes: Known per-frame boxes, passed to ``compute_shared_bbox``.
+
+    Returns:
+        List of contiguous RGBA arrays (views of one stack), empty if all
+        frames lack content.
+    """
+    stack = prepare_frame_stack(images, scale, crop_option, threshold, bboxes)
+    return [] if stack is None else list(stack)
 
 
 def build_frame_durations(
@@ -5,9 +5,7 @@ animations, applying selection rules (All, First, Last, No duplicates, etc.),
 and resolving index ranges.
 """
 
-import numpy as np
-
-from core.extractor.image_utils import ensure_rgba_array
+from core.extractor.frame_dedupe import FrameDeduper
 
 
 class FrameSelector:
@@ -18,15 +16,18 @@ class FrameSelector:
     """
 
     @staticmethod
-    def is_single_frame(image_tuples):
+    def is_single_frame(image_tuples, dedupe=None):
         """Return ``True`` when all frames are visually identical.
 
-        Compares metadata and pixel data across frames. Returns ``True`` for
+        Compares metadata, then pixel data through a ``FrameDeduper``
+        (fingerprint buckets, then exact compares). Returns ``True`` for
         empty or single-element sequences.
 
         Args:
             image_tuples: Sequence of ``(name, image, metadata)`` tuples where
                 image is a PIL Image or NumPy array.
+            dedupe: ``FrameDeduper`` over ``image_tuples`` to reuse; one is
+                created if omitted.
 
         Returns:
             ``True`` if every frame matches the first, ``False`` otherwise.
@@ -34,45 +35,24 @@ class FrameSelector:
         if not image_tuples or len(image_tuples) == 1:
             return True
 
-        _, first_image, first_meta = image_tuples[0]
-        first_array = ensure_rgba_array(first_image)
-
-        try:
-            first_bytes = first_array.tobytes()
-        except Exception:
-            first_bytes = None
-
-        first_shape = first_array.shape
-
-        for _, image, metadata in image_tuples[1:]:
-            if metadata != first_meta:
-                return False
-
-            candidate = ensure_rgba_array(image)
-            if candidate.shape != first_shape:
-                return False
-
-            if first_bytes is not None:
-                try:
-                    if candidate.tobytes() != first_bytes:
-                        return False
-                    continue
-                except Exception:
-                    first_bytes = None
-
-            if not np.array_equal(candidate, first_array):
-                return False
+        first_meta = image_tuples[0][2]
+        if any(frame[2] != first_meta for frame in image_tuples[1:]):
+            return False
 
-        return True
+        if dedupe is None:
+            dedupe = FrameDeduper.from_frames(image_tuples)
+        return dedupe.all_identical()
 
     @staticmethod
-    def get_kept_frames(settings, single_frame, image_tuples):
+    def get_kept_frames(settings, single_frame, image_tuples, dedupe=None):
         """Determine which frame indices to keep based on selection settings.
 
         Args:
             settings: Dict with optional ``frame_selection`` key.
             single_frame: When ``True``, forces selection to ``["0"]``.
             image_tuples: Sequence of ``(name, image, metadata)`` tuples.
+            dedupe: ``FrameDeduper`` over ``image_tuples`` to reuse for
+                ``"No duplicates"``; one is created if omitted.
 
         Returns:
             List of string indices or ranges (e.g., ``["0", "2-5", "-1"]``).
@@ -93,15 +73,9 @@ class FrameSelector:
         elif kept_frames == "First, Last":
             return ["0", "-1"]
         elif kept_frames == "No duplicates":
-            unique_indices = []
-            seen_signatures = set()
-            for i, frame in enumerate(image_tuples):
-                signature = FrameSelector._frame_signature(frame[1])
-                if signature is None or signature not in seen_signatures:
-                    if signature is not None:
-                        seen_signatures.add(signature)
-                    unique_indices.append(str(i))
-            return unique_indices
+            if dedupe is None:
+                dedupe = FrameDeduper.from_frames(image_tuples)
+            return [str(index) for index in dedupe.unique_indices()]
         else:
             return kept_frames.split(",")
 
@@ -180,38 +154,3 @@ class FrameSelector:
                 except ValueError:
                     continue
         return sorted(kept_frame_indices)
-
-    @staticmethod
-    def _frame_signature(frame_source):
-        """Compute a hash signature for duplicate detection.
-
-        Samples a sparse grid of pixels to produce a fast, approximate
-        fingerprint of the image data.
-
-        Args:
-            frame_source: PIL Image or NumPy array.
-
-        Returns:
-            Integer hash, or ``None`` if the frame cannot be processed.
-        """
-        try:
-            array = ensure_rgba_array(frame_source)
-        except Exception:
-            return None
-
-        if array.ndim < 2:
-            return None
-
-        step_y = max(1, array.shape[0] // 32)
-        step_x = max(1, array.shape[1] // 32)
-        sample = array[::step_y, ::step_x]
-        if sample.ndim == 3 and sample.shape[2] > 4:
-            sample = sample[..., :4]
-
-        try:
-            sample = np.ascontiguousarray(sample)
-            prefix = sample.tobytes()
-        except Exception:
-            return None
-
-        return hash((array.shape, array.dtype.str, prefix))
@@ -7,6 +7,10 @@ Type Aliases:
     FrameSource: ``Union[Image.Image, np.ndarray]`` — frame data may be
         either a PIL Image or a NumPy array throughout the pipeline.
     BBox: ``Tuple[int, int, int, int]`` — bounding box as ``(left, top, right, bottom)``.
+
+``FrameRecord`` is the ``(name, image, metadata)`` frame tuple with a
+bounding-box cache attached, so each frame's content box is found once and
+shared by selection, cropping and export.
 """
 
 from __future__ import annotations
@@ -16,10 +20,11 @@ from typing import List, Optional, Sequence, Tuple, Union
 import numpy as np
 from PIL import Image
 
-
 FrameSource = Union[Image.Image, np.ndarray]
 BBox = Tuple[int, int, int, int]
 
+_UNSET = object()  # FrameRecord bbox not computed yet
+
 
 def scale_image_nearest(image: Image.Image, size: float) -> Image.Image:
     """Scale an image using nearest-neighbor sampling.
@@ -46,6 +51,132 @@ def scale_image_nearest(image: Image.Image, size: float) -> Image.Image:
     return working.resize((new_width, new_height), Image.NEAREST)
 
 
+def scale_array_nearest(array: np.ndarray, size: float) -> np.ndarray:
+    """Scale an RGBA array using nearest-neighbor sampling.
+
+    Array counterpart of :func:`scale_image_nearest` that picks the same
+    source pixels as PIL's ``NEAREST`` filter, so previews match exports.
+
+    Args:
+        array: Source array (H x W x C).
+        size: Scale multiplier; negative values flip horizontally.
+
+    Returns:
+        Scaled array, or the original (possibly flipped view) if the
+        dimensions are unchanged.
+    """
+
+    working = array[:, ::-1] if size < 0 else array
+    height, width = working.shape[0], working.shape[1]
+    new_width = max(1, round(width * abs(size)))
+    new_height = max(1, round(height * abs(size)))
+    if new_width == width and new_height == height:
+        return working
+
+    rows = _nearest_source_indices(height, new_height)
+    cols = _nearest_source_indices(width, new_width)
+    return working[rows[:, None], cols]
+
+
+def _nearest_source_indices(source: int, target: int) -> np.ndarray:
+    """Return the source index PIL's nearest filter samples for each target.
+
+    PIL steps from the first pixel centre by accumulating the scale in
+    double precision, so the cumulative sum reproduces its rounding exactly.
+    """
+    step = source / target
+    positions = np.full(target, step)
+    positions[0] = step * 0.5
+    indices = np.cumsum(positions).astype(np.intp)
+    return np.minimum(indices, source - 1)
+
+
+def scale_stack_nearest(stack: np.ndarray, size: float) -> np.ndarray:
+    """Scale a ``(N, H, W, C)`` frame stack using nearest-neighbor sampling.
+
+    Stack counterpart of :func:`scale_array_nearest`: the same source pixels
+    are picked for every frame in one operation. Whole-number factors use
+    ``np.repeat``, which is what the nearest filter reduces to. RGBA pixels
+    are moved as single 32-bit values rather than four separate bytes.
+
+    Args:
+        stack: Frames sharing one canvas, stacked on the first axis.
+        size: Scale multiplier; negative values flip horizontally.
+
+    Returns:
+        Scaled (or flipped) stack, or the original if neither applies.
+    """
+
+    height, width = stack.shape[1], stack.shape[2]
+    new_width = max(1, round(width * abs(size)))
+    new_height = max(1, round(height * abs(size)))
+    if new_width == width and new_height == height and size >= 0:
+        return stack
+
+    packed = stack.dtype == np.uint8 and stack.shape[3] == 4 and stack.strides[3] == 1
+    working = stack.view(np.uint32)[..., 0] if packed else stack
+    if size < 0:
+        working = working[:, :, ::-1]
+
+    if new_height % height == 0:
+        if new_height != height:
+            working = np.repeat(working, new_height // height, axis=1)
+    else:
+        working = np.take(working, _nearest_source_indices(height, new_height), axis=1)
+    if new_width % width == 0:
+        if new_width != width:
+            working = np.repeat(working, new_width // width, axis=2)
+    else:
+        working = np.take(working, _nearest_source_indices(width, new_width), axis=2)
+
+    if packed:
+        working = np.ascontiguousarray(working)[..., None].view(np.uint8)
+    return working
+
+
+def stack_frames(
+    images: Sequence[FrameSource], bbox: Optional[BBox] = None
+) -> np.ndarray:
+    """Copy frames into one ``(N, H, W, C)`` array.
+
+    Frames are aligned top-left on the largest canvas among them, as in
+    :func:`pad_frames_to_canvas`. With ``bbox`` only that part of the canvas
+    is copied, so cropping costs no extra pass; areas a frame does not
+    cover stay transparent. The result never shares memory with the input.
+
+    Args:
+        images: Sequence of PIL Images or NumPy arrays.
+        bbox: Optional ``(left, top, right, bottom)`` region of the canvas.
+
+    Returns:
+        New contiguous uint8 array holding every frame.
+    """
+
+    arrays = [ensure_rgba_array(frame) for frame in images]
+    if not arrays:
+        return np.zeros((0, 0, 0, 4), dtype=np.uint8)
+
+    height = max(array.shape[0] for array in arrays)
+    width = max(array.shape[1] for array in arrays)
+    left, top, right, bottom = bbox if bbox is not None else (0, 0, width, height)
+    left, top = max(0, min(width, int(left))), max(0, min(height, int(top)))
+    right, bottom = max(left, min(width, int(right))), max(
+        top, min(height, int(bottom))
+    )
+
+    stack = np.zeros(
+        (len(arrays), bottom - top, right - left, arrays[0].shape[2]), dtype=np.uint8
+    )
+    for index, array in enumerate(arrays):
+        copy_height = min(array.shape[0], bottom) - top
+        copy_width = min(array.shape[1], right) - left
+        if copy_height > 0 and copy_width > 0:
+            stack[index, :copy_height, :copy_width] = array[
+                top : top + copy_height, left : left + copy_width
+            ]
+    return stack
+
+
 def pad_frames_to_canvas(images: Sequence[FrameSource]) -> List[np.ndarray]:
     """Pad frames so they share a common canvas size.
 
@@ -70,15 +201,8 @@ def pad_frames_to_canvas(images: Sequence[FrameSource]) -> List[np.ndarray]:
     if max_width == min_width and max_height == min_height:
         return arrays
 
-    padded: List[np.ndarray] = []
-    for array in arrays:
-        if array.shape[1] == max_width and array.shape[0] == max_height:
-            padded.append(array)
-            continue
-        canvas = np.zeros((max_height, max_width, array.shape[2]), dtype=np.uint8)
-        canvas[: array.shape[0], : array.shape[1]] = array
-        padded.append(canvas)
-    return padded
+    # One allocation for the whole animation instead of a canvas per frame
+    return list(stack_frames(arrays))
 
 
 def image_to_rgba_array(image: Image.Image) -> np.ndarray:
@@ -260,6 +384,152 @@ def frame_bbox(frame: FrameSource, *, threshold: int = 0) -> Optional[BBox]:
     return bbox_from_array(array, threshold=threshold)
 
 
+def bbox_in_rect(
+    array: np.ndarray, rect: BBox, *, threshold: int = 0
+) -> Optional[BBox]:
+    """Return the bounding box of an array whose content lies inside ``rect``.
+
+    Used when metadata says where a sprite sits on its canvas. If every edge
+    row and column of ``rect`` has a visible pixel the rect is already tight
+    and only its perimeter is read; otherwise only the pixels inside it are
+    scanned.
+
+    Args:
+        array: Source RGBA NumPy array, transparent outside ``rect``.
+        rect: Tuple ``(left, top, right, bottom)`` enclosing all content.
+        threshold: Minimum alpha to be considered visible.
+
+    Returns:
+        Tuple ``(left, top, right, bottom)``, or ``None`` if empty.
+    """
+
+    height, width = array.shape[0], array.shape[1]
+    left, top, right, bottom = rect
+    left, top = max(0, int(left)), max(0, int(top))
+    right, bottom = min(width, int(right)), min(height, int(bottom))
+    if right <= left or bottom <= top:
+        return None
+
+    region = array[top:bottom, left:right]
+    if region.ndim == 3 and region.shape[2] >= 4:
+        alpha = region[..., 3]
+        if (
+            (alpha[0] > threshold).any()
+            and (alpha[-1] > threshold).any()
+            and (alpha[:, 0] > threshold).any()
+            and (alpha[:, -1] > threshold).any()
+        ):
+            return left, top, right, bottom
+
+    bbox = bbox_from_array(region, threshold=threshold)
+    if bbox is None:
+        return None
+    return bbox[0] + left, bbox[1] + top, bbox[2] + left, bbox[3] + top
+
+
+def union_bbox(bboxes: Sequence[Optional[BBox]]) -> Optional[BBox]:
+    """Return the box spanning every non-empty box, or ``None`` if all are empty."""
+
+    boxes = [bbox for bbox in bboxes if bbox is not None]
+    if not boxes:
+        return None
+    return (
+        int(min(bbox[0] for bbox in boxes)),
+        int(min(bbox[1] for bbox in boxes)),
+        int(max(bbox[2] for bbox in boxes)),
+        int(max(bbox[3] for bbox in boxes)),
+    )
+
+
+class FrameRecord(tuple):
+    """A ``(name, image, metadata)`` frame tuple with a cached bounding box.
+
+    Unpacks, indexes and compares like the plain tuples used throughout the
+    extractor, so it can be passed anywhere a frame tuple is expected. The
+    bounding box of the image is computed at most once per record, and only
+    when a consumer asks for it.
+
+    Producers that know where the content sits on the canvas, such as
+    ``SpriteProcessor`` from the atlas metadata, pass it as ``content_rect``
+    so the box is taken from the metadata instead of scanning the frame
+    (see :func:`bbox_in_rect`). Producers that already know the box itself
+    pass it as ``bbox`` (``None`` for an empty frame).
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        image: FrameSource,
+        metadata,
+        *,
+        content_rect: Optional[BBox] = None,
+        bbox=_UNSET,
+    ):
+        record = super().__new__(cls, (name, image, metadata))
+        record._content_rect = content_rect
+        record._bbox = bbox
+        return record
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    @property
+    def bbox(self) -> Optional[BBox]:
+        """Bounding box of visible pixels, or ``None`` if the frame is empty."""
+        if self._bbox is _UNSET:
+            if self._content_rect is not None:
+                self._bbox = bbox_in_rect(
+                    ensure_rgba_array(self[1]), self._content_rect
+                )
+            else:
+                self._bbox = frame_bbox(self[1])
+        return self._bbox
+
+    def with_image(self, image: FrameSource) -> "FrameRecord":
+        """Return a record holding the same pixels in another container.
+
+        The bounding box (computed or pending) carries over; use this for
+        conversions such as PIL image to array, never for edited pixels.
+        """
+        return FrameRecord(
+            self[0],
+            image,
+            self[2],
+            content_rect=self._content_rect,
+            bbox=self._bbox,
+        )
+
+    def renamed(
+        self, name: str, metadata, image: Optional[FrameSource] = None
+    ) -> "FrameRecord":
+        """Return a record of the same pixels under another name and metadata.
+
+        Used when a frame is reused by reference (editor composites); the
+        bounding box carries over like in :meth:`with_image`.
+
+        Args:
+            name: Name of the new record.
+            metadata: Metadata of the new record.
+            image: Another container of the same pixels, e.g. a read-only
+                view; defaults to this record's image.
+        """
+        return FrameRecord(
+            name,
+            self[1] if image is None else image,
+            metadata,
+            content_rect=self._content_rect,
+            bbox=self._bbox,
+        )
+
+
+def frame_record_bbox(frame) -> Optional[BBox]:
+    """Return the bounding box of a frame tuple, cached for ``FrameRecord``."""
+
+    if isinstance(frame, FrameRecord):
+        return frame.bbox
+    return frame_bbox(frame[1])
+
+
 def crop_to_bbox(array: np.ndarray, bbox: BBox) -> np.ndarray:
     """Return a view of the array cropped to the bounding box.
 
@@ -288,20 +558,61 @@ def crop_to_bbox(array: np.ndarray, bbox: BBox) -> np.ndarray:
     return array[top:bottom, left:right]
 
 
-def apply_alpha_threshold(array: np.ndarray, threshold: float) -> np.ndarray:
+def crop_to_bbox_padded(array: np.ndarray, bbox: BBox) -> np.ndarray:
+    """Crop to the bounding box, padding areas outside the array.
+
+    Matches ``Image.crop``: the result is always the size of the box, and
+    whatever the box covers beyond the array is transparent. Frames of an
+    animation can have different canvas sizes, so the shared box may reach
+    past a frame in one axis and fall short in the other.
+
+    Args:
+        array: Source ``(H, W, C)`` NumPy array.
+        bbox: Tuple ``(left, top, right, bottom)``.
+
+    Returns:
+        A view when the box lies inside the array, otherwise a new array.
+    """
+
+    height, width = array.shape[0], array.shape[1]
+    left, top, right, bottom = (int(value) for value in bbox)
+    if left >= 0 and top >= 0 and right <= width and bottom <= height:
+        return array[top:bottom, left:right]
+
+    padded = np.zeros(
+        (max(0, bottom - top), max(0, right - left)) + array.shape[2:],
+        dtype=array.dtype,
+    )
+    source_left, source_top = max(left, 0), max(top, 0)
+    source_right, source_bottom = min(right, width), min(bottom, height)
+    if source_right > source_left and source_bottom > source_top:
+        padded[
+            source_top - top : source_bottom - top,
+            source_left - left : source_right - left,
+        ] = array[source_top:source_bottom, source_left:source_right]
+    return padded
+
+
+def apply_alpha_threshold(
+    array: np.ndarray, threshold: float, *, in_place: bool = False
+) -> np.ndarray:
     """Clamp the alpha channel to fully transparent or fully opaque.
 
     Pixels with alpha above the normalized threshold become 255; others become 0.
+    The input is copied first unless the caller owns it and says so, so
+    frames shared with an atlas or a cache are never modified.
 
     Args:
-        array: RGBA NumPy array.
+        array: RGBA NumPy array, or a ``(N, H, W, 4)`` stack of them.
         threshold: Normalized cutoff in ``[0.0, 1.0]``.
+        in_place: Write into ``array`` (if writable) instead of a copy; for
+            private buffers such as a stack built by :func:`stack_frames`.
 
     Returns:
-        Array with binary alpha; may be a copy if the input was read-only.
+        Array with binary alpha.
     """
 
-    if array.ndim < 3 or array.shape[2] < 4:
+    if array.ndim < 3 or array.shape[-1] < 4:
         return array
 
     try:
@@ -310,7 +621,7 @@ def apply_alpha_threshold(array: np.ndarray, threshold: float) -> np.ndarray:
         return array
 
     value = min(max(value, 0.0), 1.0)
-    working = array if array.flags.writeable else array.copy()
+    working = array if in_place and array.flags.writeable else array.copy()
     alpha_view = working[..., 3]
 
     mask = np.empty(alpha_view.shape, dtype=bool)
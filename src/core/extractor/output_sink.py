@@ -0,0 +1,331 @@
+"""Destinations for exported files.
+
+Exporters encode every file into memory and hand the bytes to an
+``OutputSink``, which decides where and when they reach storage:
+
+    DirectorySink  one file per output under a directory, written by the
+                   exporting thread or queued to a ``WriterPool`` so
+                   encoding carries on while earlier files are written
+    ZipSink        every output of a spritesheet in one ``.zip``
+    TarSink        every output of a spritesheet in one ``.tar``
+
+Frames-only exports of large sheets produce tens of thousands of small
+files; on network storage each open/write/close is a round trip, which the
+writer pool overlaps and the archive sinks avoid altogether.
+
+Paths passed to a sink are relative to its root; ``/`` and the platform
+separator are both accepted.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+SINK_KINDS = ("directory", "zip", "tar")
+
+# Encoded bytes a pool may hold before writers make the exporters wait
+DEFAULT_MAX_PENDING_BYTES = 64 * 1024 * 1024
+
+
+class WriterPool:
+    """Writer threads shared by every sink of an extraction run.
+
+    Spritesheets are exported by several worker threads at once; sharing
+    one pool keeps the number of concurrent writes at ``threads`` instead
+    of multiplying it by the worker count.
+
+    Attributes:
+        threads: Number of writer threads.
+        max_pending_bytes: Queued bytes above which ``submit`` blocks.
+    """
+
+    _shared: Dict[int, "WriterPool"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self, threads: int, max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES
+    ) -> None:
+        self.threads = max(1, int(threads))
+        self.max_pending_bytes = max_pending_bytes
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.threads, thread_name_prefix="output-writer"
+        )
+        self._pending_bytes = 0
+        self._condition = threading.Condition()
+
+    @classmethod
+    def shared(cls, threads: int) -> "WriterPool":
+        """Return the process-wide pool with ``threads`` writers."""
+        threads = max(1, int(threads))
+        with cls._shared_lock:
+            pool = cls._shared.get(threads)
+            if pool is None:
+                pool = cls(threads)
+                cls._shared[threads] = pool
+            return pool
+
+    def submit(self, write: Callable[[], None], nbytes: int) -> Future:
+        """Queue a write of ``nbytes``, waiting while too much is queued.
+
+        A single write larger than the limit is still accepted once the
+        queue has drained.
+        """
+        with self._condition:
+            while (
+                self._pending_bytes
+                and self._pending_bytes + nbytes > self.max_pending_bytes
+            ):
+                self._condition.wait()
+            self._pending_bytes += nbytes
+
+        def run():
+            try:
+                write()
+            finally:
+                with self._condition:
+                    self._pending_bytes -= nbytes
+                    self._condition.notify_all()
+
+        return self._executor.submit(run)
+
+
+class OutputSink(ABC):
+    """Receives encoded files by path relative to the sink's root.
+
+    Sinks are context managers; ``close`` waits for queued writes and
+    finishes archives.
+    """
+
+    @abstractmethod
+    def write(self, relative_path: str, data: bytes) -> None:
+        """Store ``data`` under ``relative_path``."""
+
+    def save(self, relative_path: str, encode: Callable[[BinaryIO], None]) -> None:
+        """Encode into memory with ``encode(file)`` and store the result."""
+        buffer = io.BytesIO()
+        encode(buffer)
+        self.write(relative_path, buffer.getvalue())
+
+    def describe(self, relative_path: str) -> str:
+        """Return a readable location of an output for log messages."""
+        return relative_path
+
+    def close(self) -> None:
+        """Flush everything written so far; the sink is unusable afterwards."""
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Keep the original error; still wait for the writes in flight
+        try:
+            self.close()
+        except Exception as close_error:
+            print(f"[OutputSink] Error while closing after a failure: {close_error}")
+
+
+class DirectorySink(OutputSink):
+    """Writes each output as its own file under ``root``.
+
+    Attributes:
+        root: Directory the relative paths are resolved against.
+        writer_pool: Pool that performs the writes, or ``None`` to write in
+            the calling thread.
+        fsync: Whether each file is flushed to disk before it counts as
+            written.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        writer_pool: Optional[WriterPool] = None,
+        fsync: bool = False,
+    ) -> None:
+        self.root = root
+        self.writer_pool = writer_pool
+        self.fsync = fsync
+        self._created_dirs = set()
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+
+    def _path(self, relative_path: str) -> str:
+        return os.path.join(self.root, *relative_path.replace("\\", "/").split("/"))
+
+    def _ensure_dir(self, directory: str) -> None:
+        # One makedirs per folder rather than one per file
+        with self._lock:
+            if directory in self._created_dirs:
+                return
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._created_dirs.add(directory)
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        with open(path, "wb") as file:
+            file.write(data)
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+    def write(self, relative_path: str, data: bytes) -> None:
+        path = self._path(relative_path)
+        self._ensure_dir(os.path.dirname(path))
+        if self.writer_pool is None:
+            self._write_file(path, data)
+            return
+        future = self.writer_pool.submit(
+            lambda: self._write_file(path, data), len(data)
+        )
+        with self._lock:
+            if len(self._futures) >= 1024:
+                # Drop finished writes, keeping the ones that failed for close()
+                self._futures = [
+                    pending
+                    for pending in self._futures
+                    if not pending.done() or pending.exception() is not None
+                ]
+            self._futures.append(future)
+
+    def describe(self, relative_path: str) -> str:
+        return self._path(relative_path)
+
+    def close(self) -> None:
+        """Wait for queued writes.
+
+        Raises:
+            Exception: The first error raised by a write, once every write
+                has finished.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        errors = [error for error in errors if error is not None]
+        if errors:
+            print(
+                f"[DirectorySink] {len(errors)} file(s) failed to write to {self.root}"
+            )
+            raise errors[0]
+
+
+class _ArchiveSink(OutputSink):
+    """Common part of the archive sinks: one file, written in order."""
+
+    extension = ""
+
+    def __init__(self, archive_path: str) -> None:
+        self.archive_path = archive_path
+        directory = os.path.dirname(archive_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._archive = self._open()
+
+    @abstractmethod
+    def _open(self):
+        """Create the archive file and return the open archive."""
+
+    @abstractmethod
+    def _add(self, name: str, data: bytes) -> None:
+        """Append one entry; called with the sink's lock held."""
+
+    def write(self, relative_path: str, data: bytes) -> None:
+        name = relative_path.replace("\\", "/").lstrip("/")
+        with self._lock:
+            self._add(name, data)
+
+    def describe(self, relative_path: str) -> str:
+        return f"{self.archive_path}:{relative_path.replace(os.sep, '/')}"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+
+
+class ZipSink(_ArchiveSink):
+    """Stores every output in one ``.zip`` archive.
+
+    Entries are stored uncompressed: the images are already compressed,
+    and deflating them again costs time without saving space.
+    """
+
+    extension = ".zip"
+
+    def _open(self):
+        return zipfile.ZipFile(self.archive_path, "w", zipfile.ZIP_STORED)
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_STORED
+        self._archive.writestr(info, data)
+
+
+class TarSink(_ArchiveSink):
+    """Stores every output in one uncompressed ``.tar`` archive."""
+
+    extension = ".tar"
+
+    def _open(self):
+        return tarfile.open(self.archive_path, "w")
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._archive.addfile(info, io.BytesIO(data))
+
+
+def create_output_sink(
+    output_dir: str,
+    kind: str = "directory",
+    writer_threads: int = 0,
+    fsync: bool = False,
+) -> OutputSink:
+    """Return the sink for one spritesheet's exports.
+
+    Args:
+        output_dir: The spritesheet's output folder. Archive sinks write
+            ``output_dir`` plus ``.zip`` or ``.tar`` instead.
+        kind: One of ``SINK_KINDS``.
+        writer_threads: Writer threads for a directory sink; ``0`` writes
+            in the exporting thread.
+        fsync: Flush each file of a directory sink to disk.
+
+    Returns:
+        A new ``OutputSink``; close it once the spritesheet is exported.
+
+    Raises:
+        ValueError: If ``kind`` is not a known sink.
+    """
+    kind = (kind or "directory").lower()
+    if kind == "directory":
+        pool = WriterPool.shared(writer_threads) if writer_threads > 0 else None
+        return DirectorySink(output_dir, pool, fsync)
+    if kind == "zip":
+        return ZipSink(os.path.normpath(output_dir) + ZipSink.extension)
+    if kind == "tar":
+        return TarSink(os.path.normpath(output_dir) + TarSink.extension)
+    raise ValueError(f"Unknown output sink: {kind}")
+
+
+__all__ = [
+    "DirectorySink",
+    "OutputSink",
+    "SINK_KINDS",
+    "TarSink",
+    "WriterPool",
+    "ZipSink",
+    "create_output_sink",
+]
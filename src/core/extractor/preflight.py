@@ -0,0 +1,225 @@
+"""Metadata-only validation of a batch before extraction starts.
+
+Parse errors otherwise surface one file at a time inside
+``FileProcessorWorker._process_single_file``. ``run_preflight`` parses every
+metadata file of a batch up front across a process pool and checks the
+sprite rectangles against the atlas size, read from the image header
+without decoding pixels. Each file yields a ``PreflightReport`` whose
+``result`` is a ``ParseResult`` summary suitable for ``ParseErrorDialog``:
+
+    - parse failures become file-level errors
+    - zero/negative sized sprites keep their ``ZERO_DIMENSION`` errors
+    - sprites reaching past the atlas become ``SPRITE_OUT_OF_BOUNDS`` warnings
+
+Files are parsed through ``MetadataCache``. Batches small enough for the
+cache to hold are parsed in-process, so extracting them afterwards reuses
+the parses; larger batches would only evict each other and go to the pool.
+
+Spritemap projects and images without metadata are not parsed by the
+registry and are left out, as are files whose metadata is missing.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+from parsers.metadata_cache import MetadataCache
+from parsers.parser_types import ParseResult, ParserError, ParserErrorCode
+
+# Below this many files a pool costs more to start than it saves
+PARALLEL_MIN_FILES = 16
+
+
+@dataclass
+class PreflightTask:
+    """One atlas to validate.
+
+    Attributes:
+        filename: Spritesheet name as listed in the batch.
+        image_path: Atlas image; only its header is read.
+        metadata_path: Metadata file parsed through ``MetadataCache``.
+    """
+
+    filename: str
+    image_path: str
+    metadata_path: str
+
+
+@dataclass
+class PreflightReport:
+    """Validation outcome of one ``PreflightTask``.
+
+    Attributes:
+        filename: Spritesheet name as listed in the batch.
+        result: Parse summary. Its ``sprites`` is left empty so reports stay
+            cheap to send between processes; see ``sprite_count``.
+        sprite_count: Sprites that passed validation.
+        image_size: Atlas ``(width, height)``, or None if unreadable.
+        out_of_bounds: Names of sprites reaching past the atlas.
+        zero_size: Names of sprites with a zero or negative size.
+    """
+
+    filename: str
+    result: ParseResult
+    sprite_count: int = 0
+    image_size: Optional[Tuple[int, int]] = None
+    out_of_bounds: List[str] = field(default_factory=list)
+    zero_size: List[str] = field(default_factory=list)
+
+    @property
+    def has_issues(self) -> bool:
+        """Return True if the file has errors or warnings."""
+        return bool(self.result.errors or self.result.warnings)
+
+
+def build_preflight_tasks(
+    input_dir: str, spritesheet_list: Iterable[str]
+) -> List[PreflightTask]:
+    """Resolve the metadata of each listed spritesheet.
+
+    Uses the same rules as ``FileProcessorWorker._process_single_file``:
+    ``<stem>.xml`` is preferred over ``<stem>.txt``, and spritemap projects
+    (``Animation.json`` plus ``<stem>.json``) are skipped.
+
+    Args:
+        input_dir: Root directory of the batch.
+        spritesheet_list: Relative spritesheet filenames.
+
+    Returns:
+        Tasks for the spritesheets that have parseable metadata.
+    """
+    tasks = []
+    for filename in spritesheet_list:
+        relative_path = Path(filename)
+        atlas_path = Path(input_dir) / relative_path
+        atlas_dir = atlas_path.parent
+        base_filename = relative_path.stem
+
+        if (atlas_dir / "Animation.json").is_file() and (
+            atlas_dir / f"{base_filename}.json"
+        ).is_file():
+            continue
+        for extension in (".xml", ".txt"):
+            metadata_path = atlas_dir / f"{base_filename}{extension}"
+            if metadata_path.is_file():
+                tasks.append(
+                    PreflightTask(filename, str(atlas_path), str(metadata_path))
+                )
+                break
+    return tasks
+
+
+def preflight_file(task: PreflightTask) -> PreflightReport:
+    """Parse one metadata file and check it against its atlas header.
+
+    Never raises. The parse is shared through ``MetadataCache``; in pool
+    worker processes that cache is discarded with the worker.
+
+    Args:
+        task: Atlas and metadata paths.
+
+    Returns:
+        The file's report.
+    """
+    summary = ParseResult(file_path=task.metadata_path)
+    report = PreflightReport(task.filename, summary)
+
+    try:
+        with Image.open(task.image_path) as image:
+            report.image_size = image.size
+    except FileNotFoundError:
+        summary.add_error(
+            ParserErrorCode.FILE_NOT_FOUND, f"Atlas image not found: {task.image_path}"
+        )
+    except Exception as e:
+        summary.add_error(
+            ParserErrorCode.FILE_READ_ERROR, f"Cannot read atlas image: {e}"
+        )
+
+    try:
+        parsed = MetadataCache.parse(task.metadata_path)
+    except ParserError as e:
+        summary.add_error(e.code, e.message)
+        return report
+    except Exception as e:
+        summary.add_error(
+            ParserErrorCode.UNKNOWN_ERROR, f"Unexpected error parsing file: {e}"
+        )
+        return report
+
+    summary.parser_name = parsed.parser_name
+    summary.errors.extend(parsed.errors)
+    summary.warnings.extend(parsed.warnings)
+    report.zero_size = [
+        error.sprite_name
+        for error in parsed.errors
+        if error.code == ParserErrorCode.ZERO_DIMENSION
+    ]
+
+    table = parsed.sprites
+    report.sprite_count = len(table)
+    if report.image_size is not None and len(table):
+        width, height = report.image_size
+        for index in table.out_of_bounds_mask(width, height).nonzero()[0].tolist():
+            name = table.names[index]
+            report.out_of_bounds.append(name)
+            summary.add_warning(
+                ParserErrorCode.SPRITE_OUT_OF_BOUNDS,
+                f"Sprite '{name}' extends past the {width}x{height} atlas",
+                sprite_name=name,
+            )
+    return report
+
+
+def run_preflight(
+    tasks: List[PreflightTask],
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, PreflightReport]:
+    """Validate a batch, in parallel when it is large enough.
+
+    Args:
+        tasks: Files to validate, e.g. from ``build_preflight_tasks``.
+        max_workers: Process cap; defaults to the CPU count.
+        progress_callback: Called as ``(done, total)`` after each file.
+
+    Returns:
+        Reports keyed by filename, in task order.
+    """
+    total = len(tasks)
+    workers = min(total, max_workers or os.cpu_count() or 1)
+    reports: Dict[str, PreflightReport] = {}
+
+    in_process = total < PARALLEL_MIN_FILES or total <= MetadataCache.max_entries
+    if workers <= 1 or in_process:
+        for done, task in enumerate(tasks, 1):
+            reports[task.filename] = preflight_file(task)
+            if progress_callback:
+                progress_callback(done, total)
+        return reports
+
+    # Several files per round trip; small metadata files parse in
+    # well under a millisecond
+    chunksize = max(1, total // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(preflight_file, tasks, chunksize=chunksize)
+        for done, (task, report) in enumerate(zip(tasks, results), 1):
+            reports[task.filename] = report
+            if progress_callback:
+                progress_callback(done, total)
+    return reports
+
+
+__all__ = [
+    "PreflightReport",
+    "PreflightTask",
+    "build_preflight_tasks",
+    "preflight_file",
+    "run_preflight",
+]
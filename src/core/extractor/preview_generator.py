@@ -1,23 +1,74 @@
-"""Temporary animation preview generation for the UI.
+"""Animation preview generation for the UI.
 
-Provides ``PreviewGenerator`` which renders a single animation to a temp
-file for display in the application's preview pane.
+Provides ``PreviewGenerator`` which renders a single animation either to
+display-ready frames in memory (``PreviewAnimation``), frame by frame for
+progressive display (``iter_preview_frames``), or to a temp file for the
+application's preview pane.
 """
 
 import os
 import tempfile
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from core.extractor.animation_exporter import AnimationExporter
-from core.extractor.atlas_processor import AtlasProcessor
-from core.extractor.frame_pipeline import FramePipeline
-from core.extractor.image_utils import scale_image_nearest
-from core.editor.editor_composite import (
-    build_editor_composite_frames,
-    clone_animation_map,
+from core.extractor.frame_pipeline import (
+    FramePipeline,
+    build_frame_durations,
+    prepare_array_sequence,
+)
+from core.extractor.image_utils import (
+    apply_alpha_threshold,
+    crop_to_bbox,
+    ensure_rgba_array,
+    frame_bbox,
+    frame_record_bbox,
+    pad_frames_to_canvas,
+    scale_array_nearest,
+    scale_image_nearest,
 )
-from core.extractor.sprite_processor import SpriteProcessor
-from core.extractor.spritemap import AdobeSpritemapRenderer
+from core.editor.editor_composite import build_editor_composite_frames
+from core.extractor.preview_session import PreviewSession, PreviewSessionCache
+
+
+@dataclass
+class PreviewAnimation:
+    """Prepared animation frames ready for display.
+
+    Attributes:
+        frames: Contiguous RGBA arrays (H x W x 4, uint8), one per frame.
+        durations: Per-frame display durations in milliseconds.
+        animation_format: Format the frames were prepared for.
+        settings: Merged settings used to prepare the frames.
+    """
+
+    frames: List[np.ndarray]
+    durations: List[int]
+    animation_format: str
+    settings: dict
+
+
+@dataclass
+class PreviewRequest:
+    """Everything needed to (re)prepare one animation preview.
+
+    Attributes:
+        atlas_path: Path to the source atlas image.
+        metadata_path: Path to metadata, or ``None`` for unknown sheets.
+        animation_name: Name of the animation to preview.
+        settings: Export settings dict.
+        spritemap_info: Optional Adobe spritemap project info dict.
+        spritesheet_label: Friendly display name for the spritesheet.
+    """
+
+    atlas_path: str
+    metadata_path: Optional[str]
+    animation_name: str
+    settings: dict
+    spritemap_info: Optional[dict] = None
+    spritesheet_label: Optional[str] = None
 
 
 class PreviewGenerator:
@@ -68,17 +119,15 @@ class PreviewGenerator:
         """
         try:
             label = spritesheet_label or os.path.basename(atlas_path)
+            session = PreviewSessionCache.get(atlas_path, metadata_path, spritemap_info)
 
-            animations = self._collect_preview_frames(
-                atlas_path,
-                metadata_path,
-                spritemap_info,
-                label,
-                animation_name,
-                settings,
-            )
-            if not animations:
+            with session.lock:
+                prepared = self._prepare_preview_animation(
+                    session, label, animation_name, settings
+                )
+            if not prepared:
                 return None
+            filtered_frames, merged_settings = prepared
 
             if temp_dir is None:
                 temp_dir = tempfile.mkdtemp()
@@ -88,110 +137,392 @@ class PreviewGenerator:
                 self.current_version,
                 scale_image_nearest,
             )
+            animation_exporter.save_animations(
+                filtered_frames, label, animation_name, merged_settings
+            )
 
-            for anim_name, image_tuples in animations.items():
-                preview_settings = self.settings_manager.get_settings(
-                    label, f"{label}/{anim_name}"
-                )
-                merged_settings = {**preview_settings, **settings}
+            target_extension = self._preview_extension_for_format(
+                merged_settings["animation_format"]
+            )
+            return self._find_generated_preview_file(temp_dir, target_extension)
 
-                animation_format = self._resolve_preview_format(merged_settings)
-                merged_settings["animation_format"] = animation_format
+        except Exception as exc:
+            print(f"Preview animation generation error: {exc}")
+            return None
 
-                filtered_frames = self._filter_preview_frames(
-                    image_tuples,
-                    merged_settings,
-                    label,
-                    anim_name,
-                )
+    def generate_preview_frames(
+        self,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        settings: dict,
+        animation_name: str,
+        spritemap_info: Optional[dict] = None,
+        spritesheet_label: Optional[str] = None,
+    ) -> Optional[PreviewAnimation]:
+        """Prepare display-ready frames without encoding an animation file.
 
-                animation_exporter.save_animations(
-                    filtered_frames, label, anim_name, merged_settings
-                )
+        Frames go through the same selection, cropping, thresholding and
+        scaling as an export, so the preview window can show them directly.
+        Only the format's lossy steps (GIF palette quantization and duplicate
+        merging) are skipped. The spritesheet's ``PreviewSession`` keeps every
+        stage cached, so a settings tweak only redoes the stages it affects.
+
+        Args:
+            atlas_path: Path to the source atlas image.
+            metadata_path: Path to metadata, or ``None`` for unknown sheets.
+            settings: Export settings dict.
+            animation_name: Name of the animation to preview.
+            spritemap_info: Optional Adobe spritemap project info dict.
+            spritesheet_label: Friendly display name for the spritesheet.
+
+        Returns:
+            The prepared ``PreviewAnimation``, or ``None`` on failure.
+        """
+        try:
+            label = spritesheet_label or os.path.basename(atlas_path)
+            session = PreviewSessionCache.get(atlas_path, metadata_path, spritemap_info)
 
-                target_extension = self._preview_extension_for_format(animation_format)
-                generated_file = self._find_generated_preview_file(
-                    temp_dir, target_extension
+            with session.lock:
+                prepared = self._prepare_preview_animation(
+                    session, label, animation_name, settings
+                )
+                if not prepared:
+                    return None
+                filtered_frames, merged_settings = prepared
+
+                cropped = self._cropped_stage(session, filtered_frames, merged_settings)
+                scale = merged_settings.get("scale")
+                frames = session.cached_stage(
+                    "scaled",
+                    (scale,),
+                    cropped,
+                    lambda: prepare_array_sequence(cropped, scale, None),
                 )
-                if generated_file:
-                    return generated_file
+            if not frames:
+                return None
+
+            animation_format = merged_settings["animation_format"]
+            durations = build_frame_durations(
+                len(frames),
+                merged_settings.get("fps"),
+                merged_settings.get("delay"),
+                merged_settings.get("period"),
+                merged_settings.get("var_delay", False),
+                round_to_ten=animation_format == "GIF",
+            )
+            return PreviewAnimation(
+                frames=frames,
+                durations=durations,
+                animation_format=animation_format,
+                settings=merged_settings,
+            )
+
+        except Exception as exc:
+            print(f"Preview frame generation error: {exc}")
             return None
 
+    def iter_preview_frames(
+        self,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        settings: dict,
+        animation_name: str,
+        spritemap_info: Optional[dict] = None,
+        spritesheet_label: Optional[str] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """Yield display-ready frames one at a time as they are prepared.
+
+        Lets the preview window start playing before the whole animation is
+        ready. Spritemap animations that are not cached yet are streamed while
+        their symbols render; those frames are provisional (cropped to the
+        bounds seen so far) and the final frames come from
+        ``generate_preview_frames``, which afterwards is a cache hit. For
+        every other source the yielded frames are the final ones.
+
+        Partial results are never cached, so a cancelled run leaves the
+        session as it was.
+
+        Args:
+            atlas_path: Path to the source atlas image.
+            metadata_path: Path to metadata, or ``None`` for unknown sheets.
+            settings: Export settings dict.
+            animation_name: Name of the animation to preview.
+            spritemap_info: Optional Adobe spritemap project info dict.
+            spritesheet_label: Friendly display name for the spritesheet.
+            cancelled: Polled between frames; stop early when it returns
+                ``True``.
+
+        Yields:
+            ``(index, total, frame)`` with ``frame`` an RGBA array.
+        """
+        is_cancelled = cancelled or (lambda: False)
+        try:
+            label = spritesheet_label or os.path.basename(atlas_path)
+            session = PreviewSessionCache.get(atlas_path, metadata_path, spritemap_info)
+
+            with session.lock:
+                merged_settings = self._merge_preview_settings(
+                    label, animation_name, settings
+                )
+                if self._can_stream_render(
+                    session, label, animation_name, merged_settings
+                ):
+                    yield from self._stream_spritemap_frames(
+                        session, label, animation_name, merged_settings, is_cancelled
+                    )
+                    return
+
+                prepared = self._prepare_preview_animation(
+                    session, label, animation_name, settings
+                )
+                if not prepared or is_cancelled():
+                    return
+                filtered_frames, merged_settings = prepared
+
+                cropped = self._cropped_stage(session, filtered_frames, merged_settings)
+                scale = merged_settings.get("scale")
+                total = len(cropped)
+                frames = session.peek_stage("scaled", (scale,), cropped)
+                if frames is not None:
+                    for index, frame in enumerate(frames):
+                        yield index, total, frame
+                    return
+
+                frames = []
+                for index, array in enumerate(cropped):
+                    if is_cancelled():
+                        return
+                    frame = prepare_array_sequence([array], scale, None)[0]
+                    frames.append(frame)
+                    yield index, total, frame
+                session.store_stage("scaled", (scale,), cropped, frames)
+
         except Exception as exc:
-            print(f"Preview animation generation error: {exc}")
+            print(f"Preview frame streaming error: {exc}")
+
+    def _can_stream_render(
+        self,
+        session: PreviewSession,
+        spritesheet_label: str,
+        animation_name: str,
+        merged_settings: dict,
+    ) -> bool:
+        """Return ``True`` if raw frames can be shown while they render.
+
+        Only uncached spritemap symbols qualify, and only when every rendered
+        frame is kept: other selections need the whole animation first.
+        """
+        if not session.spritemap_info or session.has_animation(animation_name):
+            return False
+        if merged_settings.get("indices"):
+            return False
+        if merged_settings.get("frame_selection") not in (None, "All"):
+            return False
+        return not self._get_editor_composite_definition(
+            spritesheet_label, animation_name
+        )
+
+    def _stream_spritemap_frames(
+        self,
+        session: PreviewSession,
+        spritesheet_label: str,
+        animation_name: str,
+        merged_settings: dict,
+        is_cancelled: Callable[[], bool],
+    ) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """Render a spritemap symbol, yielding provisional frames as they appear.
+
+        Once every frame has rendered, the finished raw frames are stored in
+        the session exactly as ``_render_spritemap_preview`` would produce them.
+        """
+        renderer = session.spritemap_renderer(self.settings_manager, spritesheet_label)
+        if renderer is None:
+            return
+
+        symbol_entry = session.spritemap_info.get("symbol_map", {}).get(
+            animation_name, animation_name
+        )
+        total = renderer.frame_count(symbol_entry)
+        crop = (merged_settings.get("crop_option") or "None").lower() != "none"
+        threshold = self._preview_threshold(merged_settings) if crop else None
+        scale = merged_settings.get("scale")
+        scale_value = scale if isinstance(scale, (int, float)) else 1.0
+
+        rendered = []
+        union = None
+        for index, image in renderer.iter_animation_frames(symbol_entry):
+            if is_cancelled():
+                return
+            rendered.append((index, image))
+
+            array = ensure_rgba_array(image)
+            if crop:
+                bbox = frame_bbox(array)
+                if bbox is not None:
+                    union = (
+                        bbox
+                        if union is None
+                        else (
+                            min(union[0], bbox[0]),
+                            min(union[1], bbox[1]),
+                            max(union[2], bbox[2]),
+                            max(union[3], bbox[3]),
+                        )
+                    )
+                if union is None:
+                    continue
+                array = crop_to_bbox(array, union)
+                if threshold is not None:
+                    array = apply_alpha_threshold(array, threshold)
+            frame = np.ascontiguousarray(scale_array_nearest(array, scale_value))
+            yield len(rendered) - 1, total, frame
+
+        frames = renderer.finalize_frames(rendered, renderer.frame_prefix(symbol_entry))
+        if not frames:
+            print(f"No frames rendered for spritemap animation: {animation_name}")
+            return
+        session.animation_frames(animation_name, lambda: frames)
+
+    def _merge_preview_settings(
+        self, spritesheet_label: str, animation_name: str, settings: dict
+    ) -> dict:
+        """Overlay ``settings`` on the stored animation settings."""
+        preview_settings = self.settings_manager.get_settings(
+            spritesheet_label, f"{spritesheet_label}/{animation_name}"
+        )
+        merged_settings = {**preview_settings, **settings}
+        merged_settings["animation_format"] = self._resolve_preview_format(
+            merged_settings
+        )
+        return merged_settings
+
+    @staticmethod
+    def _preview_threshold(merged_settings: dict) -> Optional[float]:
+        """Return the alpha threshold the exporter would apply, if any."""
+        if merged_settings["animation_format"] != "GIF":
+            return None
+        try:
+            return float(merged_settings.get("threshold"))
+        except (TypeError, ValueError):
+            return None
+
+    def _cropped_stage(
+        self, session: PreviewSession, filtered_frames: List, merged_settings: dict
+    ) -> List[np.ndarray]:
+        """Return the selected frames cropped and thresholded, cached per session."""
+        crop_option = merged_settings.get("crop_option")
+        threshold = self._preview_threshold(merged_settings)
+
+        def crop():
+            bboxes = None
+            if (crop_option or "None").lower() != "none":
+                bboxes = [frame_record_bbox(frame) for frame in filtered_frames]
+            return prepare_array_sequence(
+                pad_frames_to_canvas([frame[1] for frame in filtered_frames]),
+                1.0,
+                crop_option,
+                threshold,
+                bboxes,
+            )
+
+        return session.cached_stage(
+            "cropped", (crop_option, threshold), filtered_frames, crop
+        )
+
+    def _prepare_preview_animation(
+        self,
+        session: PreviewSession,
+        spritesheet_label: str,
+        animation_name: str,
+        settings: dict,
+    ) -> Optional[Tuple[List, dict]]:
+        """Collect frames and resolve settings for the requested animation.
+
+        Returns:
+            Tuple of (selected frames, merged settings), or ``None`` if no
+            frames are available.
+        """
+        image_tuples = self._collect_preview_frames(
+            session, spritesheet_label, animation_name, settings
+        )
+        if not image_tuples:
+            return None
+
+        merged_settings = self._merge_preview_settings(
+            spritesheet_label, animation_name, settings
+        )
+
+        indices = merged_settings.get("indices")
+        selection_key = (
+            merged_settings.get("frame_selection"),
+            tuple(indices) if isinstance(indices, (list, tuple)) else indices,
+        )
+        filtered_frames = session.cached_stage(
+            "selection",
+            selection_key,
+            image_tuples,
+            lambda: self._filter_preview_frames(
+                image_tuples,
+                merged_settings,
+                spritesheet_label,
+                animation_name,
+            ),
+        )
+        if not filtered_frames:
             return None
+        return filtered_frames, merged_settings
 
     def _collect_preview_frames(
         self,
-        atlas_path,
-        metadata_path,
-        spritemap_info,
-        spritesheet_label,
-        animation_name,
-        settings,
-    ) -> Optional[Dict[str, List]]:
+        session: PreviewSession,
+        spritesheet_label: str,
+        animation_name: str,
+        settings: dict,
+    ) -> Optional[List]:
         """Collect frames for the requested animation from the appropriate source.
 
         Checks for editor composite definitions first, then spritemap projects,
-        and finally standard spritesheet metadata.
+        and finally standard spritesheet metadata. Rendered frames are cached
+        in the session; composites are rebuilt because their definition can
+        change between previews.
 
         Returns:
-            Dict mapping animation name to frame list, or ``None`` if unavailable.
+            Frame list, or ``None`` if unavailable.
         """
         definition = self._get_editor_composite_definition(
             spritesheet_label, animation_name
         )
         if definition:
             frames = self._build_editor_composite_preview_frames(
-                definition,
-                atlas_path,
-                metadata_path,
-                spritemap_info,
-                spritesheet_label,
+                definition, session, spritesheet_label
             )
-            return {animation_name: frames} if frames else None
+            return frames or None
 
-        if spritemap_info:
-            frames = self._render_spritemap_preview(
-                spritemap_info,
-                atlas_path,
+        if session.spritemap_info:
+            return session.animation_frames(
                 animation_name,
-                spritesheet_label,
-                settings,
+                lambda: self._render_spritemap_preview(
+                    session, animation_name, spritesheet_label
+                ),
             )
-            return {animation_name: frames} if frames else None
 
-        frames = self._render_spritesheet_preview(
-            atlas_path, metadata_path, animation_name
+        return session.animation_frames(
+            animation_name,
+            lambda: self._render_spritesheet_preview(session, animation_name),
         )
-        return {animation_name: frames} if frames else None
 
-    def _render_spritemap_preview(
-        self,
-        spritemap_info,
-        atlas_path,
-        animation_name,
-        spritesheet_label,
-        settings,
-    ):
+    def _render_spritemap_preview(self, session, animation_name, spritesheet_label):
         """Render frames for an Adobe Spritemap animation.
 
         Returns:
             List of frame tuples, or ``None`` if rendering fails.
         """
-        animation_json_path = spritemap_info.get("animation_json")
-        spritemap_json_path = spritemap_info.get("spritemap_json")
-        if not animation_json_path or not spritemap_json_path:
+        renderer = session.spritemap_renderer(self.settings_manager, spritesheet_label)
+        if renderer is None:
             return None
 
-        renderer = AdobeSpritemapRenderer(
-            animation_json_path,
-            spritemap_json_path,
-            atlas_path,
-            filter_single_frame=settings.get("filter_single_frame_spritemaps", True),
-        )
-        renderer.ensure_animation_defaults(self.settings_manager, spritesheet_label)
-        symbol_entry = spritemap_info.get("symbol_map", {}).get(
+        symbol_entry = session.spritemap_info.get("symbol_map", {}).get(
             animation_name, animation_name
         )
         frames = renderer.render_animation(symbol_entry)
@@ -200,29 +531,20 @@ class PreviewGenerator:
             return None
         return frames
 
-    def _render_spritesheet_preview(self, atlas_path, metadata_path, animation_name):
+    def _render_spritesheet_preview(self, session, animation_name):
         """Render frames for a standard spritesheet animation.
 
         Returns:
             List of frame tuples, or ``None`` if parsing fails.
         """
-        if not metadata_path:
-            return None
-
-        atlas_processor = AtlasProcessor(atlas_path, metadata_path)
-        if metadata_path.endswith(".xml"):
-            animation_sprites = atlas_processor.parse_xml_for_preview(animation_name)
-        elif metadata_path.endswith(".txt"):
-            animation_sprites = atlas_processor.parse_txt_for_preview(animation_name)
-        else:
-            print(f"Unsupported metadata format for preview: {metadata_path}")
+        if not session.metadata_path:
             return None
 
-        if not animation_sprites:
-            print(f"No sprites found for animation: {animation_name}")
+        sprite_processor = session.sprite_processor
+        if sprite_processor is None:
+            print(f"Could not load spritesheet for preview: {session.atlas_path}")
             return None
 
-        sprite_processor = SpriteProcessor(atlas_processor.atlas, animation_sprites)
         processed = sprite_processor.process_specific_animation(animation_name)
         frames = processed.get(animation_name)
         if not frames:
@@ -233,9 +555,7 @@ class PreviewGenerator:
     def _build_editor_composite_preview_frames(
         self,
         definition,
-        atlas_path,
-        metadata_path,
-        spritemap_info,
+        session,
         spritesheet_label,
     ):
         """Build frames for an editor-defined composite animation.
@@ -243,12 +563,7 @@ class PreviewGenerator:
         Returns:
             List of composite frame tuples, or empty list on failure.
         """
-        source_frames = self._load_source_frames_for_preview(
-            atlas_path,
-            metadata_path,
-            spritemap_info,
-            spritesheet_label,
-        )
+        source_frames = self._load_source_frames_for_preview(session, spritesheet_label)
         if not source_frames:
             print(
                 "[PreviewGenerator] Unable to load source frames for composite preview."
@@ -260,71 +575,29 @@ class PreviewGenerator:
             log_warning=lambda message: print(message),
         )
 
-    def _load_source_frames_for_preview(
-        self,
-        atlas_path,
-        metadata_path,
-        spritemap_info,
-        spritesheet_label,
-    ):
+    def _load_source_frames_for_preview(self, session, spritesheet_label):
         """Load all source animations for composite frame building.
 
         Returns:
             Dict mapping animation names to frame lists.
         """
         try:
-            if spritemap_info:
-                return self._load_spritemap_source_frames(
-                    spritemap_info,
-                    atlas_path,
-                    spritesheet_label,
+            if session.spritemap_info:
+                renderer = session.spritemap_renderer(
+                    self.settings_manager, spritesheet_label
                 )
+                if renderer is None:
+                    return {}
+                return session.source_animations(renderer.build_animation_frames)
 
-            if not metadata_path:
+            sprite_processor = session.sprite_processor
+            if sprite_processor is None:
                 return {}
-
-            return self._load_metadata_source_frames(atlas_path, metadata_path)
+            return session.source_animations(sprite_processor.process_sprites)
         except Exception as exc:
             print(f"[PreviewGenerator] Failed to load source frames for preview: {exc}")
             return {}
 
-    def _load_spritemap_source_frames(
-        self, spritemap_info, atlas_path, spritesheet_label
-    ):
-        """Load all animations from an Adobe Spritemap project.
-
-        Returns:
-            Cloned animation map dict.
-        """
-        animation_json_path = spritemap_info.get("animation_json")
-        spritemap_json_path = spritemap_info.get("spritemap_json")
-        if not animation_json_path or not spritemap_json_path:
-            return {}
-
-        renderer = AdobeSpritemapRenderer(
-            animation_json_path,
-            spritemap_json_path,
-            atlas_path,
-            filter_single_frame=False,
-        )
-        renderer.ensure_animation_defaults(self.settings_manager, spritesheet_label)
-        animations = renderer.build_animation_frames()
-        return clone_animation_map(animations)
-
-    @staticmethod
-    def _load_metadata_source_frames(atlas_path, metadata_path):
-        """Load all animations from standard spritesheet metadata.
-
-        Returns:
-            Cloned animation map dict.
-        """
-        atlas_processor = AtlasProcessor(atlas_path, metadata_path)
-        sprite_processor = SpriteProcessor(
-            atlas_processor.atlas, atlas_processor.sprites
-        )
-        animations = sprite_processor.process_sprites()
-        return clone_animation_map(animations)
-
     @staticmethod
     def _resolve_preview_format(settings):
         """Return the animation format for preview, defaulting to GIF."""
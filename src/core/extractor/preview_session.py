@@ -0,0 +1,297 @@
+"""Per-spritesheet state kept hot between animation previews.
+
+Provides ``PreviewSession``, which holds the decoded atlas, parsed sprites,
+rendered animation frames and the most recent selection/preparation results
+for one spritesheet, and ``PreviewSessionCache``, a small LRU of sessions
+shared by every ``PreviewGenerator``.
+
+Each stage is recomputed only when its inputs change:
+
+    source files (mtime/size) -> decoded atlas + parsed sprites
+    animation name            -> raw frames
+    frame selection settings  -> selected frames
+    crop/threshold            -> cropped arrays
+    scale                     -> display-ready arrays
+
+Frame durations are cheap and always recomputed by the caller.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.editor.editor_composite import clone_animation_map
+from core.extractor.atlas_processor import AtlasProcessor
+from core.extractor.frame_pipeline import FrameTuple
+from core.extractor.sprite_processor import SpriteProcessor
+from core.extractor.spritemap import AdobeSpritemapRenderer
+
+SessionKey = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def _file_fingerprint(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Return ``(mtime_ns, size)`` for a file, or ``None`` if unavailable."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class PreviewSession:
+    """Cached preview state for a single spritesheet.
+
+    Attributes:
+        atlas_path: Path to the atlas image.
+        metadata_path: Path to the metadata file, or ``None``.
+        spritemap_info: Adobe spritemap project info, or ``None``.
+        fingerprint: File fingerprints the cached data was built from.
+    """
+
+    MAX_ANIMATIONS = 8  # Raw frame lists kept per spritesheet
+
+    def __init__(
+        self,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        spritemap_info: Optional[dict] = None,
+    ) -> None:
+        """Create an empty session; stages are filled on first use.
+
+        Args:
+            atlas_path: Path to the atlas image.
+            metadata_path: Path to metadata, or ``None`` for unknown sheets.
+            spritemap_info: Optional Adobe spritemap project info dict.
+        """
+        self.atlas_path = atlas_path
+        self.metadata_path = metadata_path
+        self.spritemap_info = spritemap_info
+        self.fingerprint = self._current_fingerprint()
+        # Held by whoever is reading or filling stages; preview frames are
+        # prepared on worker threads
+        self.lock = threading.RLock()
+
+        self._sprite_processor: Optional[SpriteProcessor] = None
+        self._renderer: Optional[AdobeSpritemapRenderer] = None
+        self._source_animations: Optional[Dict[str, List[FrameTuple]]] = None
+        self._animations: "OrderedDict[str, List[FrameTuple]]" = OrderedDict()
+        # stage -> (settings key, value, upstream result it was computed from)
+        self._stages: Dict[str, Tuple[tuple, Any, Any]] = {}
+
+    def _current_fingerprint(self) -> tuple:
+        """Fingerprint every file the session reads."""
+        paths = [self.atlas_path, self.metadata_path]
+        if self.spritemap_info:
+            paths.append(self.spritemap_info.get("animation_json"))
+            paths.append(self.spritemap_info.get("spritemap_json"))
+        return tuple(_file_fingerprint(path) for path in paths)
+
+    def is_stale(self) -> bool:
+        """Return ``True`` if a source file changed since the session was built."""
+        return self._current_fingerprint() != self.fingerprint
+
+    # ------------------------------------------------------------------
+    # Source stages
+    # ------------------------------------------------------------------
+    @property
+    def sprite_processor(self) -> Optional[SpriteProcessor]:
+        """Decoded atlas and parsed sprites, built once per session."""
+        if self._sprite_processor is None and self.metadata_path:
+            atlas_processor = AtlasProcessor(self.atlas_path, self.metadata_path)
+            if atlas_processor.atlas is None:
+                return None
+            self._sprite_processor = SpriteProcessor(
+                atlas_processor.atlas, atlas_processor.sprites
+            )
+        return self._sprite_processor
+
+    def spritemap_renderer(
+        self, settings_manager=None, spritesheet_label: Optional[str] = None
+    ) -> Optional[AdobeSpritemapRenderer]:
+        """Return the spritemap renderer, loading the project on first use.
+
+        Args:
+            settings_manager: Receives FPS defaults when the renderer is built.
+            spritesheet_label: Spritesheet name used for those defaults.
+        """
+        if self._renderer is None and self.spritemap_info:
+            animation_json_path = self.spritemap_info.get("animation_json")
+            spritemap_json_path = self.spritemap_info.get("spritemap_json")
+            if not animation_json_path or not spritemap_json_path:
+                return None
+            # render_animation ignores the filter; build_animation_frames
+            # callers (editor composites) want every symbol
+            self._renderer = AdobeSpritemapRenderer(
+                animation_json_path,
+                spritemap_json_path,
+                self.atlas_path,
+                filter_single_frame=False,
+            )
+            if settings_manager is not None:
+                self._renderer.ensure_animation_defaults(
+                    settings_manager, spritesheet_label
+                )
+        return self._renderer
+
+    def animation_frames(
+        self, animation_name: str, render: Callable[[], Optional[List[FrameTuple]]]
+    ) -> Optional[List[FrameTuple]]:
+        """Return the raw frames of an animation, rendering them once.
+
+        Args:
+            animation_name: Cache key for the animation.
+            render: Produces the frame list on a cache miss.
+
+        Returns:
+            The cached frame list (do not mutate), or ``None`` if rendering
+            produced nothing.
+        """
+        frames = self._animations.get(animation_name)
+        if frames is not None:
+            self._animations.move_to_end(animation_name)
+            return frames
+
+        frames = render()
+        if not frames:
+            return None
+        self._animations[animation_name] = frames
+        while len(self._animations) > self.MAX_ANIMATIONS:
+            self._animations.popitem(last=False)
+        return frames
+
+    def source_animations(
+        self, load: Callable[[], Dict[str, List[FrameTuple]]]
+    ) -> Dict[str, List[FrameTuple]]:
+        """Return a clone of every animation, used to build editor composites.
+
+        Args:
+            load: Produces the full animation map on a cache miss.
+        """
+        if self._source_animations is None:
+            self._source_animations = load() or {}
+        return clone_animation_map(self._source_animations)
+
+    # ------------------------------------------------------------------
+    # Settings-dependent stages
+    # ------------------------------------------------------------------
+    def cached_stage(
+        self, stage: str, key: tuple, inputs: Any, compute: Callable[[], Any]
+    ) -> Any:
+        """Return the last result of ``stage`` if its key is unchanged.
+
+        Only the most recent result per stage is kept: settings tweaks in the
+        preview window change one stage at a time.
+
+        Args:
+            stage: Stage name.
+            key: Settings the stage depends on.
+            inputs: Upstream result; the cached value is only reused for the
+                very same object.
+            compute: Produces the result on a miss.
+        """
+        value = self.peek_stage(stage, key, inputs)
+        if value is None:
+            value = compute()
+            self.store_stage(stage, key, inputs, value)
+        return value
+
+    def peek_stage(self, stage: str, key: tuple, inputs: Any) -> Any:
+        """Return the cached result of ``stage`` for ``key``/``inputs``, or ``None``."""
+        entry = self._stages.get(stage)
+        if entry is not None and entry[0] == key and entry[2] is inputs:
+            return entry[1]
+        return None
+
+    def store_stage(self, stage: str, key: tuple, inputs: Any, value: Any) -> None:
+        """Record a result computed outside ``cached_stage`` (e.g. incrementally)."""
+        self._stages[stage] = (key, value, inputs)
+
+    def has_animation(self, animation_name: str) -> bool:
+        """Return ``True`` if the raw frames of an animation are cached."""
+        return animation_name in self._animations
+
+
+class PreviewSessionCache:
+    """LRU of ``PreviewSession`` objects shared across preview requests.
+
+    Preview requests build a fresh ``Extractor``/``PreviewGenerator`` each
+    time, so sessions live at class level like the parser and exporter
+    registries.
+
+    Class Attributes:
+        max_sessions: Spritesheets kept hot at once.
+    """
+
+    max_sessions: int = 3
+    _sessions: "OrderedDict[SessionKey, PreviewSession]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(
+        atlas_path: str,
+        metadata_path: Optional[str],
+        spritemap_info: Optional[dict],
+    ) -> SessionKey:
+        animation_json = spritemap_json = None
+        if spritemap_info:
+            animation_json = spritemap_info.get("animation_json")
+            spritemap_json = spritemap_info.get("spritemap_json")
+        return (
+            os.path.abspath(atlas_path),
+            os.path.abspath(metadata_path) if metadata_path else None,
+            animation_json,
+            spritemap_json,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        atlas_path: str,
+        metadata_path: Optional[str],
+        spritemap_info: Optional[dict] = None,
+    ) -> PreviewSession:
+        """Return the session for a spritesheet, creating or rebuilding it.
+
+        A session whose source files changed on disk is discarded.
+
+        Args:
+            atlas_path: Path to the atlas image.
+            metadata_path: Path to metadata, or ``None``.
+            spritemap_info: Optional Adobe spritemap project info dict.
+        """
+        key = cls._key(atlas_path, metadata_path, spritemap_info)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is not None and not session.is_stale():
+                cls._sessions.move_to_end(key)
+                return session
+
+            session = PreviewSession(atlas_path, metadata_path, spritemap_info)
+            cls._sessions[key] = session
+            cls._sessions.move_to_end(key)
+            while len(cls._sessions) > cls.max_sessions:
+                cls._sessions.popitem(last=False)
+            return session
+
+    @classmethod
+    def invalidate(cls, atlas_path: Optional[str] = None) -> None:
+        """Drop cached sessions.
+
+        Args:
+            atlas_path: Only drop sessions for this atlas; ``None`` drops all.
+        """
+        with cls._lock:
+            if atlas_path is None:
+                cls._sessions.clear()
+                return
+            target = os.path.abspath(atlas_path)
+            for key in [key for key in cls._sessions if key[0] == target]:
+                del cls._sessions[key]
+
+
+__all__ = ["PreviewSession", "PreviewSessionCache"]
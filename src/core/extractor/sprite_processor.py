@@ -4,22 +4,24 @@ Provides ``SpriteProcessor`` which crops individual sprites from an atlas
 and organizes them into animation groups based on naming conventions.
 """
 
-import re
-
 import numpy as np
 
-from utils.utilities import Utilities
+from core.extractor.frame_buffer import readonly_view
+from core.extractor.image_utils import FrameRecord
+from parsers.sprite_table import SpriteTable
 
 
 class SpriteProcessor:
     """Extract sprites from an atlas and group them into animations.
 
     Caches an RGBA NumPy view of the atlas so each sprite extraction is a
-    cheap array slice rather than repeated PIL conversions.
+    cheap array slice rather than repeated PIL conversions. Sprite metadata
+    is held as a ``SpriteTable`` so frame geometry is computed column-wise.
 
     Attributes:
         atlas: Source PIL image.
-        sprites: List of sprite metadata dicts from a parser.
+        sprites: Sprite metadata as given, a list of dicts or a ``SpriteTable``.
+        table: The same sprites as a ``SpriteTable``.
     """
 
     def __init__(self, atlas, sprites):
@@ -27,14 +29,33 @@ class SpriteProcessor:
 
         Args:
             atlas: PIL image of the full atlas.
-            sprites: List of sprite dicts with keys like ``name``, ``x``, ``y``, etc.
+            sprites: Sprite dicts with keys like ``name``, ``x``, ``y``, etc.,
+                or a ``SpriteTable``. Dicts missing a required key are skipped.
         """
         self.atlas = atlas
         # Cache an RGBA atlas so downstream crops avoid repeated conversions.
         self._atlas_rgba = atlas if atlas.mode == "RGBA" else atlas.convert("RGBA")
-        # Keep a NumPy view of the atlas so each sprite extraction is a cheap slice.
-        self._atlas_array = np.ascontiguousarray(np.asarray(self._atlas_rgba))
+        # Keep a NumPy view of the atlas so each sprite extraction is a cheap
+        # slice. It is read-only, so no consumer can write through a frame
+        # into the atlas (see frame_buffer).
+        self._atlas_array = readonly_view(
+            np.ascontiguousarray(np.asarray(self._atlas_rgba))
+        )
         self.sprites = sprites
+        self.table = SpriteTable.from_sprites(sprites)
+        self._report_out_of_bounds()
+
+    def _report_out_of_bounds(self):
+        """Log sprites whose rectangle leaves the atlas; they are clipped."""
+        atlas_height, atlas_width = self._atlas_array.shape[:2]
+        outside = self.table.out_of_bounds_mask(atlas_width, atlas_height)
+        count = int(np.count_nonzero(outside))
+        if count:
+            examples = ", ".join(str(name) for name in self.table.names[outside][:5])
+            print(
+                f"[SpriteProcessor] {count} sprite(s) extend past the "
+                f"{atlas_width}x{atlas_height} atlas and will be clipped: {examples}"
+            )
 
     def process_sprites(self):
         """Process all sprites and group them into animations by name prefix.
@@ -43,21 +64,13 @@ class SpriteProcessor:
             Dict mapping animation names to lists of ``(name, image, metadata)``
             tuples where image is a NumPy array.
         """
-        animations = {}
-        for sprite in self.sprites:
-            frame_tuple = self._build_frame_tuple(sprite)
-            if frame_tuple is None:
-                continue
-            name = frame_tuple[0]
-            folder_name = Utilities.strip_trailing_digits(name)
-            animations.setdefault(folder_name, []).append(frame_tuple)
-        return animations
+        return self._group_frames(None)
 
     def process_specific_animation(self, animation_name):
         """Process only sprites belonging to a specific animation.
 
         Uses flexible pattern matching to handle trailing digits and
-        separator variations.
+        separator variations, answered from the table's name index.
 
         Args:
             animation_name: Animation identifier to match against sprite names.
@@ -65,92 +78,105 @@ class SpriteProcessor:
         Returns:
             Dict mapping matched animation names to frame tuple lists.
         """
-        patterns = [
-            animation_name,
-            re.sub(r"\d+$", "", animation_name),
-            re.sub(r"_?\d+$", "", animation_name),
-            re.sub(r"[-_]?\d+$", "", animation_name),
-        ]
-        patterns = list(dict.fromkeys(patterns))
-
-        matching_sprites = []
-        for sprite in self.sprites:
-            sprite_name = sprite.get("name", "")
-            if any(
-                sprite_name == pat or sprite_name.startswith(pat) for pat in patterns
-            ):
-                matching_sprites.append(sprite)
-
-        if not matching_sprites:
+        matching = self.table.name_index.match_animation(animation_name)
+        if not len(matching):
             return {}
+        return self._group_frames(matching)
 
-        animations = {}
-        for sprite in matching_sprites:
-            frame_tuple = self._build_frame_tuple(sprite)
-            if frame_tuple is None:
-                continue
-            name = frame_tuple[0]
-            folder_name = Utilities.strip_trailing_digits(name)
-            animations.setdefault(folder_name, []).append(frame_tuple)
+    def _group_frames(self, indices):
+        """Build frames for the given rows (all if ``None``), grouped by animation.
+
+        Group names come from the name index, so no name is stripped twice.
+        """
+        base_names = self.table.name_index.base_names
+        if indices is None:
+            rows = range(len(self.table))
+            table = self.table
+        else:
+            rows = indices.tolist()
+            table = self.table.select(indices)
 
+        animations = {}
+        for row, frame_tuple in zip(rows, self._iter_frame_tuples(table)):
+            animations.setdefault(base_names[row], []).append(frame_tuple)
         return animations
 
-    def _build_frame_tuple(self, sprite):
-        """Build a frame tuple from a sprite metadata dict.
+    def _iter_frame_tuples(self, table):
+        """Yield a frame tuple per sprite row.
+
+        Canvas sizes and the "needs a canvas" test are computed for all rows
+        at once; the loop only slices the atlas and composes where needed.
         Handles rotation, frame offsets, and canvas composition.
 
         Args:
-            sprite: Dict with at least ``name``, ``x``, ``y``, ``width``, ``height``.
+            table: ``SpriteTable`` rows to build.
 
-        Returns:
-            Tuple ``(name, array, metadata)``, or ``None`` if required keys are missing.
+        Yields:
+            ``FrameRecord`` tuples ``(name, array, metadata)`` whose bounding
+            box is seeded with the sprite's rect on the frame canvas.
         """
-        try:
-            name = sprite["name"]
-            x, y, width, height = (
-                sprite["x"],
-                sprite["y"],
-                sprite["width"],
-                sprite["height"],
-            )
-        except KeyError:
-            return None
-
-        frame_x = sprite.get("frameX", 0)
-        frame_y = sprite.get("frameY", 0)
-        frame_width = sprite.get("frameWidth", width)
-        frame_height = sprite.get("frameHeight", height)
-        rotated = sprite.get("rotated", False)
-
-        sprite_array = self._atlas_array[y : y + height, x : x + width]
-        requires_canvas = rotated or frame_x or frame_y
-
-        if rotated:
-            sprite_array = np.rot90(sprite_array)
-            sprite_height, sprite_width = sprite_array.shape[:2]
-            frame_width = max(height - frame_x, frame_width, 1)
-            frame_height = max(width - frame_y, frame_height, 1)
-        else:
+        rotated = table.rotated
+        # Size of the sprite once rotated back upright
+        upright_width = np.where(rotated, table.height, table.width)
+        upright_height = np.where(rotated, table.width, table.height)
+        frame_widths = np.maximum(
+            np.maximum(upright_width - table.frame_x, table.frame_width), 1
+        )
+        frame_heights = np.maximum(
+            np.maximum(upright_height - table.frame_y, table.frame_height), 1
+        )
+        offset = rotated | (table.frame_x != 0) | (table.frame_y != 0)
+
+        rows = zip(
+            table.names.tolist(),
+            table.x.tolist(),
+            table.y.tolist(),
+            table.width.tolist(),
+            table.height.tolist(),
+            table.frame_x.tolist(),
+            table.frame_y.tolist(),
+            frame_widths.tolist(),
+            frame_heights.tolist(),
+            rotated.tolist(),
+            offset.tolist(),
+        )
+        for (
+            name,
+            x,
+            y,
+            width,
+            height,
+            frame_x,
+            frame_y,
+            frame_width,
+            frame_height,
+            is_rotated,
+            requires_canvas,
+        ) in rows:
+            sprite_array = self._atlas_array[y : y + height, x : x + width]
+            if is_rotated:
+                sprite_array = np.rot90(sprite_array)
+
+            # Clipped sprites are smaller than their metadata says
             sprite_height, sprite_width = sprite_array.shape[:2]
-            frame_width = max(width - frame_x, frame_width, 1)
-            frame_height = max(height - frame_y, frame_height, 1)
-
-        if frame_width != sprite_width or frame_height != sprite_height:
-            requires_canvas = True
-
-        if requires_canvas:
-            frame_array = self._compose_frame_array(
-                sprite_array,
-                frame_width,
-                frame_height,
-                frame_x,
-                frame_y,
-            )
-        else:
-            frame_array = sprite_array
-
-        metadata = (x, y, width, height, frame_x, frame_y)
-        return name, frame_array, metadata
+            if requires_canvas or (
+                frame_width != sprite_width or frame_height != sprite_height
+            ):
+                frame_array, content_rect = self._compose_frame_array(
+                    sprite_array,
+                    frame_width,
+                    frame_height,
+                    frame_x,
+                    frame_y,
+                )
+                # Handed out like the atlas slices: shared and read-only
+                frame_array = readonly_view(frame_array)
+            else:
+                frame_array = sprite_array
+                content_rect = (0, 0, sprite_width, sprite_height)
+
+            metadata = (x, y, width, height, frame_x, frame_y)
+            yield FrameRecord(name, frame_array, metadata, content_rect=content_rect)
 
     @staticmethod
     def _compose_frame_array(
@@ -159,7 +185,7 @@ class SpriteProcessor:
         frame_height: int,
         frame_x: int,
         frame_y: int,
-    ) -> np.ndarray:
+    ) -> tuple:
         """Place the trimmed sprite onto its logical canvas.
 
         Args:
@@ -170,7 +196,8 @@ class SpriteProcessor:
             frame_y: Vertical offset (negative moves sprite down).
 
         Returns:
-            RGBA NumPy array of the composed frame.
+            Tuple ``(canvas, rect)``: the composed RGBA array and the
+            ``(left, top, right, bottom)`` area the sprite was copied to.
         """
 
         canvas = np.zeros(
@@ -195,4 +222,10 @@ class SpriteProcessor:
                 src_x : src_x + copy_width,
             ]
 
-        return canvas
+        rect = (
+            dest_x,
+            dest_y,
+            dest_x + max(0, copy_width),
+            dest_y + max(0, copy_height),
+        )
+        return canvas, rect
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
+from utils.utilities import Utilities
+
 
 def _frame_duration(frame: dict) -> int:
     """Return clamped duration for a single frame entry.
@@ -149,3 +151,58 @@ def extract_label_ranges_from_layers(
         Sorted list of dicts with ``name``, ``start``, and ``end`` keys.
     """
     return _extract_label_ranges_from_layers(layers)
+
+
+def build_symbol_map(
+    animation_json: dict, filter_single_frame: bool = True
+) -> Dict[str, dict]:
+    """Map display labels to the symbols and timeline labels of a project.
+
+    Args:
+        animation_json: Parsed Animation.json structure.
+        filter_single_frame: Skip entries spanning one frame or less.
+
+    Returns:
+        Dict keyed by human-friendly label. Values hold ``type``
+        (``"symbol"`` or ``"timeline_label"``), ``value`` (original name)
+        and ``frame_count``.
+    """
+
+    symbol_map: Dict[str, dict] = {}
+
+    def register_entry(display_name, entry_type, entry_value, frame_count):
+        """Store entries with unique labels so symbols and labels never collide."""
+        suffix = " (Timeline)" if entry_type == "timeline_label" else " (Symbol)"
+        candidate = display_name
+        if candidate in symbol_map:
+            candidate = f"{display_name}{suffix}"
+            counter = 2
+            while candidate in symbol_map:
+                candidate = f"{display_name}{suffix} #{counter}"
+                counter += 1
+        symbol_map[candidate] = {
+            "type": entry_type,
+            "value": entry_value,
+            "frame_count": frame_count,
+        }
+
+    symbol_lengths = compute_symbol_lengths(animation_json)
+
+    for symbol in animation_json.get("SD", {}).get("S", []):
+        raw_name = symbol.get("SN")
+        if not raw_name:
+            continue
+        frame_count = symbol_lengths.get(raw_name, 0)
+        if filter_single_frame and frame_count <= 1:
+            continue
+        display_name = Utilities.strip_trailing_digits(raw_name) or raw_name
+        register_entry(display_name, "symbol", raw_name, frame_count)
+
+    for label in extract_label_ranges(animation_json, None):
+        label_name = label["name"]
+        frame_count = label["end"] - label["start"]
+        if filter_single_frame and frame_count <= 1:
+            continue
+        register_entry(label_name, "timeline_label", label_name, frame_count)
+
+    return symbol_map
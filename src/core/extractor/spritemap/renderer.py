@@ -8,7 +8,7 @@ or timeline label into a sequence of cropped RGBA frames.
 from __future__ import annotations
 
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from PIL import Image
 
@@ -157,30 +157,62 @@ class AdobeSpritemapRenderer:
             frames exist.
         """
 
+        frames_with_index = list(
+            self._iter_symbol_frames(symbol_name, start_frame, end_frame)
+        )
+        return self.finalize_frames(
+            frames_with_index,
+            frame_name_prefix or (symbol_name if symbol_name else "timeline"),
+        )
+
+    def _iter_symbol_frames(
+        self,
+        symbol_name: Optional[str],
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Image.Image]]:
+        """Yield ``(relative_index, image)`` for each frame as it is rendered.
+
+        Frames that render to nothing are skipped. Images are not normalized
+        or cropped; see ``finalize_frames``.
+        """
+
         total_frames = self.symbols.length(symbol_name)
         if total_frames == 0:
-            return []
+            return
 
         if end_frame is None or end_frame > total_frames:
             end_frame = total_frames
 
-        if start_frame >= end_frame:
-            return []
-
-        rendered_frames: List[
-            Tuple[str, Image.Image, Tuple[int, int, int, int, int, int]]
-        ] = []
-        frames_with_index = []
-
         for frame_index in range(start_frame, end_frame):
             frame_image = self.symbols.render_symbol(symbol_name, frame_index)
             if frame_image is None:
                 continue
-            frames_with_index.append((frame_index - start_frame, frame_image))
+            yield frame_index - start_frame, frame_image
+
+    def finalize_frames(
+        self,
+        frames_with_index: Sequence[Tuple[int, Image.Image]],
+        prefix: str,
+    ) -> List[Tuple[str, Image.Image, Tuple[int, int, int, int, int, int]]]:
+        """Normalize rendered frames to one canvas and crop to their union bbox.
+
+        Args:
+            frames_with_index: ``(relative_index, image)`` pairs as rendered.
+            prefix: Prefix for generated frame names.
+
+        Returns:
+            List of ``(name, image, bounds)`` tuples, or empty if no frame has
+            visible pixels.
+        """
 
         if not frames_with_index:
             return []
 
+        rendered_frames: List[
+            Tuple[str, Image.Image, Tuple[int, int, int, int, int, int]]
+        ] = []
+
         sizes = [frame.size for _, frame in frames_with_index]
         max_width = max(width for width, _ in sizes)
         max_height = max(height for _, height in sizes)
@@ -210,8 +242,6 @@ class AdobeSpritemapRenderer:
         if min_x > max_x:
             return []
 
-        prefix = frame_name_prefix or (symbol_name if symbol_name else "timeline")
-
         for frame_index, frame in normalized_frames:
             cropped_frame = frame.crop((min_x, min_y, max_x, max_y))
             frame_name = f"{prefix}_{frame_index:04d}"
@@ -264,20 +294,57 @@ class AdobeSpritemapRenderer:
             List of ``(name, image, bounds)`` tuples for the requested target.
         """
 
+        frames_with_index = list(self.iter_animation_frames(target))
+        return self.finalize_frames(frames_with_index, self.frame_prefix(target))
+
+    def iter_animation_frames(self, target) -> Iterator[Tuple[int, Image.Image]]:
+        """Yield raw frames of a symbol or timeline label as they render.
+
+        Consumers that want to show frames early can display these and pass
+        the collected pairs to ``finalize_frames`` for the final, cropped
+        frames that ``render_animation`` would return.
+
+        Args:
+            target: Symbol name, or a dict with ``type`` and ``value`` keys.
+
+        Yields:
+            ``(relative_index, image)`` pairs.
+        """
+
         target_type, target_value = self._normalize_target(target)
 
         if target_type == "timeline_label":
             label_range = self.symbols.get_label_range(None, target_value)
             if not label_range:
-                return []
-            return self._render_symbol_frames(
+                return
+            yield from self._iter_symbol_frames(
                 None,
                 start_frame=label_range["start"],
                 end_frame=label_range["end"],
-                frame_name_prefix=target_value,
             )
+            return
+
+        yield from self._iter_symbol_frames(target_value)
+
+    def frame_count(self, target) -> int:
+        """Return the number of frames ``target`` spans (before skipping blanks)."""
 
-        return self._render_symbol_frames(target_value)
+        target_type, target_value = self._normalize_target(target)
+        if target_type == "timeline_label":
+            label_range = self.symbols.get_label_range(None, target_value)
+            if not label_range:
+                return 0
+            total = self.symbols.length(None)
+            return max(0, min(label_range["end"], total) - label_range["start"])
+        return self.symbols.length(target_value)
+
+    def frame_prefix(self, target) -> str:
+        """Return the frame name prefix ``render_animation`` uses for ``target``."""
+
+        target_type, target_value = self._normalize_target(target)
+        if target_type == "timeline_label":
+            return target_value
+        return target_value if target_value else "timeline"
 
     def _normalize_target(self, target):
         """Normalize a render target to a ``(type, value)`` pair.
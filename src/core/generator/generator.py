@@ -5,7 +5,8 @@
 Provides the SparrowAtlasGenerator class for packing sprite frames into a
 single atlas image and emitting a Sparrow-format XML manifest. Supports
 multiple packing strategies (grid, growing, ordered, maxrects, guillotine,
-shelf, skyline) selectable via AtlasSettings.algorithm_hint.
+shelf, skyline) selectable via AtlasSettings.algorithm_hint, plus an "auto"
+mode that searches packer combinations in parallel.
 """
 
 import xml.etree.ElementTree as ET
@@ -16,6 +17,7 @@ import re
 from typing import List, Dict, Tuple, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 import time
 
 # Import our own modules
@@ -32,8 +34,12 @@ from packers import (
     ShelfHeuristic,
     SkylinePacker,
     SkylineHeuristic,
+    PackingPlan,
     find_optimal_size,
+    find_optimal_size_parallel,
     next_power_of_2,
+    pack_frames,
+    sort_frames,
 )
 
 
@@ -48,6 +54,7 @@ class PackingAlgorithm(Enum):
     GUILLOTINE_PACKER = 5  # Guillotine bin packing
     SHELF_PACKER = 6  # Shelf bin packing (FFDH)
     SKYLINE_PACKER = 7  # Skyline bin packing
+    AUTO_SEARCH = 8  # Parallel search over packers, heuristics and sort orders
 
 
 @dataclass
@@ -101,6 +108,8 @@ class AtlasSettings:
     preferred_height: Optional[int] = None
     forced_width: Optional[int] = None
     forced_height: Optional[int] = None
+    search_time_budget: Optional[float] = None  # Overrides the mode default
+    search_workers: Optional[int] = None  # Process count for auto search
 
     @property
     def algorithm(self) -> PackingAlgorithm:
@@ -115,9 +124,23 @@ class AtlasSettings:
             "guillotine": PackingAlgorithm.GUILLOTINE_PACKER,
             "shelf": PackingAlgorithm.SHELF_PACKER,
             "skyline": PackingAlgorithm.SKYLINE_PACKER,
+            "auto": PackingAlgorithm.AUTO_SEARCH,
         }
         return hint_map.get(hint, PackingAlgorithm.GROWING_PACKER)
 
+    @property
+    def auto_search_budget(self) -> Optional[float]:
+        """Wall-clock budget in seconds for the auto search (None = no limit)."""
+        if self.search_time_budget is not None:
+            return self.search_time_budget
+        mode_budgets = {0: 1.0, 1: 5.0}
+        return mode_budgets.get(self.optimization_mode_index)
+
+    @property
+    def hybrid_race(self) -> bool:
+        """Whether the hybrid packer races two strategies (highest mode)."""
+        return self.optimization_mode_index >= 2
+
     @property
     def allow_flip(self) -> bool:
         """Whether vertical flipping is permitted during packing."""
@@ -228,6 +251,7 @@ class SparrowAtlasGenerator:
         """
         self.progress_callback = progress_callback
         self.frames: List[Frame] = []
+        self.search_plan: Optional[PackingPlan] = None
 
     def generate_atlas(
         self,
@@ -319,6 +343,12 @@ class SparrowAtlasGenerator:
                 "efficiency": self._calculate_efficiency(atlas_width, atlas_height),
                 "metadata_files": [metadata_path],
                 "output_format": output_format,
+                "packing_plan": (
+                    self.search_plan.label
+                    if settings.algorithm == PackingAlgorithm.AUTO_SEARCH
+                    and self.search_plan
+                    else None
+                ),
             }
 
         except Exception as e:
@@ -386,8 +416,9 @@ class SparrowAtlasGenerator:
         mode = max(0, settings.optimization_mode_index)
         algorithm = settings.algorithm
 
-        if algorithm == PackingAlgorithm.NONE:
-            # Grid mode keeps incoming order for compatibility
+        if algorithm in (PackingAlgorithm.NONE, PackingAlgorithm.AUTO_SEARCH):
+            # Grid mode keeps incoming order for compatibility; the auto
+            # search chooses its own sort order
             return
 
         if algorithm == PackingAlgorithm.GROWING_PACKER:
@@ -454,6 +485,8 @@ class SparrowAtlasGenerator:
             return self._get_shelf_packer_size(settings)
         elif settings.algorithm == PackingAlgorithm.SKYLINE_PACKER:
             return self._get_skyline_packer_size(settings)
+        elif settings.algorithm == PackingAlgorithm.AUTO_SEARCH:
+            return self._get_auto_search_size(settings)
         else:
             # Default to growing packer
             return self._get_growing_packer_size(settings)
@@ -689,7 +722,7 @@ class SparrowAtlasGenerator:
 
         Args:
             settings: Atlas settings with size constraints.
-            packer_cls: Packer class with a fit() method.
+            packer_cls: Packer class (or factory) with a fit() method.
             allow_flip: Pass flip permission to hybrid packer.
 
         Returns:
@@ -734,7 +767,9 @@ class SparrowAtlasGenerator:
     def _get_hybrid_packer_size(self, settings: AtlasSettings) -> Tuple[int, int]:
         """Estimate atlas size using Hybrid adaptive packer."""
         return self._search_size_with_packer(
-            settings, HybridAdaptivePacker, allow_flip=settings.allow_flip
+            settings,
+            partial(HybridAdaptivePacker, race=settings.hybrid_race),
+            allow_flip=settings.allow_flip,
         )
 
     def _get_guillotine_packer_size(self, settings: AtlasSettings) -> Tuple[int, int]:
@@ -821,6 +856,40 @@ class SparrowAtlasGenerator:
 
         return result.width, result.height
 
+    def _get_auto_search_size(self, settings: AtlasSettings) -> Tuple[int, int]:
+        """Run the parallel packer search and remember the winning plan.
+
+        Args:
+            settings: Atlas settings with size constraints and search budget.
+
+        Returns:
+            Optimal (width, height) tuple from the best combination.
+        """
+        self.search_plan = None
+        if not self.frames:
+            return settings.min_size, settings.min_size
+
+        pad = settings.padding * 2
+        frames = [(f.width + pad, f.height + pad, f) for f in self.frames]
+
+        self.search_plan = find_optimal_size_parallel(
+            frames,
+            min_size=settings.min_size,
+            max_size=settings.max_size,
+            power_of_2=settings.power_of_2,
+            allow_rotation=settings.allow_rotation,
+            time_budget=settings.auto_search_budget,
+            max_workers=settings.search_workers,
+            fixed_width=settings.forced_width,
+            fixed_height=settings.forced_height,
+        )
+
+        if self.search_plan is None:
+            # Nothing fit within the limits; fall back to MaxRects sizing
+            return self._get_maxrects_packer_size(settings)
+
+        return self.search_plan.result.width, self.search_plan.result.height
+
     def _get_ordered_packer_size(self, settings: AtlasSettings) -> Tuple[int, int]:
         """Dry-run the ordered packer to estimate canvas bounds.
 
@@ -1010,7 +1079,7 @@ class SparrowAtlasGenerator:
             return True
 
         blocks = self._build_blocks_for_advanced_packers(settings, include_frame=True)
-        packer = HybridAdaptivePacker()
+        packer = HybridAdaptivePacker(race=settings.hybrid_race)
         success = packer.fit(
             blocks,
             atlas_width,
@@ -1142,6 +1211,50 @@ class SparrowAtlasGenerator:
 
         return True
 
+    def _pack_auto_search(
+        self, atlas_width: int, atlas_height: int, settings: AtlasSettings
+    ) -> bool:
+        """Pack frames with the combination chosen by the auto search.
+
+        Args:
+            atlas_width: Target canvas width
+            atlas_height: Target canvas height
+            settings: Atlas configuration
+
+        Returns:
+            True if packing succeeded
+        """
+        if not self.frames:
+            return True
+
+        plan = self.search_plan
+        if plan is None:
+            return self._pack_maxrects(atlas_width, atlas_height, settings)
+
+        pad = settings.padding * 2
+        pack_input = sort_frames(
+            [(f.width + pad, f.height + pad, f) for f in self.frames],
+            plan.sort_order,
+        )
+        results = pack_frames(
+            pack_input,
+            atlas_width,
+            atlas_height,
+            plan.algorithm,
+            plan.heuristic,
+            allow_rotation=plan.allow_rotation,
+        )
+        if results is None:
+            return False
+
+        for x, y, w, h, rotated, frame in results:
+            frame.x = x + settings.padding
+            frame.y = y + settings.padding
+            frame.rotated = rotated
+            frame.flip_y = False
+
+        return True
+
     def _apply_block_positions(
         self, blocks: List[Dict[str, object]], settings: AtlasSettings
     ) -> bool:
@@ -1199,6 +1312,8 @@ class SparrowAtlasGenerator:
             return self._pack_shelf(atlas_width, atlas_height, settings)
         elif settings.algorithm == PackingAlgorithm.SKYLINE_PACKER:
             return self._pack_skyline(atlas_width, atlas_height, settings)
+        elif settings.algorithm == PackingAlgorithm.AUTO_SEARCH:
+            return self._pack_auto_search(atlas_width, atlas_height, settings)
         else:
             # Default to growing packer for other algorithms
             return self._pack_growing(atlas_width, atlas_height, settings)
@@ -1368,6 +1483,7 @@ class SparrowAtlasGenerator:
                     PackingAlgorithm.ORDERED_PACKER: "Ordered",
                     PackingAlgorithm.MAXRECTS_PACKER: "MaxRects",
                     PackingAlgorithm.HYBRID_PACKER: "Hybrid Adaptive",
+                    PackingAlgorithm.AUTO_SEARCH: "Auto Search",
                 }
                 algorithm_label = algorithm_label_map.get(
                     settings.algorithm, settings.algorithm.name.title()
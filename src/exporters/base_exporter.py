@@ -30,6 +30,13 @@ from exporters.exporter_types import (
     PackingError,
     SpriteData,
 )
+from packers import (
+    SEARCH_HEURISTICS,
+    find_optimal_size,
+    find_optimal_size_parallel,
+    pack_frames,
+    sort_frames,
+)
 
 
 class BaseExporter(ABC):
@@ -42,7 +49,7 @@ class BaseExporter(ABC):
 
     The base class provides:
         - export_file(): Main entry point for creating atlas + metadata.
-        - pack_sprites(): Sprite packing with configurable algorithms.
+        - pack_sprites(): Sprite packing through the shared packers package.
         - composite_atlas(): Render sprites onto atlas image.
     """
 
@@ -179,8 +186,13 @@ class BaseExporter(ABC):
     ) -> Tuple[List[PackedSprite], int, int]:
         """Pack sprites into an atlas layout.
 
-        Uses a simple shelf-packing algorithm by default.
-        Subclasses or future versions can plug in more sophisticated packers.
+        Uses the same packers and size search as the atlas generator, so
+        exported atlases are as tight as generated ones. The algorithm is
+        selected by ``options.packer``; "auto" runs the parallel search over
+        every algorithm, heuristic and sort order.
+
+        ``options.padding`` separates sprites from each other and from the
+        atlas edges.
 
         Args:
             sprites: Sprite definitions to pack.
@@ -190,68 +202,147 @@ class BaseExporter(ABC):
             Tuple of (packed_sprites, atlas_width, atlas_height).
 
         Raises:
-            PackingError: If sprites cannot fit in the maximum dimensions.
+            PackingError: If the packer is unknown or sprites cannot fit in
+                the maximum dimensions.
         """
-        padding = self.options.padding
-        max_width = self.options.max_width
-        max_height = self.options.max_height
-
-        # Sort sprites by height (descending) for better shelf packing
-        sorted_sprites = sorted(
-            sprites,
-            key=lambda s: sprite_images[s["name"]].height,
-            reverse=True,
-        )
+        opts = self.options
+        padding = opts.padding
+        max_width = opts.max_width
+        max_height = opts.max_height
+
+        # Each sprite reserves padding on its right/bottom edge; the atlas
+        # reserves the same strip on its left/top edge.
+        frames = [
+            (
+                sprite_images[sprite["name"]].width + padding,
+                sprite_images[sprite["name"]].height + padding,
+                sprite,
+            )
+            for sprite in sprites
+        ]
+
+        placements = self._run_packer(frames)
+        if placements is None:
+            raise PackingError(
+                ExporterErrorCode.ATLAS_TOO_LARGE,
+                f"Cannot fit all sprites in {max_width}x{max_height} atlas",
+                details={"sprite_count": len(sprites), "packer": opts.packer},
+            )
 
         packed: List[PackedSprite] = []
-        current_x = padding
-        current_y = padding
-        row_height = 0
         atlas_width = 0
         atlas_height = 0
-
-        for sprite in sorted_sprites:
-            img = sprite_images[sprite["name"]]
-            w, h = img.width, img.height
-
-            # Check if sprite fits in current row
-            if current_x + w + padding > max_width:
-                # Move to next row
-                current_x = padding
-                current_y += row_height + padding
-                row_height = 0
-
-            # Check if sprite fits vertically
-            if current_y + h + padding > max_height:
-                raise PackingError(
-                    ExporterErrorCode.ATLAS_TOO_LARGE,
-                    f"Cannot fit all sprites in {max_width}x{max_height} atlas",
-                    details={"sprite_count": len(sprites)},
-                )
-
-            # Place sprite
+        for x, y, w, h, rotated, sprite in placements:
+            placed_w, placed_h = (h, w) if rotated else (w, h)
             packed.append(
                 PackedSprite(
                     sprite=sprite,
-                    atlas_x=current_x,
-                    atlas_y=current_y,
-                    rotated=False,
+                    atlas_x=x + padding,
+                    atlas_y=y + padding,
+                    rotated=rotated,
                 )
             )
-
-            # Update tracking
-            current_x += w + padding
-            row_height = max(row_height, h)
-            atlas_width = max(atlas_width, current_x)
-            atlas_height = max(atlas_height, current_y + h + padding)
+            atlas_width = max(atlas_width, x + placed_w + padding)
+            atlas_height = max(atlas_height, y + placed_h + padding)
 
         # Optionally round up to power of two
-        if self.options.power_of_two:
+        if opts.power_of_two:
             atlas_width = self._next_power_of_two(atlas_width)
             atlas_height = self._next_power_of_two(atlas_height)
 
         return packed, atlas_width, atlas_height
 
+    def _run_packer(
+        self, frames: List[Tuple[int, int, SpriteData]]
+    ) -> Optional[List[Tuple[int, int, int, int, bool, SpriteData]]]:
+        """Find the smallest bin for the frames and pack them into it.
+
+        Args:
+            frames: (padded_width, padded_height, sprite) tuples.
+
+        Returns:
+            Placements as (x, y, width, height, rotated, sprite), relative to
+            the padded origin, or None if nothing fits the maximum size.
+
+        Raises:
+            PackingError: If ``options.packer`` is not a known algorithm.
+        """
+        opts = self.options
+        padding = opts.padding
+        max_width = opts.max_width
+        max_height = opts.max_height
+
+        candidates: List[Tuple[int, int]] = []
+        if opts.packer == "auto":
+            plan = find_optimal_size_parallel(
+                frames,
+                max_size=max(max_width, max_height) - padding,
+                allow_rotation=opts.allow_rotation,
+                time_budget=opts.search_time_budget,
+            )
+            if plan is None:
+                return None
+            algorithm = plan.algorithm
+            heuristic = plan.heuristic
+            allow_rotation = plan.allow_rotation
+            frames = sort_frames(frames, plan.sort_order)
+            if not opts.power_of_two:
+                # The search already sized the bin; only add the edge strip
+                candidates.append(
+                    (plan.result.width + padding, plan.result.height + padding)
+                )
+        elif opts.packer in SEARCH_HEURISTICS:
+            algorithm = opts.packer
+            heuristic = opts.packer_heuristic or ""  # "" = packer default
+            allow_rotation = opts.allow_rotation
+            frames = sort_frames(frames, opts.sort_order)
+        else:
+            raise PackingError(
+                ExporterErrorCode.PACKING_FAILED,
+                f"Unknown packer: {opts.packer}",
+                details={"available_packers": ["auto", *SEARCH_HEURISTICS]},
+            )
+
+        def try_pack(width: int, height: int) -> bool:
+            return (
+                pack_frames(
+                    frames,
+                    width - padding,
+                    height - padding,
+                    algorithm,
+                    heuristic,
+                    allow_rotation,
+                )
+                is not None
+            )
+
+        if not candidates:
+            size = find_optimal_size(
+                frames,
+                try_pack,
+                min_size=padding + 1,
+                max_size=max(max_width, max_height),
+                power_of_2=opts.power_of_two,
+            )
+            candidates.append((size.width, size.height))
+        # The size search may return an unverified bound; fall back to the
+        # largest allowed atlas before giving up
+        candidates.append((max_width, max_height))
+        for width, height in candidates:
+            if width > max_width or height > max_height:
+                continue
+            placements = pack_frames(
+                frames,
+                width - padding,
+                height - padding,
+                algorithm,
+                heuristic,
+                allow_rotation,
+            )
+            if placements is not None:
+                return placements
+        return None
+
     def composite_atlas(
         self,
         packed_sprites: List[PackedSprite],
@@ -276,9 +367,9 @@ class BaseExporter(ABC):
         for packed in packed_sprites:
             img = sprite_images[packed.name]
 
-            # Handle rotation if needed
+            # Rotated sprites are stored 90° clockwise, like the generator
             if packed.rotated:
-                img = img.transpose(Image.Transpose.ROTATE_90)
+                img = img.transpose(Image.Transpose.ROTATE_270)
 
             # Ensure image is RGBA
             if img.mode != "RGBA":
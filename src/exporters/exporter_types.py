@@ -153,6 +153,13 @@ class ExportOptions:
         max_width: Maximum atlas width in pixels.
         max_height: Maximum atlas height in pixels.
         allow_rotation: Allow 90-degree rotation for better packing.
+        packer: Packing algorithm ("maxrects", "skyline", "guillotine",
+            "shelf") or "auto" to search all of them in parallel.
+        packer_heuristic: Heuristic key for the packer. None uses the
+            packer's default.
+        sort_order: Sprite sort order before packing (key of
+            packers.SORT_ORDERS).
+        search_time_budget: Wall-clock budget in seconds for "auto".
         trim_sprites: Trim transparent edges from sprites.
         pretty_print: Format metadata with indentation.
         include_metadata: Include atlas metadata (size, image name).
@@ -165,6 +172,10 @@ class ExportOptions:
     max_width: int = 4096
     max_height: int = 4096
     allow_rotation: bool = False
+    packer: str = "maxrects"
+    packer_heuristic: Optional[str] = None
+    sort_order: str = "area"
+    search_time_budget: Optional[float] = 1.0
     trim_sprites: bool = False
     pretty_print: bool = True
     include_metadata: bool = True
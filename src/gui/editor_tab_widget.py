@@ -4,13 +4,16 @@
 from __future__ import annotations
 
 import os
+import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QPoint, QPointF, QRect, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+import numpy as np
+
+from PySide6.QtCore import QPoint, QPointF, QRect, QRectF, QSize, Qt, QThread, Signal
+from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPixmap, QTransform
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -35,7 +38,11 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 
+from core.editor.animation_loader import load_animation_frames
+from core.extractor.frame_buffer import readonly_view
+from core.extractor.image_utils import ensure_rgba_array
 from utils.FNF.alignment import resolve_fnf_offset
+from utils.utilities import Utilities
 
 
 try:
@@ -52,19 +59,67 @@ except (
 ANIMATION_ID_ROLE = Qt.ItemDataRole.UserRole + 1
 FRAME_INDEX_ROLE = Qt.ItemDataRole.UserRole + 2
 
+# Running from source rather than a compiled release is a debug build
+DEBUG_BUILD = not Utilities.is_compiled()
+
 ORIGIN_MODE_CENTER = "center"
 ORIGIN_MODE_TOP_LEFT = "top_left"
 VALID_ORIGIN_MODES = {ORIGIN_MODE_CENTER, ORIGIN_MODE_TOP_LEFT}
 
 
-@dataclass
+class FramePixmapCache:
+    """LRU of display pixmaps for editor frames.
+
+    Frames keep their pixels as arrays; a ``QPixmap`` is only built when a
+    frame is drawn (current frame, ghost overlay) and the most recently used
+    ones are kept. Frames sharing one pixel array, such as composite
+    entries and their sources, share the pixmap. Like ``QPixmap`` itself it
+    is used from the GUI thread only.
+
+    Class Attributes:
+        max_pixmaps: Pixmaps kept at once.
+    """
+
+    max_pixmaps: int = 64
+    # Keyed by id(array); the entry keeps the array alive so ids stay unique
+    _pixmaps: "OrderedDict[int, Tuple[np.ndarray, QPixmap]]" = OrderedDict()
+
+    @classmethod
+    def get(cls, image: np.ndarray) -> QPixmap:
+        """Return the pixmap of an RGBA array, converting it on a miss."""
+        key = id(image)
+        entry = cls._pixmaps.get(key)
+        if entry is not None and entry[0] is image:
+            cls._pixmaps.move_to_end(key)
+            return entry[1]
+
+        height, width = image.shape[:2]
+        pixels = np.ascontiguousarray(image)
+        qimage = QImage(
+            pixels.data, width, height, width * 4, QImage.Format.Format_RGBA8888
+        )
+        # fromImage copies the pixels, so the QImage may borrow the array
+        pixmap = QPixmap.fromImage(qimage)
+        cls._pixmaps[key] = (image, pixmap)
+        cls._pixmaps.move_to_end(key)
+        while len(cls._pixmaps) > cls.max_pixmaps:
+            cls._pixmaps.popitem(last=False)
+        return pixmap
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._pixmaps.clear()
+
+
+@dataclass(eq=False)
 class AlignmentFrame:
     """Sprite frame plus metadata tracked during manual alignment.
 
     Attributes:
         name (str): Unique label shown in the tree widget.
         original_key (str): Key used to look the frame up in the source data.
-        pixmap (QPixmap): Rasterized frame used for display/dragging.
+        image (np.ndarray): Read-only RGBA pixels, shared with the source
+            frames and with composite entries built from this frame.
         duration_ms (int): Playback duration for preview loops.
         offset_x (int): User-defined horizontal shift relative to canvas origin.
         offset_y (int): User-defined vertical shift relative to canvas origin.
@@ -73,12 +128,25 @@ class AlignmentFrame:
 
     name: str
     original_key: str
-    pixmap: QPixmap
+    image: np.ndarray
     duration_ms: int = 100
     offset_x: int = 0
     offset_y: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def width(self) -> int:
+        return self.image.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.image.shape[0]
+
+    @property
+    def pixmap(self) -> QPixmap:
+        """Pixmap used for display/dragging, built on first use."""
+        return FramePixmapCache.get(self.image)
+
 
 @dataclass
 class AlignmentAnimation:
@@ -112,8 +180,8 @@ class AlignmentAnimation:
         max_side_limit = 4096
         required_side = step
         if self.frames:
-            max_w = max(frame.pixmap.width() for frame in self.frames)
-            max_h = max(frame.pixmap.height() for frame in self.frames)
+            max_w = max(frame.width for frame in self.frames)
+            max_h = max(frame.height for frame in self.frames)
             required_side = max(step, max(max_w, max_h))
         target_side = ((required_side + step - 1) // step) * step
         target_side = min(max_side_limit, target_side)
@@ -126,12 +194,183 @@ class AlignmentAnimation:
             self.canvas_height = target_side
 
 
+class EditorAnimationLoader(QThread):
+    """Background thread that loads an extractor animation for the editor.
+
+    Frames are read with ``load_animation_frames``, so atlases already
+    decoded for previews are reused, and are sent to the GUI thread as
+    ``AlignmentFrame`` chunks so the tree fills in while the rest are still
+    being converted. Pixmaps are not built here; frames create them lazily
+    on the GUI thread. ``stop()`` cancels between frames.
+
+    Signals:
+        frames_loaded(str, object): Animation ID and the next list of
+            ``AlignmentFrame`` objects.
+        loading_finished(str, int): Animation ID and the number of frames
+            sent; 0 if the animation had none.
+        error_occurred(str, str): Animation ID and an error message.
+    """
+
+    CHUNK_SIZE = 32
+
+    frames_loaded = Signal(str, object)
+    loading_finished = Signal(str, int)
+    error_occurred = Signal(str, str)
+
+    def __init__(
+        self,
+        animation_id: str,
+        animation: AlignmentAnimation,
+        spritemap_info: Optional[dict],
+        spritemap_target: Any,
+        frame_duration: int,
+        settings_manager=None,
+    ):
+        """Initialize the loader.
+
+        Args:
+            animation_id: ID the animation will be registered under.
+            animation: Empty editor entry carrying the spritesheet name,
+                animation name and source paths.
+            spritemap_info: Adobe spritemap project info, if any.
+            spritemap_target: Symbol or timeline label to render.
+            frame_duration: Duration given to every frame, in milliseconds.
+            settings_manager: Receives spritemap FPS defaults.
+        """
+        super().__init__()
+        self.animation_id = animation_id
+        self.spritesheet_name = animation.spritesheet_name
+        self.animation_name = animation.animation_name
+        self.spritesheet_path = animation.metadata.get("spritesheet_path")
+        self.metadata_path = animation.metadata.get("metadata_path") or None
+        self.spritemap_info = spritemap_info
+        self.spritemap_target = spritemap_target
+        self.frame_duration = frame_duration
+        self.settings_manager = settings_manager
+        self._stop_requested = False
+
+    def stop(self):
+        """Request to stop loading."""
+        self._stop_requested = True
+
+    def run(self):
+        """Load the frames and emit them in chunks."""
+        try:
+            raw_frames = load_animation_frames(
+                self.spritesheet_path,
+                self.metadata_path,
+                self.animation_name,
+                spritemap_info=self.spritemap_info,
+                spritemap_target=self.spritemap_target,
+                settings_manager=self.settings_manager,
+                spritesheet_label=self.spritesheet_name,
+                is_cancelled=lambda: self._stop_requested,
+            )
+            sent = 0
+            chunk: List[AlignmentFrame] = []
+            for frame_name, frame_image, frame_metadata in raw_frames or []:
+                if self._stop_requested:
+                    return
+                chunk.append(
+                    AlignmentFrame(
+                        name=frame_name,
+                        original_key=frame_name,
+                        image=EditorTabWidget._frame_array(frame_image),
+                        duration_ms=self.frame_duration,
+                        metadata=EditorTabWidget._extract_frame_metadata(
+                            frame_metadata
+                        ),
+                    )
+                )
+                if len(chunk) == self.CHUNK_SIZE:
+                    self.frames_loaded.emit(self.animation_id, chunk)
+                    sent += len(chunk)
+                    chunk = []
+            if self._stop_requested:
+                return
+            if chunk:
+                self.frames_loaded.emit(self.animation_id, chunk)
+                sent += len(chunk)
+            self.loading_finished.emit(self.animation_id, sent)
+        except Exception as exc:
+            self.error_occurred.emit(self.animation_id, str(exc))
+
+
+@dataclass
+class _PendingLoad:
+    """An extractor animation whose frames are still arriving."""
+
+    animation: AlignmentAnimation
+    loader: EditorAnimationLoader
+    overrides: Dict[str, Any] = field(default_factory=dict)
+
+
+class ScaledLayer:
+    """One canvas layer pre-scaled to the current zoom.
+
+    Drawing a pixmap through a scaled painter resamples it on every paint.
+    The layer keeps the scaled (and, for the ghost, faded) copy and only
+    rebuilds it when the source pixmap, zoom or opacity changes, so moving
+    the layer while dragging is a plain blit.
+
+    Class Attributes:
+        max_pixels: Largest scaled copy kept; bigger layers are drawn
+            through the painter transform instead.
+    """
+
+    max_pixels: int = 4096 * 4096
+
+    def __init__(self):
+        self._key: Optional[tuple] = None
+        self._pixmap: Optional[QPixmap] = None
+
+    def scaled(
+        self, source: QPixmap, zoom: float, opacity: float = 1.0
+    ) -> Optional[QPixmap]:
+        """Return ``source`` scaled by ``zoom``, or ``None`` if it is too large."""
+        width = max(1, round(source.width() * zoom))
+        height = max(1, round(source.height() * zoom))
+        if width * height > self.max_pixels:
+            return None
+        key = (source.cacheKey(), width, height, opacity)
+        if key != self._key:
+            pixmap = source
+            if (width, height) != (source.width(), source.height()):
+                pixmap = source.scaled(
+                    width,
+                    height,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.FastTransformation,
+                )
+            if opacity < 1.0:
+                faded = QPixmap(pixmap.size())
+                faded.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(faded)
+                painter.setOpacity(opacity)
+                painter.drawPixmap(0, 0, pixmap)
+                painter.end()
+                pixmap = faded
+            self._key = key
+            self._pixmap = pixmap
+        return self._pixmap
+
+
 class AlignmentCanvas(QWidget):
-    """Interactive scene that renders a frame, ghost overlay, and guides."""
+    """Interactive scene that renders a frame, ghost overlay, and guides.
+
+    The checkerboard is filled with a cached tile brush, the frame and
+    ghost are drawn from ``ScaledLayer`` copies, and moving the frame or
+    ghost only repaints the area they left and entered. In debug builds F12
+    toggles a repaint rate overlay.
+    """
 
     offsetChanged = Signal(int, int)
     zoomChanged = Signal(float)
 
+    CHECKER_SQUARE = 16
+    FPS_SAMPLES = 30
+    _checker_tile: Optional[QPixmap] = None
+
     def __init__(self):
         """Initialize drawing state, default zoom levels, and input flags."""
         super().__init__()
@@ -158,6 +397,12 @@ class AlignmentCanvas(QWidget):
         self._snap_step = 1
         self._view_translation = QPointF(0.0, 0.0)
         self._origin_mode = ORIGIN_MODE_CENTER
+        self._frame_layer = ScaledLayer()
+        self._ghost_layer = ScaledLayer()
+        # Opt-in repaint timing overlay for profiling; off for users
+        self._show_fps = False
+        self._paint_times: deque = deque(maxlen=self.FPS_SAMPLES)
+        self._last_paint_ms = 0.0
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setMinimumSize(self.sizeHint())
@@ -223,12 +468,16 @@ class AlignmentCanvas(QWidget):
         offset_x = self._apply_snapping(int(offset_x))
         offset_y = self._apply_snapping(int(offset_y))
         changed = (offset_x, offset_y) != (self._offset_x, self._offset_y)
+        previous_rect = self._layer_rect(self._pixmap, self._offset_x, self._offset_y)
         self._offset_x = offset_x
         self._offset_y = offset_y
         if changed and notify:
             self.offsetChanged.emit(self._offset_x, self._offset_y)
         if changed:
-            self.update()
+            self._update_moved_layer(
+                previous_rect,
+                self._layer_rect(self._pixmap, self._offset_x, self._offset_y),
+            )
 
     def offsets(self) -> Tuple[int, int]:
         """Return the current (x, y) offsets."""
@@ -249,8 +498,22 @@ class AlignmentCanvas(QWidget):
             offset_x (int): Horizontal shift relative to origin.
             offset_y (int): Vertical shift relative to origin.
         """
+        opacity = max(0.05, min(0.95, opacity))
+        if pixmap is self._ghost_pixmap and opacity == self._ghost_opacity:
+            # Same ghost, at most moved; repaint where it was and is now
+            previous_rect = self._layer_rect(
+                pixmap, self._ghost_offset_x, self._ghost_offset_y
+            )
+            self._ghost_offset_x = int(offset_x)
+            self._ghost_offset_y = int(offset_y)
+            current_rect = self._layer_rect(
+                pixmap, self._ghost_offset_x, self._ghost_offset_y
+            )
+            if current_rect != previous_rect:
+                self._update_moved_layer(previous_rect, current_rect)
+            return
         self._ghost_pixmap = pixmap
-        self._ghost_opacity = max(0.05, min(0.95, opacity))
+        self._ghost_opacity = opacity
         self._ghost_offset_x = int(offset_x)
         self._ghost_offset_y = int(offset_y)
         self.update()
@@ -283,36 +546,134 @@ class AlignmentCanvas(QWidget):
         """Expose the active zoom multiplier for other widgets."""
         return self._zoom
 
+    def set_show_fps(self, enabled: bool):
+        """Toggle the repaint rate/time overlay used to profile the canvas."""
+        self._show_fps = bool(enabled)
+        self._paint_times.clear()
+        self.update()
+
     def paintEvent(self, event):  # noqa: D401 - Qt API
-        """Paint checkerboard, guides, ghost overlay, and the active sprite."""
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(28, 28, 28))
+        """Paint checkerboard, guides, ghost overlay, and the active sprite.
 
-        painter.save()
-        painter.translate(self._view_translation)
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.scale(self._zoom, self._zoom)
-        painter.translate(-self.width() / 2, -self.height() / 2)
+        Only ``event.rect()`` is repainted; during drags that is the area the
+        sprite left and entered.
+        """
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), QColor(28, 28, 28))
 
+        transform = self._view_transform()
         canvas_rect = self._canvas_rect()
-        self._paint_checkerboard(painter, canvas_rect)
+        painter.setTransform(transform)
+        painter.setBrushOrigin(canvas_rect.topLeft())
+        painter.fillRect(canvas_rect, self._checkerboard_brush())
         self._paint_crosshair(painter, canvas_rect)
+        painter.resetTransform()
 
         if self._ghost_pixmap and not self._ghost_pixmap.isNull():
-            anchor_x, anchor_y = self._origin_anchor(canvas_rect, self._ghost_pixmap)
-            ghost_x = anchor_x + self._ghost_offset_x
-            ghost_y = anchor_y + self._ghost_offset_y
-            painter.setOpacity(self._ghost_opacity)
-            painter.drawPixmap(ghost_x, ghost_y, self._ghost_pixmap)
-            painter.setOpacity(1.0)
+            self._paint_layer(
+                painter,
+                transform,
+                self._ghost_layer,
+                self._ghost_pixmap,
+                self._ghost_offset_x,
+                self._ghost_offset_y,
+                self._ghost_opacity,
+            )
 
         if self._pixmap and not self._pixmap.isNull():
-            anchor_x, anchor_y = self._origin_anchor(canvas_rect, self._pixmap)
-            target_x = anchor_x + self._offset_x
-            target_y = anchor_y + self._offset_y
-            painter.drawPixmap(target_x, target_y, self._pixmap)
+            self._paint_layer(
+                painter,
+                transform,
+                self._frame_layer,
+                self._pixmap,
+                self._offset_x,
+                self._offset_y,
+            )
+
+        if self._show_fps:
+            self._paint_fps(painter, started)
+        painter.end()
+
+    def _view_transform(self) -> QTransform:
+        """Map canvas coordinates to widget coordinates (pan, then zoom)."""
+        transform = QTransform()
+        transform.translate(self._view_translation.x(), self._view_translation.y())
+        transform.translate(self.width() / 2, self.height() / 2)
+        transform.scale(self._zoom, self._zoom)
+        transform.translate(-self.width() / 2, -self.height() / 2)
+        return transform
+
+    def _paint_layer(
+        self,
+        painter: QPainter,
+        transform: QTransform,
+        layer: ScaledLayer,
+        pixmap: QPixmap,
+        offset_x: int,
+        offset_y: int,
+        opacity: float = 1.0,
+    ):
+        """Draw a sprite layer from its zoomed copy, or scaled if too large."""
+        anchor_x, anchor_y = self._origin_anchor(self._canvas_rect(), pixmap)
+        target_x = anchor_x + offset_x
+        target_y = anchor_y + offset_y
+        scaled = layer.scaled(pixmap, self._zoom, opacity)
+        if scaled is not None:
+            position = transform.map(QPointF(target_x, target_y))
+            painter.drawPixmap(round(position.x()), round(position.y()), scaled)
+            return
+        painter.setTransform(transform)
+        painter.setOpacity(opacity)
+        painter.drawPixmap(target_x, target_y, pixmap)
+        painter.setOpacity(1.0)
+        painter.resetTransform()
+
+    def _layer_rect(
+        self, pixmap: Optional[QPixmap], offset_x: int, offset_y: int
+    ) -> QRect:
+        """Widget-space rectangle covered by a sprite layer at the given offsets."""
+        if not pixmap or pixmap.isNull():
+            return QRect()
+        anchor_x, anchor_y = self._origin_anchor(self._canvas_rect(), pixmap)
+        rect = QRectF(
+            anchor_x + offset_x, anchor_y + offset_y, pixmap.width(), pixmap.height()
+        )
+        # Margin covers rounding of the zoomed position
+        return (
+            self._view_transform().mapRect(rect).toAlignedRect().adjusted(-2, -2, 2, 2)
+        )
 
-        painter.restore()
+    def _update_moved_layer(self, previous_rect: QRect, current_rect: QRect):
+        """Schedule a repaint of the area a layer left and the area it covers now."""
+        dirty = previous_rect.united(current_rect)
+        if dirty.isNull():
+            return
+        self.update(dirty)
+        if self._show_fps:
+            self.update(self._fps_rect())
+
+    def _fps_rect(self) -> QRect:
+        return QRect(6, 6, 190, 20)
+
+    def _paint_fps(self, painter: QPainter, started: float):
+        """Draw repaints per second and the previous paint's duration."""
+        now = time.perf_counter()
+        self._paint_times.append(now)
+        fps = 0.0
+        if len(self._paint_times) > 1:
+            elapsed = self._paint_times[-1] - self._paint_times[0]
+            if elapsed > 0:
+                fps = (len(self._paint_times) - 1) / elapsed
+        rect = self._fps_rect()
+        painter.fillRect(rect, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(
+            rect.adjusted(6, 0, 0, 0),
+            Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+            f"{fps:5.1f} fps  {self._last_paint_ms:5.2f} ms/paint",
+        )
+        self._last_paint_ms = (now - started) * 1000
 
     def _canvas_rect(self) -> QRect:
         """Return the rectangle describing the virtual canvas within widget."""
@@ -332,15 +693,23 @@ class AlignmentCanvas(QWidget):
         base_y = canvas_rect.center().y() - height // 2
         return base_x, base_y
 
-    def _paint_checkerboard(self, painter: QPainter, rect):
-        """Fill the canvas with alternating squares to show transparency."""
-        square = 16
-        dark = QColor(60, 60, 60)
-        light = QColor(80, 80, 80)
-        for x in range(rect.left(), rect.right() + square, square):
-            for y in range(rect.top(), rect.bottom() + square, square):
-                color = dark if ((x // square + y // square) % 2 == 0) else light
-                painter.fillRect(x, y, square, square, color)
+    @classmethod
+    def _checkerboard_brush(cls) -> QBrush:
+        """Brush tiling alternating squares to show transparency.
+
+        The 2x2-square tile is built once; filling the canvas with it is a
+        single call at any canvas size or zoom.
+        """
+        if cls._checker_tile is None:
+            square = cls.CHECKER_SQUARE
+            tile = QPixmap(square * 2, square * 2)
+            tile.fill(QColor(60, 60, 60))
+            painter = QPainter(tile)
+            painter.fillRect(square, 0, square, square, QColor(80, 80, 80))
+            painter.fillRect(0, square, square, square, QColor(80, 80, 80))
+            painter.end()
+            cls._checker_tile = tile
+        return QBrush(cls._checker_tile)
 
     def _paint_crosshair(self, painter: QPainter, rect):
         """Draw either axes through the center or lines along the top-left."""
@@ -422,6 +791,8 @@ class AlignmentCanvas(QWidget):
             self.set_offsets(self._offset_x, self._offset_y - step, notify=True)
         elif event.key() == Qt.Key.Key_Down:
             self.set_offsets(self._offset_x, self._offset_y + step, notify=True)
+        elif event.key() == Qt.Key.Key_F12 and DEBUG_BUILD:
+            self.set_show_fps(not self._show_fps)
         else:
             handled = False
         if not handled:
@@ -536,6 +907,10 @@ class EditorTabWidget(QWidget):
         self._updating_controls = False
         self._detached_window: Optional[CanvasDetachWindow] = None
         self._animation_items: Dict[str, QTreeWidgetItem] = {}
+        # Keyed by the animation ID the frames will be registered under
+        self._pending_loads: Dict[str, _PendingLoad] = {}
+        # Loaders are kept until their thread ends, even once cancelled
+        self._load_workers: List[EditorAnimationLoader] = []
         self._default_status_text = self.tr(
             "Drag the frame, use arrow keys for fine adjustments, or type offsets manually."
         )
@@ -1090,7 +1465,7 @@ class EditorTabWidget(QWidget):
         self.ghost_frame_combo.clear()
         for animation_id, animation in self._animations.items():
             for idx, frame in enumerate(animation.frames):
-                label = f"{animation.display_name} - {frame.name} ({frame.pixmap.width()}x{frame.pixmap.height()})"
+                label = f"{animation.display_name} - {frame.name} ({frame.width}x{frame.height})"
                 self.ghost_frame_combo.addItem(label, (animation_id, idx))
         if current_data is not None:
             for i in range(self.ghost_frame_combo.count()):
@@ -1260,14 +1635,13 @@ class EditorTabWidget(QWidget):
                 frames: List[AlignmentFrame] = []
                 duration = int(img.info.get("duration", 100))
                 for idx, frame in enumerate(ImageSequence.Iterator(img)):
-                    frame = frame.convert("RGBA")
-                    pixmap = self._pil_to_pixmap(frame)
+                    image = self._frame_array(frame.convert("RGBA"))
                     frame_name = f"{os.path.basename(file_path)}#frame_{idx:04d}"
                     frames.append(
                         AlignmentFrame(
                             name=self.tr("Frame {index}").format(index=idx + 1),
                             original_key=frame_name,
-                            pixmap=pixmap,
+                            image=image,
                             duration_ms=duration,
                         )
                     )
@@ -1282,8 +1656,8 @@ class EditorTabWidget(QWidget):
                 )
                 return None
 
-            max_w = max(frame.pixmap.width() for frame in frames)
-            max_h = max(frame.pixmap.height() for frame in frames)
+            max_w = max(frame.width for frame in frames)
+            max_h = max(frame.height for frame in frames)
             animation = AlignmentAnimation(
                 display_name=os.path.basename(file_path),
                 frames=frames,
@@ -1313,150 +1687,167 @@ class EditorTabWidget(QWidget):
         spritemap_info: Optional[dict] = None,
         spritemap_target: Optional[dict] = None,
     ):
-        """Public entry point used by the extract tab to open an animation."""
-        animation = self._build_animation_from_spritesheet(
-            spritesheet_name,
-            animation_name,
-            spritesheet_path,
-            metadata_path,
+        """Public entry point used by the extract tab to open an animation.
+
+        Frames load on an ``EditorAnimationLoader``. The animation shows up
+        with its first frames and the rest are added as they arrive.
+        """
+        display_name = f"{spritesheet_name}/{animation_name}"
+        for pending in self._pending_loads.values():
+            if pending.animation.display_name == display_name:
+                self.status_label.setText(
+                    self.tr("{animation} is still loading.").format(
+                        animation=animation_name
+                    )
+                )
+                return
+
+        settings = {}
+        settings_manager = getattr(self.parent_app, "settings_manager", None)
+        if settings_manager is not None:
+            settings = settings_manager.get_settings(spritesheet_name, display_name)
+        fps = settings.get("fps", 24)
+        frame_duration = int(round(1000 / max(1, fps)))
+
+        animation = AlignmentAnimation(
+            display_name=display_name,
+            frames=[],
+            canvas_width=0,
+            canvas_height=0,
+            source="extract",
+            spritesheet_name=spritesheet_name,
+            animation_name=animation_name,
+            metadata={
+                "spritesheet_path": spritesheet_path,
+                "metadata_path": metadata_path or "",
+            },
+        )
+        animation_id = uuid.uuid4().hex
+        loader = EditorAnimationLoader(
+            animation_id,
+            animation,
             spritemap_info,
             spritemap_target,
+            frame_duration,
+            settings_manager,
         )
-        if animation:
-            self._register_animation(animation)
-            self.status_label.setText(
-                self.tr("Loaded {animation} from {sheet}.").format(
-                    animation=animation_name, sheet=spritesheet_name
-                )
+        loader.frames_loaded.connect(self._on_frames_loaded)
+        loader.loading_finished.connect(self._on_loading_finished)
+        loader.error_occurred.connect(self._on_loading_failed)
+        loader.finished.connect(lambda: self._forget_load_worker(loader))
+        self._pending_loads[animation_id] = _PendingLoad(
+            animation, loader, settings.get("alignment_overrides") or {}
+        )
+        self._load_workers.append(loader)
+        self.status_label.setText(
+            self.tr("Loading {animation} from {sheet}...").format(
+                animation=animation_name, sheet=spritesheet_name
             )
+        )
+        loader.start()
+
+    def _on_frames_loaded(self, animation_id: str, frames: List[AlignmentFrame]):
+        """Add a chunk of loaded frames, registering the animation on the first."""
+        pending = self._pending_loads.get(animation_id)
+        if pending is None:
+            return  # Removed while loading
+        animation = pending.animation
+
+        if animation_id not in self._animations:
+            animation.frames = list(frames)
+            animation.ensure_canvas_bounds()
+            if pending.overrides:
+                self._apply_alignment_overrides(animation, pending.overrides)
+            self._register_animation(animation, animation_id)
             self._focus_latest_animation()
-        else:
-            QMessageBox.warning(
-                self,
-                self.tr("Editor"),
-                self.tr(
-                    "Could not load animation '{animation}' from '{sheet}'."
-                ).format(animation=animation_name, sheet=spritesheet_name),
-            )
+            return
 
-    def _build_animation_from_spritesheet(
-        self,
-        spritesheet_name: str,
-        animation_name: str,
-        spritesheet_path: str,
-        metadata_path: Optional[str],
-        spritemap_info: Optional[dict],
-        spritemap_target: Optional[dict],
-    ) -> Optional[AlignmentAnimation]:
-        """Assemble an animation from atlas metadata or spritemap exports."""
-        try:
-            frames: List[AlignmentFrame] = []
-            fps = 24
-            if hasattr(self.parent_app, "settings_manager"):
-                settings = self.parent_app.settings_manager.get_settings(
-                    spritesheet_name, f"{spritesheet_name}/{animation_name}"
-                )
-                fps = settings.get("fps", fps)
-            frame_duration = int(round(1000 / max(1, fps)))
-
-            if spritemap_info:
-                from core.extractor.spritemap import AdobeSpritemapRenderer
-
-                target = spritemap_target or animation_name
-                animation_json = spritemap_info.get("animation_json")
-                spritemap_json = spritemap_info.get("spritemap_json")
-                if not (animation_json and spritemap_json):
-                    raise ValueError("Spritemap metadata is incomplete.")
-                renderer = AdobeSpritemapRenderer(
-                    animation_json,
-                    spritemap_json,
-                    spritesheet_path,
-                    filter_single_frame=True,
-                )
-                raw_frames = renderer.render_animation(target)
-            else:
-                if not metadata_path:
-                    raise ValueError("The selected spritesheet does not have metadata.")
-                from core.extractor.atlas_processor import AtlasProcessor
-                from core.extractor.sprite_processor import SpriteProcessor
-
-                atlas_processor = AtlasProcessor(spritesheet_path, metadata_path)
-                if metadata_path.endswith(".xml"):
-                    animation_sprites = atlas_processor.parse_xml_for_preview(
-                        animation_name
-                    )
-                elif metadata_path.endswith(".txt"):
-                    animation_sprites = atlas_processor.parse_txt_for_preview(
-                        animation_name
-                    )
-                else:
-                    animation_sprites = []
+        start = len(animation.frames)
+        animation.frames.extend(frames)
+        if pending.overrides:
+            self._apply_frame_overrides(animation, pending.overrides, frames)
+        animation.ensure_canvas_bounds(respect_existing=True)
+        item = self._animation_items.get(animation_id)
+        if item is not None:
+            self._append_frame_items(item, animation_id, animation, start)
+        if animation_id == self._current_animation_id:
+            self._sync_canvas_size_controls(animation)
 
-                if not animation_sprites:
-                    return None
+    def _on_loading_finished(self, animation_id: str, frame_count: int):
+        """Report the outcome of a background load."""
+        pending = self._pending_loads.pop(animation_id, None)
+        if pending is None:
+            return
+        animation = pending.animation
+        if frame_count == 0 or animation_id not in self._animations:
+            self._warn_load_failed(animation)
+            return
+        self._refresh_ghost_options()
+        self.status_label.setText(
+            self.tr("Loaded {animation} from {sheet}.").format(
+                animation=animation.animation_name, sheet=animation.spritesheet_name
+            )
+        )
 
-                sprite_processor = SpriteProcessor(
-                    atlas_processor.atlas, animation_sprites
-                )
-                processed = sprite_processor.process_specific_animation(animation_name)
-                raw_frames = processed.get(animation_name, [])
+    def _on_loading_failed(self, animation_id: str, message: str):
+        pending = self._pending_loads.pop(animation_id, None)
+        if pending is None:
+            return
+        print(
+            f"[EditorTabWidget] Failed to build animation "
+            f"{pending.animation.animation_name}: {message}"
+        )
+        self._warn_load_failed(pending.animation)
 
-            if not raw_frames:
-                return None
+    def _warn_load_failed(self, animation: AlignmentAnimation):
+        QMessageBox.warning(
+            self,
+            self.tr("Editor"),
+            self.tr("Could not load animation '{animation}' from '{sheet}'.").format(
+                animation=animation.animation_name, sheet=animation.spritesheet_name
+            ),
+        )
 
-            for idx, frame_entry in enumerate(raw_frames):
-                frame_name, pil_image, _meta = frame_entry
-                frame_metadata = self._extract_frame_metadata(_meta)
-                pixmap = self._pil_to_pixmap(pil_image)
-                frames.append(
-                    AlignmentFrame(
-                        name=frame_name,
-                        original_key=frame_name,
-                        pixmap=pixmap,
-                        duration_ms=frame_duration,
-                        metadata=frame_metadata,
-                    )
-                )
+    def _forget_load_worker(self, worker: EditorAnimationLoader):
+        if worker in self._load_workers:
+            self._load_workers.remove(worker)
 
-            max_w = max(frame.pixmap.width() for frame in frames)
-            max_h = max(frame.pixmap.height() for frame in frames)
-            animation = AlignmentAnimation(
-                display_name=f"{spritesheet_name}/{animation_name}",
-                frames=frames,
-                canvas_width=max_w,
-                canvas_height=max_h,
-                source="extract",
-                spritesheet_name=spritesheet_name,
-                animation_name=animation_name,
-                metadata={
-                    "spritesheet_path": spritesheet_path,
-                    "metadata_path": metadata_path or "",
-                },
-            )
-            animation.ensure_canvas_bounds()
+    def _cancel_load(self, animation_id: str):
+        """Stop loading frames for an animation that is being removed."""
+        pending = self._pending_loads.pop(animation_id, None)
+        if pending is not None:
+            pending.loader.stop()
 
-            overrides = {}
-            if hasattr(self.parent_app, "settings_manager"):
-                settings = self.parent_app.settings_manager.get_settings(
-                    spritesheet_name, f"{spritesheet_name}/{animation_name}"
-                )
-                overrides = settings.get("alignment_overrides", {})
-            if overrides:
-                self._apply_alignment_overrides(animation, overrides)
+    def stop_background_workers(self):
+        """Cancel animation loads and wait for their threads to end."""
+        for animation_id in list(self._pending_loads):
+            self._cancel_load(animation_id)
+        for worker in list(self._load_workers):
+            worker.wait(1000)
 
-            return animation
-        except Exception as exc:
-            print(
-                f"[EditorTabWidget] Failed to build animation {animation_name}: {exc}"
-            )
-            return None
+    def _sync_canvas_size_controls(self, animation: AlignmentAnimation):
+        """Show an animation's canvas size in the spin boxes and on the canvas.
+
+        Signals are blocked: setting the width alone would otherwise store
+        the previous animation's height through ``_on_canvas_size_changed``.
+        """
+        for spin, value in (
+            (self.canvas_width_spin, animation.canvas_width),
+            (self.canvas_height_spin, animation.canvas_height),
+        ):
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        self.canvas.set_canvas_size(animation.canvas_width, animation.canvas_height)
 
     # ------------------------------------------------------------------
     # Animation registration / selection
     # ------------------------------------------------------------------
-    def _register_animation(self, animation: AlignmentAnimation) -> str:
+    def _register_animation(
+        self, animation: AlignmentAnimation, animation_id: Optional[str] = None
+    ) -> str:
         """Assign an ID, add the animation to the tree, and select it."""
-        animation_id = uuid.uuid4().hex
+        animation_id = animation_id or uuid.uuid4().hex
         self._animations[animation_id] = animation
         item = QTreeWidgetItem([animation.display_name])
         item.setData(0, ANIMATION_ID_ROLE, animation_id)
@@ -1480,12 +1871,25 @@ class EditorTabWidget(QWidget):
         """Fill the tree item with child entries representing each frame."""
         while animation_item.childCount():
             animation_item.removeChild(animation_item.child(0))
-        for idx, frame in enumerate(animation.frames):
-            label = f"{frame.name}  ({frame.pixmap.width()}x{frame.pixmap.height()})"
+        self._append_frame_items(animation_item, animation_id, animation, 0)
+
+    def _append_frame_items(
+        self,
+        animation_item: QTreeWidgetItem,
+        animation_id: str,
+        animation: AlignmentAnimation,
+        start: int,
+    ):
+        """Add child entries for the frames from ``start`` on in one call."""
+        children = []
+        for idx in range(start, len(animation.frames)):
+            frame = animation.frames[idx]
+            label = f"{frame.name}  ({frame.width}x{frame.height})"
             child = QTreeWidgetItem([label])
             child.setData(0, ANIMATION_ID_ROLE, animation_id)
             child.setData(0, FRAME_INDEX_ROLE, idx)
-            animation_item.addChild(child)
+            children.append(child)
+        animation_item.addChildren(children)
 
     def _focus_latest_animation(self):
         """Scroll to and select the most recently added animation item."""
@@ -1516,6 +1920,7 @@ class EditorTabWidget(QWidget):
             if animation_item is None:
                 continue
             animation_id = animation_item.data(0, ANIMATION_ID_ROLE)
+            self._cancel_load(animation_id)
             if animation_id in self._animations:
                 del self._animations[animation_id]
             self._animation_items.pop(animation_id, None)
@@ -1561,13 +1966,13 @@ class EditorTabWidget(QWidget):
             if animation_id not in source_animation_ids:
                 source_animation_ids.append(animation_id)
             for index, frame in enumerate(animation.frames):
-                max_frame_width = max(max_frame_width, frame.pixmap.width())
-                max_frame_height = max(max_frame_height, frame.pixmap.height())
+                max_frame_width = max(max_frame_width, frame.width)
+                max_frame_height = max(max_frame_height, frame.height)
                 combined_frames.append(
                     AlignmentFrame(
                         name=f"{animation.display_name} - {frame.name}",
                         original_key=frame.original_key,
-                        pixmap=frame.pixmap,
+                        image=frame.image,
                         duration_ms=frame.duration_ms,
                         offset_x=frame.offset_x,
                         offset_y=frame.offset_y,
@@ -1744,8 +2149,7 @@ class EditorTabWidget(QWidget):
         self.offset_y_spin.setValue(display_y)
         self._updating_controls = False
         self.canvas.set_offsets(display_x, display_y)
-        self.canvas_width_spin.setValue(animation.canvas_width)
-        self.canvas_height_spin.setValue(animation.canvas_height)
+        self._sync_canvas_size_controls(animation)
         self.save_overrides_button.setEnabled(animation.source == "extract")
         self.export_composite_button.setEnabled(
             bool(animation.metadata.get("source_animation_ids"))
@@ -1820,8 +2224,7 @@ class EditorTabWidget(QWidget):
             self._updating_controls = False
             self.canvas.set_offsets(offset_x, offset_y)
 
-        self.canvas_width_spin.setValue(animation.canvas_width)
-        self.canvas_height_spin.setValue(animation.canvas_height)
+        self._sync_canvas_size_controls(animation)
         self.save_overrides_button.setEnabled(animation.source == "extract")
         self.export_composite_button.setEnabled(
             bool(animation.metadata.get("source_animation_ids"))
@@ -2163,7 +2566,7 @@ class EditorTabWidget(QWidget):
                 AlignmentFrame(
                     name=frame.name,
                     original_key=frame.original_key,
-                    pixmap=frame.pixmap,
+                    image=frame.image,
                     duration_ms=frame.duration_ms,
                     offset_x=display_x,
                     offset_y=display_y,
@@ -2360,8 +2763,18 @@ class EditorTabWidget(QWidget):
             animation.fnf_raw_offsets = {key: value for key, value in raw_block.items()}
         else:
             animation.fnf_raw_offsets = None
+        self._apply_frame_overrides(animation, overrides, animation.frames)
+        animation.ensure_canvas_bounds(respect_existing=True)
+
+    @staticmethod
+    def _apply_frame_overrides(
+        animation: AlignmentAnimation,
+        overrides: dict,
+        frames: List[AlignmentFrame],
+    ):
+        """Replay saved per-frame offsets onto ``frames`` of ``animation``."""
         frame_map = overrides.get("frames", {})
-        for frame in animation.frames:
+        for frame in frames:
             data = frame_map.get(frame.original_key)
             if data is None:
                 offset_x, offset_y = animation.default_offset
@@ -2377,10 +2790,10 @@ class EditorTabWidget(QWidget):
 
             frame.offset_x = offset_x
             frame.offset_y = offset_y
-        animation.ensure_canvas_bounds(respect_existing=True)
 
     def closeEvent(self, event):  # noqa: D401 - Qt API
         """Ensure detached windows close when the editor tab is closed."""
+        self.stop_background_workers()
         if self._detached_window:
             self._detached_window.close()
         super().closeEvent(event)
@@ -2389,67 +2802,10 @@ class EditorTabWidget(QWidget):
     # Utility helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _pil_to_pixmap(image) -> QPixmap:
-        """Convert a Pillow image into a ``QPixmap`` for canvas rendering."""
-        image = image.convert("RGBA")
-        data = image.tobytes("raw", "RGBA")
-        bytes_per_line = image.width * 4
-        qimage = QImage(
-            data,
-            image.width,
-            image.height,
-            bytes_per_line,
-            QImage.Format.Format_RGBA8888,
-        )
-        return QPixmap.fromImage(qimage.copy())
+    def _frame_array(image) -> np.ndarray:
+        """Return a frame's pixels as a read-only RGBA array without copying.
 
-    @staticmethod
-    def _pixmap_to_pil(pixmap: QPixmap) -> Any:
-        """Convert a pixmap back into a Pillow image for export routines."""
-        if not PIL_AVAILABLE:
-            raise RuntimeError("Pillow is required to export editor composites")
-        if pixmap.isNull():
-            return Image.new("RGBA", (1, 1), (0, 0, 0, 0))
-        qimage = pixmap.toImage().convertToFormat(QImage.Format.Format_RGBA8888)
-        width = qimage.width()
-        height = qimage.height()
-        buffer = qimage.bits()
-        byte_count = qimage.sizeInBytes()
-        data = buffer.tobytes(byte_count)
-        pil_image = Image.frombuffer("RGBA", (width, height), data, "raw", "RGBA", 0, 1)
-        return pil_image.copy()
-
-    def build_canvas_frames(self, animation_id: str) -> List[Tuple[str, Any, dict]]:
-        """Render frames as RGBA canvases honoring origin modes and offsets."""
-        if not PIL_AVAILABLE:
-            return []
-        animation = self._animations.get(animation_id)
-        if animation is None or not animation.frames:
-            return []
-        aligned_frames: List[Tuple[str, Any, dict]] = []
-        for index, frame in enumerate(animation.frames):
-            canvas = Image.new(
-                "RGBA",
-                (animation.canvas_width, animation.canvas_height),
-                (0, 0, 0, 0),
-            )
-            pixmap_image = self._pixmap_to_pil(frame.pixmap)
-            if animation.origin_mode == ORIGIN_MODE_TOP_LEFT:
-                offset_x = frame.offset_x
-                offset_y = frame.offset_y
-            else:
-                offset_x = (
-                    animation.canvas_width - pixmap_image.width
-                ) // 2 + frame.offset_x
-                offset_y = (
-                    animation.canvas_height - pixmap_image.height
-                ) // 2 + frame.offset_y
-            canvas.paste(pixmap_image, (offset_x, offset_y), pixmap_image)
-            aligned_frames.append(
-                (
-                    frame.name or f"frame_{index}",
-                    canvas,
-                    {"duration_ms": frame.duration_ms, **frame.metadata},
-                )
-            )
-        return aligned_frames
+        Extractor frames are already arrays (often views into the atlas) and
+        are shared as they are; PIL images are converted once.
+        """
+        return readonly_view(ensure_rgba_array(image))
@@ -26,15 +26,129 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, QCoreApplication
+from PySide6.QtCore import Qt, QCoreApplication, QThread, Signal
 from PySide6.QtGui import QAction
 
 from gui.extractor.enhanced_list_widget import EnhancedListWidget
-from utils.utilities import Utilities
-from core.extractor.spritemap.metadata import (
-    compute_symbol_lengths,
-    extract_label_ranges,
-)
+from core.extractor.directory_index import DirectoryIndex
+from core.extractor.spritemap.metadata import build_symbol_map
+
+
+class SpritesheetIndexWorker(QThread):
+    """Background thread that discovers spritesheets in an input directory.
+
+    Wraps ``DirectoryIndex.scan`` so large or network-mounted folders never
+    block the GUI thread.
+
+    Signals:
+        entries_found(object): List of ``SpritesheetEntry`` for one directory.
+        indexing_finished(int): Total number of spritesheets found.
+    """
+
+    entries_found = Signal(object)
+    indexing_finished = Signal(int)
+
+    def __init__(self, directory: str, filter_single_frame: bool = True):
+        """Initialize the worker.
+
+        Args:
+            directory: Input directory to index.
+            filter_single_frame: Skip single-frame spritemap symbols.
+        """
+        super().__init__()
+        self.index = DirectoryIndex(directory, filter_single_frame=filter_single_frame)
+        self._stop_requested = False
+
+    def stop(self):
+        """Request to stop indexing."""
+        self._stop_requested = True
+
+    def run(self):
+        """Walk the directory and emit entries as each folder is paired."""
+        total = 0
+        try:
+            for entries in self.index.scan(cancelled=lambda: self._stop_requested):
+                total += len(entries)
+                self.entries_found.emit(entries)
+        except Exception as exc:
+            print(f"[SpritesheetIndexWorker] Indexing failed: {exc}")
+        if not self._stop_requested:
+            self.indexing_finished.emit(total)
+
+
+class AnimationNamesWorker(QThread):
+    """Background thread that parses a metadata file for its animation names.
+
+    The parse lands in ``MetadataCache``, so extracting or previewing the
+    spritesheet afterwards does not parse it again.
+
+    Signals:
+        names_ready(str, object): Spritesheet name and its sorted animation
+            names, or ``None`` if the file could not be parsed.
+    """
+
+    names_ready = Signal(str, object)
+
+    def __init__(self, spritesheet_name: str, metadata_path: str):
+        """Initialize the worker.
+
+        Args:
+            spritesheet_name: List entry the names belong to.
+            metadata_path: Metadata file to parse.
+        """
+        super().__init__()
+        self.spritesheet_name = spritesheet_name
+        self.metadata_path = metadata_path
+
+    def run(self):
+        """Parse the metadata and emit the names."""
+        from parsers.metadata_cache import MetadataCache
+
+        try:
+            names = MetadataCache.animation_names(self.metadata_path)
+        except Exception as e:
+            print(f"Error parsing metadata {self.metadata_path}: {e}")
+            names = None
+        self.names_ready.emit(self.spritesheet_name, names)
+
+
+class MetadataPreflightWorker(QThread):
+    """Background thread that validates a batch's metadata with ``run_preflight``.
+
+    Signals:
+        progress_updated(int, int): Files checked so far and the total.
+        reports_ready(object): Dict of ``PreflightReport`` keyed by
+            spritesheet name.
+    """
+
+    progress_updated = Signal(int, int)
+    reports_ready = Signal(object)
+
+    def __init__(self, tasks, max_workers: Optional[int] = None):
+        """Initialize the worker.
+
+        Args:
+            tasks: ``PreflightTask`` list from ``build_preflight_tasks``.
+            max_workers: Process cap passed to ``run_preflight``.
+        """
+        super().__init__()
+        self.tasks = tasks
+        self.max_workers = max_workers
+
+    def run(self):
+        """Validate the batch and emit the reports."""
+        from core.extractor.preflight import run_preflight
+
+        try:
+            reports = run_preflight(
+                self.tasks,
+                max_workers=self.max_workers,
+                progress_callback=self.progress_updated.emit,
+            )
+        except Exception as e:
+            print(f"[Preflight] Metadata check failed: {e}")
+            reports = {}
+        self.reports_ready.emit(reports)
 
 
 class ExtractTabWidget(QWidget):
@@ -55,6 +169,9 @@ class ExtractTabWidget(QWidget):
         self.use_existing_ui = use_existing_ui
         self.filter_single_frame_spritemaps = True
         self.editor_composites = defaultdict(dict)
+        self.index_worker = None
+        self.metadata_workers = []
+        self.preflight_worker = None
 
         if use_existing_ui and parent:
             # Use existing UI elements from parent
@@ -677,51 +794,67 @@ class ExtractTabWidget(QWidget):
             )
 
     def populate_spritesheet_list(self, directory):
-        """Populates the spritesheet list from a directory."""
+        """Populates the spritesheet list from a directory.
+
+        Discovery runs on a ``SpritesheetIndexWorker``; spritesheets are added
+        as each folder is indexed.
+        """
         if not self.parent_app:
             return
 
+        self._stop_index_worker()
+
         self.listbox_png.clear()
         self.listbox_data.clear()
         self.parent_app.data_dict.clear()
 
-        directory_path = Path(directory)
-        if not directory_path.exists():
+        if not Path(directory).exists():
             return
 
-        # Root-level PNGs
-        for png_file in sorted(directory_path.glob("*.png")):
-            display_name = self._format_display_name(directory_path, png_file)
-            self.listbox_png.add_item(display_name, str(png_file))
-            self.find_data_files_for_spritesheet(
-                png_file,
-                search_directory=png_file.parent,
-                display_name=display_name,
-            )
-
-        # Nested spritemap folders (Animation.json + matching spritemap json)
-        for png_file in sorted(directory_path.rglob("*.png")):
-            if png_file.parent == directory_path:
-                continue
-            animation_json = png_file.parent / "Animation.json"
-            spritemap_json = png_file.parent / f"{png_file.stem}.json"
-            if not (animation_json.exists() and spritemap_json.exists()):
-                continue
-            display_name = self._format_display_name(directory_path, png_file)
-            if self.listbox_png.find_item_by_text(display_name):
-                continue
-            self.listbox_png.add_item(display_name, str(png_file))
-            self.find_data_files_for_spritesheet(
-                png_file,
-                search_directory=png_file.parent,
-                display_name=display_name,
-            )
+        self.index_worker = SpritesheetIndexWorker(
+            directory, self.filter_single_frame_spritemaps
+        )
+        self.index_worker.entries_found.connect(self._on_index_entries_found)
+        self.index_worker.indexing_finished.connect(self._on_indexing_finished)
+        self.index_worker.start()
+
+    def _stop_index_worker(self):
+        """Cancel a directory scan that is still running."""
+        if self.index_worker and self.index_worker.isRunning():
+            self.index_worker.stop()
+            self.index_worker.wait(1000)
+        self.index_worker = None
+
+    def _on_index_entries_found(self, entries):
+        """Add spritesheets reported by the index worker to the list."""
+        if self.sender() is not self.index_worker:
+            return  # Late batch from a cancelled scan
+
+        self.listbox_png.setUpdatesEnabled(False)
+        try:
+            for entry in entries:
+                self.listbox_png.add_item(entry.display_name, entry.image_path)
+                self.parent_app.data_dict[entry.display_name] = dict(entry.data_files)
+        finally:
+            self.listbox_png.setUpdatesEnabled(True)
+
+    def _on_indexing_finished(self, total):
+        """Log the outcome of a directory scan."""
+        if self.sender() is not self.index_worker:
+            return
+        index = self.index_worker.index
+        print(
+            f"[ExtractTab] Indexed {total} spritesheets "
+            f"({index.listed_directories} of {index.indexed_directories} folders listed)"
+        )
 
     def populate_spritesheet_list_from_files(self, files, temp_folder=None):
         """Populates the spritesheet list from manually selected files."""
         if not self.parent_app:
             return
 
+        self._stop_index_worker()
+
         self.listbox_png.clear()
         self.listbox_data.clear()
         self.parent_app.data_dict.clear()
@@ -805,51 +938,15 @@ class ExtractTabWidget(QWidget):
             dict: Keys are human-friendly labels, values describe the original
                 symbol, label, and estimated frame count.
         """
-        symbol_map = {}
-
-        def register_entry(display_name, entry_type, entry_value, frame_count):
-            """Store entries with unique labels so symbols and labels never collide."""
-            suffix = " (Timeline)" if entry_type == "timeline_label" else " (Symbol)"
-            candidate = display_name
-            if candidate in symbol_map:
-                candidate = f"{display_name}{suffix}"
-                counter = 2
-                while candidate in symbol_map:
-                    candidate = f"{display_name}{suffix} #{counter}"
-                    counter += 1
-            symbol_map[candidate] = {
-                "type": entry_type,
-                "value": entry_value,
-                "frame_count": frame_count,
-            }
-
         try:
             with open(animation_json_path, "r", encoding="utf-8") as animation_file:
                 animation_json = json.load(animation_file)
-
-            symbol_lengths = compute_symbol_lengths(animation_json)
-
-            for symbol in animation_json.get("SD", {}).get("S", []):
-                raw_name = symbol.get("SN")
-                if not raw_name:
-                    continue
-                frame_count = symbol_lengths.get(raw_name, 0)
-                if self.filter_single_frame_spritemaps and frame_count <= 1:
-                    continue
-                display_name = Utilities.strip_trailing_digits(raw_name) or raw_name
-                register_entry(display_name, "symbol", raw_name, frame_count)
-
-            for label in extract_label_ranges(animation_json, None):
-                label_name = label["name"]
-                frame_count = label["end"] - label["start"]
-                if self.filter_single_frame_spritemaps and frame_count <= 1:
-                    continue
-                register_entry(label_name, "timeline_label", label_name, frame_count)
+            return build_symbol_map(animation_json, self.filter_single_frame_spritemaps)
         except Exception as exc:
             print(
                 f"Error parsing spritemap animation metadata {animation_json_path}: {exc}"
             )
-        return symbol_map
+            return {}
 
     def register_editor_composite(
         self,
@@ -929,29 +1026,10 @@ class ExtractTabWidget(QWidget):
         data_files = self.parent_app.data_dict[spritesheet_name]
 
         if isinstance(data_files, dict):
-            if "xml" in data_files:
-                try:
-                    from parsers.xml_parser import XmlParser
-
-                    xml_parser = XmlParser(
-                        directory=str(Path(data_files["xml"]).parent),
-                        xml_filename=Path(data_files["xml"]).name,
-                    )
-                    self._populate_animation_names(xml_parser.get_data())
-                except Exception as e:
-                    print(f"Error parsing XML: {e}")
-
-            elif "txt" in data_files:
-                try:
-                    from parsers.txt_parser import TxtParser
-
-                    txt_parser = TxtParser(
-                        directory=str(Path(data_files["txt"]).parent),
-                        txt_filename=Path(data_files["txt"]).name,
-                    )
-                    self._populate_animation_names(txt_parser.get_data())
-                except Exception as e:
-                    print(f"Error parsing TXT: {e}")
+            metadata_path = data_files.get("xml") or data_files.get("txt")
+            if metadata_path:
+                if self._populate_metadata_names(spritesheet_name, metadata_path):
+                    return
 
             elif "spritemap" in data_files:
                 spritemap_info = data_files.get("spritemap", {})
@@ -981,6 +1059,48 @@ class ExtractTabWidget(QWidget):
 
         self._append_editor_composites_to_list(spritesheet_name)
 
+    def _populate_metadata_names(self, spritesheet_name, metadata_path):
+        """List the animations of an XML/TXT atlas, parsing it in the background.
+
+        Returns:
+            ``True`` if the names are being parsed asynchronously and the list
+            will be completed by ``_on_animation_names_ready``.
+        """
+        from parsers.metadata_cache import MetadataCache
+
+        if MetadataCache.get(metadata_path) is not None:
+            self._populate_animation_names(MetadataCache.animation_names(metadata_path))
+            return False
+
+        worker = AnimationNamesWorker(spritesheet_name, metadata_path)
+        worker.names_ready.connect(self._on_animation_names_ready)
+        worker.finished.connect(lambda: self._forget_metadata_worker(worker))
+        self.metadata_workers.append(worker)
+        worker.start()
+        return True
+
+    def _forget_metadata_worker(self, worker):
+        if worker in self.metadata_workers:
+            self.metadata_workers.remove(worker)
+
+    def _on_animation_names_ready(self, spritesheet_name, names):
+        """Fill the animation list once a background parse finishes."""
+        current_item = self.listbox_png.currentItem()
+        if not current_item or current_item.text() != spritesheet_name:
+            return  # The user moved on; the parse is cached for later
+
+        self.listbox_data.clear()
+        self._populate_animation_names(names)
+        self._append_editor_composites_to_list(spritesheet_name)
+
+    def stop_background_workers(self):
+        """Wait for directory indexing and metadata parsing threads to end."""
+        self._stop_index_worker()
+        for worker in list(self.metadata_workers):
+            worker.wait(1000)
+        if self.preflight_worker:
+            self.preflight_worker.wait(1000)
+
     def _populate_unknown_parser_fallback(self):
         """Use the generic parser when nothing else recognized the source."""
         self._populate_using_unknown_parser()
@@ -1039,6 +1159,8 @@ class ExtractTabWidget(QWidget):
             except Exception:
                 pass
 
+        self._stop_index_worker()
+
         # Clear the list widgets
         self.listbox_png.clear()
         self.listbox_data.clear()
@@ -1114,6 +1236,11 @@ class ExtractTabWidget(QWidget):
         settings_action.triggered.connect(self.override_spritesheet_settings)
         menu.addAction(settings_action)
 
+        check_action = QAction(self.tr("Check Metadata of All Spritesheets"), self)
+        check_action.setEnabled(self.preflight_worker is None)
+        check_action.triggered.connect(self.check_metadata)
+        menu.addAction(check_action)
+
         menu.addSeparator()
 
         delete_action = QAction(self.tr("Delete"), self)
@@ -1800,6 +1927,79 @@ class ExtractTabWidget(QWidget):
 
         return True, "", spritesheet_list
 
+    def check_metadata(self):
+        """Validate the metadata of every listed spritesheet in the background.
+
+        Parses each file with ``run_preflight`` without decoding images. For
+        batches ``MetadataCache`` can hold, the parses stay cached for the
+        extraction that follows.
+        Results are shown by ``_on_preflight_finished``.
+        """
+        from core.extractor.preflight import build_preflight_tasks
+
+        if self.preflight_worker is not None:
+            return
+
+        tasks = build_preflight_tasks(
+            self.input_dir_label.text(), self.get_spritesheet_list()
+        )
+        if not tasks:
+            QMessageBox.information(
+                self,
+                self.tr("Check Metadata"),
+                self.tr("No XML or TXT metadata to check."),
+            )
+            return
+
+        max_workers = None
+        app_config = getattr(self.parent_app, "app_config", None)
+        if app_config:
+            resource_limits = app_config.settings.get("resource_limits", {})
+            try:
+                max_workers = int(resource_limits.get("cpu_cores", "auto"))
+            except (TypeError, ValueError):
+                max_workers = None
+
+        self.preflight_worker = MetadataPreflightWorker(tasks, max_workers)
+        self.preflight_worker.reports_ready.connect(self._on_preflight_finished)
+        self.preflight_worker.finished.connect(self._forget_preflight_worker)
+        self.preflight_worker.start()
+
+    def _forget_preflight_worker(self):
+        if self.sender() is self.preflight_worker:
+            # finished is emitted just before the thread ends; let it end
+            self.preflight_worker.wait()
+            self.preflight_worker = None
+
+    def _on_preflight_finished(self, reports):
+        """Show the metadata check results; skipped files leave the list."""
+        from gui.extractor.parse_error_dialog import ParseErrorDialog
+
+        for report in reports.values():
+            if report.out_of_bounds or report.zero_size:
+                print(
+                    f"[Preflight] {report.filename}: "
+                    f"{len(report.out_of_bounds)} out of bounds, "
+                    f"{len(report.zero_size)} zero-size sprite(s)"
+                )
+
+        parse_results = {name: report.result for name, report in reports.items()}
+        if not any(report.has_issues for report in reports.values()):
+            QMessageBox.information(
+                self,
+                self.tr("Check Metadata"),
+                self.tr("No problems found in {count} metadata file(s).").format(
+                    count=len(reports)
+                ),
+            )
+            return
+
+        action, files_to_skip = ParseErrorDialog.show_if_needed(
+            self.parent_app, parse_results
+        )
+        if action == "skip" and files_to_skip:
+            self.filter_unknown_atlases(files_to_skip)
+
     def get_input_directory(self):
         """Get the input directory path."""
         return self.input_dir_label.text()
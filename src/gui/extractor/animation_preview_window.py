@@ -3,12 +3,14 @@
 """Animation preview dialog for viewing and adjusting extracted animations.
 
 Provides a real-time preview of GIF, WebP, and APNG animations with playback
-controls, frame selection, and export settings. Runs frame loading in a
-background thread to maintain UI responsiveness.
+controls, frame selection, and export settings. Frames prepared in memory by
+``PreviewGenerator`` are shown directly, streamed in from a background thread
+so playback starts before the whole animation is ready; animation files are
+also loaded in a background thread to maintain UI responsiveness.
 """
 
 import os
-from typing import List
+from typing import List, Optional
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -33,7 +35,7 @@ from PySide6.QtWidgets import (
     QScrollArea,
 )
 from PySide6.QtCore import Qt, QTimer, QThread, Signal, QSize, QRect
-from PySide6.QtGui import QPixmap, QImage, QPainter, QColor
+from PySide6.QtGui import QBrush, QPixmap, QImage, QPainter, QColor
 
 try:
     from PIL import Image
@@ -44,6 +46,7 @@ except ImportError:
 
 MAX_FRAMES_IN_MEMORY = 100
 FRAME_CACHE_SIZE = 20
+PROGRESSIVE_START_FRAMES = 8  # Frames needed before streamed playback starts
 
 
 class AnimationProcessor(QThread):
@@ -140,6 +143,78 @@ class AnimationProcessor(QThread):
             self.error_occurred.emit(f"Failed to load animation: {str(e)}")
 
 
+class PreviewFrameStream(QThread):
+    """Background thread that prepares in-memory preview frames one by one.
+
+    Frames are emitted as soon as ``PreviewGenerator.iter_preview_frames``
+    yields them; the final ``PreviewAnimation`` follows once every frame is
+    ready. ``stop()`` cancels between frames, leaving the preview cache
+    untouched.
+
+    Signals:
+        frame_ready(int, int, object): Frame index, expected total and the
+            RGBA array.
+        stream_complete(object): The final ``PreviewAnimation``, or ``None``
+            if nothing could be prepared.
+        error_occurred(str): Emitted with an error message on failure.
+    """
+
+    frame_ready = Signal(int, int, object)
+    stream_complete = Signal(object)
+    error_occurred = Signal(str)
+
+    def __init__(self, preview_generator, request):
+        """Initialize the frame stream.
+
+        Args:
+            preview_generator: ``PreviewGenerator`` that prepares the frames.
+            request: ``PreviewRequest`` describing the animation.
+        """
+        super().__init__()
+        self.preview_generator = preview_generator
+        self.request = request
+        self._stop_requested = False
+
+    def stop(self):
+        """Request to stop streaming."""
+        self._stop_requested = True
+
+    def run(self):
+        """Stream frames, then emit the finished preview."""
+        request = self.request
+        try:
+            for index, total, frame in self.preview_generator.iter_preview_frames(
+                request.atlas_path,
+                request.metadata_path,
+                request.settings,
+                request.animation_name,
+                spritemap_info=request.spritemap_info,
+                spritesheet_label=request.spritesheet_label,
+                cancelled=lambda: self._stop_requested,
+            ):
+                if self._stop_requested:
+                    return
+                self.frame_ready.emit(index, total, frame)
+
+            if self._stop_requested:
+                return
+
+            # Every stage is cached now, so this only resolves durations
+            preview = self.preview_generator.generate_preview_frames(
+                request.atlas_path,
+                request.metadata_path,
+                request.settings,
+                request.animation_name,
+                spritemap_info=request.spritemap_info,
+                spritesheet_label=request.spritesheet_label,
+            )
+            if not self._stop_requested:
+                self.stream_complete.emit(preview)
+
+        except Exception as e:
+            self.error_occurred.emit(f"Failed to prepare animation: {str(e)}")
+
+
 class FrameListWidget(QListWidget):
     """List widget for frame navigation with checkbox selection.
 
@@ -171,16 +246,27 @@ class FrameListWidget(QListWidget):
         self.clear()
         for i in range(count):
             if frame_durations and i < len(frame_durations):
-                delay_ms = frame_durations[i]
-                frame_text = f"Frame {i + 1} ({delay_ms}ms)"
+                self.add_frame(frame_durations[i])
             else:
-                frame_text = f"Frame {i + 1}"
+                self.add_frame()
 
-            item = QListWidgetItem(frame_text)
-            item.setData(Qt.ItemDataRole.UserRole, i)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Checked)
-            self.addItem(item)
+    def add_frame(self, delay_ms: Optional[int] = None):
+        """Append a checked entry for the next frame.
+
+        Args:
+            delay_ms: Optional delay in milliseconds shown in the label.
+        """
+        i = self.count()
+        if delay_ms is not None:
+            frame_text = f"Frame {i + 1} ({delay_ms}ms)"
+        else:
+            frame_text = f"Frame {i + 1}"
+
+        item = QListWidgetItem(frame_text)
+        item.setData(Qt.ItemDataRole.UserRole, i)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(Qt.CheckState.Checked)
+        self.addItem(item)
 
     def update_frame_delays(self, frame_durations: List[int], show_delays: bool = True):
         """Refresh delay labels on existing frame entries.
@@ -468,12 +554,7 @@ class AnimationDisplay(QScrollArea):
             final_pixmap.fill(Qt.GlobalColor.transparent)
 
             painter = QPainter(final_pixmap)
-
-            pattern_size = self._checkered_pattern.size()
-            for x in range(0, final_pixmap.width(), pattern_size.width()):
-                for y in range(0, final_pixmap.height(), pattern_size.height()):
-                    painter.drawPixmap(x, y, self._checkered_pattern)
-
+            painter.fillRect(final_pixmap.rect(), QBrush(self._checkered_pattern))
             painter.drawPixmap(0, 0, display_pixmap)
             painter.end()
 
@@ -509,7 +590,10 @@ class AnimationPreviewWindow(QDialog):
         settings_saved(dict): Emitted with the chosen export settings.
 
     Attributes:
-        animation_path: Path to the animation file being previewed.
+        animation_path: Path to the animation file being previewed, or
+            ``None`` when showing in-memory frames.
+        preview: In-memory ``PreviewAnimation`` being shown, if any.
+        request: ``PreviewRequest`` the frames are streamed from, if any.
         settings: Dictionary of current animation settings.
         frames: List of loaded QPixmap frames.
         frame_durations: Per-frame display durations in milliseconds.
@@ -517,16 +601,35 @@ class AnimationPreviewWindow(QDialog):
 
     settings_saved = Signal(dict)
 
-    def __init__(self, parent, animation_path: str, settings: dict):
+    # Cancelled loaders that outlived their wait. Qt aborts if a QThread is
+    # destroyed while running, so they are kept here, beyond the window's own
+    # lifetime, until they finish.
+    _retired_threads: List[QThread] = []
+
+    def __init__(
+        self,
+        parent,
+        animation_path: Optional[str],
+        settings: dict,
+        preview=None,
+        request=None,
+    ):
         """Create the preview dialog and start loading frames.
 
         Args:
             parent: Parent widget (typically the main application window).
-            animation_path: Path to the animation file to preview.
+            animation_path: Path to the animation file to preview, or
+                ``None`` when ``preview`` or ``request`` is given.
             settings: Initial animation settings dictionary.
+            preview: Optional ``PreviewAnimation`` with prepared frames;
+                shown directly instead of decoding ``animation_path``.
+            request: Optional ``PreviewRequest``; frames are prepared in the
+                background and playback starts once the first few exist.
         """
         super().__init__(parent)
         self.animation_path = animation_path
+        self.preview = preview
+        self.request = request
         self.settings = settings.copy() if settings else {}
 
         self.frames: List[QPixmap] = []
@@ -535,6 +638,9 @@ class AnimationPreviewWindow(QDialog):
         self.is_playing = False
         self.is_loading = False
         self.processor = None
+        self.stream = None
+        self._stream_buffers = []
+        self._play_when_ready = True
         self._loop_delay_applied = False
 
         self._last_update_time = 0
@@ -856,16 +962,23 @@ class AnimationPreviewWindow(QDialog):
         return controls_layout
 
     def load_animation(self):
-        """Start loading animation frames in a background thread."""
-        if not os.path.exists(self.animation_path):
+        """Show in-memory frames, or start preparing/loading them in the background."""
+        if self.preview is not None:
+            self._load_preview_frames()
+            return
+
+        if self.request is not None:
+            self._start_preview_stream()
+            return
+
+        if not self.animation_path or not os.path.exists(self.animation_path):
             QMessageBox.warning(
                 self, "Error", f"Animation file not found: {self.animation_path}"
             )
             return
 
-        if self.processor and self.processor.isRunning():
-            self.processor.stop()
-            self.processor.wait(1000)
+        self._retire_thread(self.processor)
+        self.processor = None
 
         self.frames.clear()
         self.frame_durations.clear()
@@ -883,6 +996,149 @@ class AnimationPreviewWindow(QDialog):
         self.processor.progress_updated.connect(self.on_progress_updated)
         self.processor.start()
 
+    def _load_preview_frames(self):
+        """Wrap the prepared frame buffers as pixmaps without decoding a file.
+
+        Pixmaps already built from the same buffers while streaming are kept.
+        """
+        self._stop_background_loading()
+
+        frames = []
+        for index, array in enumerate(self.preview.frames):
+            if (
+                index < len(self._stream_buffers)
+                and index < len(self.frames)
+                and self._stream_buffers[index] is array
+            ):
+                frames.append(self.frames[index])
+            else:
+                frames.append(self._pixmap_from_array(array))
+        self._stream_buffers = []
+        self.frames = frames
+        self.frame_durations = list(self.preview.durations)
+
+        self.on_processing_complete()
+
+    @staticmethod
+    def _pixmap_from_array(array) -> QPixmap:
+        """Convert a contiguous RGBA array into a pixmap."""
+        height, width = array.shape[:2]
+        # The QImage borrows the array's memory; fromImage makes the copy
+        qimg = QImage(
+            array.data,
+            width,
+            height,
+            array.strides[0],
+            QImage.Format.Format_RGBA8888,
+        )
+        return QPixmap.fromImage(qimg)
+
+    def _stop_background_loading(self):
+        """Cancel any file load or frame stream still running."""
+        self._retire_thread(self.processor)
+        self.processor = None
+        self._retire_thread(self.stream)
+
+    @classmethod
+    def _retire_thread(cls, thread: Optional[QThread]):
+        """Stop a loader thread, keeping it referenced until it finishes."""
+        cls._retired_threads[:] = [
+            retired for retired in cls._retired_threads if not retired.isFinished()
+        ]
+        if thread is None or not thread.isRunning():
+            return
+        thread.stop()
+        if not thread.wait(1000):
+            cls._retired_threads.append(thread)
+
+    def _start_preview_stream(self):
+        """Prepare ``self.request`` in the background, showing frames as they arrive.
+
+        A stream that is still running is cancelled first, so settings changes
+        mid-render only pay for the latest request.
+        """
+        from core.extractor import PreviewGenerator
+
+        self._play_when_ready = self._play_when_ready or self.is_playing
+        self._stop_background_loading()
+        if self.is_playing:
+            self.pause()
+
+        self.frames = []
+        self.frame_durations = []
+        self._stream_buffers = []
+        self.current_frame = 0
+        self.frame_list.clear()
+        self.position_slider.setMaximum(0)
+
+        self.is_loading = True
+        self.progress_label.setText("Rendering...")
+        if self.play_button:
+            self.play_button.setEnabled(False)
+
+        parent = self.parent()
+        preview_generator = PreviewGenerator(
+            getattr(parent, "settings_manager", None),
+            getattr(parent, "current_version", "2.0.0"),
+        )
+        self.stream = PreviewFrameStream(preview_generator, self.request)
+        self.stream.frame_ready.connect(self.on_stream_frame)
+        self.stream.stream_complete.connect(self.on_stream_complete)
+        self.stream.error_occurred.connect(self.on_processing_error)
+        self.stream.start()
+
+    def on_stream_frame(self, frame_index: int, total: int, frame):
+        """Show a streamed frame and start playback once enough have arrived.
+
+        Args:
+            frame_index: Zero-based index of the frame.
+            total: Expected number of frames.
+            frame: Contiguous RGBA array for the frame.
+        """
+        if self.sender() is not self.stream:
+            return  # Late signal from a cancelled stream
+
+        self._stream_buffers.append(frame)
+        self.frames.append(self._pixmap_from_array(frame))
+        self.frame_list.add_frame()
+        self.position_slider.setMaximum(len(self.frames) - 1)
+
+        if self.progress_label:
+            self.progress_label.setText(
+                f"Rendering... ({len(self.frames)}/{max(total, len(self.frames))})"
+            )
+
+        if len(self.frames) == 1:
+            self.update_display()
+
+        if len(self.frames) == min(PROGRESSIVE_START_FRAMES, max(total, 1)):
+            if self.play_button:
+                self.play_button.setEnabled(True)
+            self._start_streamed_playback()
+
+    def _start_streamed_playback(self):
+        """Start playback once, if it was running or this is the first load."""
+        if self._play_when_ready and not self.is_playing:
+            self.play()
+        self._play_when_ready = False
+
+    def on_stream_complete(self, preview):
+        """Replace streamed frames with the finished preview.
+
+        Args:
+            preview: Final ``PreviewAnimation``, or ``None`` on failure.
+        """
+        if self.sender() is not self.stream:
+            return
+
+        if preview is None:
+            self.on_processing_error("Could not generate animation preview.")
+            return
+
+        self.preview = preview
+        self._load_preview_frames()
+        self._start_streamed_playback()
+
     def on_progress_updated(self, current: int, total: int):
         """Update the progress label during frame loading.
 
@@ -965,10 +1221,8 @@ class AnimationPreviewWindow(QDialog):
         QMessageBox.warning(self, "Error", error_message)
 
     def cleanup_resources(self):
-        """Stop the processor thread, timer, and release frames."""
-        if self.processor and self.processor.isRunning():
-            self.processor.stop()
-            self.processor.wait(1000)
+        """Stop background threads and the timer, and release frames."""
+        self._stop_background_loading()
 
         if self.timer and self.timer.isActive():
             self.timer.stop()
@@ -1321,9 +1575,13 @@ class AnimationPreviewWindow(QDialog):
         self.display.set_transparency_background(checked)
 
     def regenerate_animation(self):
-        """Re-export the animation with current settings and reload it."""
+        """Re-prepare the animation frames with current settings and show them.
+
+        Frames stream in the background; a preparation still running for
+        earlier settings is cancelled.
+        """
         try:
-            from core.extractor import Extractor
+            from core.extractor import PreviewRequest
 
             current_spritesheet_item = (
                 self.parent().extract_tab_widget.listbox_png.currentItem()
@@ -1362,8 +1620,6 @@ class AnimationPreviewWindow(QDialog):
                     elif "spritemap" in data_files:
                         spritemap_info = data_files["spritemap"]
 
-            extractor = Extractor(None, "2.0.0", self.parent().settings_manager)
-
             animation_name = current_animation_item.text()
             complete_settings = self.parent().get_complete_preview_settings(
                 spritesheet_name, animation_name
@@ -1402,23 +1658,18 @@ class AnimationPreviewWindow(QDialog):
             if self.settings.get("animation_format") == "GIF":
                 complete_settings["threshold"] = self.settings.get("threshold", 0.5)
 
-            temp_path = extractor.generate_temp_animation_for_preview(
+            self.request = PreviewRequest(
                 atlas_path=spritesheet_path,
                 metadata_path=metadata_path,
-                settings=complete_settings,
                 animation_name=animation_name,
+                settings=complete_settings,
                 spritemap_info=spritemap_info,
                 spritesheet_label=spritesheet_name,
             )
-
-            if temp_path and os.path.exists(temp_path):
-                self.animation_path = temp_path
-                self.settings = complete_settings
-                self.frames.clear()
-                self.frame_durations.clear()
-                self.load_animation()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to regenerate animation.")
+            self.preview = None
+            self.animation_path = None
+            self.settings = complete_settings
+            self.load_animation()
 
         except Exception as e:
             QMessageBox.warning(
@@ -21,6 +21,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+from core.extractor.frame_encoders import COMPRESSION_PROFILES
+
 
 class CompressionSettingsWindow(QDialog):
     """Dialog for configuring format-specific compression settings.
@@ -34,6 +36,8 @@ class CompressionSettingsWindow(QDialog):
         current_format: Uppercase format string ('PNG', 'WEBP', etc.).
         original_values: Snapshot of values when the dialog opened.
         compression_widgets: Dictionary mapping format names to widget dicts.
+        profile_combobox: Compression profile selector, or ``None`` when no
+            profile changes the current format.
     """
 
     def __init__(
@@ -54,6 +58,7 @@ class CompressionSettingsWindow(QDialog):
 
         self.original_values = {}
         self.compression_widgets = {}
+        self.profile_combobox = None
 
         self.setWindowTitle(self.tr("Compression Settings"))
         self.setModal(True)
@@ -114,6 +119,8 @@ class CompressionSettingsWindow(QDialog):
             no_settings_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             content_layout.addWidget(no_settings_label)
 
+        self.create_profile_settings(content_layout)
+
         content_layout.addStretch()
         scroll_area.setWidget(content_widget)
         layout.addWidget(scroll_area)
@@ -132,6 +139,38 @@ class CompressionSettingsWindow(QDialog):
 
         layout.addLayout(button_layout)
 
+    def create_profile_settings(self, layout):
+        """Add the compression profile selector if a profile affects the format.
+
+        Args:
+            layout: Parent QVBoxLayout for the settings group.
+        """
+        prefix = f"{self.current_format.lower()}_"
+        if not any(
+            key.startswith(prefix)
+            for profile in COMPRESSION_PROFILES.values()
+            for key in profile
+        ):
+            return
+
+        group = QGroupBox(self.tr("Compression Profile"))
+        grid = QGridLayout(group)
+
+        grid.addWidget(QLabel(self.tr("Profile:")), 0, 0)
+        profile_combobox = QComboBox()
+        profile_combobox.addItem(self.tr("Default"), "default")
+        profile_combobox.addItem(self.tr("Fast"), "fast")
+        profile_combobox.setToolTip(
+            "Compression profile:\n"
+            "• Default: Use the settings above\n"
+            "• Fast: Low-effort compression for quick iteration builds.\n"
+            "  Files are larger but export much faster; lossless stays lossless"
+        )
+        grid.addWidget(profile_combobox, 0, 1)
+
+        self.profile_combobox = profile_combobox
+        layout.addWidget(group)
+
     def create_png_settings(self, layout):
         """Add PNG compression controls to the layout.
 
@@ -439,6 +478,12 @@ class CompressionSettingsWindow(QDialog):
         elif self.current_format == "TIFF":
             self.load_tiff_values(global_settings, compression_defaults)
 
+        if self.profile_combobox:
+            index = self.profile_combobox.findData(
+                global_settings.get("compression_profile", "default")
+            )
+            self.profile_combobox.setCurrentIndex(max(index, 0))
+
         self.store_original_values()
 
     def load_png_values(self, global_settings, defaults):
@@ -551,37 +596,7 @@ class CompressionSettingsWindow(QDialog):
 
     def store_original_values(self):
         """Snapshot current widget values into original_values for comparison."""
-        self.original_values = {}
-
-        if self.current_format == "PNG" and "PNG" in self.compression_widgets:
-            widgets = self.compression_widgets["PNG"]
-            self.original_values = {
-                "png_compress_level": widgets["compress_level"].value(),
-                "png_optimize": widgets["optimize"].isChecked(),
-            }
-        elif self.current_format == "WEBP" and "WEBP" in self.compression_widgets:
-            widgets = self.compression_widgets["WEBP"]
-            self.original_values = {
-                "webp_lossless": widgets["lossless"].isChecked(),
-                "webp_quality": widgets["quality"].value(),
-                "webp_method": widgets["method"].value(),
-                "webp_alpha_quality": widgets["alpha_quality"].value(),
-                "webp_exact": widgets["exact"].isChecked(),
-            }
-        elif self.current_format == "AVIF" and "AVIF" in self.compression_widgets:
-            widgets = self.compression_widgets["AVIF"]
-            self.original_values = {
-                "avif_lossless": widgets["lossless"].isChecked(),
-                "avif_quality": widgets["quality"].value(),
-                "avif_speed": widgets["speed"].value(),
-            }
-        elif self.current_format == "TIFF" and "TIFF" in self.compression_widgets:
-            widgets = self.compression_widgets["TIFF"]
-            self.original_values = {
-                "tiff_compression_type": widgets["compression_type"].currentText(),
-                "tiff_quality": widgets["quality"].value(),
-                "tiff_optimize": widgets["optimize"].isChecked(),
-            }
+        self.original_values = self.get_current_values()
 
     def get_current_values(self):
         """Read current widget values for the active format.
@@ -589,6 +604,17 @@ class CompressionSettingsWindow(QDialog):
         Returns:
             Dictionary of setting keys to their current values.
         """
+        values = self.get_format_values()
+        if self.profile_combobox:
+            values["compression_profile"] = self.profile_combobox.currentData()
+        return values
+
+    def get_format_values(self):
+        """Read the active format's compression widget values.
+
+        Returns:
+            Dictionary of prefixed setting keys to their current values.
+        """
         if self.current_format == "PNG" and "PNG" in self.compression_widgets:
             widgets = self.compression_widgets["PNG"]
             return {
@@ -581,6 +581,7 @@ class GenerateTabWidget(QWidget):
             (self.tr("Shelf (FFDH)"), "shelf"),
             (self.tr("Skyline"), "skyline"),
             (self.tr("Hybrid Adaptive (Experimental)"), "hybrid"),
+            (self.tr("Auto (Parallel Search)"), "auto"),
         ]
 
         self.packer_method_combobox.blockSignals(True)
@@ -747,6 +748,8 @@ class GenerateTabWidget(QWidget):
             return "shelf"
         if "skyline" in text:
             return "skyline"
+        if "auto" in text:
+            return "auto"
         return "growing"
 
     def _algorithm_level_specs(self):
@@ -818,6 +821,15 @@ class GenerateTabWidget(QWidget):
                 "allow_rotation": [False, True, True],
                 "allow_flip": [False, True, True],
             },
+            "auto": {
+                "steps": [
+                    self.tr("Quick Search"),
+                    self.tr("Balanced Search"),
+                    self.tr("Exhaustive Search"),
+                ],
+                "allow_rotation": [True, True, True],
+                "allow_flip": [False, False, False],
+            },
         }
 
     def on_algorithm_changed(self, _text):
@@ -13,11 +13,13 @@ Available Packers:
 - GuillotinePacker: Subdivides space with guillotine cuts
 - ShelfPacker: Organizes frames into horizontal shelves
 - SkylinePacker: Tracks top edge of placed rectangles
-- HybridAdaptivePacker: Wrapper with analysis hooks
+- HybridAdaptivePacker: Profiles the blocks and picks Shelf or MaxRects adaptively
 
 Size Optimization:
 - find_optimal_size: Binary search for minimum atlas dimensions
 - find_optimal_size_multi_algorithm: Try multiple packers, return best result
+- find_optimal_size_parallel: Search algorithm/heuristic/sort/rotation
+  combinations across a process pool with an optional time budget
 """
 
 from .growing_packer import GrowingPacker
@@ -29,8 +31,14 @@ from .skyline_packer import SkylinePacker, SkylineHeuristic
 from .hybrid_adaptive_packer import HybridAdaptivePacker
 from .size_optimizer import (
     SizeResult,
+    PackingPlan,
+    SORT_ORDERS,
+    SEARCH_HEURISTICS,
     find_optimal_size,
     find_optimal_size_multi_algorithm,
+    find_optimal_size_parallel,
+    pack_frames,
+    sort_frames,
     next_power_of_2,
     calculate_bounds,
 )
@@ -53,8 +61,14 @@ __all__ = [
     "SkylineHeuristic",
     # Size optimization
     "SizeResult",
+    "PackingPlan",
+    "SORT_ORDERS",
+    "SEARCH_HEURISTICS",
     "find_optimal_size",
     "find_optimal_size_multi_algorithm",
+    "find_optimal_size_parallel",
+    "pack_frames",
+    "sort_frames",
     "next_power_of_2",
     "calculate_bounds",
 ]
@@ -1,22 +1,117 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Hybrid packer skeleton mixing MaxRects heuristics with future AI/GPU hooks."""
+"""
+Adaptive packer that picks a packing strategy from the shape of the input.
+
+The block set is profiled first (count, size variance, aspect ratios).
+Uniform grids and sets of similar height only use the cheap shelf packer.
+Heterogeneous sets try the shelf packer first and escalate to MaxRects when
+it does not fit and its layout leaves room for MaxRects to do better.
+Optionally the candidate strategies are raced and the tighter layout is
+kept. Every decision is reported through ``telemetry_callback``.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .maxrects_packer import MaxRectsPacker, MaxRectsHeuristic
+from .shelf_packer import ShelfPackerDecreasingHeight, ShelfHeuristic
+from .skyline_packer import SkylinePacker, SkylineHeuristic
+
+
+@dataclass
+class BlockProfile:
+    """Summary statistics of a block set used to choose a strategy."""
+
+    count: int
+    total_area: int
+    distinct_sizes: int
+    area_cv: float  # Coefficient of variation of block areas
+    height_cv: float  # Coefficient of variation of block heights
+    max_aspect: float  # Largest long-side / short-side ratio
+    max_width: int = 0
+    max_height: int = 0
+
+    @property
+    def uniform(self) -> bool:
+        """True when every block is (nearly) the same size."""
+        return self.distinct_sizes == 1 or (
+            self.area_cv < 0.05 and self.height_cv < 0.05
+        )
+
+
+# Shelf strip at one bin width: (height limit it was packed with, height
+# used or None if it overran the limit, placements as (x, y, w, h, rotated))
+ShelfStrip = Tuple[int, Optional[int], Optional[Tuple[Tuple[int, ...], ...]]]
+
+
+@dataclass
+class _BlockAnalysis:
+    """Everything the packer derives from a block set's sizes alone."""
 
-from .maxrects_packer import MaxRectsPacker
+    profile: BlockProfile
+    rotate: List[int]  # Indices of blocks tagged force_rotate
+    flip: List[int]  # Indices of blocks tagged force_flip_y
+    per_block: Tuple[Dict[str, float], ...]
+    strips: Dict[Tuple[int, bool], ShelfStrip] = field(default_factory=dict)
 
 
 class HybridAdaptivePacker:
-    """Future-facing packer that layers block analysis on top of MaxRects."""
+    """
+    Packer that profiles its input and dispatches to the cheapest good fit.
 
-    def __init__(self, telemetry_callback=None) -> None:
+    Strategy choice:
+    - Small sets: MaxRects (cheap at this size and the tightest)
+    - Uniform sizes: Shelf (rows of equal cells are already optimal)
+    - Similar heights: Shelf (FFDH rows waste almost nothing)
+    - Everything else: Shelf (FFDH), escalating to MaxRects (BSSF) when the
+      shelf layout does not fit. Escalation is skipped when Shelf already
+      packs the bin width within SHELF_TOLERANCE of full occupancy, since
+      MaxRects could gain at most that much; size searches probe many bins
+      and would otherwise run MaxRects at every one Shelf misses.
+
+    With ``race=True`` every candidate strategy runs (the uniform case races
+    Shelf against Skyline) and the layout with the smaller used bounding box
+    wins.
+    """
+
+    SMALL_SET = 32  # Up to this many blocks MaxRects is always affordable
+    SIMILAR_HEIGHT_CV = 0.15  # Height variation still packed as shelf rows
+    SHELF_TOLERANCE = 0.05  # Occupancy shortfall Shelf may keep without MaxRects
+    MAX_CACHED_ANALYSES = 8
+    MAX_CACHED_STRIPS = 32  # Shelf strips kept per analysis
+
+    # Block analyses keyed by block sizes and the rotation/flip flags. A size
+    # search fits the same blocks into many bins, each with a new packer, so
+    # the profile is computed once per search instead of once per bin, and
+    # a shelf strip once per bin width instead of once per bin.
+    _analyses: Dict[Tuple, _BlockAnalysis] = {}
+
+    def __init__(
+        self,
+        telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        race: bool = False,
+    ) -> None:
+        """
+        Initialize the adaptive packer.
+
+        Args:
+            telemetry_callback: Receives dict events describing the profile,
+                the chosen strategy and the packing outcome
+            race: Run the two best strategies and keep the tighter layout
+        """
         self.telemetry_callback = telemetry_callback
-        self.analysis_snapshot: Dict[str, Dict[str, float]] = {}
+        self.race = race
+        self.analysis_snapshot: Dict[str, Any] = {}
         self.root: Dict[str, int] = {"w": 0, "h": 0}
-        self._last_gpu_tick: float = 0.0
+        self.strategy: Optional[str] = None
+        self._analysis: Optional[_BlockAnalysis] = None
+        # Occupancy of the last shelf layout at the bin width, ignoring height
+        self.shelf_occupancy = 0.0
 
     def fit(
         self,
@@ -26,89 +121,395 @@ class HybridAdaptivePacker:
         allow_rotation: bool = True,
         allow_flip: bool = True,
     ) -> bool:
+        """
+        Fit blocks into the provided bin using the adaptively chosen strategy.
+
+        Args:
+            blocks: List of blocks with 'w' and 'h' keys
+            width: Bin width
+            height: Bin height
+            allow_rotation: Whether to allow 90-degree rotation
+            allow_flip: Whether to tag tall blocks for vertical flipping
+
+        Returns:
+            True if all blocks were packed successfully
+        """
+        self.root = {"w": width, "h": height}
+        self.shelf_occupancy = 0.0
         if not blocks:
-            self.root = {"w": width, "h": height}
             return True
+        if width <= 0 or height <= 0:
+            return False
 
         insights = self._analyze_and_tag_blocks(blocks, allow_rotation, allow_flip)
         self.analysis_snapshot = insights
+        profile: BlockProfile = insights["profile"]
+
+        # Cheap lower bounds: no strategy can beat them, so skip packing
+        if profile.total_area > width * height or not self._blocks_fit_bin(
+            blocks, profile, width, height, allow_rotation
+        ):
+            self.strategy = None
+            self._emit({"event": "hybrid_pack", "success": False, "strategy": None})
+            return False
 
-        packer = MaxRectsPacker()
-        success = packer.fit(blocks, width, height, allow_rotation=allow_rotation)
-        self.root = packer.root if success else {"w": width, "h": height}
+        strategies = self.choose_strategies(profile)
+        self._emit(
+            {
+                "event": "strategy",
+                "strategy": strategies[0],
+                "candidates": strategies,
+                "race": self.race,
+            }
+        )
+
+        best_fits: Optional[List[Dict[str, Any]]] = None
+        best_key = None
+        elapsed: Dict[str, float] = {}
+        skipped: List[str] = []
+
+        for order, strategy in enumerate(strategies):
+            if (
+                order
+                and not self.race
+                and strategy == "maxrects"
+                and self.shelf_occupancy >= 1.0 - self.SHELF_TOLERANCE
+            ):
+                skipped.append(strategy)
+                break
+            start = time.perf_counter()
+            # Shelf's occupancy is only needed if MaxRects may follow it
+            measure = not self.race and "maxrects" in strategies[order + 1 :]
+            fits = self._run_strategy(
+                strategy, blocks, width, height, allow_rotation, profile, measure
+            )
+            elapsed[strategy] = time.perf_counter() - start
+            if fits is None:
+                continue
+
+            used_w = max(fit["x"] + fit["w"] for fit in fits)
+            used_h = max(fit["y"] + fit["h"] for fit in fits)
+            key = (used_w * used_h, order)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_fits = fits
+                self.strategy = strategy
+            if not self.race:
+                break  # Cascade: the first strategy that fits wins
 
-        if success and allow_flip:
-            # Persist flip metadata back into placements for downstream consumers
-            for block in blocks:
-                if block.get("force_flip_y") and block.get("fit"):
-                    block["fit"]["flip_y"] = True
+        success = best_fits is not None
+        if success:
+            for block, fit in zip(blocks, best_fits):
+                if allow_flip and block.get("force_flip_y"):
+                    # Persist flip metadata back into placements for downstream consumers
+                    fit["flip_y"] = True
+                block["fit"] = fit
 
-        self._emit_telemetry(success)
+        self._emit(
+            {
+                "event": "hybrid_pack",
+                "success": success,
+                "strategy": self.strategy if success else None,
+                "elapsed": elapsed,
+                "skipped": skipped,
+            }
+        )
         return success
 
     # ------------------------------------------------------------------
-    # Placeholder analysis hooks
+    # Profiling and strategy selection
     # ------------------------------------------------------------------
+    @staticmethod
+    def profile_blocks(blocks: List[Dict[str, Any]]) -> BlockProfile:
+        """Compute size and shape statistics for a block set."""
+        count = len(blocks)
+        areas = []
+        heights = []
+        sizes = set()
+        max_aspect = 1.0
+        max_width = max_height = 0
+
+        for block in blocks:
+            w = block.get("w", 0)
+            h = block.get("h", 0)
+            max_width = max(max_width, w)
+            max_height = max(max_height, h)
+            areas.append(w * h)
+            heights.append(h)
+            sizes.add((w, h))
+            short_side = min(w, h)
+            if short_side > 0:
+                max_aspect = max(max_aspect, max(w, h) / short_side)
+
+        def coefficient_of_variation(values: List[int]) -> float:
+            if not values:
+                return 0.0
+            mean = sum(values) / len(values)
+            if mean <= 0:
+                return 0.0
+            variance = sum((v - mean) ** 2 for v in values) / len(values)
+            return math.sqrt(variance) / mean
+
+        return BlockProfile(
+            count=count,
+            total_area=sum(areas),
+            distinct_sizes=len(sizes),
+            area_cv=coefficient_of_variation(areas),
+            height_cv=coefficient_of_variation(heights),
+            max_aspect=max_aspect,
+            max_width=max_width,
+            max_height=max_height,
+        )
+
+    @staticmethod
+    def _blocks_fit_bin(
+        blocks: List[Dict[str, Any]],
+        profile: BlockProfile,
+        width: int,
+        height: int,
+        allow_rotation: bool,
+    ) -> bool:
+        """Check that every block fits the empty bin in some orientation."""
+        if profile.max_width <= width and profile.max_height <= height:
+            return True
+        if not allow_rotation:
+            return False
+        for block in blocks:
+            w = block.get("w", 0)
+            h = block.get("h", 0)
+            if w <= width and h <= height:
+                continue
+            if allow_rotation and h <= width and w <= height:
+                continue
+            return False
+        return True
+
+    def choose_strategies(self, profile: BlockProfile) -> List[str]:
+        """Return the strategies to try, cheapest first."""
+        if profile.count <= self.SMALL_SET:
+            return ["maxrects", "shelf"] if self.race else ["maxrects"]
+        if profile.uniform:
+            return ["shelf", "skyline"] if self.race else ["shelf"]
+        if profile.height_cv <= self.SIMILAR_HEIGHT_CV:
+            return ["shelf", "maxrects"] if self.race else ["shelf"]
+        return ["shelf", "maxrects"]
+
     def _analyze_and_tag_blocks(
         self,
         blocks: List[Dict[str, Any]],
         allow_rotation: bool,
         allow_flip: bool,
-    ) -> Dict[str, Dict[str, float]]:
-        """Run lightweight heuristics and tag the blocks with rotation/flip hints."""
+    ) -> Dict[str, Any]:
+        """Profile the block set and tag blocks with rotation/flip hints.
 
-        insights: Dict[str, Dict[str, float]] = {"per_block": {}, "summary": {}}
-        total_area = 0
+        The snapshot's ``per_block`` hints are keyed by block index.
+        """
+        sizes = tuple((block.get("w", 0), block.get("h", 0)) for block in blocks)
+        key = (sizes, allow_rotation, allow_flip)
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = self._analyze_sizes(sizes, allow_rotation, allow_flip)
+            if len(self._analyses) >= self.MAX_CACHED_ANALYSES:
+                self._analyses.clear()
+            self._analyses[key] = analysis
+        self._analysis = analysis
+        profile = analysis.profile
 
-        for block in blocks:
-            block_id = block.get("id") or str(id(block))
-            width = block.get("w", 0)
-            height = block.get("h", 0)
+        for index in analysis.rotate:
+            blocks[index]["force_rotate"] = True
+        for index in analysis.flip:
+            blocks[index]["force_flip_y"] = True
+
+        insights: Dict[str, Any] = {
+            "per_block": dict(enumerate(analysis.per_block)),
+            "profile": profile,
+            "summary": {
+                "total_area": float(profile.total_area),
+                "block_count": float(profile.count),
+            },
+        }
+        self._emit({"event": "profile", "payload": asdict(profile)})
+        return insights
+
+    @classmethod
+    def _analyze_sizes(
+        cls,
+        sizes: Tuple[Tuple[int, int], ...],
+        allow_rotation: bool,
+        allow_flip: bool,
+    ) -> _BlockAnalysis:
+        """Profile the sizes and find the blocks to tag with rotate/flip hints."""
+        rotate: List[int] = []
+        flip: List[int] = []
+        per_block = []
+        for index, (width, height) in enumerate(sizes):
             aspect = width / height if height else 1
-            block_area = width * height
-            total_area += block_area
+            rotated = allow_rotation and aspect < 1 and height - width > 4
+            flipped = allow_flip and height > width * 1.2
+            if rotated:
+                rotate.append(index)
+            if flipped:
+                flip.append(index)
+            per_block.append(
+                {"aspect": aspect, "rotate": float(rotated), "flip_y": float(flipped)}
+            )
+        profile = cls.profile_blocks([{"w": w, "h": h} for w, h in sizes])
+        return _BlockAnalysis(profile, rotate, flip, tuple(per_block))
 
-            rotate = allow_rotation and aspect < 1 and height - width > 4
-            flip = allow_flip and height > width * 1.2
+    @classmethod
+    def clear_analysis_cache(cls) -> None:
+        """Forget cached block analyses, e.g. before timing a cold search."""
+        cls._analyses.clear()
 
-            if rotate:
-                block["force_rotate"] = True
-            if flip:
-                block["force_flip_y"] = True
+    # ------------------------------------------------------------------
+    # Strategy runners
+    # ------------------------------------------------------------------
+    def _run_strategy(
+        self,
+        strategy: str,
+        blocks: List[Dict[str, Any]],
+        width: int,
+        height: int,
+        allow_rotation: bool,
+        profile: BlockProfile,
+        measure: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pack with one strategy without touching the caller's blocks.
 
-            insights["per_block"][block_id] = {
-                "aspect": aspect,
-                "rotate": float(rotate),
-                "flip_y": float(flip),
-            }
+        ``measure`` asks Shelf to record ``shelf_occupancy`` when it does not
+        fit, for the escalation check.
 
-        insights["summary"] = {
-            "total_area": float(total_area),
-            "block_count": float(len(blocks)),
-        }
+        Returns:
+            Placement dicts in block order, or None if not everything fits
+        """
+        if strategy == "maxrects":
+            trial_blocks = [dict(block) for block in blocks]
+            packer = MaxRectsPacker(heuristic=MaxRectsHeuristic.BSSF)
+            if not packer.fit(trial_blocks, width, height, allow_rotation):
+                return None
+            return [block["fit"] for block in trial_blocks]
 
-        # Placeholder GPU/AI hooks that can be wired later without changing API
-        self._simulate_gpu_probe(insights)
-        self._consult_ai_planner(insights)
+        if strategy == "skyline":
+            packer = SkylinePacker(
+                width,
+                height,
+                heuristic=SkylineHeuristic.MIN_WASTE,
+                allow_rotation=allow_rotation,
+            )
+            return self._pack_frames(packer, blocks)
 
-        return insights
+        return self._run_shelf(
+            blocks, width, height, allow_rotation, profile.total_area, measure
+        )
 
-    def _simulate_gpu_probe(self, insights: Dict[str, Dict[str, float]]) -> None:
-        """Pretend to schedule work on GPU – currently a no-op placeholder."""
+    def _run_shelf(
+        self,
+        blocks: List[Dict[str, Any]],
+        width: int,
+        height: int,
+        allow_rotation: bool,
+        total_area: int,
+        measure: bool,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pack FFDH shelf rows, optionally measuring the occupancy Shelf reaches.
 
-        if self.telemetry_callback:
-            self.telemetry_callback(
-                {"event": "gpu_probe", "payload": insights["summary"]}
+        With ``measure`` the rows may run past the bin, up to the height at
+        which Shelf would fall below SHELF_TOLERANCE; a pass that reaches
+        that limit leaves ``shelf_occupancy`` at 0, which is all the
+        escalation check needs to know.
+
+        Strips are cached per bin width. Without rotation the rows at a width
+        are the same whatever the height, so one strip answers every height
+        the size search tries at it. With rotation a strip is reused only for
+        the same limit, which failing bins of a width share.
+        """
+        limit = height
+        if measure:
+            limit = max(
+                height, int(total_area / (width * (1.0 - self.SHELF_TOLERANCE)))
             )
 
-    def _consult_ai_planner(self, insights: Dict[str, Dict[str, float]]) -> None:
-        """Stub for AI-driven layout tuning."""
+        strips = self._analysis.strips
+        key = (width, allow_rotation)
+        strip = strips.get(key)
+        if strip is None:
+            reusable = False
+        elif allow_rotation:
+            reusable = strip[0] == limit
+        else:
+            reusable = strip[1] is not None or strip[0] >= limit
+        if not reusable:
+            strip = self._pack_strip(blocks, width, limit, allow_rotation)
+            if len(strips) >= self.MAX_CACHED_STRIPS:
+                strips.clear()
+            strips[key] = strip
 
-        if self.telemetry_callback:
-            self.telemetry_callback(
-                {"event": "ai_hint", "payload": insights["summary"]}
-            )
+        _, used_height, placements = strip
+        if used_height:
+            self.shelf_occupancy = total_area / (width * used_height)
+            if used_height <= height:
+                return [
+                    {"x": x, "y": y, "w": w, "h": h, "rotated": rotated}
+                    for x, y, w, h, rotated in placements
+                ]
+        if not allow_rotation or limit == height:
+            return None
+        # A bounded bin may open a rotated shelf where the taller strip kept
+        # the block upright, so overrunning the bin does not prove it fails
+        packer = ShelfPackerDecreasingHeight(
+            width,
+            height,
+            heuristic=ShelfHeuristic.BEST_HEIGHT_FIT,
+            allow_rotation=True,
+        )
+        return self._pack_frames(packer, blocks)
+
+    def _pack_strip(
+        self,
+        blocks: List[Dict[str, Any]],
+        width: int,
+        limit: int,
+        allow_rotation: bool,
+    ) -> ShelfStrip:
+        """Pack shelf rows into a ``width`` x ``limit`` strip."""
+        packer = ShelfPackerDecreasingHeight(
+            width,
+            limit,
+            heuristic=ShelfHeuristic.BEST_HEIGHT_FIT,
+            allow_rotation=allow_rotation,
+        )
+        fits = self._pack_frames(packer, blocks)
+        if fits is None:
+            return limit, None, None
+        placements = tuple(
+            (fit["x"], fit["y"], fit["w"], fit["h"], fit["rotated"]) for fit in fits
+        )
+        return limit, packer.current_y, placements
+
+    @staticmethod
+    def _pack_frames(packer, blocks: List[Dict[str, Any]]):
+        """Run a frame-list packer and return placement dicts in block order."""
+        frames = [
+            (block.get("w", 0), block.get("h", 0), index)
+            for index, block in enumerate(blocks)
+        ]
+        results = packer.pack(frames)
+        if len(results) != len(frames):
+            return None
+
+        fits: List[Dict[str, Any]] = [{} for _ in blocks]
+        for x, y, w, h, rotated, index in results:
+            fits[index] = {
+                "x": x,
+                "y": y,
+                "w": h if rotated else w,
+                "h": w if rotated else h,
+                "rotated": rotated,
+            }
+        return fits
 
-    def _emit_telemetry(self, success: bool) -> None:
+    def _emit(self, event: Dict[str, Any]) -> None:
         if self.telemetry_callback:
-            self.telemetry_callback({"event": "hybrid_pack", "success": success})
+            self.telemetry_callback(event)
@@ -19,6 +19,8 @@ from __future__ import annotations
 from enum import Enum, auto
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 
 class MaxRectsHeuristic(Enum):
     """Heuristics for choosing rectangle placement."""
@@ -30,6 +32,191 @@ class MaxRectsHeuristic(Enum):
     CP = auto()  # Contact Point
 
 
+class FreeRectSet:
+    """
+    Ordered set of maximal free rectangles stored as an (N, 4) integer array.
+
+    Each row holds ``x, y, w, h``. Row order is significant: placement scoring
+    breaks ties in favour of the earliest rectangle, so splits insert their
+    children where the parent used to be. Intersection and containment tests
+    run as column-wise comparisons, so Python only ever touches the rows that
+    actually match a query.
+    """
+
+    __slots__ = ("rects",)
+
+    def __init__(self, width: int, height: int) -> None:
+        self.rects: np.ndarray = np.array([[0, 0, width, height]], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def as_dicts(self) -> List[Dict[str, int]]:
+        """Return the rectangles as ``{"x", "y", "w", "h"}`` dicts."""
+        return [{"x": x, "y": y, "w": w, "h": h} for x, y, w, h in self.rects.tolist()]
+
+    def split(self, x: int, y: int, w: int, h: int) -> None:
+        """
+        Carve the used rectangle out of every free rectangle it overlaps.
+
+        Overlapping rectangles are replaced in place by up to four children
+        (left, right, top, bottom). Only the new children can become redundant,
+        because the surviving rectangles were already pairwise non-contained,
+        so pruning is limited to them.
+        """
+        rects = self.rects
+        left = rects[:, 0]
+        top = rects[:, 1]
+        right = left + rects[:, 2]
+        bottom = top + rects[:, 3]
+        used_right = x + w
+        used_bottom = y + h
+
+        hit_idx = np.flatnonzero(
+            (left < used_right) & (right > x) & (top < used_bottom) & (bottom > y)
+        )
+        count = hit_idx.size
+        if count == 0:
+            return
+
+        px = left[hit_idx]
+        py = top[hit_idx]
+        pr = right[hit_idx]
+        pb = bottom[hit_idx]
+
+        children = np.empty((count, 4, 4), dtype=np.int64)
+        children[:, 0] = np.stack([px, py, x - px, pb - py], axis=1)
+        children[:, 1] = np.stack(
+            [np.full(count, used_right), py, pr - used_right, pb - py], axis=1
+        )
+        children[:, 2] = np.stack([px, py, pr - px, y - py], axis=1)
+        children[:, 3] = np.stack(
+            [px, np.full(count, used_bottom), pr - px, pb - used_bottom], axis=1
+        )
+        valid = np.stack(
+            [
+                (x > px) & (x < pr),
+                used_right < pr,
+                (y > py) & (y < pb),
+                used_bottom < pb,
+            ],
+            axis=1,
+        )
+
+        kept = np.delete(rects, hit_idx, axis=0)
+        positions = np.repeat(hit_idx - np.arange(count), valid.sum(axis=1))
+        self.rects = np.insert(kept, positions, children[valid], axis=0)
+        self._prune(positions + np.arange(positions.size))
+
+    def _prune(self, new_rows: np.ndarray) -> None:
+        """
+        Drop new rectangles that are contained in another free rectangle.
+
+        Exact duplicates keep only their last occurrence, matching the classic
+        pairwise pruning order.
+        """
+        if new_rows.size == 0:
+            return
+
+        rects = self.rects
+        candidates = rects[new_rows]
+        contains = (
+            (rects[:, 0] <= candidates[:, 0, None])
+            & (rects[:, 1] <= candidates[:, 1, None])
+            & (
+                rects[:, 0] + rects[:, 2]
+                >= (candidates[:, 0] + candidates[:, 2])[:, None]
+            )
+            & (
+                rects[:, 1] + rects[:, 3]
+                >= (candidates[:, 1] + candidates[:, 3])[:, None]
+            )
+        )
+        equal = (rects[None, :, :] == candidates[:, None, :]).all(axis=2)
+        later = np.arange(len(rects))[None, :] > new_rows[:, None]
+        redundant = (contains & (~equal | later)).any(axis=1)
+
+        if redundant.any():
+            self.rects = np.delete(rects, new_rows[redundant], axis=0)
+
+
+class ContactIndex:
+    """
+    Edge index over placed rectangles for Contact Point scoring.
+
+    Placed rectangles are bucketed by each edge coordinate, so a contact query
+    only visits rectangles whose edges line up exactly with the candidate.
+    A rectangle with zero width (or height) has both edges at one coordinate;
+    it is kept in a bucket of its own so it is counted once, like any other.
+    """
+
+    __slots__ = (
+        "_by_left",
+        "_by_right",
+        "_by_top",
+        "_by_bottom",
+        "_zero_width",
+        "_zero_height",
+    )
+
+    def __init__(self) -> None:
+        self._by_left: Dict[int, List[Tuple[int, int]]] = {}
+        self._by_right: Dict[int, List[Tuple[int, int]]] = {}
+        self._by_top: Dict[int, List[Tuple[int, int]]] = {}
+        self._by_bottom: Dict[int, List[Tuple[int, int]]] = {}
+        self._zero_width: Dict[int, List[Tuple[int, int]]] = {}
+        self._zero_height: Dict[int, List[Tuple[int, int]]] = {}
+
+    def add(self, x: int, y: int, w: int, h: int) -> None:
+        """Register a placed rectangle."""
+        if w:
+            self._by_left.setdefault(x, []).append((y, y + h))
+            self._by_right.setdefault(x + w, []).append((y, y + h))
+        else:
+            self._zero_width.setdefault(x, []).append((y, y + h))
+        if h:
+            self._by_top.setdefault(y, []).append((x, x + w))
+            self._by_bottom.setdefault(y + h, []).append((x, x + w))
+        else:
+            self._zero_height.setdefault(y, []).append((x, x + w))
+
+    def contact(self, x: int, y: int, w: int, h: int) -> int:
+        """Return the edge length shared with placed rectangles."""
+        contact = 0
+        right = x + w
+        bottom = y + h
+
+        # Vertical edges touching: overlap measured along Y
+        vertical = [
+            self._by_right.get(x, ()),
+            self._by_left.get(right, ()),
+            self._zero_width.get(x, ()),
+        ]
+        if w:
+            vertical.append(self._zero_width.get(right, ()))
+        for spans in vertical:
+            for start, end in spans:
+                overlap = min(bottom, end) - max(y, start)
+                if overlap > 0:
+                    contact += overlap
+
+        # Horizontal edges touching: overlap measured along X
+        horizontal = [
+            self._by_bottom.get(y, ()),
+            self._by_top.get(bottom, ()),
+            self._zero_height.get(y, ()),
+        ]
+        if h:
+            horizontal.append(self._zero_height.get(bottom, ()))
+        for spans in horizontal:
+            for start, end in spans:
+                overlap = min(right, end) - max(x, start)
+                if overlap > 0:
+                    contact += overlap
+
+        return contact
+
+
 class MaxRectsPacker:
     """
     MaxRects bin packing implementation.
@@ -37,23 +224,40 @@ class MaxRectsPacker:
     The algorithm maintains a list of maximal free rectangles. When a sprite
     is placed, any free rectangle that overlaps is split into up to 4 new
     rectangles. Redundant rectangles (fully contained in others) are pruned.
+
+    Free rectangles live in a FreeRectSet (array-backed, vectorized queries)
+    and placed rectangles are indexed by edge for Contact Point scoring, so
+    per-placement work only touches matching candidates.
     """
 
-    def __init__(self, heuristic: MaxRectsHeuristic = MaxRectsHeuristic.BSSF) -> None:
+    def __init__(
+        self,
+        heuristic: MaxRectsHeuristic = MaxRectsHeuristic.BSSF,
+        vectorized: bool = True,
+    ) -> None:
         """
         Initialize the MaxRects packer.
 
         Args:
             heuristic: Placement heuristic to use
+            vectorized: Score all candidates in one numpy pass when the
+                heuristic supports it (everything except CP)
         """
         self.bin_width: int = 0
         self.bin_height: int = 0
         self.allow_rotation: bool = True
         self.heuristic = heuristic
-        self.free_rectangles: List[Dict[str, int]] = []
+        self.vectorized = vectorized
+        self.free_rects = FreeRectSet(0, 0)
+        self.contact_index = ContactIndex()
         self.used_rectangles: List[Dict[str, int]] = []
         self.root: Dict[str, int] = {"w": 0, "h": 0}
 
+    @property
+    def free_rectangles(self) -> List[Dict[str, int]]:
+        """Current free rectangles as dicts, in scoring order."""
+        return self.free_rects.as_dicts()
+
     def fit(
         self,
         blocks: List[Dict[str, Any]],
@@ -80,7 +284,8 @@ class MaxRectsPacker:
         self.bin_height = height
         self.allow_rotation = allow_rotation
         self.root = {"w": width, "h": height}
-        self.free_rectangles = [{"x": 0, "y": 0, "w": width, "h": height}]
+        self.free_rects = FreeRectSet(width, height)
+        self.contact_index = ContactIndex()
         self.used_rectangles = []
 
         for block in blocks:
@@ -90,8 +295,9 @@ class MaxRectsPacker:
 
             block["fit"] = placement
             self.used_rectangles.append(placement)
-            self._split_free_rectangles(placement)
-            self._prune_free_rectangles()
+            x, y, w, h = placement["x"], placement["y"], placement["w"], placement["h"]
+            self.contact_index.add(x, y, w, h)
+            self.free_rects.split(x, y, w, h)
 
         return True
 
@@ -124,17 +330,29 @@ class MaxRectsPacker:
             if self.allow_rotation:
                 orientations.append((block_h, block_w, True))
 
-        for rect in self.free_rectangles:
+        if self.vectorized and self.heuristic != MaxRectsHeuristic.CP:
+            best_node = self._find_position_vectorized(block, orientations)
+            if best_node and block.get("force_flip_y"):
+                best_node["flip_y"] = True
+            return best_node
+
+        # Only rectangles that fit at least one orientation are scored
+        rects = self.free_rects.rects
+        fits = np.zeros(len(rects), dtype=bool)
+        for orient_w, orient_h, _ in orientations:
+            fits |= (rects[:, 2] >= orient_w) & (rects[:, 3] >= orient_h)
+
+        for rect in rects[fits].tolist():
             for orient_w, orient_h, rotated in orientations:
-                if orient_w <= rect["w"] and orient_h <= rect["h"]:
+                if orient_w <= rect[2] and orient_h <= rect[3]:
                     score = self._score_position(
                         rect, orient_w, orient_h, rotated, block
                     )
                     if score < best_score:
                         best_score = score
                         best_node = {
-                            "x": rect["x"],
-                            "y": rect["y"],
+                            "x": rect[0],
+                            "y": rect[1],
                             "w": orient_w,
                             "h": orient_h,
                             "rotated": rotated,
@@ -145,9 +363,73 @@ class MaxRectsPacker:
 
         return best_node
 
+    def _find_position_vectorized(
+        self,
+        block: Dict[str, Any],
+        orientations: List[Tuple[int, int, bool]],
+    ) -> Optional[Dict[str, int]]:
+        """
+        Score every (free rectangle, orientation) pair in one numpy pass.
+
+        Candidates are laid out rectangle-major, orientation-minor, the same
+        order the scalar loop visits them, so taking the first lexicographic
+        minimum of (primary, secondary) reproduces its tie-breaking exactly.
+        """
+        rects = self.free_rects.rects
+        rect_x = rects[:, 0]
+        rect_y = rects[:, 1]
+        rect_w = rects[:, 2]
+        rect_h = rects[:, 3]
+        force_rotate = bool(block.get("force_rotate"))
+
+        primaries = []
+        secondaries = []
+        for orient_w, orient_h, rotated in orientations:
+            leftover_w = rect_w - orient_w
+            leftover_h = rect_h - orient_h
+            rotation_penalty = 0.1 if rotated and not force_rotate else 0.0
+
+            if self.heuristic == MaxRectsHeuristic.BLSF:
+                primary = np.maximum(leftover_w, leftover_h) + rotation_penalty
+                secondary = np.minimum(leftover_w, leftover_h)
+            elif self.heuristic == MaxRectsHeuristic.BAF:
+                leftover_area = leftover_w * rect_h + leftover_h * orient_w
+                primary = leftover_area + rotation_penalty
+                secondary = np.minimum(leftover_w, leftover_h)
+            elif self.heuristic == MaxRectsHeuristic.BL:
+                primary = rect_y + rotation_penalty
+                secondary = rect_x
+            else:
+                # BSSF (also the default)
+                primary = np.minimum(leftover_w, leftover_h) + rotation_penalty
+                secondary = np.maximum(leftover_w, leftover_h)
+
+            primaries.append(
+                np.where((leftover_w >= 0) & (leftover_h >= 0), primary, np.inf)
+            )
+            secondaries.append(secondary)
+
+        primary = np.stack(primaries, axis=1).ravel()
+        best_primary = primary.min(initial=np.inf)
+        if best_primary == np.inf:
+            return None
+
+        secondary = np.stack(secondaries, axis=1).ravel()
+        best = int(np.argmin(np.where(primary == best_primary, secondary, np.inf)))
+        rect_index, orient_index = divmod(best, len(orientations))
+        orient_w, orient_h, rotated = orientations[orient_index]
+
+        return {
+            "x": int(rect_x[rect_index]),
+            "y": int(rect_y[rect_index]),
+            "w": orient_w,
+            "h": orient_h,
+            "rotated": rotated,
+        }
+
     def _score_position(
         self,
-        rect: Dict[str, int],
+        rect: List[int],
         width: int,
         height: int,
         rotated: bool,
@@ -156,10 +438,18 @@ class MaxRectsPacker:
         """
         Score a potential placement (lower is better).
 
+        Args:
+            rect: Free rectangle as ``[x, y, w, h]``
+            width: Placed width (after orientation)
+            height: Placed height (after orientation)
+            rotated: Whether this orientation is rotated
+            block: Source block (for rotation hints)
+
         Returns a tuple for tie-breaking: (primary_score, secondary_score)
         """
-        leftover_h = rect["h"] - height
-        leftover_w = rect["w"] - width
+        rect_x, rect_y, rect_w, rect_h = rect
+        leftover_h = rect_h - height
+        leftover_w = rect_w - width
 
         # Mild penalty for rotations unless explicitly requested
         rotation_penalty = 0.1 if rotated and not block.get("force_rotate") else 0.0
@@ -178,19 +468,19 @@ class MaxRectsPacker:
 
         elif self.heuristic == MaxRectsHeuristic.BAF:
             # Best Area Fit - minimize leftover area
-            leftover_area = leftover_w * rect["h"] + leftover_h * width
+            leftover_area = leftover_w * rect_h + leftover_h * width
             short_side = min(leftover_w, leftover_h)
             return (leftover_area + rotation_penalty, short_side)
 
         elif self.heuristic == MaxRectsHeuristic.BL:
             # Bottom-Left - prefer positions with lower Y, then lower X
-            return (rect["y"] + rotation_penalty, rect["x"])
+            return (rect_y + rotation_penalty, rect_x)
 
         elif self.heuristic == MaxRectsHeuristic.CP:
             # Contact Point - maximize contact with bin edges and other rects
-            contact = self._contact_point_score(rect["x"], rect["y"], width, height)
+            contact = self._contact_point_score(rect_x, rect_y, width, height)
             # Negate because we want maximum contact but lower scores are better
-            return (-contact + rotation_penalty, rect["y"])
+            return (-contact + rotation_penalty, rect_y)
 
         # Default to BSSF
         short_side = min(leftover_w, leftover_h)
@@ -218,103 +508,6 @@ class MaxRectsPacker:
             contact += w  # Bottom edge
 
         # Contact with placed rectangles
-        for used in self.used_rectangles:
-            ux, uy, uw, uh = used["x"], used["y"], used["w"], used["h"]
-
-            # Check horizontal adjacency
-            if x == ux + uw or x + w == ux:
-                # Vertical overlap
-                y_overlap = min(y + h, uy + uh) - max(y, uy)
-                if y_overlap > 0:
-                    contact += y_overlap
-
-            # Check vertical adjacency
-            if y == uy + uh or y + h == uy:
-                # Horizontal overlap
-                x_overlap = min(x + w, ux + uw) - max(x, ux)
-                if x_overlap > 0:
-                    contact += x_overlap
+        contact += self.contact_index.contact(x, y, w, h)
 
         return contact
-
-    def _split_free_rectangles(self, used_node: Dict[str, int]) -> None:
-        """Split any free rectangles that overlap with the used node."""
-        new_free: List[Dict[str, int]] = []
-
-        for rect in self.free_rectangles:
-            if not self._rects_intersect(rect, used_node):
-                new_free.append(rect)
-                continue
-
-            # Split horizontally - left portion
-            if used_node["x"] > rect["x"] and used_node["x"] < rect["x"] + rect["w"]:
-                new_rect = rect.copy()
-                new_rect["w"] = used_node["x"] - rect["x"]
-                new_free.append(new_rect)
-
-            # Split horizontally - right portion
-            if used_node["x"] + used_node["w"] < rect["x"] + rect["w"]:
-                new_rect = rect.copy()
-                new_rect["x"] = used_node["x"] + used_node["w"]
-                new_rect["w"] = (
-                    rect["x"] + rect["w"] - (used_node["x"] + used_node["w"])
-                )
-                new_free.append(new_rect)
-
-            # Split vertically - top portion
-            if used_node["y"] > rect["y"] and used_node["y"] < rect["y"] + rect["h"]:
-                new_rect = rect.copy()
-                new_rect["h"] = used_node["y"] - rect["y"]
-                new_free.append(new_rect)
-
-            # Split vertically - bottom portion
-            if used_node["y"] + used_node["h"] < rect["y"] + rect["h"]:
-                new_rect = rect.copy()
-                new_rect["y"] = used_node["y"] + used_node["h"]
-                new_rect["h"] = (
-                    rect["y"] + rect["h"] - (used_node["y"] + used_node["h"])
-                )
-                new_free.append(new_rect)
-
-        self.free_rectangles = [r for r in new_free if r["w"] > 0 and r["h"] > 0]
-
-    def _prune_free_rectangles(self) -> None:
-        """Remove free rectangles that are fully contained within others."""
-        i = 0
-        while i < len(self.free_rectangles):
-            j = i + 1
-            rect_i = self.free_rectangles[i]
-            removed = False
-            while j < len(self.free_rectangles):
-                rect_j = self.free_rectangles[j]
-                if self._is_contained_in(rect_i, rect_j):
-                    removed = True
-                    break
-                if self._is_contained_in(rect_j, rect_i):
-                    del self.free_rectangles[j]
-                    continue
-                j += 1
-            if removed:
-                del self.free_rectangles[i]
-            else:
-                i += 1
-
-    @staticmethod
-    def _rects_intersect(a: Dict[str, int], b: Dict[str, int]) -> bool:
-        """Check if two rectangles intersect."""
-        return not (
-            a["x"] >= b["x"] + b["w"]
-            or a["x"] + a["w"] <= b["x"]
-            or a["y"] >= b["y"] + b["h"]
-            or a["y"] + a["h"] <= b["y"]
-        )
-
-    @staticmethod
-    def _is_contained_in(inner: Dict[str, int], outer: Dict[str, int]) -> bool:
-        """Check if inner rectangle is fully contained in outer rectangle."""
-        return (
-            inner["x"] >= outer["x"]
-            and inner["y"] >= outer["y"]
-            and inner["x"] + inner["w"] <= outer["x"] + outer["w"]
-            and inner["y"] + inner["h"] <= outer["y"] + outer["h"]
-        )
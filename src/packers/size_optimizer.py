@@ -6,11 +6,19 @@ Optimal atlas size calculator using binary search.
 This module provides utilities for finding the minimum atlas size that can
 fit all frames using a given packing algorithm. It uses binary search to
 efficiently find the optimal dimensions, avoiding wasted space.
+
+It also provides a parallel search that evaluates algorithm, heuristic,
+sort order and rotation combinations across a process pool, optionally
+bounded by a wall-clock budget.
 """
 
 from __future__ import annotations
 
 import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
@@ -30,6 +38,70 @@ class SizeResult:
     algorithm_used: str
 
 
+@dataclass
+class PackingPlan:
+    """Winning combination of a parallel atlas search."""
+
+    algorithm: str  # "maxrects", "skyline", "guillotine" or "shelf"
+    heuristic: str  # Heuristic key, same keys as the generator hints
+    sort_order: str  # Key into SORT_ORDERS
+    allow_rotation: bool
+    result: SizeResult
+    evaluated: int = 0  # Combinations that finished before the deadline
+    timed_out: bool = False  # True if some combinations were abandoned
+
+    @property
+    def label(self) -> str:
+        """Human-readable name of the combination."""
+        rotation = "/rot" if self.allow_rotation else ""
+        return f"{self.algorithm}-{self.heuristic}/{self.sort_order}{rotation}"
+
+
+# Descending sort keys applied to (width, height) before packing
+SORT_ORDERS: dict[str, Callable[[tuple[int, int]], Any]] = {
+    "area": lambda wh: (wh[0] * wh[1], max(wh)),
+    "max_side": lambda wh: (max(wh), wh[0] * wh[1]),
+    "height": lambda wh: (wh[1], wh[0]),
+    "width": lambda wh: (wh[0], wh[1]),
+    "perimeter": lambda wh: (wh[0] + wh[1], max(wh)),
+}
+
+# Heuristic keys tried per algorithm by the parallel search
+SEARCH_HEURISTICS: dict[str, tuple[str, ...]] = {
+    "maxrects": ("bssf", "blsf", "baf", "bl"),
+    "skyline": ("bottom_left", "min_waste", "best_fit"),
+    "guillotine": ("bssf", "blsf", "baf", "waf"),
+    # Shelf sorts by height internally, so sort orders are not varied for it
+    "shelf": ("best_height", "best_width", "first_fit"),
+}
+
+_MAXRECTS_HEURISTICS = {
+    "bssf": MaxRectsHeuristic.BSSF,
+    "blsf": MaxRectsHeuristic.BLSF,
+    "baf": MaxRectsHeuristic.BAF,
+    "bl": MaxRectsHeuristic.BL,
+    "cp": MaxRectsHeuristic.CP,
+}
+_SKYLINE_HEURISTICS = {
+    "bottom_left": SkylineHeuristic.BOTTOM_LEFT,
+    "min_waste": SkylineHeuristic.MIN_WASTE,
+    "best_fit": SkylineHeuristic.BEST_FIT,
+}
+_GUILLOTINE_PLACEMENTS = {
+    "bssf": GuillotinePlacement.BSSF,
+    "blsf": GuillotinePlacement.BLSF,
+    "baf": GuillotinePlacement.BAF,
+    "waf": GuillotinePlacement.WAF,
+}
+_SHELF_HEURISTICS = {
+    "next_fit": ShelfHeuristic.NEXT_FIT,
+    "first_fit": ShelfHeuristic.FIRST_FIT,
+    "best_width": ShelfHeuristic.BEST_WIDTH_FIT,
+    "best_height": ShelfHeuristic.BEST_HEIGHT_FIT,
+    "worst_width": ShelfHeuristic.WORST_WIDTH_FIT,
+}
+
+
 def next_power_of_2(n: int) -> int:
     """Return the next power of 2 >= n."""
     if n <= 0:
@@ -472,3 +544,287 @@ def find_optimal_size_multi_algorithm(
         best_algorithm = "fallback"
 
     return best_result, best_algorithm
+
+
+def sort_frames(
+    frames: list[tuple[int, int, Any]], sort_order: str
+) -> list[tuple[int, int, Any]]:
+    """
+    Sort frames in descending order of a SORT_ORDERS key.
+
+    Args:
+        frames: List of (width, height, user_data) tuples
+        sort_order: Key into SORT_ORDERS; unknown keys keep the input order
+
+    Returns:
+        New sorted list (the sort is stable)
+    """
+    key_fn = SORT_ORDERS.get(sort_order)
+    if key_fn is None:
+        return list(frames)
+    return sorted(frames, key=lambda f: key_fn((f[0], f[1])), reverse=True)
+
+
+def pack_frames(
+    frames: list[tuple[int, int, Any]],
+    width: int,
+    height: int,
+    algorithm: str,
+    heuristic: str,
+    allow_rotation: bool = False,
+) -> Optional[list[tuple[int, int, int, int, bool, Any]]]:
+    """
+    Pack frames with one algorithm/heuristic combination, in input order.
+
+    Frame dimensions must already include padding.
+
+    Args:
+        frames: List of (width, height, user_data) tuples
+        width: Atlas width
+        height: Atlas height
+        algorithm: "maxrects", "skyline", "guillotine" or "shelf"
+        heuristic: Heuristic key for the algorithm
+        allow_rotation: Allow 90-degree rotation
+
+    Returns:
+        List of (x, y, width, height, rotated, user_data) in input order, or
+        None if not every frame fits
+    """
+    if algorithm == "maxrects":
+        blocks = [{"w": w, "h": h, "data": data} for w, h, data in frames]
+        packer = MaxRectsPacker(
+            heuristic=_MAXRECTS_HEURISTICS.get(heuristic, MaxRectsHeuristic.BSSF)
+        )
+        if not packer.fit(blocks, width, height, allow_rotation=allow_rotation):
+            return None
+        return [
+            (
+                block["fit"]["x"],
+                block["fit"]["y"],
+                block["w"],
+                block["h"],
+                bool(block["fit"].get("rotated", False)),
+                block["data"],
+            )
+            for block in blocks
+        ]
+
+    if algorithm == "skyline":
+        packer = SkylinePacker(
+            width,
+            height,
+            heuristic=_SKYLINE_HEURISTICS.get(heuristic, SkylineHeuristic.MIN_WASTE),
+            allow_rotation=allow_rotation,
+        )
+    elif algorithm == "guillotine":
+        packer = GuillotinePacker(
+            width,
+            height,
+            placement=_GUILLOTINE_PLACEMENTS.get(heuristic, GuillotinePlacement.BAF),
+            allow_rotation=allow_rotation,
+        )
+    elif algorithm == "shelf":
+        packer = ShelfPackerDecreasingHeight(
+            width,
+            height,
+            heuristic=_SHELF_HEURISTICS.get(heuristic, ShelfHeuristic.BEST_HEIGHT_FIT),
+            allow_rotation=allow_rotation,
+        )
+    else:
+        raise ValueError(f"Unknown packing algorithm: {algorithm}")
+
+    results = packer.pack(list(frames))
+    if len(results) != len(frames):
+        return None
+    return results
+
+
+# Set in pool workers by _init_search_worker; the parent sets the event once
+# it abandons the search
+_cancel_event = None
+
+
+class _SearchCancelled(Exception):
+    """Raised in a pool worker whose search has been abandoned."""
+
+
+def _init_search_worker(cancel_event) -> None:
+    """Pool initializer: keep the search's cancellation event."""
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _evaluate_combination(
+    task: tuple[list[tuple[int, int]], str, str, str, bool, dict[str, Any]],
+) -> Optional[SizeResult]:
+    """
+    Size one search combination (runs inside a pool worker).
+
+    Returns:
+        SizeResult for a verified fit, or None if the combination fails or
+        the search was abandoned
+    """
+    dims, algorithm, heuristic, sort_order, allow_rotation, size_kwargs = task
+    frames = sort_frames([(w, h, None) for w, h in dims], sort_order)
+
+    def try_pack(width: int, height: int) -> bool:
+        if _cancel_event is not None and _cancel_event.is_set():
+            raise _SearchCancelled()
+        placed = pack_frames(
+            frames, width, height, algorithm, heuristic, allow_rotation
+        )
+        return placed is not None
+
+    try:
+        result = find_optimal_size(frames, try_pack, padding=0, **size_kwargs)
+        # The size search can return an unverified upper bound when nothing fits
+        if not try_pack(result.width, result.height):
+            return None
+    except _SearchCancelled:
+        return None
+    return result
+
+
+def find_optimal_size_parallel(
+    frames: list[tuple[int, int, Any]],
+    min_size: int = 1,
+    max_size: int = 8192,
+    padding: int = 0,
+    power_of_2: bool = False,
+    allow_rotation: bool = False,
+    algorithms: Optional[dict[str, tuple[str, ...]]] = None,
+    sort_orders: Optional[tuple[str, ...]] = None,
+    time_budget: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    fixed_width: Optional[int] = None,
+    fixed_height: Optional[int] = None,
+) -> Optional[PackingPlan]:
+    """
+    Search algorithm x heuristic x sort order x rotation across processes.
+
+    Every combination runs find_optimal_size in a pool worker. The smallest
+    atlas area wins; ties go to the combination listed first, so the result
+    does not depend on completion order. With a time budget, the best result
+    available at the deadline is returned. If nothing has finished by then,
+    the search waits for the first result. Abandoned evaluations are
+    cancelled; those already running stop before their next pack attempt.
+
+    Args:
+        frames: List of (width, height, user_data) tuples
+        min_size: Minimum atlas dimension
+        max_size: Maximum atlas dimension
+        padding: Padding around each frame
+        power_of_2: Constrain dimensions to powers of 2
+        allow_rotation: Also try every combination with rotation enabled
+        algorithms: Mapping of algorithm to heuristic keys
+            (defaults to SEARCH_HEURISTICS)
+        sort_orders: SORT_ORDERS keys to try (defaults to all)
+        time_budget: Wall-clock budget in seconds, or None to finish everything
+        max_workers: Process count (defaults to os.cpu_count()); 1 runs inline
+        fixed_width: If set, use this exact width
+        fixed_height: If set, use this exact height
+
+    Returns:
+        PackingPlan for the best combination, or None if nothing fits
+    """
+    if not frames:
+        return None
+
+    algorithms = algorithms or SEARCH_HEURISTICS
+    sort_orders = sort_orders or tuple(SORT_ORDERS)
+    rotations = (False, True) if allow_rotation else (False,)
+    dims = [(w + padding * 2, h + padding * 2) for w, h, _ in frames]
+    size_kwargs = {
+        "min_size": min_size,
+        "max_size": max_size,
+        "power_of_2": power_of_2,
+        "fixed_width": fixed_width,
+        "fixed_height": fixed_height,
+    }
+
+    combos: list[tuple[str, str, str, bool]] = []
+    for algorithm, heuristics in algorithms.items():
+        orders = sort_orders[:1] if algorithm == "shelf" else sort_orders
+        for heuristic in heuristics:
+            for sort_order in orders:
+                for rotated in rotations:
+                    combos.append((algorithm, heuristic, sort_order, rotated))
+
+    tasks = [(dims, *combo, size_kwargs) for combo in combos]
+    deadline = time.monotonic() + time_budget if time_budget else None
+    best: Optional[tuple[int, int, SizeResult]] = None  # (area, index, result)
+    evaluated = 0
+
+    def consider(index: int, result: Optional[SizeResult]) -> None:
+        nonlocal best
+        if result is None:
+            return
+        key = (result.width * result.height, index)
+        if best is None or key < best[:2]:
+            best = (*key, result)
+
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    timed_out = False
+
+    if workers <= 1:
+        for index, task in enumerate(tasks):
+            if deadline is not None and best and time.monotonic() >= deadline:
+                timed_out = True
+                break
+            consider(index, _evaluate_combination(task))
+            evaluated += 1
+    else:
+        cancel_event = multiprocessing.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_search_worker,
+            initargs=(cancel_event,),
+        )
+        try:
+            futures = {
+                executor.submit(_evaluate_combination, task): index
+                for index, task in enumerate(tasks)
+            }
+            pending = set(futures)
+            while pending:
+                timeout = None
+                if deadline is not None and best is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    evaluated += 1
+                    try:
+                        consider(futures[future], future.result())
+                    except Exception:
+                        continue
+                if (
+                    pending
+                    and deadline is not None
+                    and best is not None
+                    and time.monotonic() >= deadline
+                ):
+                    timed_out = True
+                    break
+        finally:
+            # Running workers poll the event between pack attempts
+            cancel_event.set()
+            executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+    if best is None:
+        return None
+
+    _, index, result = best
+    algorithm, heuristic, sort_order, rotated = combos[index]
+    plan = PackingPlan(
+        algorithm=algorithm,
+        heuristic=heuristic,
+        sort_order=sort_order,
+        allow_rotation=rotated,
+        result=result,
+        evaluated=evaluated,
+        timed_out=timed_out,
+    )
+    result.algorithm_used = plan.label
+    return plan
@@ -9,6 +9,7 @@ formats including JSON, XML, plist, CSS, and text-based definitions.
 Main entry points:
     - ParserRegistry: Auto-detects format and provides unified parsing.
     - parse_file(): Convenience function for parsing any supported format.
+    - MetadataCache: Shares parsed results until the file changes on disk.
 
 Error handling:
     - ParserError: Base exception for all parsing errors.
@@ -17,6 +18,8 @@ Error handling:
 Sprite data:
     - SpriteData: TypedDict defining the canonical sprite structure.
     - normalize_sprite(): Ensures sprites have consistent fields and types.
+    - SpriteTable: Columnar NumPy form of a sprite list for large atlases.
+    - AnimationNameIndex: Sorted-name index grouping sprites by animation.
 """
 
 # Core types - no dependencies on other parser modules
@@ -34,7 +37,10 @@ from parsers.parser_types import (
     validate_sprites,
 )
 
+from parsers.animation_index import AnimationNameIndex
+from parsers.sprite_table import SpriteTable
 from parsers.base_parser import BaseParser
+from parsers.metadata_cache import MetadataCache
 
 
 # Lazy import for registry to avoid circular imports
@@ -75,8 +81,12 @@ __all__ = [
     "ParseResult",
     "normalize_sprite",
     "validate_sprites",
+    "SpriteTable",
+    "AnimationNameIndex",
     # Base class
     "BaseParser",
+    # Cache
+    "MetadataCache",
     # Functions
     "get_registry",
     "parse_file",
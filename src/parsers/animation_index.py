@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Precompiled lookup of sprites by animation name.
+
+Frame grouping and single-animation previews both map sprite names to
+animations: grouping strips trailing frame numbers from every name, and a
+preview keeps the sprites whose name starts with one of a few prefixes
+derived from the requested animation. Doing that per request costs a regex
+per sprite and a linear scan.
+
+``AnimationNameIndex`` does the work once per atlas:
+
+    - names sorted once, so every prefix is a ``bisect`` range and selecting
+      one animation costs O(log n + k) for k matching sprites
+    - the stripped base name of every sprite, computed once, plus the
+      sprite indices of each base name in document order
+
+``SpriteTable.name_index`` caches one index per table, so the tables shared
+through ``MetadataCache`` keep theirs across preview and extraction runs.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.utilities import Utilities
+
+# Suffixes removed from a requested animation name to get its match prefixes
+_PATTERN_SUFFIXES = (
+    re.compile(r"\d+$"),
+    re.compile(r"_?\d+$"),
+    re.compile(r"[-_]?\d+$"),
+)
+
+
+class AnimationNameIndex:
+    """Sorted-name and base-name index over one atlas's sprite names.
+
+    Indices returned by the lookups refer to positions in the ``names``
+    sequence the index was built from, in ascending (document) order.
+
+    Attributes:
+        names: Sprite names in document order (``None`` stored as ``""``).
+    """
+
+    def __init__(self, names: Sequence[Optional[str]]) -> None:
+        """Sort the names once; base names are derived on first use.
+
+        Args:
+            names: Sprite names in document order.
+        """
+        self.names: List[str] = [name or "" for name in names]
+        order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._order = np.array(order, dtype=np.intp)
+        self._sorted_names = [self.names[index] for index in order]
+        self._base_names: Optional[List[str]] = None
+        self._groups: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ------------------------------------------------------------------
+    # Prefix lookups
+    # ------------------------------------------------------------------
+    @staticmethod
+    def animation_patterns(animation_name: str) -> List[str]:
+        """Return the prefixes a sprite name may start with to match.
+
+        The name itself plus the name without trailing digits and an
+        optional ``_``/``-`` separator, without duplicates.
+
+        Args:
+            animation_name: Requested animation name.
+        """
+        patterns = [animation_name]
+        patterns.extend(suffix.sub("", animation_name) for suffix in _PATTERN_SUFFIXES)
+        return list(dict.fromkeys(patterns))
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Return the ``[start, stop)`` range of sorted names with ``prefix``."""
+        start = bisect_left(self._sorted_names, prefix)
+        # The smallest string greater than every string with this prefix:
+        # drop trailing U+10FFFF (nothing sorts above it), bump the last char
+        stem = prefix.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return start, len(self._sorted_names)
+        upper = stem[:-1] + chr(ord(stem[-1]) + 1)
+        return start, bisect_left(self._sorted_names, upper, lo=start)
+
+    def indices_with_prefix(self, prefix: str) -> np.ndarray:
+        """Return the document-order indices of names starting with ``prefix``."""
+        start, stop = self.prefix_range(prefix)
+        return np.sort(self._order[start:stop])
+
+    def match_animation(self, animation_name: str) -> np.ndarray:
+        """Return indices of sprites belonging to ``animation_name``.
+
+        Matches the historic rule: a sprite belongs to the animation if its
+        name starts with any of ``animation_patterns(animation_name)``.
+
+        Args:
+            animation_name: Requested animation name.
+
+        Returns:
+            Sorted array of sprite indices.
+        """
+        ranges = sorted(
+            self.prefix_range(prefix)
+            for prefix in self.animation_patterns(animation_name)
+        )
+        # Merge overlapping ranges (the prefixes usually nest) so every
+        # sprite is picked once
+        merged: List[List[int]] = []
+        for start, stop in ranges:
+            if stop <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([start, stop])
+        if not merged:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(
+            np.concatenate([self._order[start:stop] for start, stop in merged])
+        )
+
+    # ------------------------------------------------------------------
+    # Base-name grouping
+    # ------------------------------------------------------------------
+    @property
+    def base_names(self) -> List[str]:
+        """Per-sprite animation name (trailing frame number stripped)."""
+        if self._base_names is None:
+            strip = Utilities.strip_trailing_digits
+            self._base_names = [strip(name) for name in self.names]
+        return self._base_names
+
+    @property
+    def groups(self) -> Dict[str, np.ndarray]:
+        """Map each base name to its sprite indices, in first-appearance order."""
+        if self._groups is None:
+            members: Dict[str, List[int]] = {}
+            for index, base_name in enumerate(self.base_names):
+                members.setdefault(base_name, []).append(index)
+            self._groups = {
+                base_name: np.array(indices, dtype=np.intp)
+                for base_name, indices in members.items()
+            }
+        return self._groups
+
+
+__all__ = ["AnimationNameIndex"]
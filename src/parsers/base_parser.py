@@ -24,6 +24,7 @@ from parsers.parser_types import (
     normalize_sprite,
     validate_sprites,
 )
+from parsers.sprite_table import SpriteTable
 
 
 class BaseParser(ABC):
@@ -111,6 +112,13 @@ class BaseParser(ABC):
             )
 
         try:
+            # Formats with very large atlases fill a SpriteTable directly
+            table = cls.parse_table(file_path)
+            if table is not None:
+                result = table.validate(file_path)
+                result.parser_name = cls.__name__
+                return result
+
             # Try to call the format-specific parse method
             parse_method = cls._get_legacy_parse_method()
             if parse_method:
@@ -132,6 +140,74 @@ class BaseParser(ABC):
                 details={"exception_type": type(e).__name__},
             )
 
+    @classmethod
+    def parse_table(cls, file_path: str) -> Optional[SpriteTable]:
+        """Parse a file straight into a columnar ``SpriteTable``.
+
+        Parsers of formats that commonly hold tens of thousands of sprites
+        override this to skip building a dict per sprite; ``parse_file`` then
+        validates the table column-wise and returns it as
+        ``ParseResult.sprites``.
+
+        Args:
+            file_path: Absolute path to the metadata file.
+
+        Returns:
+            The unvalidated table, or None if this parser only produces dicts.
+        """
+        return None
+
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> Optional[List[Dict[str, Any]]]:
+        """Return raw sprites from a document that is already loaded in memory.
+
+        ``ParserRegistry`` has to load ``.json``, ``.xml`` and ``.plist`` files
+        to tell their formats apart. Parsers that can work from that loaded
+        document override this so the file is not read and decoded twice.
+
+        Args:
+            document: The decoded JSON/plist object or the XML root element.
+
+        Returns:
+            Raw sprite dicts, or None if this parser needs the file itself.
+        """
+        return None
+
+    @classmethod
+    def parse_document(cls, document: Any, file_path: str) -> ParseResult:
+        """Parse an already loaded document, falling back to ``parse_file``.
+
+        Errors are reported exactly as ``parse_file`` reports them.
+
+        Args:
+            document: Document loaded during format detection.
+            file_path: Path the document was loaded from, for error context.
+
+        Returns:
+            ParseResult containing sprites, warnings, and errors.
+
+        Raises:
+            FormatError: If the document structure is invalid.
+        """
+        try:
+            raw_sprites = cls.sprites_from_document(document)
+        except ParserError:
+            raise
+        except Exception as e:
+            raise FormatError(
+                ParserErrorCode.UNKNOWN_ERROR,
+                f"Unexpected error parsing file: {e}",
+                file_path=file_path,
+                details={"exception_type": type(e).__name__},
+            )
+
+        if raw_sprites is None:
+            return cls.parse_file(file_path)
+
+        result = validate_sprites(raw_sprites, file_path)
+        result.parser_name = cls.__name__
+        return result
+
     @classmethod
     def _get_legacy_parse_method(
         cls,
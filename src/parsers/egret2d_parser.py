@@ -87,6 +87,11 @@ class Egret2DParser(BaseParser):
             sprites.append(sprite_data)
         return sprites
 
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already decoded JSON document."""
+        return cls.parse_from_frames(document.get("frames", {}))
+
     @staticmethod
     def parse_json_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse an Egret2D JSON file and return sprite metadata.
@@ -99,8 +104,7 @@ class Egret2DParser(BaseParser):
         """
         with open(file_path, "r", encoding="utf-8") as json_file:
             data = json.load(json_file)
-        frames = data.get("frames", {})
-        return Egret2DParser.parse_from_frames(frames)
+        return Egret2DParser.sprites_from_document(data)
 
 
 __all__ = ["Egret2DParser"]
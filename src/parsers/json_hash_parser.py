@@ -94,6 +94,11 @@ class JsonHashAtlasParser(BaseParser):
             sprites.append(sprite_data)
         return sprites
 
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already decoded JSON document."""
+        return cls.parse_from_frames(document.get("frames", {}))
+
     @staticmethod
     def parse_json_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse a JSON hash atlas file and return sprite metadata.
@@ -106,8 +111,7 @@ class JsonHashAtlasParser(BaseParser):
         """
         with open(file_path, "r", encoding="utf-8") as json_file:
             data = json.load(json_file)
-        frames = data.get("frames", {})
-        return JsonHashAtlasParser.parse_from_frames(frames)
+        return JsonHashAtlasParser.sprites_from_document(data)
 
 
 __all__ = ["JsonHashAtlasParser"]
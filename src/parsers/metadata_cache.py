@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Shared cache of parsed spritesheet metadata.
+
+Selecting a spritesheet in the Extract tab, previewing one of its
+animations and extracting it all need the same parsed metadata. This module
+provides ``MetadataCache`` so the file is parsed once and reused until it
+changes on disk.
+
+Entries are keyed by absolute path, mtime and size; editing the file
+invalidates its entry automatically.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from parsers.parser_types import ParseResult
+from parsers.sprite_table import SpriteTable
+
+CacheKey = Tuple[str, int, int]
+
+
+class MetadataCache:
+    """Process-wide LRU of ``ParseResult`` objects.
+
+    Lives at class level like ``ParserRegistry`` so the GUI, preview and
+    extraction workers share it. Cached results must be treated as
+    read-only.
+
+    Class Attributes:
+        max_entries: Parsed files kept at once.
+    """
+
+    max_entries: int = 32
+    _results: "OrderedDict[CacheKey, ParseResult]" = OrderedDict()
+    _names: "OrderedDict[CacheKey, List[str]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(file_path: str) -> Optional[CacheKey]:
+        """Return the cache key for a file, or ``None`` if it cannot be read."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def get(cls, file_path: str) -> Optional[ParseResult]:
+        """Return the cached result for ``file_path`` without parsing."""
+        key = cls._key(file_path)
+        if key is None:
+            return None
+        with cls._lock:
+            result = cls._results.get(key)
+            if result is not None:
+                cls._results.move_to_end(key)
+            return result
+
+    @classmethod
+    def parse(cls, file_path: str) -> ParseResult:
+        """Return the parsed metadata of ``file_path``, parsing it on a miss.
+
+        Two threads asking for the same uncached file may both parse it; the
+        results are identical and the last one is kept.
+
+        Args:
+            file_path: Path to the metadata file.
+
+        Returns:
+            The cached or freshly parsed ``ParseResult``; its ``sprites`` is
+            always a ``SpriteTable``.
+
+        Raises:
+            ParserError: Propagated from ``ParserRegistry.parse_file``;
+                failures are not cached.
+        """
+        from parsers.parser_registry import ParserRegistry
+
+        key = cls._key(file_path)
+        if key is not None:
+            with cls._lock:
+                result = cls._results.get(key)
+                if result is not None:
+                    cls._results.move_to_end(key)
+                    return result
+
+        if not ParserRegistry._all_parsers:
+            ParserRegistry.initialize()
+        result = ParserRegistry.parse_file(file_path)
+        # One table (and one name index) per file for every consumer
+        if not isinstance(result.sprites, SpriteTable):
+            result.sprites = SpriteTable.from_sprites(result.sprites)
+
+        if key is not None:
+            with cls._lock:
+                cls._results[key] = result
+                cls._results.move_to_end(key)
+                while len(cls._results) > cls.max_entries:
+                    stale_key, _ = cls._results.popitem(last=False)
+                    cls._names.pop(stale_key, None)
+        return result
+
+    @classmethod
+    def animation_names(cls, file_path: str) -> List[str]:
+        """Return the sorted animation names found in ``file_path``.
+
+        Names are sprite names with trailing frame numbers stripped, derived
+        from the same parse the extractor uses.
+
+        Args:
+            file_path: Path to the metadata file.
+
+        Raises:
+            ParserError: If the file cannot be parsed.
+        """
+        key = cls._key(file_path)
+        if key is not None:
+            with cls._lock:
+                names = cls._names.get(key)
+                if names is not None:
+                    return names
+
+        # Reuses the base names extraction groups frames by
+        index = cls.parse(file_path).sprites.name_index
+        names = sorted(
+            {
+                base_name or name
+                for name, base_name in zip(index.names, index.base_names)
+                if name
+            }
+        )
+
+        if key is not None:
+            with cls._lock:
+                if key in cls._results:
+                    cls._names[key] = names
+        return names
+
+    @classmethod
+    def invalidate(cls, file_path: Optional[str] = None) -> None:
+        """Drop cached results.
+
+        Args:
+            file_path: Only drop entries for this file; ``None`` drops all.
+        """
+        with cls._lock:
+            if file_path is None:
+                cls._results.clear()
+                cls._names.clear()
+                return
+            target = os.path.abspath(file_path)
+            for key in [key for key in cls._results if key[0] == target]:
+                del cls._results[key]
+                cls._names.pop(key, None)
+
+
+__all__ = ["MetadataCache"]
@@ -7,13 +7,18 @@ This module provides:
     - ParserRegistry: Central registry of all available parsers.
     - Auto-detection of file formats based on extension and content.
     - Unified parse_file() entry point for the extraction pipeline.
+
+Content-based detection has to decode ambiguous ``.json`` and ``.plist``
+files. The decoded document is handed to the chosen parser so each file is
+read and decoded only once. ``.xml`` detection only reads the first few
+elements and the chosen parser then streams the file.
 """
 
 from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from parsers.base_parser import BaseParser
 from parsers.parser_types import (
@@ -98,14 +103,30 @@ class ParserRegistry:
         Returns:
             The most appropriate parser class, or None if unsupported.
         """
+        return cls.detect_parser_and_document(file_path)[0]
+
+    @classmethod
+    def detect_parser_and_document(
+        cls, file_path: str
+    ) -> Tuple[Optional[Type[BaseParser]], Any]:
+        """Detect the best parser and keep the document decoded to find it.
+
+        Args:
+            file_path: Path to the file to parse.
+
+        Returns:
+            Tuple of (parser class or None, decoded document or None). The
+            document is None when the extension alone decided the parser or
+            the file could not be decoded.
+        """
         ext = os.path.splitext(file_path)[1].lower()
         candidates = cls.get_parsers_for_extension(ext)
 
         if not candidates:
-            return None
+            return None, None
 
         if len(candidates) == 1:
-            return candidates[0]
+            return candidates[0], None
 
         # Multiple candidates - try content-based detection
         if ext == ".json":
@@ -116,14 +137,14 @@ class ParserRegistry:
             return cls._detect_plist_parser(file_path, candidates)
 
         # Default to first candidate
-        return candidates[0]
+        return candidates[0], None
 
     @classmethod
     def _detect_json_parser(
         cls,
         file_path: str,
         candidates: List[Type[BaseParser]],
-    ) -> Optional[Type[BaseParser]]:
+    ) -> Tuple[Optional[Type[BaseParser]], Any]:
         """Detect the correct JSON parser based on content structure.
 
         Args:
@@ -131,8 +152,10 @@ class ParserRegistry:
             candidates: List of parser classes to check.
 
         Returns:
-            The matching parser class or the first candidate as fallback.
+            Tuple of (matching parser class or the first candidate as
+            fallback, decoded JSON document or None).
         """
+        data = None
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -145,12 +168,12 @@ class ParserRegistry:
                     # Godot Atlas format
                     for parser in candidates:
                         if parser.__name__ == "GodotAtlasParser":
-                            return parser
+                            return parser, data
                 elif textures and "frames" in textures[0]:
                     # Phaser3 format
                     for parser in candidates:
                         if parser.__name__ == "Phaser3Parser":
-                            return parser
+                            return parser, data
 
             if "frames" in data:
                 frames = data["frames"]
@@ -158,7 +181,7 @@ class ParserRegistry:
                     # JSON Array format
                     for parser in candidates:
                         if parser.__name__ == "JsonArrayAtlasParser":
-                            return parser
+                            return parser, data
                 elif isinstance(frames, dict):
                     # Check for Egret2D (simple x/y/w/h) vs Hash format
                     if frames:
@@ -167,62 +190,65 @@ class ParserRegistry:
                             # Hash format with nested frame object
                             for parser in candidates:
                                 if parser.__name__ == "JsonHashAtlasParser":
-                                    return parser
+                                    return parser, data
                         else:
                             # Egret2D format with direct x/y/w/h
                             for parser in candidates:
                                 if parser.__name__ == "Egret2DParser":
-                                    return parser
+                                    return parser, data
 
             # Check for spritemap format (Adobe Animate)
             if "SD" in data or "ATLAS" in data:
                 for parser in candidates:
                     if "Spritemap" in parser.__name__:
-                        return parser
+                        return parser, data
 
         except (json.JSONDecodeError, IOError):
-            pass
+            data = None
 
-        return candidates[0] if candidates else None
+        return (candidates[0] if candidates else None), data
 
     @classmethod
     def _detect_xml_parser(
         cls,
         file_path: str,
         candidates: List[Type[BaseParser]],
-    ) -> Optional[Type[BaseParser]]:
+    ) -> Tuple[Optional[Type[BaseParser]], Any]:
         """Detect the correct XML parser based on content structure.
 
+        Only the root and its first children are read, so no document is
+        returned; XML parsers stream the file themselves.
+
         Args:
             file_path: Path to the XML file.
             candidates: List of parser classes to check.
 
         Returns:
-            The matching parser class or the first candidate as fallback.
+            Tuple of (matching parser class or the first candidate as
+            fallback, None).
         """
         try:
-            import xml.etree.ElementTree as ET
+            from parsers.xml_stream import sniff_xml_root
 
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = sniff_xml_root(file_path)
 
             # Check for matches_root method on candidates
             for parser in candidates:
                 matcher = getattr(parser, "matches_root", None)
-                if matcher and matcher(root):
-                    return parser
+                if root is not None and matcher and matcher(root):
+                    return parser, None
 
         except Exception:
             pass
 
-        return candidates[0] if candidates else None
+        return (candidates[0] if candidates else None), None
 
     @classmethod
     def _detect_plist_parser(
         cls,
         file_path: str,
         candidates: List[Type[BaseParser]],
-    ) -> Optional[Type[BaseParser]]:
+    ) -> Tuple[Optional[Type[BaseParser]], Any]:
         """Detect the correct plist parser based on content structure.
 
         Args:
@@ -230,8 +256,10 @@ class ParserRegistry:
             candidates: List of parser classes to check.
 
         Returns:
-            The matching parser class or the first candidate as fallback.
+            Tuple of (matching parser class or the first candidate as
+            fallback, decoded plist document or None).
         """
+        data = None
         try:
             import plistlib
 
@@ -245,17 +273,17 @@ class ParserRegistry:
                 if "x" in first_frame and "y" in first_frame:
                     for parser in candidates:
                         if parser.__name__ == "UIKitPlistParser":
-                            return parser
+                            return parser, data
                 # TexturePacker format uses nested frame/sourceSize
                 elif "frame" in first_frame or "textureRect" in first_frame:
                     for parser in candidates:
                         if parser.__name__ == "PlistAtlasParser":
-                            return parser
+                            return parser, data
 
         except Exception:
             pass
 
-        return candidates[0] if candidates else None
+        return (candidates[0] if candidates else None), data
 
     @classmethod
     def parse_file(cls, file_path: str) -> ParseResult:
@@ -280,7 +308,7 @@ class ParserRegistry:
                 file_path=file_path,
             )
 
-        parser_cls = cls.detect_parser(file_path)
+        parser_cls, document = cls.detect_parser_and_document(file_path)
         if not parser_cls:
             ext = os.path.splitext(file_path)[1]
             raise FormatError(
@@ -289,6 +317,8 @@ class ParserRegistry:
                 file_path=file_path,
             )
 
+        if document is not None:
+            return parser_cls.parse_document(document, file_path)
         return parser_cls.parse_file(file_path)
 
     @classmethod
@@ -14,7 +14,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union
+
+if TYPE_CHECKING:
+    from parsers.sprite_table import SpriteTable
 
 
 class ParserErrorCode(Enum):
@@ -122,6 +125,12 @@ class ParserError(Exception):
             parts.append(f"Details: {detail_str}")
         return " | ".join(parts)
 
+    def __reduce__(self):
+        # The default exception pickling calls __init__ with ``args`` (the
+        # formatted message); restore the fields instead so errors survive
+        # the trip back from worker processes
+        return (self.__class__.__new__, (self.__class__, *self.args), self.__dict__)
+
 
 class FileError(ParserError):
     """Error reading or accessing a file."""
@@ -181,7 +190,8 @@ class ParseResult:
     """Container for parser output with full diagnostics.
 
     Attributes:
-        sprites: List of successfully parsed sprite dicts.
+        sprites: Successfully parsed sprites, as a list of sprite dicts or a
+            ``SpriteTable`` (which also behaves as a sequence of dicts).
         warnings: Non-fatal issues encountered during parsing.
         errors: Fatal errors for specific sprites (partial failures).
         file_path: Path to the parsed file.
@@ -189,7 +199,7 @@ class ParseResult:
         is_valid: True if parsing produced usable sprites.
     """
 
-    sprites: List[SpriteData] = field(default_factory=list)
+    sprites: Union[List[SpriteData], SpriteTable] = field(default_factory=list)
     warnings: List[ParserWarning] = field(default_factory=list)
     errors: List[SpriteError] = field(default_factory=list)
     file_path: Optional[str] = None
@@ -98,6 +98,11 @@ class Phaser3Parser(BaseParser):
                 sprites.append(sprite_data)
         return sprites
 
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already decoded JSON document."""
+        return cls.parse_from_textures(document.get("textures", []))
+
     @staticmethod
     def parse_json_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse a Phaser 3 atlas file and return sprite metadata.
@@ -110,8 +115,7 @@ class Phaser3Parser(BaseParser):
         """
         with open(file_path, "r", encoding="utf-8") as json_file:
             data = json.load(json_file)
-        textures = data.get("textures", [])
-        return Phaser3Parser.parse_from_textures(textures)
+        return Phaser3Parser.sprites_from_document(data)
 
 
 __all__ = ["Phaser3Parser"]
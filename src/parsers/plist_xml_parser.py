@@ -96,6 +96,11 @@ class PlistAtlasParser(BaseParser):
             sprites.append(sprite_data)
         return sprites
 
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already decoded plist document."""
+        return cls.parse_from_frames(document.get("frames", {}))
+
     @staticmethod
     def parse_plist_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse a plist atlas file and return sprite metadata.
@@ -108,8 +113,7 @@ class PlistAtlasParser(BaseParser):
         """
         with open(file_path, "rb") as plist_file:
             plist_data = plistlib.load(plist_file)
-        frames = plist_data.get("frames", {})
-        return PlistAtlasParser.parse_from_frames(frames)
+        return PlistAtlasParser.sprites_from_document(plist_data)
 
     @staticmethod
     def _parse_rect(rect_value: Any) -> Tuple[int, int, int, int]:
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Columnar sprite storage for large atlases.
+
+A ``List[SpriteData]`` costs one dict per sprite, several hundred bytes each,
+and every consumer pays a ``dict.get`` per field. ``SpriteTable`` stores the
+same data as parallel NumPy columns plus a names array, so parsers of large
+atlases can fill it directly and consumers can validate, bounds-check and
+group sprites with array operations.
+
+The table is also a read-only sequence of ``SpriteData`` dicts: indexing or
+iterating it builds the same dicts ``normalize_sprite`` returns, so code
+written for sprite lists keeps working. ``ParseResult.sprites`` may hold
+either form.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from parsers.animation_index import AnimationNameIndex
+from parsers.parser_types import ParseResult, ParserErrorCode, SpriteData
+
+# SpriteData keys in the order of a row tuple (see ``SpriteTable.from_rows``)
+ROW_KEYS = (
+    "name",
+    "x",
+    "y",
+    "width",
+    "height",
+    "frameX",
+    "frameY",
+    "frameWidth",
+    "frameHeight",
+    "rotated",
+    "pivotX",
+    "pivotY",
+)
+
+# Integer columns in SpriteData key order; ``rotated`` is a bool column
+INT_COLUMNS = (
+    ("x", "x"),
+    ("y", "y"),
+    ("width", "width"),
+    ("height", "height"),
+    ("frame_x", "frameX"),
+    ("frame_y", "frameY"),
+    ("frame_width", "frameWidth"),
+    ("frame_height", "frameHeight"),
+)
+
+
+@dataclass(eq=False)
+class SpriteTable:
+    """Sprites of one atlas as parallel columns.
+
+    All columns have one entry per sprite. Treat instances as immutable:
+    they are shared through ``MetadataCache``.
+
+    Attributes:
+        names: Object array of sprite names.
+        x: Atlas X positions (int32).
+        y: Atlas Y positions (int32).
+        width: Cropped widths (int32).
+        height: Cropped heights (int32).
+        frame_x: Trim offsets, as ``frameX`` (int32).
+        frame_y: Trim offsets, as ``frameY`` (int32).
+        frame_width: Untrimmed widths, as ``frameWidth`` (int32).
+        frame_height: Untrimmed heights, as ``frameHeight`` (int32).
+        rotated: True for sprites stored rotated in the atlas.
+        pivot_x: Optional pivots (float64, NaN where absent).
+        pivot_y: Optional pivots (float64, NaN where absent).
+    """
+
+    names: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    frame_x: np.ndarray
+    frame_y: np.ndarray
+    frame_width: np.ndarray
+    frame_height: np.ndarray
+    rotated: np.ndarray
+    pivot_x: Optional[np.ndarray] = None
+    pivot_y: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_columns(
+        cls,
+        names: Sequence[str],
+        x: Sequence[int],
+        y: Sequence[int],
+        width: Sequence[int],
+        height: Sequence[int],
+        frame_x: Optional[Sequence[int]] = None,
+        frame_y: Optional[Sequence[int]] = None,
+        frame_width: Optional[Sequence[int]] = None,
+        frame_height: Optional[Sequence[int]] = None,
+        rotated: Optional[Sequence[bool]] = None,
+        pivot_x: Optional[Sequence[float]] = None,
+        pivot_y: Optional[Sequence[float]] = None,
+    ) -> "SpriteTable":
+        """Build a table from per-field sequences, e.g. lists a parser filled.
+
+        Missing optional columns get the ``SpriteData`` defaults: zero
+        offsets, untrimmed size equal to the cropped size, not rotated.
+        """
+        count = len(names)
+        width_col = np.asarray(width, dtype=np.int32)
+        height_col = np.asarray(height, dtype=np.int32)
+
+        def int_column(values, default):
+            if values is None:
+                return np.array(default, dtype=np.int32, copy=True)
+            return np.asarray(values, dtype=np.int32)
+
+        def pivot_column(values):
+            if values is None:
+                return None
+            column = np.asarray(values, dtype=np.float64)
+            return None if np.isnan(column).all() else column
+
+        return cls(
+            names=np.array(names, dtype=object),
+            x=np.asarray(x, dtype=np.int32),
+            y=np.asarray(y, dtype=np.int32),
+            width=width_col,
+            height=height_col,
+            frame_x=int_column(frame_x, np.zeros(count)),
+            frame_y=int_column(frame_y, np.zeros(count)),
+            frame_width=int_column(frame_width, width_col),
+            frame_height=int_column(frame_height, height_col),
+            rotated=(
+                np.zeros(count, dtype=bool)
+                if rotated is None
+                else np.asarray(rotated, dtype=bool)
+            ),
+            pivot_x=pivot_column(pivot_x),
+            pivot_y=pivot_column(pivot_y),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[Any, ...]]) -> "SpriteTable":
+        """Build a table from row tuples in ``ROW_KEYS`` order.
+
+        Rows are the cheapest record a streaming parser can collect: a
+        10-tuple of small ints instead of a dict. Rows may stop after
+        ``rotated`` (no pivots) or include both pivots.
+
+        Args:
+            rows: Tuples of ``(name, x, y, width, height, frameX, frameY,
+                frameWidth, frameHeight, rotated[, pivotX, pivotY])``.
+        """
+        if not rows:
+            return cls.from_columns([], [], [], [], [])
+        return cls.from_columns(*zip(*rows))
+
+    @classmethod
+    def from_sprites(cls, sprites: Iterable[Dict[str, Any]]) -> "SpriteTable":
+        """Build a table from sprite dicts.
+
+        Dicts missing ``name``, ``x``, ``y``, ``width`` or ``height`` are
+        skipped, as ``SpriteProcessor`` always did. Optional keys fall back to
+        the ``SpriteData`` defaults.
+
+        Args:
+            sprites: Sprite dicts, normalized or raw, or another table.
+
+        Returns:
+            A new table (or ``sprites`` itself if it already is one).
+        """
+        if isinstance(sprites, SpriteTable):
+            return sprites
+
+        columns: Dict[str, List[Any]] = {
+            name: []
+            for name in ("names", "rotated", "pivot_x", "pivot_y")
+            + tuple(column for column, _ in INT_COLUMNS)
+        }
+        has_pivots = False
+        for sprite in sprites:
+            try:
+                name = sprite["name"]
+                x, y = sprite["x"], sprite["y"]
+                width, height = sprite["width"], sprite["height"]
+            except KeyError:
+                continue
+            columns["names"].append(name)
+            columns["x"].append(x)
+            columns["y"].append(y)
+            columns["width"].append(width)
+            columns["height"].append(height)
+            columns["frame_x"].append(sprite.get("frameX", 0))
+            columns["frame_y"].append(sprite.get("frameY", 0))
+            columns["frame_width"].append(sprite.get("frameWidth", width))
+            columns["frame_height"].append(sprite.get("frameHeight", height))
+            columns["rotated"].append(bool(sprite.get("rotated", False)))
+            pivot_x = sprite.get("pivotX")
+            pivot_y = sprite.get("pivotY")
+            has_pivots = has_pivots or pivot_x is not None or pivot_y is not None
+            columns["pivot_x"].append(np.nan if pivot_x is None else pivot_x)
+            columns["pivot_y"].append(np.nan if pivot_y is None else pivot_y)
+
+        if not has_pivots:
+            columns["pivot_x"] = columns["pivot_y"] = None
+        return cls.from_columns(**columns)
+
+    # ------------------------------------------------------------------
+    # Sequence-of-dicts view
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(
+        self, index: Union[int, slice, np.ndarray]
+    ) -> Union[SpriteData, "SpriteTable"]:
+        """Return one sprite as a ``SpriteData`` dict, or a sub-table.
+
+        Integers give a dict; slices, index arrays and boolean masks give a
+        new table (see ``select``).
+        """
+        if isinstance(index, (slice, np.ndarray, list)):
+            return self.select(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sprite index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[SpriteData]:
+        """Yield every sprite as a ``SpriteData`` dict."""
+        columns = [self.names.tolist()]
+        columns.extend(getattr(self, column).tolist() for column, _ in INT_COLUMNS)
+        columns.append(self.rotated.tolist())
+        keys = ("name",) + tuple(key for _, key in INT_COLUMNS) + ("rotated",)
+        pivots = self._pivot_lists()
+        for index, values in enumerate(zip(*columns)):
+            sprite = dict(zip(keys, values))
+            if pivots is not None:
+                self._add_pivots(sprite, pivots[0][index], pivots[1][index])
+            yield sprite
+
+    def __eq__(self, other: object) -> bool:
+        """Compare sprite by sprite with another table or list of dicts."""
+        if isinstance(other, (SpriteTable, list, tuple)):
+            return len(self) == len(other) and all(
+                mine == theirs for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # Mutable arrays; like lists, tables are unhashable
+
+    def to_sprites(self) -> List[SpriteData]:
+        """Return a list of ``SpriteData`` dicts for dict-only consumers."""
+        return list(self)
+
+    def _row(self, index: int) -> SpriteData:
+        sprite: Dict[str, Any] = {"name": self.names[index]}
+        for column, key in INT_COLUMNS:
+            sprite[key] = int(getattr(self, column)[index])
+        sprite["rotated"] = bool(self.rotated[index])
+        pivots = self._pivot_lists()
+        if pivots is not None:
+            self._add_pivots(sprite, pivots[0][index], pivots[1][index])
+        return sprite
+
+    def _pivot_lists(self):
+        if self.pivot_x is None and self.pivot_y is None:
+            return None
+        count = len(self)
+        nan_column = [float("nan")] * count
+        return (
+            self.pivot_x.tolist() if self.pivot_x is not None else nan_column,
+            self.pivot_y.tolist() if self.pivot_y is not None else nan_column,
+        )
+
+    @staticmethod
+    def _add_pivots(sprite: Dict[str, Any], pivot_x: float, pivot_y: float) -> None:
+        # NaN marks "not present", matching normalize_sprite's optional keys
+        if pivot_x == pivot_x:
+            sprite["pivotX"] = pivot_x
+        if pivot_y == pivot_y:
+            sprite["pivotY"] = pivot_y
+
+    @cached_property
+    def name_index(self) -> AnimationNameIndex:
+        """Animation-name index over ``names``, built on first use."""
+        return AnimationNameIndex(self.names.tolist())
+
+    # ------------------------------------------------------------------
+    # Vectorized operations
+    # ------------------------------------------------------------------
+    def select(self, index: Union[slice, np.ndarray, Sequence[int]]) -> "SpriteTable":
+        """Return a new table with the rows picked by a slice, indices or mask."""
+        if not isinstance(index, slice):
+            index = np.asarray(index)
+            if index.dtype != bool:
+                index = index.astype(np.intp, copy=False)
+
+        def pick(column):
+            return None if column is None else column[index]
+
+        return SpriteTable(
+            names=self.names[index],
+            x=self.x[index],
+            y=self.y[index],
+            width=self.width[index],
+            height=self.height[index],
+            frame_x=self.frame_x[index],
+            frame_y=self.frame_y[index],
+            frame_width=self.frame_width[index],
+            frame_height=self.frame_height[index],
+            rotated=self.rotated[index],
+            pivot_x=pick(self.pivot_x),
+            pivot_y=pick(self.pivot_y),
+        )
+
+    def out_of_bounds_mask(self, atlas_width: int, atlas_height: int) -> np.ndarray:
+        """Return a mask of sprites not fully inside an atlas of the given size.
+
+        Rotated sprites are stored with their width and height as listed in
+        the metadata, so the rectangle is the same either way.
+        """
+        return (
+            (self.x < 0)
+            | (self.y < 0)
+            | (self.x.astype(np.int64) + self.width > atlas_width)
+            | (self.y.astype(np.int64) + self.height > atlas_height)
+        )
+
+    def validate(self, file_path: Optional[str] = None) -> ParseResult:
+        """Vectorized counterpart of ``validate_sprites``.
+
+        Rows with an empty name or a zero/negative size become sprite errors
+        with the codes ``normalize_sprite`` uses; zero untrimmed sizes fall
+        back to the cropped size.
+
+        Args:
+            file_path: Source file path for error context.
+
+        Returns:
+            ParseResult whose ``sprites`` is the table of valid rows.
+        """
+        result = ParseResult(file_path=file_path)
+
+        missing_name = np.array([not name for name in self.names], dtype=bool)
+        bad_size = (self.width <= 0) | (self.height <= 0)
+        invalid = missing_name | bad_size
+
+        for index in np.flatnonzero(invalid).tolist():
+            name = self.names[index]
+            if missing_name[index]:
+                result.add_error(
+                    ParserErrorCode.MISSING_REQUIRED_KEY,
+                    "Sprite missing required 'name' field",
+                    sprite_name=name,
+                    details={"sprite": str(self._row(index))[:100]},
+                )
+            else:
+                width, height = int(self.width[index]), int(self.height[index])
+                result.add_error(
+                    ParserErrorCode.ZERO_DIMENSION,
+                    f"Sprite '{name}' has zero or negative dimensions: "
+                    f"{width}x{height}",
+                    sprite_name=name,
+                    details={"sprite_name": name, "width": width, "height": height},
+                )
+
+        table = self.select(~invalid) if invalid.any() else self
+        if (table.frame_width == 0).any() or (table.frame_height == 0).any():
+            table = replace(
+                table,
+                frame_width=np.where(
+                    table.frame_width == 0, table.width, table.frame_width
+                ),
+                frame_height=np.where(
+                    table.frame_height == 0, table.height, table.frame_height
+                ),
+            )
+        result.sprites = table
+
+        if not len(table) and len(self):
+            result.add_warning(
+                ParserErrorCode.EMPTY_SPRITE_LIST,
+                f"All {len(self)} sprites failed validation",
+            )
+        return result
+
+
+__all__ = ["ROW_KEYS", "SpriteTable"]
@@ -26,9 +26,11 @@ from __future__ import annotations
 
 import os
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from parsers.base_parser import BaseParser
+from parsers.sprite_table import ROW_KEYS, SpriteTable
+from parsers.xml_stream import iter_child_elements
 from utils.utilities import Utilities
 
 
@@ -100,6 +102,42 @@ class StarlingXmlParser(BaseParser):
                 names.add(name)
         return names
 
+    @staticmethod
+    def sprite_row(sprite) -> Tuple[Any, ...]:
+        """Read one ``<SubTexture>`` element as a ``SpriteTable`` row.
+
+        Args:
+                sprite: A SubTexture element.
+
+        Returns:
+                Tuple of values in ``ROW_KEYS`` order, without pivots.
+        """
+        get = sprite.get
+        return (
+            get("name"),
+            int(get("x", 0)),
+            int(get("y", 0)),
+            int(get("width", 0)),
+            int(get("height", 0)),
+            int(get("frameX", 0)),
+            int(get("frameY", 0)),
+            int(get("frameWidth", get("width", 0))),
+            int(get("frameHeight", get("height", 0))),
+            get("rotated", "false") == "true",
+        )
+
+    @staticmethod
+    def sprite_from_element(sprite) -> Dict[str, Any]:
+        """Build the sprite dict for one ``<SubTexture>`` element.
+
+        Args:
+                sprite: A SubTexture element.
+
+        Returns:
+                Sprite dict with position, dimension, and rotation data.
+        """
+        return dict(zip(ROW_KEYS, StarlingXmlParser.sprite_row(sprite)))
+
     @staticmethod
     def parse_from_root(xml_root) -> List[Dict[str, Any]]:
         """Parse sprite metadata from an already-parsed XML root.
@@ -110,22 +148,53 @@ class StarlingXmlParser(BaseParser):
         Returns:
                 List of sprite dicts with position, dimension, and rotation data.
         """
-        sprites = []
-        for sprite in xml_root.findall("SubTexture"):
-            sprite_data = {
-                "name": sprite.get("name"),
-                "x": int(sprite.get("x", 0)),
-                "y": int(sprite.get("y", 0)),
-                "width": int(sprite.get("width", 0)),
-                "height": int(sprite.get("height", 0)),
-                "frameX": int(sprite.get("frameX", 0)),
-                "frameY": int(sprite.get("frameY", 0)),
-                "frameWidth": int(sprite.get("frameWidth", sprite.get("width", 0))),
-                "frameHeight": int(sprite.get("frameHeight", sprite.get("height", 0))),
-                "rotated": sprite.get("rotated", "false") == "true",
-            }
-            sprites.append(sprite_data)
-        return sprites
+        return [
+            StarlingXmlParser.sprite_from_element(sprite)
+            for sprite in xml_root.findall("SubTexture")
+        ]
+
+    @classmethod
+    def iter_sprites(
+        cls,
+        file_path: str,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream sprite dicts from a file without building the whole tree.
+
+        Args:
+                file_path: Path to the XML file.
+                name_filter: Optional predicate on the raw sprite name;
+                        rejected SubTextures are skipped before any attribute
+                        is converted.
+
+        Yields:
+                Sprite dicts in document order.
+        """
+        for sprite in iter_child_elements(file_path, "SubTexture"):
+            if name_filter is None or name_filter(sprite.get("name", "")):
+                yield cls.sprite_from_element(sprite)
+
+    @classmethod
+    def parse_table(cls, file_path: str) -> SpriteTable:
+        """Stream the file straight into a ``SpriteTable``.
+
+        Args:
+                file_path: Path to the XML file.
+
+        Returns:
+                Unvalidated table with one row per SubTexture.
+        """
+        return SpriteTable.from_rows(
+            [
+                cls.sprite_row(sprite)
+                for sprite in iter_child_elements(file_path, "SubTexture")
+            ]
+        )
+
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already parsed XML root element."""
+        return cls.parse_from_root(document)
 
     @staticmethod
     def parse_xml_data(
@@ -139,6 +208,4 @@ class StarlingXmlParser(BaseParser):
         Returns:
                 List of sprite dicts with position, dimension, and rotation data.
         """
-        tree = ET.parse(file_path)
-        xml_root = tree.getroot()
-        return StarlingXmlParser.parse_from_root(xml_root)
+        return list(StarlingXmlParser.iter_sprites(file_path))
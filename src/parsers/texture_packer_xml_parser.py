@@ -7,9 +7,11 @@ from __future__ import annotations
 
 import os
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from parsers.base_parser import BaseParser
+from parsers.sprite_table import ROW_KEYS, SpriteTable
+from parsers.xml_stream import iter_child_elements
 from utils.utilities import Utilities
 
 
@@ -79,6 +81,48 @@ class TexturePackerXmlParser(BaseParser):
                 names.add(Utilities.strip_trailing_digits(name))
         return names
 
+    @classmethod
+    def sprite_row(cls, sprite) -> Tuple[Any, ...]:
+        """Read one ``<sprite>`` element as a ``SpriteTable`` row.
+
+        Args:
+            sprite: A sprite element.
+
+        Returns:
+            Tuple of values in ``ROW_KEYS`` order, including pivots.
+        """
+        get = sprite.get
+        width = cls._parse_int(get("w"), default=0)
+        height = cls._parse_int(get("h"), default=0)
+        frame_width = cls._parse_int(get("oW"), default=None)
+        frame_height = cls._parse_int(get("oH"), default=None)
+        return (
+            get("n") or get("name"),
+            cls._parse_int(get("x"), default=0),
+            cls._parse_int(get("y"), default=0),
+            width,
+            height,
+            cls._parse_int(get("oX"), default=0),
+            cls._parse_int(get("oY"), default=0),
+            width if frame_width is None else frame_width,
+            height if frame_height is None else frame_height,
+            cls._parse_bool(get("r")),
+            cls._parse_float(get("pX"), 0.5),
+            cls._parse_float(get("pY"), 0.5),
+        )
+
+    @classmethod
+    def sprite_from_element(cls, sprite) -> Dict[str, Any]:
+        """Build the sprite dict for one ``<sprite>`` element.
+
+        Args:
+            sprite: A sprite element.
+
+        Returns:
+            Sprite dict with position, dimension, and pivot data.
+        """
+        return dict(zip(ROW_KEYS, cls.sprite_row(sprite)))
+
     @classmethod
     def parse_from_root(cls, xml_root) -> List[Dict[str, Any]]:
         """Parse sprite metadata from an already-parsed XML root.
@@ -89,28 +133,31 @@ class TexturePackerXmlParser(BaseParser):
         Returns:
             List of sprite dicts with position, dimension, and pivot data.
         """
-        sprites: List[Dict[str, Any]] = []
-        for sprite in xml_root.findall("sprite"):
-            sprite_data = {
-                "name": sprite.get("n") or sprite.get("name"),
-                "x": cls._parse_int(sprite.get("x"), default=0),
-                "y": cls._parse_int(sprite.get("y"), default=0),
-                "width": cls._parse_int(sprite.get("w"), default=0),
-                "height": cls._parse_int(sprite.get("h"), default=0),
-                "frameX": cls._parse_int(sprite.get("oX"), default=0),
-                "frameY": cls._parse_int(sprite.get("oY"), default=0),
-                "frameWidth": cls._parse_int(sprite.get("oW"), default=None),
-                "frameHeight": cls._parse_int(sprite.get("oH"), default=None),
-                "rotated": cls._parse_bool(sprite.get("r")),
-                "pivotX": cls._parse_float(sprite.get("pX"), 0.5),
-                "pivotY": cls._parse_float(sprite.get("pY"), 0.5),
-            }
-            if sprite_data["frameWidth"] is None:
-                sprite_data["frameWidth"] = sprite_data["width"]
-            if sprite_data["frameHeight"] is None:
-                sprite_data["frameHeight"] = sprite_data["height"]
-            sprites.append(sprite_data)
-        return sprites
+        return [
+            cls.sprite_from_element(sprite)
+            for sprite in xml_root.findall(cls.SPRITE_TAG)
+        ]
+
+    @classmethod
+    def iter_sprites(
+        cls,
+        file_path: str,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream sprite dicts from a file without building the whole tree.
+
+        Args:
+            file_path: Path to the XML file.
+            name_filter: Optional predicate on the raw sprite name; rejected
+                sprites are skipped before any attribute is converted.
+
+        Yields:
+            Sprite dicts in document order.
+        """
+        for sprite in iter_child_elements(file_path, cls.SPRITE_TAG):
+            name = sprite.get("n") or sprite.get("name") or ""
+            if name_filter is None or name_filter(name):
+                yield cls.sprite_from_element(sprite)
 
     @staticmethod
     def _parse_int(value, default: Optional[int] = 0) -> Optional[int]:
@@ -160,6 +207,28 @@ class TexturePackerXmlParser(BaseParser):
             return False
         return str(value).lower() in {"y", "yes", "true", "1"}
 
+    @classmethod
+    def parse_table(cls, file_path: str) -> SpriteTable:
+        """Stream the file straight into a ``SpriteTable``.
+
+        Args:
+            file_path: Path to the XML file.
+
+        Returns:
+            Unvalidated table with one row per sprite element.
+        """
+        return SpriteTable.from_rows(
+            [
+                cls.sprite_row(sprite)
+                for sprite in iter_child_elements(file_path, cls.SPRITE_TAG)
+            ]
+        )
+
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already parsed XML root element."""
+        return cls.parse_from_root(document)
+
     @staticmethod
     def parse_xml_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse a TexturePacker XML file and return sprite metadata.
@@ -170,6 +239,4 @@ class TexturePackerXmlParser(BaseParser):
         Returns:
             List of sprite dicts with position, dimension, and pivot data.
         """
-        tree = ET.parse(file_path)
-        xml_root = tree.getroot()
-        return TexturePackerXmlParser.parse_from_root(xml_root)
+        return list(TexturePackerXmlParser.iter_sprites(file_path))
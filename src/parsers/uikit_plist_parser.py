@@ -94,6 +94,11 @@ class UIKitPlistParser(BaseParser):
             sprites.append(sprite_data)
         return sprites
 
+    @classmethod
+    def sprites_from_document(cls, document: Any) -> List[Dict[str, Any]]:
+        """Return sprite metadata from an already decoded plist document."""
+        return cls.parse_from_frames(document.get("frames", {}))
+
     @staticmethod
     def parse_plist_data(file_path: str) -> List[Dict[str, Any]]:
         """Parse a UIKit plist atlas file and return sprite metadata.
@@ -106,8 +111,7 @@ class UIKitPlistParser(BaseParser):
         """
         with open(file_path, "rb") as plist_file:
             plist_data = plistlib.load(plist_file)
-        frames = plist_data.get("frames", {})
-        return UIKitPlistParser.parse_from_frames(frames)
+        return UIKitPlistParser.sprites_from_document(plist_data)
 
     @staticmethod
     def _parse_number(value: Any) -> int:
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import os
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Type
 
 from parsers.base_parser import BaseParser
 from parsers.starling_xml_parser import StarlingXmlParser
 from parsers.texture_packer_xml_parser import TexturePackerXmlParser
+from parsers.xml_stream import sniff_xml_root
 
 
 FormatParser = Type[BaseParser]
@@ -96,13 +97,60 @@ class XmlParser(BaseParser):
         tree = ET.parse(file_path)
         return file_path, tree.getroot()
 
+    @classmethod
+    def detect_file_parser(cls, file_path: str) -> FormatParser:
+        """Detect the parser class for an XML file from its first elements.
+
+        Args:
+            file_path: Path to the XML file.
+
+        Returns:
+            The matching parser class.
+
+        Raises:
+            ValueError: If no parser matches the XML structure.
+        """
+        xml_root = sniff_xml_root(file_path)
+        if xml_root is None:
+            raise ValueError(f"Empty XML spritesheet file: {file_path}")
+        return cls._detect_parser(xml_root, file_path)
+
+    @classmethod
+    def iter_sprites(
+        cls,
+        file_path: str,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream sprite dicts from any supported XML dialect.
+
+        Args:
+            file_path: Path to the XML file.
+            name_filter: Optional predicate on the raw sprite name; rejected
+                sprites are skipped before their attributes are converted.
+
+        Yields:
+            Sprite dicts in document order.
+
+        Raises:
+            ValueError: If no parser matches the XML structure.
+        """
+        parser_cls = cls.detect_file_parser(file_path)
+        iter_sprites = getattr(parser_cls, "iter_sprites", None)
+        if callable(iter_sprites):
+            yield from iter_sprites(file_path, name_filter)
+            return
+        for sprite in parser_cls.parse_xml_data(file_path):
+            if name_filter is None or name_filter(sprite.get("name") or ""):
+                yield sprite
+
     @staticmethod
     def parse_xml_data(
         file_path: str,
     ) -> List[Dict[str, Any]]:
         """Parse an XML file and return sprite metadata.
 
-        Detects the XML dialect and delegates to the appropriate parser.
+        Detects the XML dialect from the first elements and streams the file
+        through the appropriate parser.
 
         Args:
             file_path: Path to the XML file.
@@ -110,13 +158,7 @@ class XmlParser(BaseParser):
         Returns:
             List of sprite dicts with position, dimension, and rotation data.
         """
-        tree = ET.parse(file_path)
-        xml_root = tree.getroot()
-        parser_cls = XmlParser._detect_parser(xml_root, file_path)
-        parse_from_root = getattr(parser_cls, "parse_from_root", None)
-        if callable(parse_from_root):
-            return parse_from_root(xml_root)
-        return parser_cls.parse_xml_data(file_path)
+        return list(XmlParser.iter_sprites(file_path))
 
 
 __all__ = ["XmlParser", "StarlingXmlParser", "TexturePackerXmlParser"]
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Streaming helpers for large XML texture atlases.
+
+``ET.parse`` keeps an ``Element`` with its attribute dict alive for every
+``<SubTexture>``/``<sprite>`` until the whole tree is dropped, which dwarfs
+the sprite dicts built from it on atlases with tens of thousands of
+entries. The helpers here use ``ET.iterparse`` instead:
+
+    - sniff_xml_root(): Root element with only its first children attached,
+      enough for ``matches_root`` format detection.
+    - iter_child_elements(): Direct children of the root with one tag,
+      detached from the tree once the caller has seen them.
+
+Only direct children of the root are yielded, matching the
+``findall(tag)`` calls of the tree-based ``parse_from_root`` methods.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from typing import Iterator, Optional
+
+SNIFF_CHILDREN = 8  # Root children read before format detection decides
+
+
+def sniff_xml_root(
+    file_path: str, max_children: int = SNIFF_CHILDREN
+) -> Optional[ET.Element]:
+    """Read the root element and its first few children.
+
+    Parsing stops at the start of child ``max_children + 1``, so the cost
+    does not grow with the file.
+
+    Args:
+        file_path: Path to the XML file.
+        max_children: Direct root children to attach before stopping.
+
+    Returns:
+        The partial root element, or None for an empty document.
+
+    Raises:
+        ET.ParseError: If the prefix read is not well-formed XML.
+    """
+    root = None
+    depth = 0
+    children = 0
+    with open(file_path, "rb") as xml_file:
+        for event, element in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                continue
+            if root is None:
+                root = element
+            elif depth == 1:
+                children += 1
+                if children > max_children:
+                    root.remove(element)
+                    break
+            depth += 1
+    return root
+
+
+def iter_child_elements(file_path: str, tag: str) -> Iterator[ET.Element]:
+    """Yield the root's direct ``tag`` children one at a time.
+
+    Each element is complete (attributes and sub-elements) when yielded and
+    is removed from the root as soon as the caller asks for the next one,
+    so at most one child is alive at a time. Read everything you need from
+    it before advancing the iterator.
+
+    Args:
+        file_path: Path to the XML file.
+        tag: Child tag to yield, e.g. ``"SubTexture"``.
+
+    Yields:
+        Matching child elements in document order.
+
+    Raises:
+        ET.ParseError: If the file is not well-formed XML. Elements before
+            the error have already been yielded.
+    """
+    root = None
+    depth = 0
+    with open(file_path, "rb") as xml_file:
+        for event, element in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+            if element.tag == tag:
+                yield element
+            # Detach finished children (and their subtrees) from the root
+            del root[:]
+
+
+__all__ = ["iter_child_elements", "sniff_xml_root"]
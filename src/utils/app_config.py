@@ -60,6 +60,11 @@ class AppConfig:
                 "optimize": True,
             },
         },
+        "export_output": {
+            "sink": "directory",
+            "writer_threads": 0,
+            "fsync": False,
+        },
         "update_settings": {
             "check_updates_on_startup": True,
             "auto_download_updates": False,
@@ -112,6 +117,9 @@ class AppConfig:
         "remember_input_directory": bool,
         "remember_output_directory": bool,
         "origin_mode": str,
+        "sink": str,
+        "writer_threads": int,
+        "fsync": bool,
     }
 
     def __init__(self, config_path=None):
@@ -2,15 +2,95 @@
 
 Provides functions to composite RGBA images over checkerboard or solid
 backgrounds, making transparent regions visible in previews.
+
+Checkerboards are built with NumPy by repeating one cached two-by-two
+square tile, and the RGBA backgrounds used for compositing are memoized by
+size, square size and colors, so previews that composite frame after frame
+reuse one background instead of drawing it square by square each time.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 try:
-    from PIL import Image, ImageDraw
+    from PIL import Image
 
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# Backgrounds above this many pixels are built per call instead of cached
+MAX_CACHED_BACKGROUND_PIXELS = 2048 * 2048
+
+
+@lru_cache(maxsize=16)
+def _checkerboard_tile(
+    square_size: int,
+    color1: tuple[int, int, int],
+    color2: tuple[int, int, int],
+) -> np.ndarray:
+    """Return one two-by-two square period of the pattern as an RGB array."""
+    tile = np.empty((2 * square_size, 2 * square_size, 3), dtype=np.uint8)
+    tile[...] = color2
+    tile[:square_size, square_size:] = color1
+    tile[square_size:, :square_size] = color1
+    tile.flags.writeable = False
+    return tile
+
+
+def checkerboard_array(
+    width: int,
+    height: int,
+    square_size: int = 8,
+    color1: tuple[int, int, int] = (192, 192, 192),
+    color2: tuple[int, int, int] = (255, 255, 255),
+) -> np.ndarray:
+    """Return a checkerboard pattern as a ``(height, width, 3)`` array.
+
+    Args:
+        width: Width of the background in pixels.
+        height: Height of the background in pixels.
+        square_size: Size of each checkerboard square in pixels.
+        color1: RGB color for odd squares (default light gray).
+        color2: RGB color for even squares (default white).
+
+    Returns:
+        Contiguous uint8 RGB array.
+    """
+
+    square_size = max(1, int(square_size))
+    tile = _checkerboard_tile(square_size, tuple(color1), tuple(color2))
+    period = 2 * square_size
+    repeats = (-(-height // period), -(-width // period), 1)
+    return np.ascontiguousarray(np.tile(tile, repeats)[:height, :width])
+
+
+@lru_cache(maxsize=8)
+def _cached_background(
+    width: int,
+    height: int,
+    square_size: int,
+    color1: tuple[int, int, int],
+    color2: tuple[int, int, int],
+) -> "Image.Image":
+    board = checkerboard_array(width, height, square_size, color1, color2)
+    return Image.fromarray(board, "RGB").convert("RGBA")
+
+
+def _checkerboard_rgba(
+    width: int,
+    height: int,
+    square_size: int,
+    color1: tuple[int, int, int],
+    color2: tuple[int, int, int],
+) -> "Image.Image":
+    """Return an RGBA checkerboard to composite over; do not modify it."""
+    key = (width, height, max(1, int(square_size)), tuple(color1), tuple(color2))
+    if width * height > MAX_CACHED_BACKGROUND_PIXELS:
+        return _cached_background.__wrapped__(*key)
+    return _cached_background(*key)
+
 
 def create_checkerboard_background(
     width: int,
@@ -35,15 +115,8 @@ def create_checkerboard_background(
     if not PIL_AVAILABLE:
         return None
 
-    img = Image.new("RGB", (width, height), color2)
-    draw = ImageDraw.Draw(img)
-
-    for y in range(0, height, square_size):
-        for x in range(0, width, square_size):
-            if (x // square_size + y // square_size) % 2 == 1:
-                draw.rectangle([x, y, x + square_size, y + square_size], fill=color1)
-
-    return img
+    board = checkerboard_array(width, height, square_size, color1, color2)
+    return Image.fromarray(board, "RGB")
 
 
 def composite_with_checkerboard(
@@ -70,10 +143,9 @@ def composite_with_checkerboard(
     if rgba_image.mode != "RGBA":
         rgba_image = rgba_image.convert("RGBA")
 
-    bg = create_checkerboard_background(
+    bg = _checkerboard_rgba(
         rgba_image.width, rgba_image.height, square_size, color1, color2
     )
-    bg = bg.convert("RGBA")
 
     result = Image.alpha_composite(bg, rgba_image)
     return result.convert("RGB")
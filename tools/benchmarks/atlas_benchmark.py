@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Atlas benchmark: exporter pipeline vs. generator pipeline on the same sprites.
+
+Writes each corpus to a temporary directory as solid PNG sprites, then builds
+an atlas through ``ExporterRegistry.export_file`` and through
+``SparrowAtlasGenerator.generate_atlas`` with the same packer. Both entry
+points share the packers package, so the atlas sizes should match closely.
+Padding defaults to 0 because the two pipelines count padding differently
+(gap between sprites vs. border around each sprite).
+
+Usage:
+    python tools/benchmarks/atlas_benchmark.py [--repeat N] [--corpus NAME]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from bench_utils import add_src_to_path, best_of, print_table
+from packer_benchmark import build_corpora
+
+add_src_to_path()
+
+from PIL import Image  # noqa: E402
+
+from core.generator.generator import AtlasSettings, SparrowAtlasGenerator  # noqa: E402
+from exporters import ExporterRegistry, ExportOptions  # noqa: E402
+
+CORPUS_LIMIT = 200  # Sprites per corpus; keeps PNG encoding out of the way
+PACKERS = ["maxrects", "skyline", "shelf", "auto"]
+
+
+def write_sprites(sizes, directory):
+    """Save one opaque PNG per size and return (paths, sprites, images)."""
+    paths = []
+    sprites = []
+    images = {}
+    for index, (w, h) in enumerate(sizes[:CORPUS_LIMIT]):
+        name = f"sprite{index:04d}"
+        image = Image.new("RGBA", (w, h), (index % 256, 128, 64, 255))
+        path = Path(directory) / f"{name}.png"
+        image.save(path)
+        paths.append(str(path))
+        images[name] = image
+        sprites.append({"name": name, "x": 0, "y": 0, "width": w, "height": h})
+    return paths, sprites, images
+
+
+def run_exporter(sprites, images, output, packer, padding, rotation):
+    options = ExportOptions(
+        padding=padding,
+        packer=packer,
+        allow_rotation=rotation,
+        max_width=8192,
+        max_height=8192,
+    )
+    result = ExporterRegistry.export_file(
+        sprites, images, output, "starling-xml", options
+    )
+    if not result.success:
+        return None
+    return result.atlas_width, result.atlas_height
+
+
+def run_generator(paths, output, packer, padding, rotation):
+    settings = AtlasSettings(
+        max_size=8192,
+        min_size=16,
+        padding=padding,
+        power_of_2=False,
+        allow_rotation=rotation,
+        algorithm_hint=packer,
+    )
+    result = SparrowAtlasGenerator().generate_atlas(
+        {"bench": paths}, output, settings, "bench"
+    )
+    if not result.get("success"):
+        return None
+    return tuple(result["atlas_size"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per cell")
+    parser.add_argument("--corpus", help="Only run this corpus")
+    parser.add_argument("--padding", type=int, default=0, help="Sprite padding")
+    parser.add_argument("--rotation", action="store_true", help="Allow rotation")
+    args = parser.parse_args()
+
+    for name, sizes in build_corpora().items():
+        if args.corpus and name != args.corpus:
+            continue
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths, sprites, images = write_sprites(sizes, tmp)
+            sprite_area = sum(w * h for w, h in sizes[:CORPUS_LIMIT])
+
+            rows = []
+            for packer in PACKERS:
+                for entry, run in (
+                    (
+                        "exporter",
+                        lambda: run_exporter(
+                            sprites,
+                            images,
+                            f"{tmp}/export_{packer}",
+                            packer,
+                            args.padding,
+                            args.rotation,
+                        ),
+                    ),
+                    (
+                        "generator",
+                        lambda: run_generator(
+                            paths,
+                            f"{tmp}/generate_{packer}",
+                            packer,
+                            args.padding,
+                            args.rotation,
+                        ),
+                    ),
+                ):
+                    seconds, size = best_of(run, args.repeat)
+                    if size is None:
+                        rows.append([packer, entry, f"{seconds:.3f}", "-", "failed"])
+                        continue
+                    width, height = size
+                    rows.append(
+                        [
+                            packer,
+                            entry,
+                            f"{seconds:.3f}",
+                            f"{width}x{height}",
+                            f"{sprite_area / (width * height) * 100:.1f}%",
+                        ]
+                    )
+
+        print(f"\n{name} ({len(sprites)} sprites)")
+        print_table(["packer", "entry point", "seconds", "atlas", "occupancy"], rows)
+
+
+if __name__ == "__main__":
+    main()
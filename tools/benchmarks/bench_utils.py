@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the TextureAtlas Toolbox benchmark scripts.
+
+Puts ``src/`` on the import path, times callables and prints result tables.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent.parent / "src"
+
+
+def add_src_to_path():
+    """Make the application packages importable from a tools script."""
+    src = str(SRC_DIR)
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+
+def best_of(func, repeat=3):
+    """Run ``func`` ``repeat`` times and return (best_seconds, last_result)."""
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(headers, rows):
+    """Print rows as a fixed-width, left-aligned text table."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [
+        max(len(str(header)), *(len(row[i]) for row in rows)) if rows else len(header)
+        for i, header in enumerate(headers)
+    ]
+    line = "  ".join(str(h).ljust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for row in rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
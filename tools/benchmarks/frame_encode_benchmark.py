@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Frame encoding benchmark: throughput and output size per compression profile.
+
+Builds sprite-like RGBA frames (flat-colored shapes with soft edges over a
+transparent background) and encodes them in memory with the prepared
+encoders ``FrameExporter`` uses, once per format and compression profile.
+It reports:
+
+    MB/s       raw RGBA megabytes encoded per second
+    Output KB  total encoded size of all frames
+    Ratio      encoded size as a share of the raw pixels
+
+Usage:
+    python tools/benchmarks/frame_encode_benchmark.py [--frames N] [--size N]
+"""
+
+import argparse
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from core.extractor.frame_encoders import (  # noqa: E402
+    COMPRESSION_PROFILES,
+    FrameEncoderRegistry,
+)
+
+
+def make_frames(count, size):
+    """Return ``count`` RGBA frames of ellipses with antialiased edges."""
+    rng = np.random.default_rng(42)
+    frames = []
+    for _ in range(count):
+        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for _ in range(40):
+            x, y = rng.integers(size // 8, size - size // 4, 2)
+            radius = int(rng.integers(size // 64 + 1, size // 8 + 2))
+            color = tuple(int(value) for value in rng.integers(0, 256, 3))
+            draw.ellipse(
+                [int(x), int(y), int(x) + radius, int(y) + radius * 4 // 3],
+                fill=color + (255,),
+            )
+        frames.append(image.filter(ImageFilter.SMOOTH))
+    return frames
+
+
+def encode_all(frames, encoder):
+    """Encode every frame to memory and return the total encoded size."""
+    total = 0
+    for frame in frames:
+        buffer = io.BytesIO()
+        encoder.save(frame, buffer)
+        total += buffer.tell()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=16)
+    parser.add_argument("--size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--formats",
+        default="PNG,WebP",
+        help="Comma-separated frame formats (default: PNG,WebP)",
+    )
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames, args.size)
+    raw_bytes = sum(frame.width * frame.height * 4 for frame in frames)
+
+    rows = []
+    for frame_format in args.formats.split(","):
+        frame_format = frame_format.strip()
+        for profile in COMPRESSION_PROFILES:
+            encoder = FrameEncoderRegistry.get_encoder(
+                frame_format, {"compression_profile": profile}
+            )
+            seconds, encoded = best_of(lambda: encode_all(frames, encoder), args.repeat)
+            rows.append(
+                [
+                    encoder.format_name,
+                    profile,
+                    f"{raw_bytes / seconds / 1e6:.1f}",
+                    f"{encoded / 1024:.0f}",
+                    f"{encoded / raw_bytes:.1%}",
+                ]
+            )
+
+    print_table(["Format", "Profile", "MB/s", "Output KB", "Ratio"], rows)
+
+
+if __name__ == "__main__":
+    main()
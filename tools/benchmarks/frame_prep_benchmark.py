@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Frame preparation benchmark: per-frame PIL processing vs. one stacked array.
+
+Builds an animation of RGBA frames with transparent margins that move from
+frame to frame, then prepares it the way the animation exporters do:
+shared-bbox crop, alpha threshold, horizontal flip and nearest-neighbour
+scaling. It times:
+
+    per-frame  crop, threshold and ``scale_image_nearest`` on each frame
+    stack      ``prepare_frame_stack`` over the whole animation
+
+for an integer, a fractional and a flipped scale. Both paths must produce
+the same pixels.
+
+With ``--mixed-sizes`` the canvases alternate between wide and tall, so the
+shared box reaches past every frame in one axis while the frame extends
+past the box in the other. The per-frame crop must then match
+``Image.crop`` frame for frame, which is how frames were cropped before
+they were prepared as arrays.
+
+Usage:
+    python tools/benchmarks/frame_prep_benchmark.py [--frames N] [--size N]
+    python tools/benchmarks/frame_prep_benchmark.py --mixed-sizes
+"""
+
+import argparse
+
+import numpy as np
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from core.extractor.frame_pipeline import (  # noqa: E402
+    compute_shared_bbox,
+    prepare_frame_stack,
+)
+from core.extractor.image_utils import (  # noqa: E402
+    apply_alpha_threshold,
+    array_to_rgba_image,
+    crop_to_bbox_padded,
+    image_to_rgba_array,
+    scale_image_nearest,
+)
+
+THRESHOLD = 0.5
+SCALES = (2.0, 1.5, -1.0)
+
+
+def make_frames(count, size, mixed_sizes=False):
+    """Return ``count`` RGBA frames whose visible area drifts across the canvas.
+
+    With ``mixed_sizes`` odd frames are a quarter narrower and a quarter
+    taller than even frames, with content reaching into their extra rows.
+    """
+    rng = np.random.default_rng(42)
+    frames = []
+    margin = size // 8
+    for index in range(count):
+        height = width = size
+        if mixed_sizes and index % 2:
+            height, width = size + size // 4, size - size // 4
+        frame = np.zeros((height, width, 4), dtype=np.uint8)
+        offset = index % margin
+        top, left = margin + offset, margin + offset // 2
+        bottom = height - margin + offset // 3
+        right = width - margin
+        frame[top:bottom, left:right] = rng.integers(
+            0, 256, (bottom - top, right - left, 4), dtype=np.uint8
+        )
+        frames.append(frame)
+    return frames
+
+
+def check_crop_matches_pil(frames, bbox):
+    """Exit if the exporter's padded crop differs from ``Image.crop``."""
+    for index, frame in enumerate(frames):
+        expected = image_to_rgba_array(array_to_rgba_image(frame).crop(bbox))
+        if not np.array_equal(crop_to_bbox_padded(frame, bbox), expected):
+            raise SystemExit(f"frame {index}: padded crop differs from Image.crop")
+
+
+def per_frame(frames, scale):
+    """Previous exporter path: one crop, copy and PIL resize per frame."""
+    bbox = compute_shared_bbox(frames)
+    prepared = []
+    for frame in frames:
+        cropped = apply_alpha_threshold(
+            crop_to_bbox_padded(frame, bbox).copy(), THRESHOLD
+        )
+        scaled = scale_image_nearest(array_to_rgba_image(cropped), scale)
+        prepared.append(image_to_rgba_array(scaled))
+    return np.stack(prepared)
+
+
+def stacked(frames, scale):
+    return prepare_frame_stack(frames, scale, "Animation based", THRESHOLD)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--mixed-sizes",
+        action="store_true",
+        help="Alternate wide and tall canvases",
+    )
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames, args.size, args.mixed_sizes)
+    check_crop_matches_pil(frames, compute_shared_bbox(frames))
+    rows = []
+    for scale in SCALES:
+        frame_time, frame_result = best_of(
+            lambda: per_frame(frames, scale), args.repeat
+        )
+        stack_time, stack_result = best_of(lambda: stacked(frames, scale), args.repeat)
+        if not np.array_equal(frame_result, stack_result):
+            raise SystemExit(f"scale {scale}: stacked frames differ")
+        rows.append(
+            [
+                f"{scale:g}",
+                "x".join(str(value) for value in stack_result.shape[1:3]),
+                f"{frame_time * 1000:.1f}",
+                f"{stack_time * 1000:.1f}",
+                f"{frame_time / stack_time:.2f}x",
+            ]
+        )
+
+    print_table(["Scale", "Output HxW", "Per-frame ms", "Stack ms", "Speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Packer benchmark: adaptive hybrid packer vs. each fixed strategy.
+
+Every strategy sizes the atlas for each corpus with find_optimal_size. The
+table shows time-to-result and the resulting occupancy. The corpus heading
+lists the hybrid packer's candidate strategies and how many bins each one
+was tried on during the hybrid search. Each timed search starts with an
+empty hybrid analysis cache.
+
+The hybrid packer does not beat every fixed strategy everywhere. Where Shelf
+alone reaches the best occupancy (uniform_grid, character_frames,
+effects_scatter) the hybrid search reuses one shelf strip per bin width and
+is faster than plain Shelf without rotation; with --rotation it only
+matches Shelf on character_frames and effects_scatter. On ui_mixed Shelf
+stays near 92% occupancy, so the hybrid packer runs MaxRects: it reaches
+MaxRects' occupancy in roughly 25-35% less time, but is far slower than
+Shelf.
+
+Usage:
+    python tools/benchmarks/packer_benchmark.py [--repeat N] [--corpus NAME]
+"""
+
+import argparse
+import random
+from collections import Counter
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from packers import (  # noqa: E402
+    GuillotinePacker,
+    HybridAdaptivePacker,
+    MaxRectsPacker,
+    ShelfPackerDecreasingHeight,
+    SkylinePacker,
+    find_optimal_size,
+)
+
+
+def build_corpora():
+    """Return deterministic synthetic sprite-size corpora keyed by name."""
+    rng = random.Random(1234)
+    corpora = {}
+
+    # Tile sets / icon grids: every cell the same size
+    corpora["uniform_grid"] = [(64, 64)] * 400
+
+    # FNF-style character sheets: similar heights, varying widths
+    corpora["character_frames"] = [
+        (rng.randint(260, 420), rng.randint(380, 420)) for _ in range(150)
+    ]
+
+    # UI atlases: mixed icons, panels and bars
+    mixed = []
+    for _ in range(500):
+        kind = rng.random()
+        if kind < 0.6:
+            side = rng.choice([16, 24, 32, 48])
+            mixed.append((side, side))
+        elif kind < 0.85:
+            mixed.append((rng.randint(60, 200), rng.randint(10, 40)))
+        else:
+            mixed.append((rng.randint(80, 240), rng.randint(80, 240)))
+    corpora["ui_mixed"] = mixed
+
+    # Particle/effect sheets: many small, highly varied sprites
+    corpora["effects_scatter"] = [
+        (rng.randint(4, 96), rng.randint(4, 96)) for _ in range(800)
+    ]
+
+    return corpora
+
+
+def make_try_pack(strategy, frames, allow_rotation, usage=None):
+    """Return a (width, height) -> bool packing test for a strategy name.
+
+    If ``usage`` is a Counter, the hybrid packers add one count per pack run
+    by each of their inner strategies, and one per escalation they skipped.
+    """
+
+    def record(event):
+        if usage is not None and event.get("event") == "hybrid_pack":
+            usage.update(list(event.get("elapsed") or ()))
+            usage.update(f"{key} skipped" for key in event.get("skipped") or ())
+
+    def fit_blocks(packer, width, height):
+        blocks = [{"w": w, "h": h} for w, h, _ in frames]
+        if isinstance(packer, HybridAdaptivePacker):
+            return packer.fit(blocks, width, height, allow_rotation, allow_flip=False)
+        return packer.fit(blocks, width, height, allow_rotation)
+
+    def pack_frames(packer):
+        return len(packer.pack(list(frames))) == len(frames)
+
+    def try_pack(width, height):
+        if strategy == "hybrid":
+            return fit_blocks(HybridAdaptivePacker(record), width, height)
+        if strategy == "hybrid-race":
+            return fit_blocks(HybridAdaptivePacker(record, race=True), width, height)
+        if strategy == "maxrects":
+            return fit_blocks(MaxRectsPacker(), width, height)
+        if strategy == "skyline":
+            return pack_frames(
+                SkylinePacker(width, height, allow_rotation=allow_rotation)
+            )
+        if strategy == "guillotine":
+            return pack_frames(
+                GuillotinePacker(width, height, allow_rotation=allow_rotation)
+            )
+        if strategy == "shelf":
+            return pack_frames(
+                ShelfPackerDecreasingHeight(
+                    width, height, allow_rotation=allow_rotation
+                )
+            )
+        raise ValueError(strategy)
+
+    return try_pack
+
+
+STRATEGIES = ["hybrid", "hybrid-race", "maxrects", "skyline", "guillotine", "shelf"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per cell")
+    parser.add_argument("--corpus", help="Only run this corpus")
+    parser.add_argument("--rotation", action="store_true", help="Allow rotation")
+    args = parser.parse_args()
+
+    for name, sizes in build_corpora().items():
+        if args.corpus and name != args.corpus:
+            continue
+
+        frames = sorted(
+            ((w, h, None) for w, h in sizes), key=lambda f: f[0] * f[1], reverse=True
+        )
+        candidates = HybridAdaptivePacker().choose_strategies(
+            HybridAdaptivePacker.profile_blocks([{"w": w, "h": h} for w, h in sizes])
+        )
+        # One untimed hybrid search counts the packs each strategy runs
+        usage = Counter()
+        find_optimal_size(frames, make_try_pack("hybrid", frames, args.rotation, usage))
+
+        rows = []
+        for strategy in STRATEGIES:
+            try_pack = make_try_pack(strategy, frames, args.rotation)
+
+            def search():
+                # Time a cold search: no block analysis left from earlier runs
+                HybridAdaptivePacker.clear_analysis_cache()
+                return find_optimal_size(frames, try_pack)
+
+            seconds, result = best_of(search, args.repeat)
+            if not try_pack(result.width, result.height):
+                rows.append([strategy, f"{seconds:.3f}", "-", "no fit"])
+                continue
+            rows.append(
+                [
+                    strategy,
+                    f"{seconds:.3f}",
+                    f"{result.width}x{result.height}",
+                    f"{result.occupancy * 100:.1f}%",
+                ]
+            )
+
+        runs = ", ".join(f"{key} x{count}" for key, count in usage.items())
+        print(
+            f"\n{name} ({len(sizes)} sprites, hybrid tries "
+            f"{' then '.join(candidates)}; packs run: {runs})"
+        )
+        print_table(["strategy", "seconds", "atlas", "occupancy"], rows)
+
+
+if __name__ == "__main__":
+    main()
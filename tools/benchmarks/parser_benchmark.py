@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Parser benchmark: format detection followed by a second parse vs. parse-once.
+
+Writes one synthetic metadata file per ambiguous format (``.json``, ``.xml``
+and ``.plist`` need content-based detection) with the matching exporter's
+``build_metadata``, then times the previous pipeline (``detect_parser`` +
+``parser_cls.parse_file``, which decodes the file twice) against
+``ParserRegistry.parse_file``, which hands the detection document to the
+chosen parser. Both paths must return the same sprites.
+
+Usage:
+    python tools/benchmarks/parser_benchmark.py [--sprites N] [--repeat N]
+"""
+
+import argparse
+import os
+import tempfile
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from exporters import ExporterRegistry, ExportOptions  # noqa: E402
+from exporters.exporter_types import PackedSprite  # noqa: E402
+from parsers.parser_registry import ParserRegistry  # noqa: E402
+
+FORMATS = [
+    "json-hash",
+    "json-array",
+    "egret2d",
+    "phaser3",
+    "starling-xml",
+    "texturepacker-xml",
+    "plist",
+    "uikit-plist",
+]
+SPRITE_SIZE = 16
+
+
+def build_packed_sprites(count):
+    """Lay ``count`` equal sprites out on a square grid."""
+    columns = max(1, int(count**0.5))
+    packed = []
+    for index in range(count):
+        sprite = {
+            "name": f"anim{index // 24:04d}{index % 24:04d}",
+            "x": 0,
+            "y": 0,
+            "width": SPRITE_SIZE,
+            "height": SPRITE_SIZE,
+        }
+        packed.append(
+            PackedSprite(
+                sprite=sprite,
+                atlas_x=(index % columns) * SPRITE_SIZE,
+                atlas_y=(index // columns) * SPRITE_SIZE,
+            )
+        )
+    side = columns * SPRITE_SIZE
+    return packed, side, side * (count // columns + 1)
+
+
+def write_metadata(format_name, packed, width, height, directory):
+    """Write one metadata file in ``format_name`` and return its path."""
+    exporter_cls = ExporterRegistry.get_exporter(format_name)
+    exporter = exporter_cls(ExportOptions())
+    metadata = exporter.build_metadata(packed, width, height, "atlas.png")
+    path = os.path.join(directory, f"{format_name}{exporter_cls.FILE_EXTENSION}")
+    mode = "wb" if isinstance(metadata, bytes) else "w"
+    encoding = None if mode == "wb" else "utf-8"
+    with open(path, mode, encoding=encoding) as handle:
+        handle.write(metadata)
+    return path
+
+
+def parse_twice(path):
+    """The pre-parse-once pipeline: detect, then let the parser reload."""
+    return ParserRegistry.detect_parser(path).parse_file(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sprites", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ExporterRegistry.initialize()
+    ParserRegistry.initialize()
+    packed, width, height = build_packed_sprites(args.sprites)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for format_name in FORMATS:
+            path = write_metadata(format_name, packed, width, height, directory)
+            twice_time, twice = best_of(lambda: parse_twice(path), args.repeat)
+            once_time, once = best_of(
+                lambda: ParserRegistry.parse_file(path), args.repeat
+            )
+            if once.sprites != twice.sprites or once.parser_name != twice.parser_name:
+                raise SystemExit(f"{format_name}: parse-once result differs")
+            rows.append(
+                [
+                    format_name,
+                    once.parser_name,
+                    len(once.sprites),
+                    f"{os.path.getsize(path) / 1024:.0f}",
+                    f"{twice_time * 1000:.1f}",
+                    f"{once_time * 1000:.1f}",
+                    f"{twice_time / once_time:.2f}x",
+                ]
+            )
+
+    print_table(
+        [
+            "Format",
+            "Parser",
+            "Sprites",
+            "KB",
+            "Detect+parse ms",
+            "Parse-once ms",
+            "Speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Pre-flight benchmark: metadata-only batch validation, serial vs. process pool.
+
+Writes a folder of Starling XML atlases with real PNG images, where every
+tenth atlas lists a sprite outside the image, every fifteenth one a
+zero-size sprite and every fiftieth one is malformed XML. It then times:
+
+    decode   parse + full image decode per file (what extraction pays to
+             find the same problems)
+    serial   ``run_preflight`` in-process (image headers only)
+    pool     ``run_preflight`` across a process pool
+
+The serial and pool runs must report the same issues.
+
+Usage:
+    python tools/benchmarks/preflight_benchmark.py [--files N] [--sprites N]
+"""
+
+import argparse
+import os
+import tempfile
+
+from PIL import Image
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from core.extractor.preflight import build_preflight_tasks, run_preflight  # noqa: E402
+from parsers.parser_registry import ParserRegistry  # noqa: E402
+
+ATLAS_SIZE = 1024
+SPRITE_SIZE = 32
+
+
+def write_batch(directory, files, sprites):
+    """Write ``files`` atlases and return their spritesheet names."""
+    image = Image.new("RGBA", (ATLAS_SIZE, ATLAS_SIZE), (200, 80, 40, 255))
+    image.save(os.path.join(directory, "template.png"))
+    with open(os.path.join(directory, "template.png"), "rb") as handle:
+        png_bytes = handle.read()
+
+    columns = ATLAS_SIZE // SPRITE_SIZE
+    names = []
+    for file_index in range(files):
+        stem = f"atlas{file_index:05d}"
+        with open(os.path.join(directory, f"{stem}.png"), "wb") as handle:
+            handle.write(png_bytes)
+        lines = ['<TextureAtlas imagePath="{}.png">'.format(stem)]
+        for index in range(sprites):
+            x = index % columns * SPRITE_SIZE
+            y = index // columns % columns * SPRITE_SIZE
+            width = SPRITE_SIZE
+            if index == 0 and file_index % 10 == 0:
+                x = ATLAS_SIZE - 4
+            if index == 1 and file_index % 15 == 0:
+                width = 0
+            lines.append(
+                f'  <SubTexture name="anim{index // 24:03d}{index % 24:04d}" '
+                f'x="{x}" y="{y}" width="{width}" height="{SPRITE_SIZE}"/>'
+            )
+        if file_index % 50 != 49:
+            lines.append("</TextureAtlas>")
+        with open(os.path.join(directory, f"{stem}.xml"), "w") as handle:
+            handle.write("\n".join(lines))
+        names.append(f"{stem}.png")
+    return names
+
+
+def decode_all(tasks):
+    """Parse every file and fully decode its image, catching failures."""
+    failures = 0
+    for task in tasks:
+        try:
+            ParserRegistry.parse_file(task.metadata_path)
+            with Image.open(task.image_path) as image:
+                image.convert("RGBA")
+        except Exception:
+            failures += 1
+    return failures
+
+
+def summarize(reports):
+    return sorted(
+        (
+            name,
+            report.sprite_count,
+            tuple(report.out_of_bounds),
+            tuple(report.zero_size),
+            len(report.result.errors),
+        )
+        for name, report in reports.items()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--sprites", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    ParserRegistry.initialize()
+    with tempfile.TemporaryDirectory() as directory:
+        names = write_batch(directory, args.files, args.sprites)
+        tasks = build_preflight_tasks(directory, names)
+
+        decode_time, _ = best_of(lambda: decode_all(tasks), args.repeat)
+        serial_time, serial = best_of(
+            lambda: run_preflight(tasks, max_workers=1), args.repeat
+        )
+        pool_time, pool = best_of(
+            lambda: run_preflight(tasks, max_workers=args.workers), args.repeat
+        )
+        if summarize(serial) != summarize(pool):
+            raise SystemExit("pool reports differ from the serial run")
+
+    with_issues = sum(report.has_issues for report in pool.values())
+    rows = [
+        [label, len(tasks), with_issues if label != "decode" else "-", f"{t:.2f}"]
+        for label, t in (
+            ("decode", decode_time),
+            ("serial", serial_time),
+            ("pool", pool_time),
+        )
+    ]
+    print_table(["Mode", "Files", "With issues", "Seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+XML benchmark: whole-tree parsing vs. iterparse streaming on large atlases.
+
+Writes a Starling and a TexturePacker XML atlas with many entries, then
+measures time and peak traced memory (``tracemalloc``) for:
+
+    full     ``ET.parse`` + ``parse_from_root`` vs. streaming ``parse_xml_data``
+    preview  ``ET.parse`` + name filter vs. ``XmlParser.iter_sprites`` with the
+             same filter (the ``AtlasProcessor.parse_xml_for_preview`` path)
+
+Both paths must return the same sprites.
+
+Usage:
+    python tools/benchmarks/xml_stream_benchmark.py [--sprites N] [--repeat N]
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from bench_utils import add_src_to_path, best_of, print_table
+
+add_src_to_path()
+
+from parsers.starling_xml_parser import StarlingXmlParser  # noqa: E402
+from parsers.texture_packer_xml_parser import TexturePackerXmlParser  # noqa: E402
+from parsers.xml_parser import XmlParser  # noqa: E402
+
+FRAMES_PER_ANIMATION = 24
+PREVIEW_ANIMATION = "anim0003"
+
+
+def write_starling(path, count):
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('<TextureAtlas imagePath="atlas.png">\n')
+        for index in range(count):
+            handle.write(
+                f'  <SubTexture name="anim{index // FRAMES_PER_ANIMATION:04d}'
+                f'{index % FRAMES_PER_ANIMATION:04d}" x="{index % 256 * 16}" '
+                f'y="{index // 256 * 16}" width="16" height="16" frameX="-1" '
+                f'frameY="-1" frameWidth="18" frameHeight="18"/>\n'
+            )
+        handle.write("</TextureAtlas>\n")
+
+
+def write_texture_packer(path, count):
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('<TextureAtlas imagePath="atlas.png">\n')
+        for index in range(count):
+            handle.write(
+                f'  <sprite n="anim{index // FRAMES_PER_ANIMATION:04d}'
+                f'{index % FRAMES_PER_ANIMATION:04d}" x="{index % 256 * 16}" '
+                f'y="{index // 256 * 16}" w="16" h="16" oX="1" oY="1" '
+                f'oW="18" oH="18"/>\n'
+            )
+        handle.write("</TextureAtlas>\n")
+
+
+def peak_memory(func):
+    """Return (peak traced bytes, result) for one call of ``func``."""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def tree_full(parser_cls, path):
+    return parser_cls.parse_from_root(ET.parse(path).getroot())
+
+
+def tree_preview(parser_cls, path, matches):
+    root = ET.parse(path).getroot()
+    return [
+        parser_cls.sprite_from_element(element)
+        for element in root
+        if matches(element.get("name") or element.get("n") or "")
+    ]
+
+
+def stream_preview(path, matches):
+    return list(XmlParser.iter_sprites(path, name_filter=matches))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sprites", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    def matches(name):
+        return name.startswith(PREVIEW_ANIMATION)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        formats = [
+            ("starling", StarlingXmlParser, write_starling),
+            ("texturepacker", TexturePackerXmlParser, write_texture_packer),
+        ]
+        for label, parser_cls, writer in formats:
+            path = os.path.join(directory, f"{label}.xml")
+            writer(path, args.sprites)
+
+            cases = [
+                (
+                    "full",
+                    lambda: tree_full(parser_cls, path),
+                    lambda: parser_cls.parse_xml_data(path),
+                ),
+                (
+                    "preview",
+                    lambda: tree_preview(parser_cls, path, matches),
+                    lambda: stream_preview(path, matches),
+                ),
+            ]
+            for case, tree_func, stream_func in cases:
+                tree_time, tree_result = best_of(tree_func, args.repeat)
+                stream_time, stream_result = best_of(stream_func, args.repeat)
+                if tree_result != stream_result:
+                    raise SystemExit(f"{label}/{case}: streamed result differs")
+                tree_peak, _ = peak_memory(tree_func)
+                stream_peak, _ = peak_memory(stream_func)
+                rows.append(
+                    [
+                        label,
+                        case,
+                        len(stream_result),
+                        f"{tree_time * 1000:.0f}",
+                        f"{stream_time * 1000:.0f}",
+                        f"{tree_peak / 2**20:.1f}",
+                        f"{stream_peak / 2**20:.1f}",
+                    ]
+                )
+
+    print_table(
+        [
+            "Format",
+            "Case",
+            "Sprites",
+            "Tree ms",
+            "Stream ms",
+            "Tree peak MB",
+            "Stream peak MB",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()